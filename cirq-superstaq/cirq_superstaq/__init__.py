@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cirq_superstaq import compiler_output, validation
+from cirq_superstaq import compiler_output, testing, validation
 from cirq_superstaq._version import __version__
 from cirq_superstaq.compiler_output import active_qubit_indices, measured_qubit_indices
-from cirq_superstaq.job import Job
+from cirq_superstaq.job import Job, as_completed, wait
 from cirq_superstaq.ops import (
     AQTICCX,
     AQTITOFFOLI,
@@ -104,6 +104,7 @@ __all__ = [
     "__version__",
     "active_qubit_indices",
     "approx_eq_mod",
+    "as_completed",
     "barrier",
     "compiler_output",
     "deserialize_circuits",
@@ -111,5 +112,7 @@ __all__ = [
     "qubit_subspace_op",
     "qudit_swap_op",
     "serialize_circuits",
+    "testing",
     "validation",
+    "wait",
 ]
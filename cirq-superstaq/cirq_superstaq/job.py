@@ -15,13 +15,15 @@
 
 from __future__ import annotations
 
-import collections
+import asyncio
 import time
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Any, overload
 
 import cirq
 import general_superstaq as gss
+import numpy as np
+import numpy.typing as npt
 from cirq._doc import document
 
 import cirq_superstaq as css
@@ -74,6 +76,8 @@ class Job:
         self._overall_status = "Submitted"
         self._job: dict[str, Any] = {}
         self._job_id = job_id
+        self._circuits: dict[tuple[str, str], tuple[str, cirq.Circuit]] = {}
+        self._counts_arrays: dict[str, tuple[dict[str, int], gss.Counts]] = {}
 
     def _refresh_job(self) -> None:
         """If the last fetched job is not terminal, gets the job from the API."""
@@ -85,11 +89,38 @@ class Job:
                 jobs_to_fetch.append(job_id)
 
         if jobs_to_fetch:
-            result = self._client.fetch_jobs(jobs_to_fetch)
+            result = self._fetch_jobs(jobs_to_fetch)
             self._job.update(result)
 
         self._update_status_queue_info()
 
+    def _fetch_jobs(self, job_ids: list[str]) -> dict[str, gss.typing.Job]:
+        """Fetches jobs from the API via the client's shared `gss.polling.JobPoller`, which
+        coalesces the polling of all jobs using the same client.
+
+        Args:
+            job_ids: The ids of the jobs to fetch.
+
+        Returns:
+            A dictionary mapping each job id to its (updated) job data.
+        """
+        poller = gss.polling.get_job_poller(self._client)
+        return poller.fetch_jobs(self, job_ids, self.TERMINAL_STATES)
+
+    def _polling_strategy(self, polling_seconds: float | None) -> gss.PollingStrategy:
+        """Gets the strategy with which to poll this job.
+
+        Args:
+            polling_seconds: An optional fixed interval with which to poll.
+
+        Returns:
+            A fixed-interval `gss.PollingStrategy` if `polling_seconds` is given, and otherwise
+            the client's strategy.
+        """
+        if polling_seconds is not None:
+            return gss.PollingStrategy.fixed(polling_seconds)
+        return self._client.polling_strategy
+
     def _update_status_queue_info(self) -> None:
         """Updates the overall status based on status queue info.
 
@@ -178,7 +209,7 @@ class Job:
             requested_job_id not in self._job
             or self._job[requested_job_id]["status"] not in self.TERMINAL_STATES
         ):
-            self._job.update(self._client.fetch_jobs([requested_job_id]))
+            self._job.update(self._fetch_jobs([requested_job_id]))
         requested_job_status = self._job[requested_job_id]["status"]
         return requested_job_status
 
@@ -296,12 +327,28 @@ class Job:
             self._refresh_job()
 
         if index is None:
-            serialized_circuits = [self._job[job_id][circuit_type] for job_id in job_ids]
-            return [css.deserialize_circuits(serialized)[0] for serialized in serialized_circuits]
+            return [self._deserialize_circuit(job_id, circuit_type).copy() for job_id in job_ids]
 
         gss.validation.validate_integer_param(index, min_val=0)
-        serialized_circuit = self._job[job_ids[index]][circuit_type]
-        return css.deserialize_circuits(serialized_circuit)[0]
+        return self._deserialize_circuit(job_ids[index], circuit_type).copy()
+
+    def _deserialize_circuit(self, job_id: str, circuit_type: str) -> cirq.Circuit:
+        """Deserializes a circuit from the job data, reusing the result of previous calls.
+
+        Args:
+            job_id: The id of the (sub-)job containing the circuit.
+            circuit_type: The kind of circuit to deserialize. Either "input_circuit" or
+                "compiled_circuit".
+
+        Returns:
+            The deserialized circuit, which is shared with later calls and so must not be modified.
+        """
+        serialized_circuit = self._job[job_id][circuit_type]
+        cached = self._circuits.get((job_id, circuit_type))
+        if cached is None or cached[0] != serialized_circuit:
+            cached = (serialized_circuit, css.deserialize_circuits(serialized_circuit)[0])
+            self._circuits[job_id, circuit_type] = cached
+        return cached[1]
 
     @overload
     def compiled_circuits(self, index: int) -> cirq.Circuit: ...
@@ -386,7 +433,7 @@ class Job:
         self,
         index: int,
         timeout_seconds: int = 7200,
-        polling_seconds: float = 1.0,
+        polling_seconds: float | None = None,
         qubit_indices: Sequence[int] | None = None,
     ) -> dict[str, int]: ...
 
@@ -395,7 +442,7 @@ class Job:
         self,
         index: None = None,
         timeout_seconds: int = 7200,
-        polling_seconds: float = 1.0,
+        polling_seconds: float | None = None,
         qubit_indices: Sequence[int] | None = None,
     ) -> list[dict[str, int]]: ...
 
@@ -403,7 +450,7 @@ class Job:
         self,
         index: int | None = None,
         timeout_seconds: int = 7200,
-        polling_seconds: float = 1.0,
+        polling_seconds: float | None = None,
         qubit_indices: Sequence[int] | None = None,
     ) -> dict[str, int] | list[dict[str, int]]:
         """Polls the Superstaq API for counts results (frequency of each measurement outcome).
@@ -411,7 +458,8 @@ class Job:
         Args:
             index: The index of the circuit which the counts correspond to.
             timeout_seconds: The total number of seconds to poll for.
-            polling_seconds: The interval with which to poll.
+            polling_seconds: An optional fixed interval with which to poll. By default the interval
+                is chosen by the client's `gss.PollingStrategy`.
             qubit_indices: If provided, only include measurements counts of these qubits.
 
         Returns:
@@ -424,15 +472,16 @@ class Job:
             ~gss.SuperstaqServerException: If unable to get the results from the API.
             TimeoutError: If no results are available in the provided timeout interval.
         """
-        time_waited_seconds: float = 0.0
-        while (status := self.status(index)) not in self.TERMINAL_STATES:
-            # Status does a refresh.
-            if time_waited_seconds > timeout_seconds:
-                raise TimeoutError(
-                    f"Timed out while waiting for results. Final status was '{status}'"
-                )
-            time.sleep(polling_seconds)
-            time_waited_seconds += polling_seconds
+        schedule = self._polling_strategy(polling_seconds).start()
+        with gss.polling.waiting(self):
+            while (status := self.status(index)) not in self.TERMINAL_STATES:
+                # Status does a refresh.
+                if schedule.waited_seconds > timeout_seconds:
+                    raise TimeoutError(
+                        f"Timed out while waiting for results. Final status was '{status}'"
+                    )
+                time.sleep(schedule.next_interval(status))
+        schedule.finish()
 
         self._check_if_unsuccessful(index)
         job_ids = self._job_id.split(",")
@@ -451,6 +500,127 @@ class Job:
             return _get_marginal_counts(single_counts, qubit_indices)
         return single_counts
 
+    @overload
+    async def counts_async(
+        self,
+        index: int,
+        timeout_seconds: int = 7200,
+        polling_seconds: float | None = None,
+        qubit_indices: Sequence[int] | None = None,
+    ) -> dict[str, int]: ...
+
+    @overload
+    async def counts_async(
+        self,
+        index: None = None,
+        timeout_seconds: int = 7200,
+        polling_seconds: float | None = None,
+        qubit_indices: Sequence[int] | None = None,
+    ) -> list[dict[str, int]]: ...
+
+    async def counts_async(
+        self,
+        index: int | None = None,
+        timeout_seconds: int = 7200,
+        polling_seconds: float | None = None,
+        qubit_indices: Sequence[int] | None = None,
+    ) -> dict[str, int] | list[dict[str, int]]:
+        """Asynchronously polls the Superstaq API for counts results.
+
+        Identical to `counts`, except that status requests run in the client's worker pool and
+        the event loop is free to run other tasks (such as polling other jobs) while waiting.
+
+        Args:
+            index: The index of the circuit which the counts correspond to.
+            timeout_seconds: The total number of seconds to poll for.
+            polling_seconds: An optional fixed interval with which to poll. By default the interval
+                is chosen by the client's `gss.PollingStrategy`.
+            qubit_indices: If provided, only include measurements counts of these qubits.
+
+        Returns:
+            A dictionary containing the frequency counts of the measurements the job indexed by
+            `index` or a list of such dictionaries for each respective sub-job.
+
+        Raises:
+            ~gss.SuperstaqUnsuccessfulJobException: If the job failed or has been
+                canceled or deleted.
+            ~gss.SuperstaqServerException: If unable to get the results from the API.
+            TimeoutError: If no results are available in the provided timeout interval.
+        """
+        async_client = self._client.get_async_client()
+        schedule = self._polling_strategy(polling_seconds).start()
+        with gss.polling.waiting(self):
+            while (
+                status := await async_client.run(self.status, index)
+            ) not in self.TERMINAL_STATES:
+                if schedule.waited_seconds > timeout_seconds:
+                    raise TimeoutError(
+                        f"Timed out while waiting for results. Final status was '{status}'"
+                    )
+                await asyncio.sleep(schedule.next_interval(status))
+        schedule.finish()
+
+        return self.counts(index, qubit_indices=qubit_indices)
+
+    @overload
+    def counts_array(
+        self, index: int, timeout_seconds: int = 7200, polling_seconds: float | None = None
+    ) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64 | np.float64]]: ...
+
+    @overload
+    def counts_array(
+        self, index: None = None, timeout_seconds: int = 7200, polling_seconds: float | None = None
+    ) -> list[tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64 | np.float64]]]: ...
+
+    def counts_array(
+        self,
+        index: int | None = None,
+        timeout_seconds: int = 7200,
+        polling_seconds: float | None = None,
+    ) -> (
+        tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64 | np.float64]]
+        | list[tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64 | np.float64]]]
+    ):
+        """Polls the Superstaq API for counts results, returning them as arrays.
+
+        The arrays are built once (when the results are first requested) and are read-only, so
+        slicing them (e.g. `outcomes[:, 2:5]` to select a range of qubits) doesn't copy any data.
+
+        Args:
+            index: The index of the circuit which the counts correspond to.
+            timeout_seconds: The total number of seconds to poll for.
+            polling_seconds: An optional fixed interval with which to poll. By default the interval
+                is chosen by the client's `gss.PollingStrategy`.
+
+        Returns:
+            A tuple `(outcomes, counts)`, where `outcomes` is a two-dimensional array of bits with
+            one row per measured outcome (and one column per character of the bitstrings returned
+            by `counts`), and `counts` is an array of the number of times each outcome was
+            measured. If `index` is None, a list of such tuples for each respective sub-job.
+
+        Raises:
+            ~gss.SuperstaqUnsuccessfulJobException: If the job failed or has been
+                canceled or deleted.
+            ~gss.SuperstaqServerException: If unable to get the results from the API.
+            TimeoutError: If no results are available in the provided timeout interval.
+        """
+        _ = self.counts(index, timeout_seconds=timeout_seconds, polling_seconds=polling_seconds)
+
+        job_ids = self._job_id.split(",")
+        if index is not None:
+            job_ids = [job_ids[index]]
+
+        arrays = []
+        for job_id in job_ids:
+            samples = self._job[job_id]["samples"]
+            cached = self._counts_arrays.get(job_id)
+            if cached is None or cached[0] is not samples:
+                cached = (samples, gss.Counts.from_dict(samples))
+                self._counts_arrays[job_id] = cached
+            arrays.append((cached[1].outcomes, cached[1].counts))
+
+        return arrays if index is None else arrays[0]
+
     def to_dict(self) -> dict[str, gss.typing.Job]:
         """Refreshes and returns job information.
 
@@ -491,6 +661,100 @@ class Job:
         return sub_job
 
 
+def _iter_finished(
+    jobs: Iterable[css.Job], timeout_seconds: float, polling_seconds: float | None
+) -> Iterator[tuple[css.Job, int]]:
+    """Polls the sub-jobs of many jobs from a single loop, updating each as soon as it finishes.
+
+    Args:
+        jobs: The jobs to poll.
+        timeout_seconds: The total number of seconds to poll for.
+        polling_seconds: An optional fixed interval with which to poll. By default the interval is
+            chosen by the `gss.PollingStrategy` of the client of the first job.
+
+    Yields:
+        A tuple `(job, index)` for each sub-job, in the order in which they reach a terminal state.
+
+    Raises:
+        ~gss.SuperstaqServerException: If unable to get the status of the jobs from the API.
+        TimeoutError: If some sub-jobs are still unfinished after `timeout_seconds`.
+    """
+    sub_jobs = []
+    for job in jobs:
+        for index, job_id in enumerate(job.job_id().split(",")):
+            if job._job.get(job_id, {}).get("status") in Job.TERMINAL_STATES:
+                yield job, index
+            else:
+                sub_jobs.append((job, index, job_id))
+
+    polled = gss.polling.as_completed(
+        [(job._client, job_id) for job, _, job_id in sub_jobs],
+        Job.TERMINAL_STATES,
+        timeout_seconds=timeout_seconds,
+        polling_strategy=(
+            None if polling_seconds is None else gss.PollingStrategy.fixed(polling_seconds)
+        ),
+    )
+    for position, job_data in polled:
+        job, index, job_id = sub_jobs[position]
+        job._job[job_id] = job_data
+        if all(sub_job_id in job._job for sub_job_id in job.job_id().split(",")):
+            job._update_status_queue_info()
+        yield job, index
+
+
+def wait(
+    jobs: Iterable[css.Job], timeout_seconds: float = 7200, polling_seconds: float | None = None
+) -> None:
+    """Waits for every sub-job of the given jobs to reach a terminal state.
+
+    All of the jobs are polled from a single loop, with batched `/fetch_jobs` requests.
+
+    Args:
+        jobs: The jobs to wait for.
+        timeout_seconds: The total number of seconds to poll for.
+        polling_seconds: An optional fixed interval with which to poll. By default the interval is
+            chosen by the `gss.PollingStrategy` of the client of the first job.
+
+    Raises:
+        ~gss.SuperstaqServerException: If unable to get the status of the jobs from the API.
+        TimeoutError: If some jobs are still unfinished after `timeout_seconds`.
+    """
+    for _ in _iter_finished(jobs, timeout_seconds, polling_seconds):
+        pass
+
+
+def as_completed(
+    jobs: Iterable[css.Job], timeout_seconds: float = 7200, polling_seconds: float | None = None
+) -> Iterator[tuple[css.Job, int, dict[str, int]]]:
+    """Polls many jobs from a single loop, yielding the counts of each circuit as soon as they are
+    available, e.g.:
+
+    .. code-block:: python
+
+        for job, index, counts in css.as_completed(jobs):
+            process(job.input_circuits(index), counts)
+
+    Args:
+        jobs: The jobs to poll.
+        timeout_seconds: The total number of seconds to poll for.
+        polling_seconds: An optional fixed interval with which to poll. By default the interval is
+            chosen by the `gss.PollingStrategy` of the client of the first job.
+
+    Yields:
+        A tuple `(job, index, counts)` for each circuit (where `index` is the index of the circuit
+        in `job`), in the order in which they finish.
+
+    Raises:
+        ~gss.SuperstaqUnsuccessfulJobException: If any of the sub-jobs failed or have been
+            canceled or deleted.
+        ~gss.SuperstaqServerException: If unable to get the results from the API.
+        TimeoutError: If some jobs are still unfinished after `timeout_seconds`.
+    """
+    for job, index in _iter_finished(jobs, timeout_seconds, polling_seconds):
+        yield job, index, job.counts(index)
+
+
 def _get_marginal_counts(counts: dict[str, int], indices: Sequence[int]) -> dict[str, int]:
     """Compute a marginal distribution, accumulating total counts on specific bits (by index).
 
@@ -501,8 +765,4 @@ def _get_marginal_counts(counts: dict[str, int], indices: Sequence[int]) -> dict
     Returns:
         A dictionary of counts on the target indices.
     """
-    target_counts: dict[str, int] = collections.defaultdict(int)
-    for bitstring, count in counts.items():
-        target_key = "".join([bitstring[index] for index in indices])
-        target_counts[target_key] += count
-    return dict(target_counts)
+    return gss.Counts.from_dict(counts).marginalize(indices).to_dict()
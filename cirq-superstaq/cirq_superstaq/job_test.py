@@ -14,11 +14,13 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest import mock
 
 import cirq
 import general_superstaq as gss
+import numpy as np
 import pytest
 import requests
 
@@ -335,6 +337,35 @@ def test_multi_circuit_job(multi_circuit_job: css.Job) -> None:
         assert multi_circuit_job.counts(index=2, qubit_indices=[0]) == {"0": 26, "1": 24}
 
 
+def test_counts_array(multi_circuit_job: css.Job) -> None:
+    job_info = {
+        f"job_id{i}": {"status": "Done", "samples": {"000": 8, "010": 18, "110": 9}}
+        for i in range(1, 4)
+    }
+    multi_circuit_job._job = job_info
+
+    arrays = multi_circuit_job.counts_array()
+    assert len(arrays) == 3
+    outcomes, counts = multi_circuit_job.counts_array(index=1)
+    assert outcomes.dtype == np.uint8
+    np.testing.assert_array_equal(outcomes, [[0, 0, 0], [0, 1, 0], [1, 1, 0]])
+    np.testing.assert_array_equal(counts, [8, 18, 9])
+    np.testing.assert_array_equal(arrays[2][0], outcomes)
+    np.testing.assert_array_equal(arrays[2][1], counts)
+
+    # The arrays are only built once, and slices of them are views
+    outcomes_again, counts_again = multi_circuit_job.counts_array(index=1)
+    assert outcomes_again is outcomes
+    assert counts_again is counts
+    assert np.shares_memory(outcomes[:, 1:], outcomes)
+    with pytest.raises(ValueError, match="read-only"):
+        outcomes[0, 0] = 1
+
+    # They are rebuilt if the samples change
+    multi_circuit_job._job["job_id2"] = {"status": "Done", "samples": {"1": 2}}
+    np.testing.assert_array_equal(multi_circuit_job.counts_array(index=1)[0], [[1]])
+
+
 def test_input_circuit(job: css.Job) -> None:
     input_circuit = cirq.Circuit(cirq.H(cirq.q(0)), cirq.measure(cirq.q(0)))
     job_dict = {
@@ -352,6 +383,33 @@ def test_input_circuit(job: css.Job) -> None:
     assert job.input_circuits(index=0) == input_circuit
 
 
+def test_circuits_deserialized_once(job: css.Job) -> None:
+    input_circuit = cirq.Circuit(cirq.H(cirq.q(0)), cirq.measure(cirq.q(0)))
+    compiled_circuit = cirq.Circuit(cirq.X(cirq.q(0)), cirq.measure(cirq.q(0)))
+    job_dict = {
+        "status": "Done",
+        "input_circuit": css.serialize_circuits(input_circuit),
+        "compiled_circuit": css.serialize_circuits(compiled_circuit),
+    }
+
+    with patched_requests({"job_id": job_dict}), mock.patch(
+        "cirq_superstaq.deserialize_circuits", wraps=css.deserialize_circuits
+    ) as mock_deserialize:
+        for _ in range(3):
+            assert job.input_circuits() == [input_circuit]
+            assert job.compiled_circuits(index=0) == compiled_circuit
+        assert mock_deserialize.call_count == 2
+
+        # Returned circuits are copies, so modifying them doesn't affect the job
+        job.input_circuits(index=0).append(cirq.X(cirq.q(1)))
+        assert job.input_circuits(index=0) == input_circuit
+
+        # Circuits are deserialized again if the job data changes
+        job._job["job_id"]["input_circuit"] = css.serialize_circuits(compiled_circuit)
+        assert job.input_circuits(index=0) == compiled_circuit
+        assert mock_deserialize.call_count == 3
+
+
 def test_job_status_refresh() -> None:
     completed_job_dict = {"new_job_id": {"status": "Done"}}
 
@@ -405,6 +463,35 @@ def test_job_counts(job: css.Job, job_dict: dict[str, object]) -> None:
         assert job.counts(index=0, qubit_indices=[0]) == ({"1": 1})
         assert job.counts() == [{"10": 1}]
 
+    # Fractional counts (e.g. from measurement error mitigation) aren't truncated
+    job_result = modifiy_job_result(job_dict, samples={"01": 1.5, "11": 2.5})
+    job._job = {}
+    with patched_requests({"job_id": job_result}):
+        assert job.counts(index=0, qubit_indices=[1]) == {"1": 4.0}
+        assert job.counts(index=0, qubit_indices=[0]) == {"0": 1.5, "1": 2.5}
+
+
+def test_job_polling_is_coalesced(job: css.Job, job_dict: dict[str, object]) -> None:
+    other_job = css.Job(job._client, "other_job_id")
+    running_job = {"status": "Running"}
+    with patched_requests(
+        {"job_id": running_job},
+        {"other_job_id": running_job},
+        {"job_id": job_dict, "other_job_id": job_dict},
+    ) as mocked_requests:
+        with mock.patch("time.monotonic", return_value=0):
+            assert job.status() == "Running"
+            assert other_job.status() == "Running"
+        assert mocked_requests.call_count == 2
+
+        # While the other job is waiting for its results, polling of both jobs is done in a single
+        # request
+        with gss.polling.waiting(other_job), mock.patch("time.monotonic", return_value=5):
+            assert job.status() == "Done"
+            assert other_job.status(index=0) == "Done"
+        assert mocked_requests.call_count == 3
+        assert mocked_requests.call_args.kwargs["json"]["job_ids"] == ["job_id", "other_job_id"]
+
 
 def test_job_counts_failed(job: css.Job, job_dict: dict[str, object]) -> None:
     job_result = modifiy_job_result(job_dict, status="Failed", failure={"error": "too many qubits"})
@@ -428,6 +515,22 @@ def test_job_counts_poll(
         mock_sleep.assert_called_once()
 
 
+@mock.patch("time.sleep", return_value=None)
+def test_job_counts_poll_adaptive(
+    mock_sleep: mock.MagicMock, job: css.Job, job_dict: dict[str, object]
+) -> None:
+    job._client.polling_strategy = gss.PollingStrategy(jitter=0)
+    statuses = [{"job_id": {"status": status}} for status in ["Queued", "Running", "Running"]]
+    with patched_requests(*statuses, {"job_id": job_dict}):
+        assert job.counts(index=0) == {"11": 1}
+
+    # Queued jobs are polled slowly, and running jobs more often
+    assert mock_sleep.call_args_list == [mock.call(2.0), mock.call(1.0), mock.call(1.0)]
+    stats = job._client.polling_strategy.stats
+    assert (stats.num_polls, stats.num_waits, stats.added_latency_seconds) == (4, 1, 1.0)
+    assert stats.sleep_seconds == pytest.approx(4.0)
+
+
 @mock.patch("time.sleep", return_value=None)
 @mock.patch("time.time", side_effect=range(20))
 def test_job_counts_poll_timeout(
@@ -442,6 +545,28 @@ def test_job_counts_poll_timeout(
     assert mock_sleep.call_count == 11
 
 
+def test_job_counts_async(job: css.Job, job_dict: dict[str, object]) -> None:
+    ready_job = {
+        "status": "Ready",
+    }
+    with patched_requests({"job_id": ready_job}, {"job_id": job_dict}) as mocked_requests:
+        results = asyncio.run(job.counts_async(index=0, polling_seconds=0))
+        assert results == {"11": 1}
+        assert mocked_requests.call_count == 2
+
+        assert asyncio.run(job.counts_async(qubit_indices=[1])) == [{"1": 1}]
+        assert mocked_requests.call_count == 2
+
+
+def test_job_counts_async_timeout(job: css.Job) -> None:
+    ready_job = {
+        "status": "Ready",
+    }
+    with patched_requests(*[{"job_id": ready_job}] * 20):
+        with pytest.raises(TimeoutError, match="Ready"):
+            _ = asyncio.run(job.counts_async(timeout_seconds=1, polling_seconds=0.1))
+
+
 @mock.patch("time.sleep", return_value=None)
 def test_job_results_poll_failure(mock_sleep: mock.MagicMock, job: css.Job) -> None:
     running_job = {
@@ -496,3 +621,46 @@ def test_get_marginal_counts() -> None:
     counts_dict = {"10": 50, "11": 50}
     indices = [0]
     assert css.job._get_marginal_counts(counts_dict, indices) == ({"1": 100})
+
+
+def test_as_completed_and_wait() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    server = css.testing.fake_superstaq_server()
+    server.install(service)
+
+    circuits = [
+        cirq.Circuit(cirq.X(cirq.q(0)), cirq.measure(cirq.q(0))),
+        cirq.Circuit(cirq.measure(cirq.q(0))),
+    ]
+    job_1 = service.create_job(circuits, 10, target="ss_unconstrained_simulator")
+    job_2 = service.create_job(circuits[1], 10, target="ss_unconstrained_simulator")
+
+    # All sub-jobs are fetched in a single request
+    assert list(css.as_completed([job_1, job_2], polling_seconds=0)) == [
+        (job_1, 0, {"1": 10}),
+        (job_1, 1, {"0": 10}),
+        (job_2, 0, {"0": 10}),
+    ]
+    assert server.request_counts["/fetch_jobs"] == 1
+    assert job_1._overall_status == "Done"
+
+    # Finished jobs are not refetched
+    css.wait([job_1, job_2])
+    assert [index for _, index, _ in css.as_completed([job_1])] == [0, 1]
+    assert server.request_counts["/fetch_jobs"] == 1
+
+    server.queue_seconds = 100
+    job_3 = service.create_job(circuits[0], 10, target="ss_unconstrained_simulator")
+    with pytest.raises(TimeoutError, match="1 job"):
+        css.wait([job_1, job_3], timeout_seconds=0)
+
+
+def test_as_completed_failure() -> None:
+    client = mock.MagicMock()
+    client.fetch_jobs.return_value = {"job_id": {"status": "Failed", "failure": {"error": "oops"}}}
+    job = css.Job(client, "job_id")
+
+    css.wait([job])
+    assert job.status() == "Failed"
+    with pytest.raises(gss.SuperstaqUnsuccessfulJobException, match="oops"):
+        _ = list(css.as_completed([job]))
@@ -11,8 +11,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """A `cirq.Sampler` implementation for the Superstaq API."""
+
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Sequence
+
 import cirq
 
 import cirq_superstaq as css
@@ -66,8 +70,8 @@ class Sampler(cirq.Sampler):
         """Runs a sweep for the given circuit.
 
         Note:
-            This creates jobs for each of the sweeps in the given sweepable, and then
-            blocks until all of jobs are complete.
+            This creates a single job running the circuit with every resolver in the given
+            sweepable (see `run_batch`), and then blocks until it is complete.
 
         Args:
             program: The circuit to sample from.
@@ -77,14 +81,157 @@ class Sampler(cirq.Sampler):
         Returns:
             A list of Cirq results, one for each parameter resolver.
         """
-        resolvers = [resolver for resolver in cirq.to_resolvers(params)]
-        job = self._service.create_job(
-            circuits=[cirq.resolve_parameters(program, resolver) for resolver in resolvers],
-            repetitions=repetitions,
-            target=self._target,
+        return self.run_batch([program], [params], repetitions)[0]
+
+    def run_batch(
+        self,
+        programs: Sequence[cirq.AbstractCircuit],
+        params_list: Sequence[cirq.Sweepable] | None = None,
+        repetitions: int | Sequence[int] = 1,
+    ) -> list[list[cirq.ResultDict]]:
+        """Runs the given circuits, each with its own parameter sweep.
+
+        Note:
+            Every circuit is submitted along with its parameter sweep at once, in a single job
+            for each distinct number of repetitions (which may be split further if the batch is
+            too large for one request). If the target supports it, each symbolic circuit is sent
+            once along with a table of parameter values; otherwise every resolved circuit is sent
+            (see `css.Service.create_job`). All of the jobs are then polled together, blocking
+            until they are complete.
+
+        Args:
+            programs: The circuits to sample from.
+            params_list: The parameter sweeps to use with each circuit. Defaults to no sweep.
+            repetitions: The number of times to sample, either for all circuits or a list with one
+                value for each circuit. Defaults to 1.
+
+        Returns:
+            A list containing, for each circuit, a list of Cirq results (one for each parameter
+            resolver in its sweep).
+
+        Raises:
+            ValueError: If the lengths of `programs`, `params_list`, or `repetitions` don't match.
+        """
+        batch = _SweepBatch(
+            programs, *self._normalize_batch_args(programs, params_list, repetitions)
         )
-        cirq_results = [
-            css.service.counts_to_results(job.counts(i), program, resolver)
-            for i, resolver in enumerate(resolvers)
+        jobs = [
+            self._service.create_job(
+                circuits=circuits, repetitions=reps, target=self._target, sweeps=sweeps
+            )
+            for reps, (circuits, sweeps) in batch.sweeps_by_repetitions().items()
         ]
-        return cirq_results
+        css.wait(jobs)
+        return batch.to_results([job.counts() for job in jobs])
+
+    async def run_sweep_async(
+        self,
+        program: cirq.AbstractCircuit,
+        params: cirq.Sweepable,
+        repetitions: int = 1,
+    ) -> list[cirq.ResultDict]:
+        """Asynchronously runs a sweep for the given circuit (see `run_sweep`).
+
+        Args:
+            program: The circuit to sample from.
+            params: The parameters to run with program.
+            repetitions: The number of times to sample. Defaults to 1.
+
+        Returns:
+            A list of Cirq results, one for each parameter resolver.
+        """
+        return (await self.run_batch_async([program], [params], repetitions))[0]
+
+    async def run_batch_async(
+        self,
+        programs: Sequence[cirq.AbstractCircuit],
+        params_list: Sequence[cirq.Sweepable] | None = None,
+        repetitions: int | Sequence[int] = 1,
+    ) -> list[list[cirq.ResultDict]]:
+        """Asynchronously runs the given circuits, each with its own parameter sweep (see
+        `run_batch`).
+
+        Args:
+            programs: The circuits to sample from.
+            params_list: The parameter sweeps to use with each circuit. Defaults to no sweep.
+            repetitions: The number of times to sample, either for all circuits or a list with one
+                value for each circuit. Defaults to 1.
+
+        Returns:
+            A list containing, for each circuit, a list of Cirq results (one for each parameter
+            resolver in its sweep).
+
+        Raises:
+            ValueError: If the lengths of `programs`, `params_list`, or `repetitions` don't match.
+        """
+        batch = _SweepBatch(
+            programs, *self._normalize_batch_args(programs, params_list, repetitions)
+        )
+        jobs = await asyncio.gather(
+            *(
+                self._service.create_job_async(
+                    circuits=circuits, repetitions=reps, target=self._target, sweeps=sweeps
+                )
+                for reps, (circuits, sweeps) in batch.sweeps_by_repetitions().items()
+            )
+        )
+        return batch.to_results(await asyncio.gather(*(job.counts_async() for job in jobs)))
+
+
+class _SweepBatch:
+    """The circuits of a batch of parameter sweeps, grouped by their numbers of repetitions."""
+
+    def __init__(
+        self,
+        programs: Sequence[cirq.AbstractCircuit],
+        params_list: Sequence[cirq.Sweepable],
+        repetitions: Sequence[int],
+    ) -> None:
+        """Initializes a `_SweepBatch`.
+
+        Args:
+            programs: The circuits to sample from.
+            params_list: The parameter sweep to use with each circuit.
+            repetitions: The number of times to sample each circuit.
+        """
+        self.programs = list(programs)
+        self.resolvers = [list(cirq.to_resolvers(params)) for params in params_list]
+
+        # Map each number of repetitions to the indices of the programs using it
+        self.program_indices: dict[int, list[int]] = {}
+        for i, reps in enumerate(repetitions):
+            if self.resolvers[i]:
+                self.program_indices.setdefault(reps, []).append(i)
+
+    def sweeps_by_repetitions(
+        self,
+    ) -> dict[int, tuple[list[cirq.AbstractCircuit], list[list[cirq.ParamResolver]]]]:
+        """Groups the (unresolved) circuits of the batch by their numbers of repetitions.
+
+        Returns:
+            A dictionary mapping each number of repetitions to the circuits to run with it, along
+            with the parameter resolvers to use with each of them.
+        """
+        return {
+            reps: ([self.programs[i] for i in indices], [self.resolvers[i] for i in indices])
+            for reps, indices in self.program_indices.items()
+        }
+
+    def to_results(self, counts: Sequence[Sequence[dict[str, int]]]) -> list[list[cirq.ResultDict]]:
+        """Converts the counts of each job (as created from `sweeps_by_repetitions`) to results.
+
+        Args:
+            counts: The counts of each resolved circuit, grouped by job.
+
+        Returns:
+            A list containing, for each circuit, a list of Cirq results (one for each parameter
+            resolver in its sweep).
+        """
+        results: list[list[cirq.ResultDict]] = [[] for _ in self.programs]
+        for indices, job_counts in zip(self.program_indices.values(), counts):
+            runs = ((i, resolver) for i in indices for resolver in self.resolvers[i])
+            for (i, resolver), circuit_counts in zip(runs, job_counts):
+                results[i].append(
+                    css.service.counts_to_results(circuit_counts, self.programs[i], resolver)
+                )
+        return results
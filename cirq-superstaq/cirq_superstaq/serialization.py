@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import gzip
 import importlib.util
+import json
+import numbers
 import warnings
 from collections.abc import Sequence
+from typing import Any
 
 import cirq
+import general_superstaq as gss
 
 import cirq_superstaq as css
 
@@ -13,19 +18,42 @@ SUPERSTAQ_RESOLVERS = [
     css.ops.qubit_gates.custom_resolver,
 ]
 
+COMPACT_FORMAT_VERSION = 1
+"""The version of the compact circuit format generated by `serialize_circuits_compact()`."""
 
-def serialize_circuits(circuits: cirq.AbstractCircuit | Sequence[cirq.AbstractCircuit]) -> str:
+
+@gss.instrumentation.timed("css.serialize_circuits")
+def serialize_circuits(
+    circuits: cirq.AbstractCircuit | Sequence[cirq.AbstractCircuit],
+    max_workers: int | None = None,
+) -> str:
     """Serialize circuit(s) into a json string.
 
     Args:
         circuits: A `cirq.Circuit` or list of `cirq.Circuits` to be serialized.
+        max_workers: Optionally, the maximum number of worker processes with which to serialize a
+            list of circuits in parallel (see `gss.serialization.map_chunks`). The result is the
+            same either way.
 
     Returns:
         A string representing the serialized circuit(s).
     """
-    return cirq.to_json(circuits)
+    if isinstance(circuits, cirq.AbstractCircuit):
+        return cirq.to_json(circuits)
+
+    serialized_chunks = gss.serialization.map_chunks(_serialize_chunk, circuits, max_workers)
+    if len(serialized_chunks) == 1:
+        return serialized_chunks[0]
+
+    # Splice the elements of each (indented) json list into a single list
+    return "[\n" + ",\n".join(chunk[2:-2] for chunk in serialized_chunks) + "\n]"
+
 
+def _serialize_chunk(circuits: Sequence[cirq.AbstractCircuit]) -> str:
+    return cirq.to_json(list(circuits))
 
+
+@gss.instrumentation.timed("css.deserialize_circuits")
 def deserialize_circuits(serialized_circuits: str) -> list[cirq.Circuit]:
     """Deserialize serialized circuit(s).
 
@@ -42,6 +70,199 @@ def deserialize_circuits(serialized_circuits: str) -> list[cirq.Circuit]:
     return circuits
 
 
+def serialize_circuits_compact(
+    circuits: cirq.AbstractCircuit | Sequence[cirq.AbstractCircuit], compress: bool = False
+) -> str:
+    """Serialize circuit(s) into a compact json string, in which each distinct gate and qubit is
+    only stored once.
+
+    The result contains a table of the distinct gates and a table of the distinct qubits (both
+    serialized with `cirq.to_json`), and for each moment of each circuit an array of integers in
+    which every operation is encoded as the index of its gate followed by the indices of its
+    qubits. Gates are deduplicated by their json serializations (rather than by equality, which
+    e.g. doesn't distinguish `cirq.Z**2` from `cirq.Z**0`). Any operations which aren't plain gate
+    operations (e.g. tagged operations or subcircuits) are stored in the gate table as a whole.
+
+    Args:
+        circuits: A `cirq.Circuit` or list of `cirq.Circuits` to be serialized.
+        compress: Whether to gzip the json string (and then base64-encode it).
+
+    Returns:
+        A string representing the serialized circuit(s).
+    """
+    if isinstance(circuits, cirq.AbstractCircuit):
+        circuits = [circuits]
+
+    gates: list[cirq.Gate | cirq.Operation] = []
+    qubits: list[cirq.Qid] = []
+    gate_indices: dict[object, int] = {}
+    qubit_indices: dict[object, int] = {}
+
+    # Only serialize each distinct gate object once (every one is kept alive by `circuits`)
+    gate_indices_by_id: dict[int, int] = {}
+
+    def _gate_index(gate: cirq.Gate | cirq.Operation) -> int:
+        index = gate_indices_by_id.get(id(gate))
+        if index is None:
+            key = cirq.to_json(gate, indent=None)
+            index = gate_indices_by_id[id(gate)] = _table_index(gates, gate_indices, gate, key)
+        return index
+
+    encoded_circuits = []
+    for circuit in circuits:
+        encoded_moments = []
+        for moment in circuit:
+            encoded_moment = []
+            for op in moment:
+                if isinstance(op, cirq.GateOperation):
+                    encoded_moment.append(_gate_index(op.gate))
+                    encoded_moment.extend(_table_index(qubits, qubit_indices, q) for q in op.qubits)
+                else:
+                    encoded_moment.append(_gate_index(op))
+            encoded_moments.append(encoded_moment)
+        encoded_circuits.append(encoded_moments)
+
+    serialized_circuits = cirq.to_json(
+        {
+            "version": COMPACT_FORMAT_VERSION,
+            "gates": gates,
+            "qubits": qubits,
+            "circuits": encoded_circuits,
+        },
+        indent=None,
+    )
+    if compress:
+        return gss.serialization.bytes_to_str(gzip.compress(serialized_circuits.encode()))
+    return serialized_circuits
+
+
+def _table_index(
+    table: list[Any], indices: dict[object, int], value: object, key: object = None
+) -> int:
+    """Finds (or adds) a value in a table of distinct values.
+
+    Args:
+        table: The table of distinct values.
+        indices: A dictionary mapping the key of each value in the table to its index.
+        value: The value to look up.
+        key: Optionally, the key identifying `value`. Defaults to `value` itself (and its type).
+
+    Returns:
+        The index of `value` in `table`.
+    """
+    if key is None:
+        key = (type(value), value)
+    index = indices.get(key)
+    if index is None:
+        index = indices[key] = len(table)
+        table.append(value)
+    return index
+
+
+def deserialize_circuits_compact(serialized_circuits: str) -> list[cirq.Circuit]:
+    """Deserialize circuit(s) serialized via `serialize_circuits_compact()`.
+
+    Args:
+        serialized_circuits: A string generated via `serialize_circuits_compact()` (with or
+            without compression).
+
+    Returns:
+        A list containing the deserialized circuits.
+
+    Raises:
+        ValueError: If `serialized_circuits` uses an unsupported version of the compact format.
+    """
+    if not serialized_circuits.startswith("{"):
+        serialized_circuits = gzip.decompress(
+            gss.serialization.str_to_bytes(serialized_circuits)
+        ).decode()
+
+    resolvers = [*SUPERSTAQ_RESOLVERS, *cirq.DEFAULT_RESOLVERS]
+    data = cirq.read_json(json_text=serialized_circuits, resolvers=resolvers)
+    if data.get("version") != COMPACT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported compact circuit format version: {data.get('version')!r}.")
+
+    gates = data["gates"]
+    qubits = data["qubits"]
+    num_qubits = [cirq.num_qubits(gate) if isinstance(gate, cirq.Gate) else 0 for gate in gates]
+
+    circuits = []
+    for encoded_moments in data["circuits"]:
+        moments = []
+        for encoded_moment in encoded_moments:
+            ops = []
+            i = 0
+            while i < len(encoded_moment):
+                gate_index = encoded_moment[i]
+                gate = gates[gate_index]
+                stop = i + 1 + num_qubits[gate_index]
+                if isinstance(gate, cirq.Gate):
+                    ops.append(gate.on(*(qubits[j] for j in encoded_moment[i + 1 : stop])))
+                else:
+                    ops.append(gate)
+                i = stop
+            moments.append(cirq.Moment(ops))
+        circuits.append(cirq.Circuit.from_moments(*moments))
+
+    return circuits
+
+
+def serialize_sweeps(sweeps: Sequence[Sequence[cirq.ParamResolver]]) -> str:
+    """Serializes the parameter resolvers of each of a list of circuits into compact tables.
+
+    Each table stores the values assigned to each parameter column-wise, e.g.
+    `{"num_resolvers": 3, "params": {"theta": [0.0, 0.5, 1.0]}}`, so that a symbolic circuit and
+    its table can be submitted in place of one resolved copy of the circuit per resolver.
+
+    Args:
+        sweeps: A list containing the parameter resolvers to use with each circuit.
+
+    Returns:
+        A json string containing one table for each circuit.
+
+    Raises:
+        ValueError: If the resolvers cannot be represented this way, i.e. if any assign non-real
+            values, or if the resolvers of a circuit don't all assign the same parameters.
+    """
+    tables = []
+    for resolvers in sweeps:
+        rows: list[dict[str, float]] = []
+        for resolver in resolvers:
+            row = {}
+            for key, value in resolver.param_dict.items():
+                if not isinstance(value, numbers.Real):
+                    raise ValueError(f"Cannot serialize the non-real value {value!r} of {key!r}.")
+                row[str(key)] = float(value)
+
+            if len(row) != len(resolver.param_dict) or (rows and row.keys() != rows[0].keys()):
+                raise ValueError("Every resolver of a circuit must assign the same parameters.")
+            rows.append(row)
+
+        names = rows[0].keys() if rows else ()
+        params = {name: [row[name] for row in rows] for name in names}
+        tables.append({"num_resolvers": len(rows), "params": params})
+
+    return json.dumps(tables)
+
+
+def deserialize_sweeps(serialized_sweeps: str) -> list[list[cirq.ParamResolver]]:
+    """Deserializes tables of parameter values generated via `serialize_sweeps()`.
+
+    Args:
+        serialized_sweeps: A json string generated via `serialize_sweeps()`.
+
+    Returns:
+        A list containing the parameter resolvers to use with each circuit.
+    """
+    return [
+        [
+            cirq.ParamResolver({name: values[i] for name, values in table["params"].items()})
+            for i in range(table["num_resolvers"])
+        ]
+        for table in json.loads(serialized_sweeps)
+    ]
+
+
 def deserialize_qiskit_circuits(
     serialized_qiskit_circuits: str,
     circuits_is_list: bool,
@@ -1,7 +1,14 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+import json
+from unittest import mock
+
 import cirq
+import general_superstaq as gss
+import numpy as np
+import pytest
+import sympy
 
 import cirq_superstaq as css
 
@@ -18,3 +25,112 @@ def test_serialization() -> None:
     serialized_circuits = css.serialization.serialize_circuits(circuits)
     assert isinstance(serialized_circuits, str)
     assert css.serialization.deserialize_circuits(serialized_circuits) == circuits
+
+
+def test_serialization_parallel() -> None:
+    qubits = cirq.LineQubit.range(2)
+    circuits = [cirq.Circuit(cirq.rx(0.1 * i).on(qubits[0]), css.ZX(*qubits)) for i in range(10)]
+
+    serialized_circuits = css.serialization.serialize_circuits(circuits, max_workers=2)
+    assert serialized_circuits == css.serialization.serialize_circuits(circuits)
+    assert css.serialization.deserialize_circuits(serialized_circuits) == circuits
+
+
+def test_serialization_compact() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    t0, t1 = cirq.LineQid.range(2, dimension=3)
+    ops = [
+        css.ZZSwapGate(0.1).on(q0, q1),
+        css.ZX(q0, q1),
+        (css.ZX**0.5).on(q1, q2),
+        css.AceCR("+-").on(q0, q1),
+        css.AceCR("-+", sandwich_rx_rads=0.2).on(q1, q2),
+        css.barrier(q0, q1, q2),
+        css.Barrier(qid_shape=(2, 3)).on(q0, t0),
+        css.ParallelGates(cirq.X, css.ZX).on(q0, q1, q2),
+        css.RGate(0.1, 0.2).on(q0),
+        css.ParallelRGate(0.1, 0.2, 3).on(q0, q1, q2),
+        css.ops.qubit_gates.IXGate().on(q2),
+        css.StrippedCZGate(0.3).on(q0, q1),
+        css.DD(q1, q2),
+        css.AQTICCX(q0, q1, q2),
+        cirq.ms(1.23).on(q0, q1),
+        css.QuditSwapGate(3).on(t0, t1),
+        css.BSWAP(t0, t1),
+        css.CZ3(t0, t1),
+        css.VirtualZPowGate(dimension=3, level=2, exponent=0.5).on(t0),
+        css.QutritZ0(t0),
+        css.QutritZ1(t1),
+        css.QutritZ2(t0),
+        css.QubitSubspaceGate(cirq.X, (3,)).on(t1),
+        cirq.X(q0).with_tags("tag"),
+        cirq.CircuitOperation(cirq.FrozenCircuit(cirq.CZ(q0, q1))),
+        cirq.global_phase_operation(1j),
+    ]
+    circuits = [cirq.Circuit(ops), cirq.Circuit(ops[::-1]), cirq.Circuit()]
+
+    serialized_circuits = css.serialization.serialize_circuits_compact(circuits)
+    assert css.serialization.deserialize_circuits_compact(serialized_circuits) == circuits
+    assert len(json.loads(serialized_circuits)["gates"]) == len(ops)
+    assert len(serialized_circuits) < len(css.serialization.serialize_circuits(circuits))
+
+    compressed_circuits = css.serialization.serialize_circuits_compact(circuits[0], compress=True)
+    assert css.serialization.deserialize_circuits_compact(compressed_circuits) == circuits[:1]
+
+    # Equal gates of different types are never merged
+    circuit = cirq.Circuit(cirq.X(q0), cirq.XPowGate()(q1), cirq.rx(np.pi)(q0), cirq.X(q1))
+    serialized_circuits = css.serialization.serialize_circuits_compact(circuit)
+    assert len(json.loads(serialized_circuits)["gates"]) == 3
+    assert css.serialization.deserialize_circuits_compact(serialized_circuits) == [circuit]
+
+    # Gates are deduplicated by their json serializations (not by equality)
+    circuit = cirq.Circuit(cirq.Z(q0) ** 2, cirq.Z(q1) ** 0, cirq.Z(q0) ** 2)
+    assert cirq.Z**2 == cirq.Z**0
+    serialized_circuits = css.serialization.serialize_circuits_compact(circuit)
+    assert len(json.loads(serialized_circuits)["gates"]) == 2
+    new_circuit = css.serialization.deserialize_circuits_compact(serialized_circuits)[0]
+    assert cirq.to_json(new_circuit) == cirq.to_json(circuit)
+    assert repr(new_circuit) == repr(circuit)
+
+    with pytest.raises(ValueError, match="Unsupported compact circuit format version: 2"):
+        _ = css.serialization.deserialize_circuits_compact(
+            serialized_circuits.replace('"version": 1', '"version": 2')
+        )
+
+
+def test_serialization_instrumentation() -> None:
+    circuit = cirq.Circuit(cirq.X(cirq.LineQubit(0)))
+
+    events: list[gss.instrumentation.Event] = []
+    with gss.instrumentation.listening(events.append):
+        _ = css.serialization.deserialize_circuits(css.serialization.serialize_circuits(circuit))
+
+    assert events == [
+        gss.instrumentation.TimingEvent("css.serialize_circuits", mock.ANY),
+        gss.instrumentation.TimingEvent("css.deserialize_circuits", mock.ANY),
+    ]
+
+
+def test_serialize_sweeps() -> None:
+    theta, phi = sympy.symbols("theta phi")
+    sweeps = [
+        list(cirq.to_resolvers(cirq.Linspace(theta, 0, 1, 3) * cirq.Points("phi", [2]))),
+        [cirq.ParamResolver()],
+        [],
+    ]
+    serialized_sweeps = css.serialization.serialize_sweeps(sweeps)
+    assert json.loads(serialized_sweeps) == [
+        {"num_resolvers": 3, "params": {"theta": [0.0, 0.5, 1.0], "phi": [2.0, 2.0, 2.0]}},
+        {"num_resolvers": 1, "params": {}},
+        {"num_resolvers": 0, "params": {}},
+    ]
+    assert css.serialization.deserialize_sweeps(serialized_sweeps) == sweeps
+
+    with pytest.raises(ValueError, match="non-real"):
+        _ = css.serialization.serialize_sweeps([[cirq.ParamResolver({theta: 1j})]])
+    with pytest.raises(ValueError, match="same parameters"):
+        _ = css.serialization.serialize_sweeps(
+            [[cirq.ParamResolver({theta: 1}), cirq.ParamResolver({phi: 1})]]
+        )
+    with pytest.raises(ValueError, match="same parameters"):
+        _ = css.serialization.serialize_sweeps([[cirq.ParamResolver({theta: 1, "theta": 2})]])
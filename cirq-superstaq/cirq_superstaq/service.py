@@ -11,12 +11,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Service to access Superstaqs API."""
+
 from __future__ import annotations
 
+import collections
 import numbers
 import warnings
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, overload
 
 import cirq
@@ -61,10 +63,136 @@ def _to_matrix_gate(matrix: npt.ArrayLike) -> cirq.MatrixGate:
     )
 
 
+def _measurement_key_slices(
+    circuit: cirq.AbstractCircuit, measurement_key_names: Sequence[str]
+) -> dict[str, slice] | None:
+    """Finds the columns of the combined measurement bitstrings belonging to each measurement key.
+
+    Args:
+        circuit: The measured circuit.
+        measurement_key_names: The (sorted) measurement key names of `circuit`.
+
+    Returns:
+        A dictionary mapping each measurement key name to the slice of its bits in the combined
+        bitstrings, or None if these could not be determined (e.g. because a key is measured more
+        than once).
+    """
+    widths: dict[str, int] = {}
+    for op in circuit.all_operations():
+        if isinstance(op.gate, cirq.MeasurementGate):
+            key = cirq.measurement_key_name(op)
+            if key in widths:
+                return None
+            widths[key] = cirq.num_qubits(op)
+
+    if sorted(widths) != list(measurement_key_names):
+        return None
+
+    slices = {}
+    start = 0
+    for key in measurement_key_names:
+        slices[key] = slice(start, start + widths[key])
+        start += widths[key]
+    return slices
+
+
+def _key_to_str(key: str | cirq.Qid | Iterable[cirq.Qid]) -> str:
+    if isinstance(key, str):
+        return key
+    if isinstance(key, cirq.Qid):
+        return str(key)
+    return ",".join(str(q) for q in key)
+
+
+def _tuple_of_big_endian_int(bit_groups: tuple[npt.NDArray[np.uint8], ...]) -> tuple[int, ...]:
+    return tuple(cirq.big_endian_bits_to_int(bits) for bits in bit_groups)
+
+
+class HistogramResult(cirq.ResultDict):
+    """A `cirq.ResultDict` which stores a histogram of outcomes rather than every shot.
+
+    Per-shot measurement arrays are only materialized when `measurements`, `records`, or `data`
+    are first accessed. Histograms (via `histogram` or `multi_measurement_histogram`) are computed
+    directly from the stored counts, so for large numbers of repetitions they are much cheaper than
+    with an ordinary `cirq.ResultDict`.
+    """
+
+    def __init__(
+        self,
+        *,
+        params: cirq.ParamResolver,
+        counts: gss.Counts,
+        key_slices: Mapping[str, slice],
+    ) -> None:
+        """Initializes a `HistogramResult`.
+
+        Args:
+            params: A `cirq.ParamResolver` of settings used for this result.
+            counts: The counts of each combined measurement outcome.
+            key_slices: A dictionary mapping each measurement key name to the columns of its bits
+                in `counts.outcomes`.
+        """
+        super().__init__(params=params)
+        self._measurements = None
+        self._records = None
+        self._counts = counts
+        self._key_slices = dict(key_slices)
+
+    @property
+    def counts(self) -> gss.Counts:
+        """The counts of each (combined) measurement outcome."""
+        return self._counts
+
+    @property
+    def measurements(self) -> Mapping[str, npt.NDArray[np.uint8]]:
+        if self._measurements is None:
+            samples = np.repeat(self._counts.outcomes, self._counts.counts.astype(int), axis=0)
+            self._measurements = {key: samples[:, cols] for key, cols in self._key_slices.items()}
+        return self._measurements
+
+    @property
+    def repetitions(self) -> int:
+        return self._counts.shots
+
+    def multi_measurement_histogram(
+        self,
+        *,
+        keys: Iterable[str | cirq.Qid | Iterable[cirq.Qid]],
+        fold_func: Callable[[tuple[npt.NDArray[np.uint8], ...]], Any] = _tuple_of_big_endian_int,
+    ) -> collections.Counter[Any]:
+        """Counts the number of times combined measurement results occurred.
+
+        Equivalent to `cirq.Result.multi_measurement_histogram`, but `fold_func` is only called
+        once per distinct outcome.
+
+        Args:
+            keys: Keys of measurements to include in the histogram.
+            fold_func: A function used to convert sampled measurement results into countable
+                values. Its input is a tuple containing the bits measured for each key.
+
+        Returns:
+            A counter indicating how often measurements sampled various results.
+        """
+        key_slices = [self._key_slices[_key_to_str(key)] for key in keys]
+        indices = [index for cols in key_slices for index in range(cols.start, cols.stop)]
+        counts = self._counts.marginalize(indices)
+
+        # The columns of each key in the marginal outcomes
+        stops = np.cumsum([cols.stop - cols.start for cols in key_slices], dtype=int).tolist()
+        bounds = list(zip([0, *stops], stops))
+
+        histogram: collections.Counter[Any] = collections.Counter()
+        for outcome, count in zip(counts.outcomes, counts.counts.tolist()):
+            if count:
+                histogram[fold_func(tuple(outcome[start:stop] for start, stop in bounds))] += count
+        return histogram
+
+
 def counts_to_results(
     counter: Mapping[str, float],
     circuit: cirq.AbstractCircuit,
     param_resolver: cirq.ParamResolver,
+    lazy: bool = False,
 ) -> cirq.ResultDict:
     """Converts a `collections.Counter` to a `cirq.ResultDict`.
 
@@ -72,6 +200,10 @@ def counts_to_results(
         counter: The `collections.Counter` of counts for the run.
         circuit: The circuit to run.
         param_resolver: A `cirq.ParamResolver` to resolve parameters in `circuit`.
+        lazy: If True, returns a `HistogramResult` (which only materializes per-shot measurements
+            when they are accessed), with measurements split by measurement key (where possible).
+            Otherwise the measurements of all keys are combined into a single array, whose key is
+            the concatenation of the sorted measurement key names.
 
     Returns:
         A `cirq.ResultDict` for the given circuit and counter.
@@ -82,7 +214,6 @@ def counts_to_results(
     # Combines all the measurement key names into a string: {'0', '1'} -> "01"
     combine_key_names = "".join(measurement_key_names)
 
-    samples: list[list[int]] = []
     if not all(counts == int(counts) for counts in counter.values()):
         warnings.warn(
             "The raw counts contain fractional values due to measurement error mitigation; please "
@@ -95,26 +226,68 @@ def counts_to_results(
             "use service.get_counts to see raw results.",
             stacklevel=2,
         )
-    for key, counts_of_key in counter.items():
-        # Combines the keys of the counter into a list. If key = "01", keys_as_list = [0, 1]
-        keys_as_list: list[int] = list(map(int, key))
-
-        # Gets execution counts per bitstring, e.g., collections.Counter({"01": 48, "11": 52})["01"]
-        # = 48. Per execution shot, appends bitstring to `samples` list. E.g., if counter is
-        # collections.Counter({"01": 48, "11": 52}), [0, 1] is appended 48 times and [1, 1] is
-        # appended 52 times.
-        counts_of_key = round(counts_of_key)
-        for _ in range(counts_of_key):
-            samples.append(keys_as_list)
-
-    result = cirq.ResultDict(
+
+    # Each bitstring is repeated round(counts_of_key) times (or not at all if this is negative)
+    rounded_counter = {key: max(round(counts_of_key), 0) for key, counts_of_key in counter.items()}
+    key_slices = _measurement_key_slices(circuit, measurement_key_names)
+    num_bits = sum(cols.stop - cols.start for cols in (key_slices or {}).values())
+    counts = gss.Counts.from_dict(rounded_counter, num_bits=None if counter else num_bits)
+
+    if key_slices is None or num_bits != counts.num_bits:
+        key_slices = {combine_key_names: slice(0, counts.num_bits)}
+
+    if lazy:
+        return HistogramResult(params=param_resolver, counts=counts, key_slices=key_slices)
+
+    # Measurements are (default) integer arrays, with a one-dimensional empty array if there are
+    # no shots, as they were when built from a list of per-shot bit lists
+    samples = np.repeat(counts.outcomes.astype(int), counts.counts.astype(int), axis=0)
+    return cirq.ResultDict(
         params=param_resolver,
-        measurements={
-            combine_key_names: np.array(samples),
-        },
+        measurements={combine_key_names: samples if len(samples) else np.array([])},
     )
 
-    return result
+
+COMPACT_CIRCUITS_MIN_OPERATIONS = 1000
+"""The minimum number of operations in a batch of circuits for it to be submitted in the compact
+"cirq_compact" format (if the target supports it)."""
+
+
+def _serialize_job_circuits(
+    circuits: cirq.AbstractCircuit | Sequence[cirq.AbstractCircuit],
+    resolvers: Sequence[Sequence[cirq.ParamResolver]] | None,
+    max_workers: int | None = None,
+    compact: bool = False,
+) -> dict[str, str]:
+    """Serializes circuits (and optionally their parameter sweeps) for a `create_job` request.
+
+    Args:
+        circuits: The circuit or list of circuits to serialize.
+        resolvers: Optionally, the parameter resolvers to submit with each circuit.
+        max_workers: Optionally, the maximum number of worker processes with which to serialize
+            `circuits` in parallel (if not using the compact format).
+        compact: Whether to serialize `circuits` in the compact "cirq_compact" format.
+
+    Returns:
+        The `serialized_circuits` argument of the client's `create_job` method.
+    """
+    if compact:
+        serialized_circuits = {
+            "cirq_compact_circuits": css.serialization.serialize_circuits_compact(
+                circuits, compress=True
+            )
+        }
+    else:
+        serialized_circuits = {
+            "cirq_circuits": css.serialization.serialize_circuits(circuits, max_workers)
+        }
+    if resolvers is not None:
+        serialized_circuits["cirq_sweeps"] = css.serialization.serialize_sweeps(resolvers)
+    return serialized_circuits
+
+
+def _payload_size(serialized_circuits: Mapping[str, str]) -> int:
+    return sum(len(serialized) for serialized in serialized_circuits.values())
 
 
 class Service(gss.service.Service):
@@ -138,6 +311,13 @@ class Service(gss.service.Service):
         ibmq_token: str | None = None,
         ibmq_instance: str | None = None,
         ibmq_channel: str | None = None,
+        retry_policy: gss.RetryPolicy | None = None,
+        request_compression: str | None = None,
+        compression_threshold_bytes: int = 64 * 1024,
+        metadata_cache: gss.MetadataCache | None = None,
+        job_store: gss.JobStore | None = None,
+        polling_strategy: gss.PollingStrategy | None = None,
+        compile_cache: gss.CompileCache | None = None,
         **kwargs: object,
     ) -> None:
         """Creates the Service to access Superstaq's API.
@@ -170,6 +350,23 @@ class Service(gss.service.Service):
                 to IBM hardware, or to access non-public IBM devices you may have access to.
             ibmq_instance: An optional instance to use when running IBM jobs.
             ibmq_channel: The type of IBM account. Must be either "ibm_quantum" or "ibm_cloud".
+            retry_policy: An optional `gss.RetryPolicy` configuring how failed requests are
+                retried (e.g. with jitter, additional retriable status codes, or a circuit
+                breaker).
+            request_compression: Optionally compress large request bodies (such as batches of
+                serialized circuits) using this encoding. Either "gzip" or "deflate".
+            compression_threshold_bytes: The minimum size (in bytes) of a request body to be
+                compressed, if `request_compression` is set.
+            metadata_cache: An optional `gss.MetadataCache` in which to cache target information
+                and target lists. The same cache can be shared by multiple services and providers.
+            job_store: An optional `gss.JobStore` in which to save finished jobs, so that they are
+                never refetched (even by other processes).
+            polling_strategy: An optional `gss.PollingStrategy` choosing the intervals with which
+                jobs are polled while waiting for their results. The same strategy (and its
+                statistics) can be shared by multiple services and providers.
+            compile_cache: An optional `gss.CompileCache` in which to cache the results of
+                `compile` (and the target-specific compile methods) for each circuit, so that
+                unchanged circuits are never recompiled.
             kwargs: Other optimization and execution parameters.
 
         Raises:
@@ -187,6 +384,13 @@ class Service(gss.service.Service):
             ibmq_token=ibmq_token,
             ibmq_instance=ibmq_instance,
             ibmq_channel=ibmq_channel,
+            retry_policy=retry_policy,
+            request_compression=request_compression,
+            compression_threshold_bytes=compression_threshold_bytes,
+            metadata_cache=metadata_cache,
+            job_store=job_store,
+            polling_strategy=polling_strategy,
+            compile_cache=compile_cache,
             **kwargs,
         )
 
@@ -244,9 +448,11 @@ class Service(gss.service.Service):
         Returns:
             The counts from running the circuit(s).
         """
-        resolved_circuits = cirq.resolve_parameters(circuits, param_resolver)
-        job = self.create_job(resolved_circuits, int(repetitions), target, method, **kwargs)
-        if isinstance(circuits, cirq.Circuit):
+        sweeps = [param_resolver] * (
+            1 if isinstance(circuits, cirq.AbstractCircuit) else len(circuits)
+        )
+        job = self.create_job(circuits, int(repetitions), target, method, sweeps=sweeps, **kwargs)
+        if isinstance(circuits, cirq.AbstractCircuit):
             return job.counts(0)
         return [job.counts(i) for i in range(len(circuits))]
 
@@ -297,10 +503,12 @@ class Service(gss.service.Service):
         Returns:
             The `cirq.ResultDict` object(s) from running the circuit(s).
         """
-        resolved_circuits = cirq.resolve_parameters(circuits, param_resolver)
-        job = self.create_job(resolved_circuits, int(repetitions), target, method, **kwargs)
+        sweeps = [param_resolver] * (
+            1 if isinstance(circuits, cirq.AbstractCircuit) else len(circuits)
+        )
+        job = self.create_job(circuits, int(repetitions), target, method, sweeps=sweeps, **kwargs)
 
-        if isinstance(circuits, cirq.Circuit):
+        if isinstance(circuits, cirq.AbstractCircuit):
             return counts_to_results(job.counts(0), circuits, param_resolver)
         return [
             counts_to_results(job.counts(i), circuit, param_resolver)
@@ -325,6 +533,8 @@ class Service(gss.service.Service):
         repetitions: int = 1000,
         target: str | None = None,
         method: str | None = None,
+        sweeps: Sequence[cirq.Sweepable] | None = None,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> css.job.Job:
         """Creates a new job to run the given circuit(s).
@@ -334,26 +544,31 @@ class Service(gss.service.Service):
             repetitions: The number of times to repeat the circuit. Defaults to 1000.
             target: Where to run the job.
             method: The optional execution method.
+            sweeps: An optional parameter sweep for each circuit, in which case each circuit is
+                run once for every parameter resolver in its sweep. If the target supports it
+                (i.e. its `target_info` includes "supports_parameter_binding"), the symbolic
+                circuits are submitted along with tables of parameter values and resolved by the
+                server; otherwise they are resolved before submission.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the submission of large batches).
             kwargs: Other optimization and execution parameters.
 
         Returns:
-            A `css.Job` which can be queried for status or results.
+            A `css.Job` which can be queried for status or results. If `sweeps` is provided, it
+            contains a sub-job for each circuit and parameter resolver (in order).
 
         Raises:
-            ValueError: If there are no measurements in `circuits`.
+            ValueError: If there are no measurements in `circuits`, or if `sweeps` is provided but
+                does not contain exactly one sweep per circuit.
             ~gss.SuperstaqServerException: If there was an error accessing the API.
         """
-        css.validation.validate_cirq_circuits(circuits, require_measurements=True)
-        serialized_circuits = css.serialization.serialize_circuits(circuits)
-
-        target = self._resolve_target(target)
-        result = self._client.create_job(
-            serialized_circuits={"cirq_circuits": serialized_circuits},
-            repetitions=repetitions,
-            target=target,
-            method=method,
-            **kwargs,
+        job_requests = self._get_create_job_requests(
+            circuits, repetitions, target, method, sweeps, max_workers, **kwargs
         )
+        if len(job_requests) == 1:
+            result = self._client.create_job(**job_requests[0])
+        else:
+            result = self._client.create_jobs(job_requests)
         # Make a virtual job_id that aggregates all of the individual jobs
         # into a single one that comma-separates the individual jobs.
         job_id = ",".join(result["job_ids"])
@@ -362,6 +577,233 @@ class Service(gss.service.Service):
         # when the new job's status is first queried
         return self.get_job(job_id=job_id)
 
+    async def create_job_async(
+        self,
+        circuits: cirq.AbstractCircuit | Sequence[cirq.AbstractCircuit],
+        repetitions: int = 1000,
+        target: str | None = None,
+        method: str | None = None,
+        sweeps: Sequence[cirq.Sweepable] | None = None,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> css.job.Job:
+        """Asynchronously creates a new job to run the given circuit(s).
+
+        Circuit serialization and the request itself run in the client's worker pool, so many
+        jobs can be submitted concurrently (e.g. using `asyncio.gather`) without blocking the
+        event loop.
+
+        Args:
+            circuits: The circuit or list of circuits to run.
+            repetitions: The number of times to repeat the circuit. Defaults to 1000.
+            target: Where to run the job.
+            method: The optional execution method.
+            sweeps: An optional parameter sweep for each circuit, in which case each circuit is
+                run once for every parameter resolver in its sweep. If the target supports it
+                (i.e. its `target_info` includes "supports_parameter_binding"), the symbolic
+                circuits are submitted along with tables of parameter values and resolved by the
+                server; otherwise they are resolved before submission.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the submission of large batches).
+            kwargs: Other optimization and execution parameters.
+
+        Returns:
+            A `css.Job` which can be queried for status or results. If `sweeps` is provided, it
+            contains a sub-job for each circuit and parameter resolver (in order).
+
+        Raises:
+            ValueError: If there are no measurements in `circuits`, or if `sweeps` is provided but
+                does not contain exactly one sweep per circuit.
+            ~gss.SuperstaqServerException: If there was an error accessing the API.
+        """
+        async_client = self._client.get_async_client()
+        job_requests = await async_client.run(
+            self._get_create_job_requests,
+            circuits,
+            repetitions,
+            target,
+            method,
+            sweeps,
+            max_workers,
+            **kwargs,
+        )
+        if len(job_requests) == 1:
+            result = await async_client.create_job(**job_requests[0])
+        else:
+            result = await async_client.create_jobs(job_requests)
+        job_id = ",".join(result["job_ids"])
+        return self.get_job(job_id=job_id)
+
+    def _get_create_job_requests(
+        self,
+        circuits: cirq.AbstractCircuit | Sequence[cirq.AbstractCircuit],
+        repetitions: int,
+        target: str | None,
+        method: str | None,
+        sweeps: Sequence[cirq.Sweepable] | None = None,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """Validates and serializes circuits into the arguments of `create_job` requests.
+
+        Batches with at least `COMPACT_CIRCUITS_MIN_OPERATIONS` operations are serialized in the
+        compact "cirq_compact" format if the target supports it (falling back to `cirq.to_json`).
+        Batches whose serialized size exceeds `gss.superstaq_client.MAX_JOB_PAYLOAD_BYTES` are
+        split into several requests, which are then submitted as separate jobs.
+
+        Args:
+            circuits: The circuit or list of circuits to run.
+            repetitions: The number of times to repeat the circuit.
+            target: Where to run the job.
+            method: The optional execution method.
+            sweeps: An optional parameter sweep for each circuit.
+            max_workers: The maximum number of worker processes with which to serialize `circuits`.
+            kwargs: Other optimization and execution parameters.
+
+        Returns:
+            A list of dictionaries of keyword arguments for the client's `create_job` method.
+        """
+        css.validation.validate_cirq_circuits(circuits, require_measurements=True)
+        target = self._resolve_target(target)
+
+        resolvers = None
+        if sweeps is not None:
+            circuits, resolvers = self._prepare_sweeps(circuits, sweeps, target)
+
+        compact = self._supports_compact_circuits(circuits, target)
+        all_serialized_circuits = [
+            _serialize_job_circuits(circuits, resolvers, max_workers, compact)
+        ]
+        max_payload_bytes = superstaq_client.MAX_JOB_PAYLOAD_BYTES
+        is_oversized = _payload_size(all_serialized_circuits[0]) > max_payload_bytes
+        if is_oversized and not isinstance(circuits, cirq.AbstractCircuit):
+            sizes = [
+                _payload_size(
+                    _serialize_job_circuits(
+                        circuit, resolvers and resolvers[i : i + 1], compact=compact
+                    )
+                )
+                for i, circuit in enumerate(circuits)
+            ]
+            chunks = superstaq_client.split_batch(sizes, max_payload_bytes=max_payload_bytes)
+            all_serialized_circuits = [
+                _serialize_job_circuits(
+                    circuits[chunk.start : chunk.stop],
+                    resolvers and resolvers[chunk.start : chunk.stop],
+                    max_workers,
+                    compact,
+                )
+                for chunk in chunks
+            ]
+
+        return [
+            {
+                "serialized_circuits": serialized_chunk,
+                "repetitions": repetitions,
+                "target": target,
+                "method": method,
+                **kwargs,
+            }
+            for serialized_chunk in all_serialized_circuits
+        ]
+
+    def _prepare_sweeps(
+        self,
+        circuits: cirq.AbstractCircuit | Sequence[cirq.AbstractCircuit],
+        sweeps: Sequence[cirq.Sweepable],
+        target: str,
+    ) -> tuple[list[cirq.AbstractCircuit], list[list[cirq.ParamResolver]] | None]:
+        """Pairs circuits with their parameter sweeps, either for the target to resolve or by
+        resolving them client-side.
+
+        Args:
+            circuits: The circuit or list of circuits to run.
+            sweeps: A parameter sweep for each circuit.
+            target: Where the circuits will be run.
+
+        Returns:
+            The circuits to submit, and either the parameter resolvers to submit with each one
+            (if the target will resolve them) or None (if the circuits have already been
+            resolved, in which case there is one circuit per resolver).
+
+        Raises:
+            ValueError: If there is not exactly one sweep per circuit.
+        """
+        circuits = [circuits] if isinstance(circuits, cirq.AbstractCircuit) else list(circuits)
+        if len(sweeps) != len(circuits):
+            raise ValueError("Exactly one parameter sweep must be provided for each circuit.")
+
+        # Only look up whether the target can bind parameters if it would save submitting several
+        # resolved copies of a circuit
+        resolvers = [list(cirq.to_resolvers(sweep)) for sweep in sweeps]
+        if any(
+            len(circuit_resolvers) > 1 and cirq.is_parameterized(circuit)
+            for circuit, circuit_resolvers in zip(circuits, resolvers)
+        ) and self._supports_parameter_binding(target):
+            try:
+                _ = css.serialization.serialize_sweeps(resolvers)
+            except ValueError:
+                pass  # Fall back to resolving the circuits client-side
+            else:
+                return circuits, resolvers
+
+        resolved_circuits = [
+            cirq.resolve_parameters(circuit, resolver)
+            for circuit, circuit_resolvers in zip(circuits, resolvers)
+            for resolver in circuit_resolvers
+        ]
+        return resolved_circuits, None
+
+    def _supports_parameter_binding(self, target: str) -> bool:
+        """Whether a target can resolve symbolic circuits itself, given tables of parameter values
+        (as reported by the "supports_parameter_binding" field of its `target_info`).
+
+        Args:
+            target: The target to check.
+
+        Returns:
+            True if symbolic circuits can be submitted to `target` along with parameter sweeps.
+        """
+        return self._get_target_info(target).get("supports_parameter_binding") is True
+
+    def _supports_compact_circuits(
+        self, circuits: cirq.AbstractCircuit | Sequence[cirq.AbstractCircuit], target: str
+    ) -> bool:
+        """Whether to submit circuits in the compact "cirq_compact" format, i.e. whether they
+        contain enough operations for it to matter and the target accepts it (as reported by the
+        "supported_circuit_types" field of its `target_info`).
+
+        Args:
+            circuits: The circuit or list of circuits to submit.
+            target: Where the circuits will be run.
+
+        Returns:
+            True if `circuits` should be serialized with `serialize_circuits_compact()`.
+        """
+        if isinstance(circuits, cirq.AbstractCircuit):
+            circuits = [circuits]
+
+        num_operations = sum(len(moment) for circuit in circuits for moment in circuit)
+        if num_operations < COMPACT_CIRCUITS_MIN_OPERATIONS:
+            return False
+
+        supported_circuit_types = self._get_target_info(target).get("supported_circuit_types")
+        return (
+            isinstance(supported_circuit_types, list) and "cirq_compact" in supported_circuit_types
+        )
+
+    def _get_target_info(self, target: str) -> dict[str, Any]:
+        """Gets the `target_info` of a target, to check which features it supports. This is cached
+        by the client's `metadata_cache` (if set).
+
+        Args:
+            target: The target to look up.
+
+        Returns:
+            The target's `target_info` dictionary.
+        """
+        return self._client.target_info(target)["target_info"]
+
     def get_job(self, job_id: str) -> css.job.Job:
         """Gets a job that has been created on the Superstaq API.
 
@@ -488,6 +930,7 @@ class Service(gss.service.Service):
         gateset: Mapping[str, Sequence[Sequence[int]]] | None = None,
         pulses: object = None,
         variables: object = None,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> css.compiler_output.CompilerOutput:
         """Compiles and optimizes the given circuit(s) for the Advanced Quantum Testbed (AQT).
@@ -516,6 +959,8 @@ class Service(gss.service.Service):
                 values indicate which qubit(s) they act upon.
             pulses: Qtrl `PulseManager` or file path for pulse configuration.
             variables: Qtrl `VariableManager` or file path for variable configuration.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the compilation of large batches).
             kwargs: Other desired compile options.
 
         Returns:
@@ -532,7 +977,7 @@ class Service(gss.service.Service):
             raise ValueError(f"{target!r} is not a valid AQT target.")
 
         css.validation.validate_cirq_circuits(circuits)
-        serialized_circuits = css.serialization.serialize_circuits(circuits)
+        serialized_circuits = css.serialization.serialize_circuits(circuits, max_workers)
         circuits_is_list = not isinstance(circuits, cirq.Circuit)
 
         request_json = {
@@ -567,7 +1012,11 @@ class Service(gss.service.Service):
             }
 
         request_json["options"] = cirq.to_json(options_dict)
-        json_dict = self._client.post_request("/aqt_compile", request_json)
+        json_dict = self._compile_with_cache(
+            "/aqt_compile",
+            request_json,
+            lambda request: self._client.post_request("/aqt_compile", request),
+        )
         return css.compiler_output.read_json_aqt(json_dict, circuits_is_list, num_eca_circuits)
 
     def qscout_compile(
@@ -579,6 +1028,7 @@ class Service(gss.service.Service):
         base_entangling_gate: str = "xx",
         num_qubits: int | None = None,
         error_rates: SupportsItems[tuple[int, ...], float] | None = None,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> css.compiler_output.CompilerOutput:
         """Compiles and optimizes the given circuit(s) for the QSCOUT trapped-ion testbed at
@@ -611,6 +1061,8 @@ class Service(gss.service.Service):
                 for gates acting on those qubits (for example `{(0, 1): 0.3, (1, 2): 0.2}`) . If
                 provided, Superstaq will attempt to map the circuit to minimize the total error on
                 each qubit. Omitted qubit pairs are assumed to be error-free.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the compilation of large batches).
             kwargs: Other desired qscout_compile options.
 
         Returns:
@@ -630,7 +1082,7 @@ class Service(gss.service.Service):
             raise ValueError("base_entangling_gate must be 'xx', 'zz', 'sxx', or 'szz'")
 
         css.validation.validate_cirq_circuits(circuits)
-        serialized_circuits = css.serialization.serialize_circuits(circuits)
+        serialized_circuits = css.serialization.serialize_circuits(circuits, max_workers)
         circuits_is_list = not isinstance(circuits, cirq.Circuit)
 
         options_dict = {
@@ -661,12 +1113,13 @@ class Service(gss.service.Service):
             raise ValueError(f"At least {max_circuit_qubits} qubits are required for this input.")
         options_dict["num_qubits"] = num_qubits
 
-        json_dict = self._client.qscout_compile(
-            {
-                "cirq_circuits": serialized_circuits,
-                "options": cirq.to_json(options_dict),
-                "target": target,
-            }
+        request_json = {
+            "cirq_circuits": serialized_circuits,
+            "options": cirq.to_json(options_dict),
+            "target": target,
+        }
+        json_dict = self._compile_with_cache(
+            "/qscout_compile", request_json, self._client.qscout_compile
         )
 
         return css.compiler_output.read_json_qscout(json_dict, circuits_is_list)
@@ -769,6 +1222,7 @@ class Service(gss.service.Service):
         self,
         circuits: cirq.Circuit | Sequence[cirq.Circuit],
         target: str,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> css.compiler_output.CompilerOutput:
         """Compiles the given circuit(s) to the target device's native gateset.
@@ -776,6 +1230,8 @@ class Service(gss.service.Service):
         Args:
             circuits: The circuit(s) to compile.
             target: String of target device.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the compilation of large batches).
             kwargs: Other desired compile options.
 
         Returns:
@@ -786,25 +1242,51 @@ class Service(gss.service.Service):
         target = self._resolve_target(target)
 
         if target.startswith("aqt_"):
-            return self.aqt_compile(circuits, **kwargs)
+            return self.aqt_compile(circuits, max_workers=max_workers, **kwargs)
         elif target.startswith("qscout_"):
-            return self.qscout_compile(circuits, **kwargs)
+            return self.qscout_compile(circuits, max_workers=max_workers, **kwargs)
 
-        request_json = self._get_compile_request_json(circuits, target, **kwargs)
+        request_json = self._get_compile_request_json(
+            circuits, target, max_workers=max_workers, **kwargs
+        )
         circuits_is_list = not isinstance(circuits, cirq.Circuit)
-        json_dict = self._client.compile(request_json)
+        json_dict = self._compile_with_cache("/compile", request_json, self._client.compile)
         return css.compiler_output.read_json(json_dict, circuits_is_list)
 
+    def _compile_with_cache(
+        self,
+        endpoint: str,
+        request_json: dict[str, str],
+        compile_fn: Callable[[dict[str, Any]], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Sends a compile request, reusing the results of any circuits in the compile cache.
+
+        Args:
+            endpoint: The compile endpoint (used to distinguish cached results).
+            request_json: The compile request.
+            compile_fn: The function which sends a compile request to `endpoint`.
+
+        Returns:
+            The json response to `request_json`.
+        """
+        compile_cache = self._client.compile_cache
+        if compile_cache is None:
+            return compile_fn(request_json)
+
+        key_parts = (self._client.url, self._client.api_key, endpoint, css.__version__)
+        return compile_cache.compile(request_json, compile_fn, key_parts)
+
     def _get_compile_request_json(
         self,
         circuits: cirq.Circuit | Sequence[cirq.Circuit],
         target: str,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> dict[str, str]:
         """Helper method to compile json dictionary."""
 
         css.validation.validate_cirq_circuits(circuits)
-        serialized_circuits = css.serialization.serialize_circuits(circuits)
+        serialized_circuits = css.serialization.serialize_circuits(circuits, max_workers)
         request_json = {
             "cirq_circuits": serialized_circuits,
             "target": target,
@@ -13,9 +13,11 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+import asyncio
 import collections
 import json
 import os
+import pathlib
 import textwrap
 from unittest import mock
 from unittest.mock import patch
@@ -66,6 +68,8 @@ def test_counts_to_results() -> None:
     )
     result = css.service.counts_to_results({"00": 50, "11": 50}, circuit, cirq.ParamResolver({}))
     assert result.histogram(key="01") == collections.Counter({0: 50, 3: 50})
+    assert result.measurements["01"].dtype == np.array([0]).dtype
+    assert result.measurements["01"].shape == (100, 2)
 
     result = css.service.counts_to_results(
         {"00": 50.0, "11": 50.0}, circuit, cirq.ParamResolver({})
@@ -85,6 +89,76 @@ def test_counts_to_results() -> None:
         assert result.histogram(key="01") == collections.Counter({3: 100})
 
 
+def test_counts_to_results_lazy() -> None:
+    qubits = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.measure(qubits[2], qubits[0], key="b"),
+        cirq.measure(qubits[1], key="a"),
+    )
+    counter = {"001": 3, "110": 1.0, "101": 2}
+    eager_result = css.service.counts_to_results(counter, circuit, cirq.ParamResolver({"x": 1}))
+    result = css.service.counts_to_results(
+        counter, circuit, cirq.ParamResolver({"x": 1}), lazy=True
+    )
+    assert isinstance(result, css.service.HistogramResult)
+    assert result.counts == gss.Counts.from_dict({"001": 3, "110": 1, "101": 2})
+    assert result.params == eager_result.params
+    assert result.repetitions == eager_result.repetitions == 6
+
+    # Histograms are computed without materializing measurements
+    assert result.histogram(key="a") == collections.Counter({0: 3, 1: 3})
+    assert result.histogram(key="b") == collections.Counter({1: 5, 2: 1})
+    assert result.multi_measurement_histogram(keys=["b", "a"]) == collections.Counter(
+        {(1, 0): 3, (2, 1): 1, (1, 1): 2}
+    )
+    assert result.multi_measurement_histogram(keys=[]) == collections.Counter({(): 6})
+    assert result._measurements is None
+
+    # Measurements are split by key
+    assert result.measurements.keys() == {"a", "b"}
+    np.testing.assert_array_equal(
+        np.hstack([result.measurements["a"], result.measurements["b"]]),
+        eager_result.measurements["ab"],
+    )
+    assert result.records["b"].shape == (6, 1, 2)
+    assert result.histogram(key="a") == collections.Counter({0: 3, 1: 3})
+    assert result.histogram(key="a", fold_func=tuple) == collections.Counter({(0,): 3, (1,): 3})
+
+    # Keys measured more than once are combined
+    circuit = cirq.Circuit(cirq.measure(qubits[0], key="a"), cirq.measure(qubits[1], key="a"))
+    result = css.service.counts_to_results({"01": 1}, circuit, cirq.ParamResolver({}), lazy=True)
+    assert result.measurements.keys() == {"a"}
+    np.testing.assert_array_equal(result.measurements["a"], [[0, 1]])
+
+    with pytest.warns(UserWarning, match="raw counts contain negative"):
+        result = css.service.counts_to_results(
+            {"00": -5, "11": 10, "01": 0}, circuit, cirq.ParamResolver({}), lazy=True
+        )
+    assert result.histogram(key="a") == collections.Counter({3: 10})
+
+    # Keys with unknown widths are combined
+    circuit = cirq.Circuit(
+        cirq.measure(qubits[0]),
+        cirq.CircuitOperation(cirq.FrozenCircuit(cirq.measure(qubits[1]))),
+    )
+    result = css.service.counts_to_results({"01": 1}, circuit, cirq.ParamResolver({}), lazy=True)
+    assert result.histogram(key="q(0)q(1)") == collections.Counter({1: 1})
+    assert result.measurements.keys() == {"q(0)q(1)"}
+
+    circuit = cirq.Circuit(cirq.measure(qubits[0]), cirq.measure(qubits[1]))
+    result = css.service.counts_to_results({"01": 1}, circuit, cirq.ParamResolver({}), lazy=True)
+    assert result.histogram(key=qubits[1]) == collections.Counter({1: 1})
+    assert result.histogram(key=[qubits[0]]) == collections.Counter({0: 1})
+
+    # Empty counts
+    circuit = cirq.Circuit(cirq.measure(*qubits, key="a"))
+    result = css.service.counts_to_results({}, circuit, cirq.ParamResolver({}), lazy=True)
+    assert result.repetitions == 0
+    assert result.measurements["a"].shape == (0, 3)
+    eager_result = css.service.counts_to_results({}, circuit, cirq.ParamResolver({}))
+    assert eager_result.measurements["a"].shape == (0,)
+
+
 def test_service_resolve_target() -> None:
     service = css.Service(api_key="key", default_target="ss_bar_qpu")
     assert service._resolve_target("ss_foo_qpu") == "ss_foo_qpu"
@@ -205,6 +279,180 @@ def test_service_sampler() -> None:
     mock_client.create_job.assert_called_once()
 
 
+def test_service_sampler_run_batch() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    qubit = cirq.LineQubit(0)
+    theta = sympy.Symbol("theta")
+    circuits = [
+        cirq.Circuit(cirq.X(qubit) ** theta, cirq.measure(qubit, key="a")),
+        cirq.Circuit(cirq.measure(qubit, key="b")),
+    ]
+    sweep = cirq.Linspace(theta, 0, 1, 2)
+    job_ids = iter(f"job_{i}" for i in range(10))
+    submitted: list[tuple[list[cirq.Circuit], int]] = []
+
+    def create_job(serialized_circuits: dict[str, str], repetitions: int, **_: object) -> object:
+        submitted.append(
+            (css.deserialize_circuits(serialized_circuits["cirq_circuits"]), repetitions)
+        )
+        return {"job_ids": [next(job_ids) for _ in submitted[-1][0]]}
+
+    def fetch_jobs(ids: list[str], **_: object) -> object:
+        return {job_id: {"status": "Done", "samples": {"1": int(job_id[4:])}} for job_id in ids}
+
+    sampler = service.sampler(target="ss_unconstrained_simulator")
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.target_info",
+        return_value={"target_info": {}},
+    ), mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.create_job", side_effect=create_job
+    ), mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.fetch_jobs", side_effect=fetch_jobs
+    ) as mock_fetch_jobs:
+        results = sampler.run_batch(circuits, [sweep, None], repetitions=3)
+
+        # Every resolved circuit is submitted as part of a single job, and polled together
+        assert submitted == [
+            (
+                [
+                    cirq.resolve_parameters(circuits[0], {theta: 0.0}),
+                    cirq.resolve_parameters(circuits[0], {theta: 1.0}),
+                    circuits[1],
+                ],
+                3,
+            )
+        ]
+        mock_fetch_jobs.assert_called_once_with(["job_0", "job_1", "job_2"])
+
+        # Results are returned in `run_batch` order
+        assert [[result.params for result in r] for r in results] == [
+            [cirq.ParamResolver({"theta": 0.0}), cirq.ParamResolver({"theta": 1.0})],
+            [cirq.ParamResolver()],
+        ]
+        assert results[0][1].histogram(key="a") == {1: 1}
+        assert results[1][0].histogram(key="b") == {1: 2}
+
+        # Circuits with different numbers of repetitions are submitted as separate jobs
+        submitted.clear()
+        results = asyncio.run(sampler.run_batch_async(circuits, [sweep, None], repetitions=[4, 5]))
+        assert [len(job_circuits) for job_circuits, _ in submitted] == [2, 1]
+        assert [repetitions for _, repetitions in submitted] == [4, 5]
+        assert results[0][0].histogram(key="a") == {1: 3}
+        assert results[1][0].histogram(key="b") == {1: 5}
+
+        result = asyncio.run(sampler.run_async(circuits[1], repetitions=7))
+        assert submitted[-1][1] == 7
+        assert result.histogram(key="b") == {1: 6}
+
+        assert sampler.run_batch([]) == []
+
+    with pytest.raises(ValueError, match="must match"):
+        _ = sampler.run_batch(circuits, [sweep])
+
+
+def test_service_sampler_parameter_binding() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    mock_client = mock.MagicMock()
+    service._client = mock_client
+    mock_client.target_info.return_value = {"target_info": {"supports_parameter_binding": True}}
+    mock_client.create_job.return_value = {"job_ids": [f"job_{i}" for i in range(4)]}
+    mock_client.fetch_jobs.side_effect = lambda ids: {
+        job_id: {"status": "Done", "samples": {"1": 1}} for job_id in ids
+    }
+
+    qubit = cirq.LineQubit(0)
+    theta = sympy.Symbol("theta")
+    circuits = [
+        cirq.Circuit(cirq.X(qubit) ** theta, cirq.measure(qubit, key="a")),
+        cirq.Circuit(cirq.Y(qubit) ** theta, cirq.measure(qubit, key="b")),
+    ]
+    sweeps = [cirq.Linspace(theta, 0, 1, 3), cirq.Points(theta, [0.25])]
+
+    sampler = service.sampler(target="ss_unconstrained_simulator")
+    results = sampler.run_batch(circuits, sweeps, repetitions=10)
+    assert [len(r) for r in results] == [3, 1]
+    assert results[0][2].params == cirq.ParamResolver({"theta": 1.0})
+    assert results[1][0].histogram(key="b") == {1: 1}
+
+    # The symbolic circuits are submitted once each, along with tables of parameter values
+    mock_client.create_job.assert_called_once_with(
+        serialized_circuits={
+            "cirq_circuits": css.serialize_circuits(circuits),
+            "cirq_sweeps": css.serialization.serialize_sweeps(
+                [list(cirq.to_resolvers(sweep)) for sweep in sweeps]
+            ),
+        },
+        repetitions=10,
+        target="ss_unconstrained_simulator",
+        method=None,
+    )
+
+    # Target information is requested from the client (which caches it in its metadata cache)
+    _ = sampler.run_batch(circuits, sweeps, repetitions=10)
+    assert mock_client.target_info.call_args_list == [mock.call("ss_unconstrained_simulator")] * 2
+
+    # Resolvers which can't be tabulated (and non-parameterized circuits) are resolved client-side
+    mock_client.create_job.reset_mock()
+    mock_client.create_job.return_value = {"job_ids": ["job_0", "job_1"]}
+    resolvers = [cirq.ParamResolver({"theta": 0.5}), cirq.ParamResolver({"theta": 0.25, "phi": 1})]
+    results = sampler.run_batch(circuits[:1], [resolvers])
+    assert [result.params for result in results[0]] == resolvers
+
+    # Circuits with a single resolver are resolved client-side, without looking up the target
+    mock_client.target_info.reset_mock()
+    mock_client.create_job.return_value = {"job_ids": ["job_0"]}
+    service.default_target = "ss_unconstrained_simulator"
+    assert service.get_counts(circuits[0], 10, param_resolver={theta: 0.5}) == {"1": 1}
+    result = service.run(circuits[0], 10, param_resolver=cirq.ParamResolver({theta: 0.5}))
+    assert result.histogram(key="a") == {1: 1}
+    mock_client.target_info.assert_not_called()
+
+    # Frozen circuits are treated as single circuits (and then rejected by validation)
+    with pytest.raises(ValueError, match="Invalid 'circuits' input"):
+        _ = service.get_counts(
+            circuits[0].freeze(), 10, param_resolver={theta: 0.5}  # type: ignore[call-overload]
+        )
+
+    resolved_circuit = cirq.resolve_parameters(circuits[0], {theta: 0.5})
+    assert [
+        css.deserialize_circuits(call.kwargs["serialized_circuits"]["cirq_circuits"])
+        for call in mock_client.create_job.call_args_list
+    ] == [
+        [cirq.resolve_parameters(circuits[0], resolver) for resolver in resolvers],
+        [resolved_circuit],
+        [resolved_circuit],
+    ]
+    for call in mock_client.create_job.call_args_list:
+        assert "cirq_sweeps" not in call.kwargs["serialized_circuits"]
+
+    with pytest.raises(ValueError, match="one parameter sweep"):
+        _ = service.create_job(circuits, 10, sweeps=sweeps[:1])
+
+
+def test_service_target_info_metadata_cache() -> None:
+    service = css.Service(
+        api_key="key", remote_host="http://example.com", metadata_cache=gss.MetadataCache()
+    )
+    qubit = cirq.LineQubit(0)
+    theta = sympy.Symbol("theta")
+    circuit = cirq.Circuit(cirq.X(qubit) ** theta, cirq.measure(qubit))
+    sweep = cirq.Linspace(theta, 0, 1, 3)
+
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.post_request",
+        return_value={"target_info": {"supports_parameter_binding": True}},
+    ) as mock_post_request, mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.create_job",
+        return_value={"job_ids": ["job_id"]},
+    ):
+        _ = service.create_job(circuit, 10, "ss_example_qpu", sweeps=[sweep])
+        _ = service.create_job(circuit, 10, "ss_example_qpu", sweeps=[sweep])
+
+    # Target information is only requested once, via the client's metadata cache
+    mock_post_request.assert_called_once()
+    assert mock_post_request.call_args.args[0] == "/target_info"
+
+
 def test_service_get_job() -> None:
     service = css.Service(api_key="key", remote_host="http://example.com")
     mock_client = mock.MagicMock()
@@ -247,6 +495,169 @@ def test_service_create_job() -> None:
     assert create_job_kwargs["fake_data"] == ""
 
 
+def test_service_create_job_compact() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    mock_client = mock.MagicMock()
+    mock_client.create_job.return_value = {"job_ids": ["job_id"], "status": "Ready"}
+    mock_client.target_info.return_value = {
+        "target_info": {"supported_circuit_types": ["cirq", "cirq_compact"]}
+    }
+    service._client = mock_client
+
+    qubits = cirq.LineQubit.range(2)
+    small_circuit = cirq.Circuit(cirq.X(qubits[0]), cirq.measure(*qubits))
+    large_circuit = cirq.Circuit(
+        [cirq.rx(0.1).on(qubits[0]), css.ZX(*qubits)]
+        * (css.service.COMPACT_CIRCUITS_MIN_OPERATIONS // 2),
+        cirq.measure(*qubits),
+    )
+
+    # Small batches are always serialized with `cirq.to_json` (without checking the target)
+    _ = service.create_job(small_circuit, repetitions=10, target="ss_fake_qpu")
+    serialized_circuits = mock_client.create_job.call_args[1]["serialized_circuits"]
+    assert serialized_circuits == {"cirq_circuits": css.serialize_circuits(small_circuit)}
+    mock_client.target_info.assert_not_called()
+
+    _ = service.create_job(large_circuit, repetitions=10, target="ss_fake_qpu")
+    serialized_circuits = mock_client.create_job.call_args[1]["serialized_circuits"]
+    assert list(serialized_circuits) == ["cirq_compact_circuits"]
+    assert css.serialization.deserialize_circuits_compact(
+        serialized_circuits["cirq_compact_circuits"]
+    ) == [large_circuit]
+    assert len(serialized_circuits["cirq_compact_circuits"]) < 0.01 * len(
+        css.serialize_circuits(large_circuit)
+    )
+
+    # Targets which don't support the compact format fall back to `cirq.to_json`
+    mock_client.target_info.return_value = {"target_info": {"supported_circuit_types": ["cirq"]}}
+    _ = service.create_job(large_circuit, repetitions=10, target="ss_other_qpu")
+    serialized_circuits = mock_client.create_job.call_args[1]["serialized_circuits"]
+    assert serialized_circuits == {"cirq_circuits": css.serialize_circuits(large_circuit)}
+
+    mock_client.target_info.return_value = {"target_info": {}}
+    _ = service.create_job([large_circuit], repetitions=10, target="ss_another_qpu")
+    serialized_circuits = mock_client.create_job.call_args[1]["serialized_circuits"]
+    assert serialized_circuits == {"cirq_circuits": css.serialize_circuits([large_circuit])}
+
+    # Target information is requested from the client (which caches it in its metadata cache)
+    assert mock_client.target_info.call_count == 3
+
+
+@mock.patch(
+    "general_superstaq.superstaq_client._SuperstaqClient.create_job",
+    return_value={"job_ids": ["job_id"], "status": "Ready"},
+)
+def test_service_create_job_async(mock_create_job: mock.MagicMock) -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+
+    circuit = cirq.Circuit(cirq.X(cirq.LineQubit(0)), cirq.measure(cirq.LineQubit(0)))
+    job = asyncio.run(
+        service.create_job_async(
+            circuits=circuit,
+            repetitions=100,
+            target="ss_fake_qpu",
+            method="fake_method",
+            fake_data="",
+        )
+    )
+    assert job.job_id() == "job_id"
+    create_job_kwargs = mock_create_job.call_args[1]
+    assert create_job_kwargs["serialized_circuits"] == {
+        "cirq_circuits": css.serialize_circuits(circuit)
+    }
+    assert create_job_kwargs["repetitions"] == 100
+    assert create_job_kwargs["target"] == "ss_fake_qpu"
+    assert create_job_kwargs["method"] == "fake_method"
+    assert create_job_kwargs["fake_data"] == ""
+
+    with pytest.raises(ValueError, match="no measurements"):
+        _ = asyncio.run(service.create_job_async(cirq.Circuit(), target="ss_fake_qpu"))
+
+
+@mock.patch(
+    "general_superstaq.superstaq_client._SuperstaqClient.create_jobs",
+    return_value={"job_ids": ["job_id1", "job_id2"]},
+)
+def test_service_create_job_chunked(mock_create_jobs: mock.MagicMock) -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+
+    qubit = cirq.LineQubit(0)
+    circuits = [
+        cirq.Circuit(cirq.X(qubit), cirq.measure(qubit)),
+        cirq.Circuit(cirq.H(qubit), cirq.measure(qubit)),
+        cirq.Circuit(cirq.Y(qubit), cirq.measure(qubit)),
+    ]
+    max_payload_bytes = len(css.serialize_circuits(circuits[:2]))
+    expected_requests = [
+        {
+            "serialized_circuits": {"cirq_circuits": css.serialize_circuits(chunk)},
+            "repetitions": 100,
+            "target": "ss_fake_qpu",
+            "method": None,
+        }
+        for chunk in (circuits[:2], circuits[2:])
+    ]
+
+    with mock.patch("general_superstaq.superstaq_client.MAX_JOB_PAYLOAD_BYTES", max_payload_bytes):
+        job = service.create_job(circuits, repetitions=100, target="ss_fake_qpu")
+        assert job.job_id() == "job_id1,job_id2"
+        mock_create_jobs.assert_called_once_with(expected_requests)
+
+        job = asyncio.run(service.create_job_async(circuits, repetitions=100, target="ss_fake_qpu"))
+        assert job.job_id() == "job_id1,job_id2"
+        assert mock_create_jobs.call_args.args[0] == expected_requests
+
+
+def test_service_max_workers() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    qubit = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.rx(0.1 * i).on(qubit), cirq.measure(qubit)) for i in range(4)]
+    serialized_circuits = css.serialize_circuits(circuits)
+    compiled_json = {
+        "cirq_circuits": serialized_circuits,
+        "initial_logical_to_physicals": cirq.to_json([[]] * 4),
+        "final_logical_to_physicals": cirq.to_json([[]] * 4),
+        "jaqal_programs": [""] * 4,
+    }
+
+    with mock.patch(
+        "general_superstaq.serialization.map_chunks", wraps=gss.serialization.map_chunks
+    ) as mock_map_chunks, mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.create_job",
+        return_value={"job_ids": ["job_id"]},
+    ) as mock_create_job, mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.compile",
+        return_value=compiled_json,
+    ) as mock_compile, mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.post_request",
+        return_value=compiled_json,
+    ), mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.qscout_compile",
+        return_value=compiled_json,
+    ):
+        _ = service.create_job(circuits, target="ss_fake_qpu", max_workers=2)
+        assert mock_create_job.call_args.kwargs["serialized_circuits"] == {
+            "cirq_circuits": serialized_circuits
+        }
+        assert "max_workers" not in mock_create_job.call_args.kwargs
+
+        _ = asyncio.run(service.create_job_async(circuits, target="ss_fake_qpu", max_workers=2))
+        assert mock_create_job.call_args.kwargs["serialized_circuits"] == {
+            "cirq_circuits": serialized_circuits
+        }
+
+        assert service.compile(circuits, target="ss_fake_qpu", max_workers=2).circuits == circuits
+        assert mock_compile.call_args.args[0]["cirq_circuits"] == serialized_circuits
+        assert "options" not in mock_compile.call_args.args[0]
+
+        _ = service.compile(circuits, target="aqt_keysight_qpu", max_workers=2)
+        _ = service.compile(circuits, target="qscout_peregrine_qpu", max_workers=2)
+
+    assert mock_map_chunks.call_count == 5
+    for call in mock_map_chunks.call_args_list:
+        assert call.args[1:] == (circuits, 2)
+
+
 @mock.patch(
     "general_superstaq.superstaq_client._SuperstaqClient.post_request",
     return_value={
@@ -625,6 +1036,59 @@ def test_qscout_compile_num_qubits(mock_post: mock.MagicMock) -> None:
     }
 
 
+def test_service_compile_cache() -> None:
+    def compile_circuits(request_json: dict[str, str]) -> dict[str, str | list[str]]:
+        circuits = css.serialization.deserialize_circuits(request_json["cirq_circuits"])
+        return {
+            "cirq_circuits": css.serialization.serialize_circuits(circuits),
+            "initial_logical_to_physicals": cirq.to_json([[] for _ in circuits]),
+            "final_logical_to_physicals": cirq.to_json([[] for _ in circuits]),
+            "jaqal_programs": ["jaqal" for _ in circuits],
+        }
+
+    compile_cache = gss.CompileCache()
+    service = css.Service(
+        api_key="key", remote_host="http://example.com", compile_cache=compile_cache
+    )
+    circuits = [cirq.Circuit(cirq.X(cirq.q(i))) for i in range(3)]
+
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.compile",
+        side_effect=compile_circuits,
+    ) as mock_compile:
+        assert service.compile(circuits[:2], target="ss_example_qpu").circuits == circuits[:2]
+        assert service.compile(circuits[1], target="ss_example_qpu").circuit == circuits[1]
+        assert service.compile(circuits[::-1], target="ss_example_qpu").circuits == circuits[::-1]
+
+        assert mock_compile.call_count == 2
+        request_json = mock_compile.call_args.args[0]
+        assert css.serialization.deserialize_circuits(request_json["cirq_circuits"]) == [
+            circuits[2]
+        ]
+
+        # Results are never shared between targets
+        assert service.compile(circuits[0], target="ss_other_qpu").circuit == circuits[0]
+        assert mock_compile.call_count == 3
+
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.post_request",
+        side_effect=lambda endpoint, request_json: compile_circuits(request_json),
+    ) as mock_post_request:
+        assert service.aqt_compile(circuits).circuits == circuits
+        assert service.aqt_compile(circuits[0]).circuit == circuits[0]
+        mock_post_request.assert_called_once()
+
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.qscout_compile",
+        side_effect=compile_circuits,
+    ) as mock_qscout_compile:
+        assert service.qscout_compile(circuits).jaqal_programs == ["jaqal"] * 3
+        assert service.qscout_compile(circuits).jaqal_programs == ["jaqal"] * 3
+        mock_qscout_compile.assert_called_once()
+
+    assert compile_cache.hits == 7
+
+
 @mock.patch("requests.Session.post")
 def test_service_cq_compile_single(mock_post: mock.MagicMock) -> None:
     q0 = cirq.LineQubit(0)
@@ -932,3 +1396,23 @@ def test_service_remote_host_via_env() -> None:
 def test_service_no_url_default() -> None:
     service = css.Service("tomyheart")
     assert service._client.remote_host == gss.API_URL
+
+
+def test_service_job_store(tmp_path: pathlib.Path) -> None:
+    job_store = gss.JobStore(tmp_path / "jobs.sqlite3")
+    service = css.Service(api_key="key", remote_host="http://example.com", job_store=job_store)
+    server = css.testing.fake_superstaq_server()
+    server.install(service)
+
+    circuit = cirq.Circuit(cirq.X(cirq.q(0)), cirq.measure(cirq.q(0)))
+    job_id = service.create_job(circuit, 10, target="ss_unconstrained_simulator").job_id()
+
+    # A new service (e.g. in another process) sharing the job store never refetches the job
+    for _ in range(2):
+        new_service = css.Service(
+            api_key="key", remote_host="http://example.com", job_store=job_store
+        )
+        server.install(new_service)
+        assert new_service.get_job(job_id).counts(index=0) == {"1": 10}
+
+    assert server.request_counts["/fetch_jobs"] == 1
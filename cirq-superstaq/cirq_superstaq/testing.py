@@ -0,0 +1,90 @@
+"""Utilities for running cirq-superstaq against a local fake Superstaq server."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import cirq
+import general_superstaq as gss
+import numpy as np
+
+import cirq_superstaq as css
+
+
+def simulate_circuits(serialized_circuits: str, repetitions: int) -> list[dict[str, Any]]:
+    """Runs serialized `cirq.Circuit`(s) on a local simulator.
+
+    This can be registered as the "cirq_circuits" simulator of a `gss.testing.FakeSuperstaqServer`.
+    Measurement results are returned in the same format as the Superstaq API, i.e. as bitstrings
+    concatenating the results of each measurement key (sorted by name).
+
+    Args:
+        serialized_circuits: The circuit(s), serialized with `css.serialize_circuits`.
+        repetitions: The number of times to sample each circuit.
+
+    Returns:
+        A list containing the job data of each circuit.
+    """
+    simulator = cirq.Simulator()
+    job_data = []
+    for circuit in css.deserialize_circuits(serialized_circuits):
+        result = simulator.run(circuit, repetitions=repetitions)
+        keys = sorted(result.measurements)
+        bits = np.concatenate([result.measurements[key] for key in keys], axis=1)
+        bitstrings, counts = np.unique(bits.astype(int), axis=0, return_counts=True)
+        job_data.append(
+            {
+                "input_circuit": css.serialize_circuits(circuit),
+                "num_qubits": cirq.num_qubits(circuit),
+                "samples": {
+                    "".join(map(str, bitstring)): int(count)
+                    for bitstring, count in zip(bitstrings, counts)
+                },
+            }
+        )
+    return job_data
+
+
+def compile_circuits(serialized_circuits: str, target: str) -> dict[str, Any]:
+    """Returns serialized `cirq.Circuit`(s) unchanged, as if they had been compiled.
+
+    This can be registered as the "cirq_circuits" compiler of a `gss.testing.FakeSuperstaqServer`.
+
+    Args:
+        serialized_circuits: The circuit(s), serialized with `css.serialize_circuits`.
+        target: The target to compile for (unused).
+
+    Returns:
+        The body of a `/compile` response, with trivial qubit mappings.
+    """
+    circuits = css.deserialize_circuits(serialized_circuits)
+    qubit_maps = [[(q, q) for q in sorted(circuit.all_qubits())] for circuit in circuits]
+    return {
+        "cirq_circuits": serialized_circuits,
+        "initial_logical_to_physicals": cirq.to_json(qubit_maps),
+        "final_logical_to_physicals": cirq.to_json(qubit_maps),
+    }
+
+
+def fake_superstaq_server(**kwargs: Any) -> gss.testing.FakeSuperstaqServer:
+    """Creates a `gss.testing.FakeSuperstaqServer` which simulates and compiles cirq circuits.
+
+    Example:
+
+    .. code-block:: python
+
+        service = css.Service(api_key="fake", remote_host="http://localhost")
+        css.testing.fake_superstaq_server(latency_seconds=0.05).install(service)
+
+    Args:
+        kwargs: Other arguments for `gss.testing.FakeSuperstaqServer` (e.g. `latency_seconds`,
+            `queue_seconds`, or `error_rate`).
+
+    Returns:
+        The fake server, which can be installed on a `css.Service` using its `install` method.
+    """
+    return gss.testing.FakeSuperstaqServer(
+        simulators={"cirq_circuits": simulate_circuits},
+        compilers={"cirq_circuits": compile_circuits},
+        **kwargs,
+    )
@@ -0,0 +1,70 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+from unittest import mock
+
+import cirq
+import general_superstaq as gss
+import pytest
+
+import cirq_superstaq as css
+
+
+def test_simulate_circuits() -> None:
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuits = [
+        cirq.Circuit(cirq.X(q0), cirq.measure(q0, key="b"), cirq.measure(q2, q1, key="a")),
+        cirq.Circuit(cirq.X(q1), cirq.measure(q1)),
+    ]
+    job_data = css.testing.simulate_circuits(css.serialize_circuits(circuits), 10)
+    assert job_data == [
+        {
+            "input_circuit": css.serialize_circuits(circuits[0]),
+            "num_qubits": 3,
+            "samples": {"001": 10},
+        },
+        {
+            "input_circuit": css.serialize_circuits(circuits[1]),
+            "num_qubits": 1,
+            "samples": {"1": 10},
+        },
+    ]
+
+
+def test_compile_circuits() -> None:
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.CZ(q1, q0), cirq.measure(q0, q1))
+    serialized_circuits = css.serialize_circuits([circuit])
+
+    out = css.compiler_output.read_json(
+        css.testing.compile_circuits(serialized_circuits, "ss_unconstrained_simulator"),
+        circuits_is_list=True,
+    )
+    assert out.circuits == [circuit]
+    assert out.initial_logical_to_physicals == [{q0: q0, q1: q1}]
+    assert out.final_logical_to_physicals == [{q0: q0, q1: q1}]
+
+
+def test_fake_superstaq_server() -> None:
+    service = css.Service(api_key="key", remote_host="http://example.com")
+    server = css.testing.fake_superstaq_server(queue_seconds=1.0)
+    server.install(service)
+
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(q0), cirq.CX(q0, q1), cirq.measure(q0, q1))
+
+    with mock.patch("time.monotonic", return_value=100.0):
+        job = service.create_job([circuit, circuit], 50, target="ss_unconstrained_simulator")
+        assert job.status() == "Queued"
+
+    with mock.patch("time.monotonic", return_value=101.0):
+        assert job.counts() == [{"11": 50}, {"11": 50}]
+        assert job.input_circuits(index=1) == circuit
+        assert job.num_qubits(index=0) == 2
+
+    assert service.get_counts(circuit, 10, "ss_unconstrained_simulator") == {"11": 10}
+    assert service.compile(circuit, target="ss_unconstrained_simulator").circuit == circuit
+
+    server.inject_errors(status_code=400)
+    with pytest.raises(gss.SuperstaqServerException, match="Injected error"):
+        _ = service.get_targets()
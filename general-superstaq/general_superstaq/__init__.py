@@ -1,6 +1,13 @@
 from general_superstaq._init_vars import API_URL, API_VERSION
 from general_superstaq._version import __version__
+from general_superstaq.caching import MetadataCache
+from general_superstaq.compile_cache import CompileCache
+from general_superstaq.counts import Counts
+from general_superstaq.job_store import JobStore
+from general_superstaq.polling import PollingStrategy
+from general_superstaq.qubo import QuboSolutions, SparseQubo
 from general_superstaq.resource_estimate import ResourceEstimate
+from general_superstaq.retry import RetryPolicy
 from general_superstaq.service import Service
 from general_superstaq.superstaq_exceptions import (
     SuperstaqException,
@@ -10,22 +17,57 @@ from general_superstaq.superstaq_exceptions import (
 )
 from general_superstaq.typing import Target
 
-from . import serialization, service, superstaq_client, superstaq_exceptions, typing, validation
+from . import (
+    annealing,
+    caching,
+    compile_cache,
+    counts,
+    instrumentation,
+    job_store,
+    polling,
+    qubo,
+    retry,
+    serialization,
+    service,
+    superstaq_client,
+    superstaq_exceptions,
+    testing,
+    typing,
+    validation,
+)
 
 __all__ = [
     "__version__",
     "API_URL",
     "API_VERSION",
+    "CompileCache",
+    "Counts",
+    "JobStore",
+    "MetadataCache",
+    "PollingStrategy",
+    "QuboSolutions",
     "ResourceEstimate",
+    "RetryPolicy",
+    "SparseQubo",
     "SuperstaqException",
     "SuperstaqUnsuccessfulJobException",
     "SuperstaqServerException",
     "SuperstaqWarning",
     "Service",
+    "annealing",
+    "caching",
+    "compile_cache",
+    "counts",
+    "instrumentation",
+    "job_store",
+    "polling",
+    "qubo",
+    "retry",
     "serialization",
     "service",
     "superstaq_client",
     "superstaq_exceptions",
+    "testing",
     "typing",
     "Target",
     "validation",
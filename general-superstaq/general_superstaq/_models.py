@@ -44,6 +44,9 @@ class CircuitType(str, Enum):
     """The different languages that are recognized by Superstaq."""
 
     CIRQ = "cirq"
+    CIRQ_COMPACT = "cirq_compact"
+    """Cirq circuits serialized with deduplicated gate and qubit tables (see
+    `css.serialization.serialize_circuits_compact`)."""
     QISKIT = "qiskit"
     QASM_STRS = "qasm_strs"
 
@@ -0,0 +1,188 @@
+"""A local simulated-annealing QUBO solver, used for "dry-run" QUBO submissions.
+
+Annealing chains are vectorized with NumPy: in each sweep, the variables of the QUBO are updated
+one "color" at a time, where no two variables of the same color share a quadratic term (so that
+all of them can be updated simultaneously, in every chain at once). For example:
+
+.. code-block:: python
+
+    qubo = gss.SparseQubo.from_dict({("a",): 2, ("a", "b"): 1, ("b", "c"): -5, (): -3})
+    solutions = gss.annealing.anneal(qubo, num_reads=100, seed=0)
+    solutions.to_dicts()[0]  # {"a": 0, "b": 1, "c": 1}
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+import general_superstaq as gss
+
+SCHEDULES = ("geometric", "linear")
+"""The names of the built-in annealing schedules (i.e. the spacing of inverse temperatures)."""
+
+
+class _ColoredQubo:
+    """A QUBO in compressed sparse row (CSR) format, with its variables partitioned into colors."""
+
+    def __init__(self, qubo: gss.SparseQubo) -> None:
+        """Initializes a `_ColoredQubo`.
+
+        Args:
+            qubo: The QUBO to convert.
+        """
+        n = qubo.num_variables
+        off_diagonal = qubo.rows != qubo.cols
+        rows = np.concatenate([qubo.rows[off_diagonal], qubo.cols[off_diagonal]])
+        cols = np.concatenate([qubo.cols[off_diagonal], qubo.rows[off_diagonal]])
+        values = np.concatenate([qubo.values[off_diagonal]] * 2)
+
+        order = np.argsort(rows, kind="stable")
+        self.num_variables = n
+        self.indices = cols[order]
+        self.data = values[order]
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=n))])
+        self.linear = qubo.linear + np.bincount(
+            qubo.rows[~off_diagonal], weights=qubo.values[~off_diagonal], minlength=n
+        )
+
+        # Greedily color the variables, so that no two neighbors share a color
+        colors = np.full(n, -1)
+        for i in range(n):
+            neighbor_colors = set(
+                colors[self.indices[self.indptr[i] : self.indptr[i + 1]]].tolist()
+            )
+            colors[i] = next(c for c in range(n) if c not in neighbor_colors)
+
+        # For each color, the variables along with the neighbors and coefficients of their terms
+        # (concatenated), and which variables have terms along with the index of each one's first
+        # term (variables without terms are left out, as `np.add.reduceat` can't sum empty spans)
+        self.colors: list[tuple[npt.NDArray[np.int64], ...]] = []
+        self.color_data: list[npt.NDArray[np.float64]] = []
+        for color in range(colors.max(initial=-1) + 1):
+            variables = np.flatnonzero(colors == color)
+            lengths = self.indptr[variables + 1] - self.indptr[variables]
+            starts = np.cumsum(lengths) - lengths
+            positions = np.repeat(self.indptr[variables] - starts, lengths) + np.arange(
+                lengths.sum()
+            )
+            has_terms = np.flatnonzero(lengths)
+            self.colors.append((variables, self.indices[positions], has_terms, starts[has_terms]))
+            self.color_data.append(self.data[positions, np.newaxis])
+
+    def default_beta_range(self) -> tuple[float, float]:
+        """Chooses a range of inverse temperatures for which the hottest temperature is likely to
+        accept any move, and the coldest is unlikely to accept the smallest uphill move.
+
+        Returns:
+            The minimum and maximum inverse temperatures.
+        """
+        abs_data = np.abs(self.data)
+        max_delta = np.abs(self.linear) + np.bincount(
+            np.repeat(np.arange(self.num_variables), np.diff(self.indptr)),
+            weights=abs_data,
+            minlength=self.num_variables,
+        )
+        coefficients = np.concatenate([np.abs(self.linear), abs_data])
+        coefficients = coefficients[coefficients > 0]
+        if not coefficients.size:
+            return 1.0, 1.0
+        return math.log(2) / float(max_delta.max()), math.log(100) / float(coefficients.min())
+
+
+def anneal(
+    qubo: gss.SparseQubo,
+    num_reads: int = 10,
+    num_sweeps: int = 1000,
+    beta_range: tuple[float, float] | None = None,
+    schedule: str | Sequence[float] | npt.NDArray[np.float64] = "geometric",
+    seed: int | None = None,
+    max_workers: int | None = None,
+) -> gss.QuboSolutions:
+    """Approximately minimizes a QUBO via simulated annealing, with many chains run in parallel.
+
+    Args:
+        qubo: The QUBO to minimize.
+        num_reads: The number of independent annealing chains (i.e. of solutions) to run.
+        num_sweeps: The number of times each variable is updated in each chain.
+        beta_range: The initial (hottest) and final (coldest) inverse temperatures. By default
+            these are chosen from the magnitudes of the QUBO's coefficients.
+        schedule: How to space the inverse temperatures of the sweeps between `beta_range`: either
+            "geometric" or "linear", or an explicit sequence of inverse temperatures (in which case
+            `num_sweeps` and `beta_range` are ignored).
+        seed: Optionally, a seed for the random number generator.
+        max_workers: Optionally, the maximum number of worker processes across which to divide
+            the chains (see `gss.serialization.map_chunks`). The result depends on `seed` and
+            `max_workers`.
+
+    Returns:
+        The solution found by each chain, in order of increasing energy.
+
+    Raises:
+        ValueError: If `schedule` is not a recognized schedule.
+    """
+    gss.validation.validate_integer_param(num_reads)
+    if isinstance(schedule, str):
+        if schedule not in SCHEDULES:
+            raise ValueError(
+                f"Unknown annealing schedule: {schedule!r} (expected one of {SCHEDULES})."
+            )
+        gss.validation.validate_integer_param(num_sweeps)
+
+    colored_qubo = _ColoredQubo(qubo)
+    if isinstance(schedule, str):
+        beta_min, beta_max = beta_range or colored_qubo.default_beta_range()
+        if schedule == "geometric":
+            betas = np.geomspace(beta_min, beta_max, int(num_sweeps))
+        else:
+            betas = np.linspace(beta_min, beta_max, int(num_sweeps))
+    else:
+        betas = np.asarray(schedule, dtype=np.float64)
+
+    seeds = np.random.SeedSequence(seed).generate_state(int(num_reads)).tolist()
+    anneal_chains = functools.partial(_anneal_chains, colored_qubo, betas)
+    chunks = gss.serialization.map_chunks(anneal_chains, seeds, max_workers, chunks_per_worker=1)
+    solutions = np.concatenate(chunks)
+
+    energies = qubo.energies(solutions)
+    order = np.argsort(energies, kind="stable")
+    return gss.QuboSolutions(solutions[order], energies[order], qubo.variables)
+
+
+def _anneal_chains(
+    colored_qubo: _ColoredQubo, betas: npt.NDArray[np.float64], seeds: Sequence[int]
+) -> npt.NDArray[np.uint8]:
+    """Runs a number of simulated-annealing chains in parallel (as a single NumPy computation).
+
+    Args:
+        colored_qubo: The QUBO to minimize.
+        betas: The inverse temperature of each sweep.
+        seeds: A seed for each chain (which together seed the random number generator).
+
+    Returns:
+        A two-dimensional array of bits, with the final state of each chain in each row.
+    """
+    rng = np.random.default_rng(list(seeds))
+    num_chains = len(seeds)
+    linear = colored_qubo.linear[:, np.newaxis]
+
+    # Store the chains in columns, so that the values of each variable are contiguous
+    x = rng.integers(0, 2, size=(colored_qubo.num_variables, num_chains), dtype=np.uint8)
+    for beta in betas:
+        for (variables, neighbors, has_terms, starts), data in zip(
+            colored_qubo.colors, colored_qubo.color_data
+        ):
+            # The change in energy from flipping each variable (in every chain)
+            fields = np.repeat(linear[variables], num_chains, axis=1)
+            if len(neighbors):
+                fields[has_terms] += np.add.reduceat(x[neighbors] * data, starts, axis=0)
+            delta = (1.0 - 2.0 * x[variables]) * fields
+
+            accept = rng.random(delta.shape) < np.exp(np.minimum(-beta * delta, 0.0))
+            x[variables] ^= accept.view(np.uint8)
+
+    return x.T
@@ -0,0 +1,99 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+import general_superstaq as gss
+
+
+def _random_qubo(num_variables: int, num_terms: int, seed: int) -> gss.SparseQubo:
+    rng = np.random.default_rng(seed)
+    return gss.SparseQubo(
+        rng.integers(0, num_variables, num_terms),
+        rng.integers(0, num_variables, num_terms),
+        rng.normal(size=num_terms),
+        linear=rng.normal(size=num_variables),
+        offset=1.5,
+    )
+
+
+def test_anneal() -> None:
+    qubo = gss.SparseQubo.from_dict({("a",): 2, ("a", "b"): 1, ("b", "c"): -5, (): -3})
+    solutions = gss.annealing.anneal(qubo, num_reads=20, seed=0)
+    assert len(solutions) == 20
+    assert solutions.variables == ["a", "b", "c"]
+    assert solutions.to_dicts()[0] == {"a": 0, "b": 1, "c": 1}
+    assert solutions.energies[0] == -8.0
+    assert np.all(np.diff(solutions.energies) >= 0)
+    np.testing.assert_array_equal(solutions.energies, qubo.energies(solutions.solutions))
+
+    # Results are reproducible
+    other_solutions = gss.annealing.anneal(qubo, num_reads=20, seed=0)
+    np.testing.assert_array_equal(solutions.solutions, other_solutions.solutions)
+
+
+def test_anneal_finds_ground_state() -> None:
+    qubo = _random_qubo(num_variables=12, num_terms=40, seed=1)
+    all_solutions = np.array(list(itertools.product([0, 1], repeat=12)))
+    ground_state_energy = qubo.energies(all_solutions).min()
+
+    schedules: list[str | npt.NDArray[np.float64]] = [
+        "geometric",
+        "linear",
+        np.linspace(0.1, 10, 500),
+    ]
+    for schedule in schedules:
+        solutions = gss.annealing.anneal(qubo, num_reads=10, schedule=schedule, seed=2)
+        assert solutions.energies[0] == pytest.approx(ground_state_energy)
+
+    solutions = gss.annealing.anneal(qubo, num_reads=10, beta_range=(0.1, 10.0), seed=2)
+    assert solutions.energies[0] == pytest.approx(ground_state_energy)
+
+
+def test_anneal_edge_cases() -> None:
+    # Variables without quadratic terms (or without any terms), and diagonal terms
+    qubo = gss.SparseQubo([0, 2], [1, 2], [1.0, -2.0], linear=[0, 0, 1, 0], num_variables=4)
+    solutions = gss.annealing.anneal(qubo, num_reads=5, seed=0)
+    assert solutions.solutions[0, 2] == 1
+    assert solutions.energies[0] == -1.0
+
+    solutions = gss.annealing.anneal(gss.SparseQubo([], [], [], num_variables=2), num_reads=2)
+    assert solutions.solutions.shape == (2, 2)
+    assert solutions.energies.tolist() == [0.0, 0.0]
+
+
+def test_anneal_variables_without_terms() -> None:
+    # "c" has the same color as (and follows) "a", but has no quadratic terms
+    qubo = gss.SparseQubo.from_dict({("a", "b"): 1, ("a", "d"): -5, ("c",): 1, ("a",): 2})
+    solutions = gss.annealing.anneal(qubo, num_reads=50, seed=1)
+    assert solutions.energies[0] == -3.0
+    assert solutions.to_dicts()[0] == {"a": 1, "b": 0, "c": 0, "d": 1}
+
+    # Compare against brute force, with many variables lacking quadratic terms
+    for seed in range(3):
+        qubo = _random_qubo(num_variables=12, num_terms=8, seed=seed)
+        all_solutions = np.array(list(itertools.product([0, 1], repeat=12)))
+        ground_state_energy = qubo.energies(all_solutions).min()
+        solutions = gss.annealing.anneal(qubo, num_reads=10, seed=seed)
+        assert solutions.energies[0] == pytest.approx(ground_state_energy)
+
+
+def test_anneal_max_workers() -> None:
+    qubo = _random_qubo(num_variables=20, num_terms=60, seed=3)
+    solutions = gss.annealing.anneal(qubo, num_reads=8, num_sweeps=100, seed=0, max_workers=2)
+    assert len(solutions) == 8
+    np.testing.assert_array_equal(solutions.energies, qubo.energies(solutions.solutions))
+
+
+def test_anneal_validation() -> None:
+    qubo = gss.SparseQubo([0], [1], [1.0])
+    with pytest.raises(ValueError, match="Unknown annealing schedule"):
+        _ = gss.annealing.anneal(qubo, schedule="exponential")
+    with pytest.raises(ValueError, match="less than the minimum value"):
+        _ = gss.annealing.anneal(qubo, num_reads=0)
+    with pytest.raises(ValueError, match="less than the minimum value"):
+        _ = gss.annealing.anneal(qubo, num_sweeps=0)
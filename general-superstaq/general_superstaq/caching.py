@@ -0,0 +1,180 @@
+"""A client-side cache for slowly changing Superstaq API metadata (such as target information)."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import copy
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+class MetadataCache:
+    """A thread-safe cache of json-serializable API responses, which expire after a fixed TTL.
+
+    Concurrent lookups of the same (missing or expired) key are coalesced: the first caller fetches
+    the value and any others wait for (and share) its result. If a `path` is provided, cached
+    values are also persisted to disk (as json), so that they can be reused by later processes.
+    Expired values are discarded whenever they are looked up, and whenever the cache is saved.
+
+    A single cache can be shared by any number of services and providers, e.g.:
+
+    .. code-block:: python
+
+        cache = gss.MetadataCache(ttl_seconds=600, path="~/.superstaq/metadata_cache.json")
+        service = css.Service(metadata_cache=cache)
+        provider = qss.SuperstaqProvider(metadata_cache=cache)
+    """
+
+    def __init__(
+        self, ttl_seconds: float = 300.0, path: str | os.PathLike[str] | None = None
+    ) -> None:
+        """Initializes a `MetadataCache`.
+
+        Args:
+            ttl_seconds: How long cached values remain valid.
+            path: An optional file in which to persist cached values. Any (unexpired) values
+                already in this file are loaded immediately.
+
+        Raises:
+            ValueError: If `ttl_seconds` is negative.
+        """
+        if ttl_seconds < 0:
+            raise ValueError("`ttl_seconds` must be non-negative.")
+
+        self.ttl_seconds = ttl_seconds
+        self.path = pathlib.Path(path).expanduser() if path is not None else None
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._in_flight: dict[str, concurrent.futures.Future[Any]] = {}
+        self._generation = 0
+        self._load()
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Constructs a cache key from any number of json-serializable parts.
+
+        Keys are hashed, so that no sensitive information (e.g. API keys or tokens) is persisted.
+
+        Args:
+            parts: The values which uniquely identify a cached value.
+
+        Returns:
+            The cache key.
+        """
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Returns the cached value for `key`, calling `fetch()` to fetch it if necessary.
+
+        Args:
+            key: The cache key (see `make_key`).
+            fetch: A function which fetches the current (json-serializable) value.
+
+        Returns:
+            A copy of the (possibly newly fetched) value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self.hits += 1
+                    return copy.deepcopy(entry[1])
+                del self._entries[key]
+
+            self.misses += 1
+            generation = self._generation
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if future is None:
+                future = self._in_flight[key] = concurrent.futures.Future()
+
+        if not is_owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[key] = (time.time() + self.ttl_seconds, value)
+                    self._save()
+            return copy.deepcopy(value)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Discards a cached value, or all cached values.
+
+        Any fetches in progress when this is called will not be cached.
+
+        Args:
+            key: The key to discard, or None to discard everything.
+        """
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            now = time.time()
+            return sum(expires_at > now for expires_at, _ in self._entries.values())
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(entries, dict):
+            return
+
+        now = time.time()
+        for key, entry in entries.items():
+            if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], (int, float)):
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries[key] = (expires_at, value)
+
+    def _prune(self) -> None:
+        """Discards any expired entries."""
+        now = time.time()
+        self._entries = {key: entry for key, entry in self._entries.items() if entry[0] > now}
+
+    def _save(self) -> None:
+        self._prune()
+        if self.path is None:
+            return
+
+        # Write to a temporary file first, so that concurrent readers never see a partial file
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({key: list(entry) for key, entry in self._entries.items()}, file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,144 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import json
+import pathlib
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+import general_superstaq as gss
+
+
+def test_metadata_cache() -> None:
+    with pytest.raises(ValueError, match="non-negative"):
+        _ = gss.MetadataCache(ttl_seconds=-1)
+
+    cache = gss.MetadataCache(ttl_seconds=10)
+    fetch = mock.MagicMock(side_effect=[{"a": [1]}, {"a": [2]}, {"a": [3]}])
+
+    with mock.patch("time.time", return_value=100.0):
+        value = cache.get("key", fetch)
+        assert value == {"a": [1]}
+        value["a"].append(0)  # Cached values are copied
+        assert cache.get("key", fetch) == {"a": [1]}
+        assert len(cache) == 1
+
+    with mock.patch("time.time", return_value=110.0):
+        assert len(cache) == 0
+        assert cache.get("key", fetch) == {"a": [2]}
+
+        cache.invalidate("other_key")
+        assert cache.get("key", fetch) == {"a": [2]}
+        cache.invalidate("key")
+        assert cache.get("key", fetch) == {"a": [3]}
+
+    assert fetch.call_count == 3
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+    # Values fetched while the cache is being invalidated are not cached
+    def fetch_and_invalidate() -> str:
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get("key", fetch_and_invalidate) == "stale"
+    assert len(cache) == 0
+
+
+def test_metadata_cache_make_key() -> None:
+    key = gss.MetadataCache.make_key("/target_info", {"target": "t", "options": "secret"})
+    assert key == gss.MetadataCache.make_key("/target_info", {"options": "secret", "target": "t"})
+    assert key != gss.MetadataCache.make_key("/target_info", {"target": "t"})
+    assert "secret" not in key
+
+
+def test_metadata_cache_errors() -> None:
+    cache = gss.MetadataCache()
+    fetch = mock.MagicMock(side_effect=[gss.SuperstaqServerException("oops"), "value"])
+
+    with pytest.raises(gss.SuperstaqServerException, match="oops"):
+        _ = cache.get("key", fetch)
+
+    # Errors are not cached
+    assert cache.get("key", fetch) == "value"
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_metadata_cache_coalescing(fails: bool) -> None:
+    cache = gss.MetadataCache()
+    started = threading.Event()
+    release = threading.Event()
+    results: list[str] = []
+
+    def fetch() -> str:
+        started.set()
+        assert release.wait(10)
+        if fails:
+            raise gss.SuperstaqServerException("oops")
+        return "value"
+
+    def lookup() -> None:
+        try:
+            results.append(cache.get("key", fetch))
+        except gss.SuperstaqServerException:
+            results.append("error")
+
+    threads = [threading.Thread(target=lookup) for _ in range(4)]
+    threads[0].start()
+    assert started.wait(10)
+    for thread in threads[1:]:
+        thread.start()
+
+    # Wait for the other lookups to find the fetch in progress
+    while True:
+        time.sleep(0.01)
+        if cache.misses == 4:
+            break
+    release.set()
+
+    for thread in threads:
+        thread.join()
+    assert results == ["error" if fails else "value"] * 4
+
+
+def test_metadata_cache_persistence(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "cache" / "metadata.json"
+    cache = gss.MetadataCache(path=path)
+    assert cache.get("key", lambda: {"num_qubits": 4}) == {"num_qubits": 4}
+    assert path.exists()
+
+    fetch = mock.MagicMock()
+    assert gss.MetadataCache(path=path).get("key", fetch) == {"num_qubits": 4}
+    fetch.assert_not_called()
+
+    # Expired values are not loaded
+    with mock.patch("time.time", return_value=1e12):
+        assert len(gss.MetadataCache(path=path)) == 0
+
+    cache.invalidate()
+    assert len(gss.MetadataCache(path=path)) == 0
+
+    # Expired values are pruned from the file whenever the cache is saved
+    cache = gss.MetadataCache(ttl_seconds=10, path=path)
+    with mock.patch("time.time", return_value=100.0):
+        _ = cache.get("old_key", lambda: 1)
+    with mock.patch("time.time", return_value=120.0):
+        _ = cache.get("new_key", lambda: 2)
+    assert list(json.loads(path.read_text())) == ["new_key"]
+    assert list(cache._entries) == ["new_key"]
+
+    # Missing or invalid files are ignored
+    assert len(gss.MetadataCache(path=tmp_path / "missing.json")) == 0
+    for contents in ["not json", "[]", json.dumps({"key": 1, "other_key": ["soon", 2]})]:
+        path.write_text(contents)
+        assert len(gss.MetadataCache(path=path)) == 0
+
+    # Temporary files are cleaned up if writing fails
+    with mock.patch("json.dump", side_effect=TypeError), pytest.raises(TypeError):
+        _ = cache.get("key", lambda: "value")
+    assert list(path.parent.iterdir()) == [path]
@@ -0,0 +1,371 @@
+"""An opt-in, content-addressed cache of compiled circuits."""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+JSON_LIST_FIELDS = ("cirq_circuits", "initial_logical_to_physicals", "final_logical_to_physicals")
+"""Compile response fields holding json-encoded lists, with entries for each compiled circuit."""
+
+LIST_FIELDS = ("jaqal_programs", "pulse_durations", "pulse_start_times")
+"""Compile response fields holding lists, with entries for each compiled circuit."""
+
+
+class CompileCache:
+    """A cache of compilation results, keyed by a hash of each input circuit along with the
+    compilation target, options, and client version.
+
+    Results are cached per circuit wherever possible, so that compiling a batch containing a few
+    new circuits only sends those circuits to the server. Responses which cannot be split by
+    circuit (such as those containing a single pulse sequence for the whole batch) are instead
+    cached for the batch as a whole.
+
+    Cached results are kept in memory (up to `max_memory_bytes`) and, if a `path` is provided, in
+    an on-disk (SQLite) store shared by any number of processes (up to `max_disk_bytes`). In both
+    tiers the least recently used results are evicted first.
+
+    .. code-block:: python
+
+        compile_cache = gss.CompileCache(path="~/.superstaq/compile_cache.sqlite3")
+        service = css.Service(compile_cache=compile_cache)
+        output = service.ibmq_compile(circuits, target="ibmq_brisbane_qpu")  # compiled once
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        path: str | os.PathLike[str] | None = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        """Initializes a `CompileCache`.
+
+        Args:
+            max_memory_bytes: The maximum total size of the results cached in memory.
+            path: An optional database file in which to persist cached results.
+            max_disk_bytes: The maximum total size of the results persisted to `path`.
+            timeout_seconds: How long to wait for other processes to release the database.
+
+        Raises:
+            ValueError: If `max_memory_bytes` or `max_disk_bytes` is not positive.
+        """
+        if max_memory_bytes <= 0 or max_disk_bytes <= 0:
+            raise ValueError("`max_memory_bytes` and `max_disk_bytes` must be positive.")
+
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.path = pathlib.Path(path).expanduser() if path is not None else None
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._memory: collections.OrderedDict[str, str] = collections.OrderedDict()
+        self._memory_bytes = 0
+        self._connection: sqlite3.Connection | None = None
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                str(self.path),
+                timeout=timeout_seconds,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS compiled ("
+                "key TEXT PRIMARY KEY, data TEXT NOT NULL, size INTEGER NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS compiled_accessed_at ON compiled (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Constructs a cache key from any number of json-serializable parts.
+
+        Keys are hashed, so that no sensitive information (e.g. API keys or tokens) is persisted.
+
+        Args:
+            parts: The values which uniquely identify a cached result.
+
+        Returns:
+            The cache key.
+        """
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Looks up a cached result.
+
+        Args:
+            key: The cache key (see `make_key`).
+
+        Returns:
+            A copy of the cached result, or None if there is none.
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return json.loads(data)
+
+            if self._connection is None:
+                return None
+
+            row = self._connection.execute(
+                "SELECT data FROM compiled WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._connection.execute(
+                "UPDATE compiled SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._remember(key, row[0])
+            return json.loads(row[0])
+
+    def put(self, key: str, value: object) -> None:
+        """Caches a (json-serializable) result.
+
+        Args:
+            key: The cache key (see `make_key`).
+            value: The result to cache.
+        """
+        data = json.dumps(value)
+        with self._lock:
+            self._remember(key, data)
+            if self._connection is None or len(data) > self.max_disk_bytes:
+                return
+
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO compiled (key, data, size, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, data, len(data), time.time()),
+                )
+                self._evict()
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def compile(
+        self,
+        request_json: Mapping[str, Any],
+        compile_fn: Callable[[dict[str, Any]], dict[str, Any]],
+        key_parts: Sequence[object] = (),
+        circuits_field: str = "cirq_circuits",
+    ) -> dict[str, Any]:
+        """Compiles circuits, only sending those without cached results to the server.
+
+        Args:
+            request_json: The compile request, in which `circuits_field` contains the json
+                serialization of a circuit or list of circuits.
+            compile_fn: The function which sends a compile request to the server and returns the
+                json response.
+            key_parts: Additional values identifying the compilation (e.g. the endpoint and client
+                version), which are included in every cache key.
+            circuits_field: The field of `request_json` containing the serialized circuits.
+
+        Returns:
+            The json response for the full request (assembled from cached and new results).
+        """
+        serialized_circuits = json.loads(request_json[circuits_field])
+        if not isinstance(serialized_circuits, list):
+            serialized_circuits = [serialized_circuits]
+        if not serialized_circuits:
+            return compile_fn(dict(request_json))
+
+        options = {field: value for field, value in request_json.items() if field != circuits_field}
+        keys = [self.make_key(*key_parts, options, circuit) for circuit in serialized_circuits]
+        entries = [self.get(key) for key in keys]
+        missing = [i for i, entry in enumerate(entries) if entry is None]
+
+        if not missing:
+            response = _merge_responses(entries)
+            if response is not None:
+                self.hits += len(keys)
+                return response
+            missing = list(range(len(keys)))
+
+        batch_key = self.make_key(*key_parts, options, keys)
+        response = self.get(batch_key)
+        if response is not None:
+            self.hits += len(keys)
+            return response
+
+        # Only compile the circuits without cached results (if their response can be split)
+        if len(missing) < len(keys):
+            missing_circuits = [serialized_circuits[i] for i in missing]
+            missing_request = {**request_json, circuits_field: json.dumps(missing_circuits)}
+            response = self._compile_missing(missing_request, compile_fn, keys, entries, missing)
+            if response is not None:
+                return response
+
+        response = compile_fn(dict(request_json))
+        self.misses += len(keys)
+        parts = _split_response(response, len(keys))
+        if parts is None:
+            self.put(batch_key, response)
+        else:
+            for key, part in zip(keys, parts):
+                self.put(key, part)
+        return response
+
+    def _compile_missing(
+        self,
+        missing_request: dict[str, Any],
+        compile_fn: Callable[[dict[str, Any]], dict[str, Any]],
+        keys: Sequence[str],
+        entries: list[Any],
+        missing: Sequence[int],
+    ) -> dict[str, Any] | None:
+        """Compiles the circuits without cached results, and merges them with the cached results.
+
+        Args:
+            missing_request: A compile request containing only the uncached circuits.
+            compile_fn: The function which sends a compile request to the server.
+            keys: The cache keys of every circuit in the full request.
+            entries: The cached results of each circuit (or None where there are none).
+            missing: The indices of the uncached circuits in the full request.
+
+        Returns:
+            The merged json response for the full request, or None if it can't be assembled from
+            the results of individual circuits.
+        """
+        response = compile_fn(missing_request)
+        parts = _split_response(response, len(missing))
+        if parts is None:
+            return None
+
+        for i, part in zip(missing, parts):
+            self.put(keys[i], part)
+            entries[i] = part
+
+        merged_response = _merge_responses(entries)
+        if merged_response is not None:
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+        return merged_response
+
+    def _remember(self, key: str, data: str) -> None:
+        """Adds a result to the in-memory tier, evicting the least recently used results."""
+        previous_data = self._memory.pop(key, None)
+        if previous_data is not None:
+            self._memory_bytes -= len(previous_data)
+        if len(data) > self.max_memory_bytes:
+            return
+
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted_data = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted_data)
+
+    def _evict(self) -> None:
+        """Deletes the least recently used results until the on-disk tier is within its limit."""
+        assert self._connection is not None
+        (total_size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM compiled"
+        ).fetchone()
+        if total_size <= self.max_disk_bytes:
+            return
+
+        to_delete = []
+        rows = self._connection.execute(
+            "SELECT key, size FROM compiled ORDER BY accessed_at"
+        ).fetchall()
+        for key, size in rows:
+            if total_size <= self.max_disk_bytes:
+                break
+            to_delete.append((key,))
+            total_size -= size
+
+        self._connection.executemany("DELETE FROM compiled WHERE key = ?", to_delete)
+
+    @property
+    def size_bytes(self) -> int:
+        """The total size of the cached results (on disk if persisted, otherwise in memory)."""
+        with self._lock:
+            if self._connection is None:
+                return self._memory_bytes
+            query = "SELECT COALESCE(SUM(size), 0) FROM compiled"
+            return self._connection.execute(query).fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._connection is None:
+                return len(self._memory)
+            return self._connection.execute("SELECT COUNT(*) FROM compiled").fetchone()[0]
+
+    def clear(self) -> None:
+        """Deletes all cached results."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM compiled")
+
+    def close(self) -> None:
+        """Closes the database connection (if any)."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+
+
+def _split_response(response: Mapping[str, Any], num_circuits: int) -> list[dict[str, Any]] | None:
+    """Splits a compile response into the results for each of its input circuits.
+
+    Args:
+        response: The json response to a compile request.
+        num_circuits: The number of circuits in the request.
+
+    Returns:
+        A dictionary for each input circuit mapping each response field to the list of entries for
+        that circuit, or None if the response contains fields which cannot be split.
+    """
+    parts: list[dict[str, Any]] = [{} for _ in range(num_circuits)]
+    for field, value in response.items():
+        if field in JSON_LIST_FIELDS and isinstance(value, str):
+            value = json.loads(value)
+        elif field not in LIST_FIELDS:
+            return None
+
+        if not isinstance(value, list) or len(value) % num_circuits:
+            return None
+
+        size = len(value) // num_circuits
+        for i, part in enumerate(parts):
+            part[field] = value[i * size : (i + 1) * size]
+
+    return parts
+
+
+def _merge_responses(parts: Sequence[Mapping[str, Any]]) -> dict[str, Any] | None:
+    """Merges the results for individual circuits back into a single compile response.
+
+    Args:
+        parts: The results for each circuit (as returned by `_split_response`).
+
+    Returns:
+        The merged json response, or None if the results don't all contain the same fields.
+    """
+    if any(part.keys() != parts[0].keys() for part in parts):
+        return None
+
+    response: dict[str, Any] = {}
+    for field in parts[0]:
+        values = [value for part in parts for value in part[field]]
+        response[field] = json.dumps(values) if field in JSON_LIST_FIELDS else values
+    return response
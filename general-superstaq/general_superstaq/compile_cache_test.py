@@ -0,0 +1,222 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import json
+import pathlib
+from typing import Any
+from unittest import mock
+
+import pytest
+
+import general_superstaq as gss
+
+
+def _compile(request_json: dict[str, Any]) -> dict[str, Any]:
+    circuits = json.loads(request_json["cirq_circuits"])
+    return {
+        "cirq_circuits": json.dumps([f"compiled {circuit}" for circuit in circuits]),
+        "jaqal_programs": [f"jaqal {circuit}" for circuit in circuits],
+    }
+
+
+def test_compile_cache_validation() -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        _ = gss.CompileCache(max_memory_bytes=0)
+    with pytest.raises(ValueError, match="must be positive"):
+        _ = gss.CompileCache(max_disk_bytes=-1)
+
+
+def test_compile_cache_get_put() -> None:
+    cache = gss.CompileCache(max_memory_bytes=20)
+    assert cache.get("a") is None
+
+    cache.put("a", [1, 2])
+    value = cache.get("a")
+    assert value == [1, 2]
+    value.append(3)  # Cached values are copied
+    assert cache.get("a") == [1, 2]
+    assert len(cache) == 1
+    assert cache.size_bytes == len("[1, 2]")
+
+    # The least recently used results are evicted
+    cache.put("b", "0123456")
+    assert cache.get("a") == [1, 2]
+    cache.put("c", "0123456")
+    assert cache.get("a") == [1, 2]
+    assert cache.get("b") is None
+    assert cache.get("c") == "0123456"
+
+    # Replacing (or caching results too large for the cache) never double-counts
+    cache.put("a", [1])
+    cache.put("c", "x" * 20)
+    assert cache.get("c") is None
+    assert cache.size_bytes == len("[1]")
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+    cache.close()
+
+
+def test_compile_cache_make_key() -> None:
+    key = gss.CompileCache.make_key("/compile", {"target": "t", "options": "secret"})
+    assert key == gss.CompileCache.make_key("/compile", {"options": "secret", "target": "t"})
+    assert key != gss.CompileCache.make_key("/compile", {"target": "t"})
+    assert "secret" not in key
+
+
+def test_compile_cache_compile() -> None:
+    cache = gss.CompileCache()
+    compile_fn = mock.MagicMock(side_effect=_compile)
+    request_json = {"cirq_circuits": json.dumps(["a", "b"]), "target": "t", "options": "{}"}
+
+    expected = _compile(request_json)
+    assert cache.compile(request_json, compile_fn, ("/compile",)) == expected
+    assert cache.compile(request_json, compile_fn, ("/compile",)) == expected
+    compile_fn.assert_called_once_with(request_json)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Only new circuits are compiled
+    request_json["cirq_circuits"] = json.dumps(["b", "c", "a"])
+    assert cache.compile(request_json, compile_fn, ("/compile",)) == _compile(request_json)
+    compile_fn.assert_called_with({**request_json, "cirq_circuits": json.dumps(["c"])})
+    assert (cache.hits, cache.misses) == (4, 3)
+
+    # Single circuits share results with lists
+    request_json["cirq_circuits"] = json.dumps("c")
+    assert cache.compile(request_json, compile_fn, ("/compile",)) == _compile(
+        {"cirq_circuits": json.dumps(["c"])}
+    )
+    assert compile_fn.call_count == 2
+
+    # Different options, targets, or key parts are never shared
+    for request_update, key_parts in [
+        ({"options": '{"a": 1}'}, ("/compile",)),
+        ({"target": "u"}, ("/compile",)),
+        ({}, ("/aqt_compile",)),
+    ]:
+        assert cache.compile({**request_json, **request_update}, compile_fn, key_parts)
+    assert compile_fn.call_count == 5
+
+    # Empty requests are passed through
+    request_json["cirq_circuits"] = "[]"
+    compile_fn.side_effect = None
+    compile_fn.return_value = {"cirq_circuits": "[]"}
+    assert cache.compile(request_json, compile_fn) == {"cirq_circuits": "[]"}
+    assert compile_fn.call_count == 6
+
+
+def test_compile_cache_compile_multiple_outputs() -> None:
+    cache = gss.CompileCache()
+
+    def compile_eca(request_json: dict[str, Any]) -> dict[str, Any]:
+        circuits = json.loads(request_json["cirq_circuits"])
+        compiled_circuits = [f"{circuit} {i}" for circuit in circuits for i in range(2)]
+        return {"cirq_circuits": json.dumps(compiled_circuits)}
+
+    compile_fn = mock.MagicMock(side_effect=compile_eca)
+    request_json = {"cirq_circuits": json.dumps(["a"])}
+    assert cache.compile(request_json, compile_fn) == compile_eca(request_json)
+
+    request_json = {"cirq_circuits": json.dumps(["b", "a"])}
+    assert cache.compile(request_json, compile_fn) == compile_eca(request_json)
+    compile_fn.assert_called_with({"cirq_circuits": json.dumps(["b"])})
+
+
+def test_compile_cache_compile_unsplittable() -> None:
+    cache = gss.CompileCache()
+
+    def compile_pulses(request_json: dict[str, Any]) -> dict[str, Any]:
+        return {**_compile(request_json), "pulse_gate_circuits": "opaque"}
+
+    compile_fn = mock.MagicMock(side_effect=compile_pulses)
+    request_json = {"cirq_circuits": json.dumps(["a", "b"]), "target": "t"}
+
+    # Unsplittable responses are cached for the whole batch
+    assert cache.compile(request_json, compile_fn) == compile_pulses(request_json)
+    assert cache.compile(request_json, compile_fn) == compile_pulses(request_json)
+    assert compile_fn.call_count == 1
+    assert len(cache) == 1
+
+    # If only some circuits were cached, the whole batch is recompiled when necessary
+    cache.clear()
+    compile_fn.side_effect = [_compile({"cirq_circuits": json.dumps(["a"])})]
+    assert cache.compile({**request_json, "cirq_circuits": json.dumps(["a"])}, compile_fn)
+
+    compile_fn.side_effect = compile_pulses
+    assert cache.compile(request_json, compile_fn) == compile_pulses(request_json)
+    assert compile_fn.call_args_list[-2:] == [
+        mock.call({**request_json, "cirq_circuits": json.dumps(["b"])}),
+        mock.call(request_json),
+    ]
+
+    # Cached results with different fields can't be merged
+    cache.clear()
+    compile_fn.side_effect = [
+        {"cirq_circuits": json.dumps(["x"])},
+        {"cirq_circuits": json.dumps(["y"]), "jaqal_programs": ["y"]},
+        {"cirq_circuits": json.dumps(["x", "y"])},
+    ]
+    assert cache.compile({"cirq_circuits": json.dumps(["a"])}, compile_fn)
+    assert cache.compile({"cirq_circuits": json.dumps(["b"])}, compile_fn)
+    assert cache.compile({"cirq_circuits": json.dumps(["a", "b"])}, compile_fn) == {
+        "cirq_circuits": json.dumps(["x", "y"])
+    }
+
+    cache.clear()
+    compile_fn.side_effect = [
+        {"cirq_circuits": json.dumps(["x"])},
+        {"cirq_circuits": json.dumps(["y"]), "jaqal_programs": ["y"]},
+        {"cirq_circuits": json.dumps(["x", "y"])},
+    ]
+    assert cache.compile({"cirq_circuits": json.dumps(["a"])}, compile_fn)
+    assert cache.compile({"cirq_circuits": json.dumps(["a", "b"])}, compile_fn) == {
+        "cirq_circuits": json.dumps(["x", "y"])
+    }
+
+    # Responses with the wrong number of entries aren't split
+    cache.clear()
+    compile_fn.side_effect = [{"cirq_circuits": json.dumps(["x"]), "jaqal_programs": None}] * 2
+    assert cache.compile({"cirq_circuits": json.dumps(["a"])}, compile_fn)
+    assert cache.compile({"cirq_circuits": json.dumps(["a"])}, compile_fn)
+    assert compile_fn.call_count == 11
+
+
+def test_compile_cache_persistence(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "cache" / "compiled.sqlite3"
+    request_json = {"cirq_circuits": json.dumps(["a", "b"]), "target": "t"}
+
+    cache = gss.CompileCache(path=path)
+    assert cache.compile(request_json, _compile) == _compile(request_json)
+    assert len(cache) == 2
+    assert cache.size_bytes > 0
+
+    compile_fn = mock.MagicMock()
+    other_cache = gss.CompileCache(path=path)
+    assert other_cache.compile(request_json, compile_fn) == _compile(request_json)
+    assert other_cache.compile(request_json, compile_fn) == _compile(request_json)
+    compile_fn.assert_not_called()
+
+    # The least recently used results are evicted from disk
+    size = other_cache.size_bytes // 2
+    small_cache = gss.CompileCache(path=tmp_path / "small.sqlite3", max_disk_bytes=size)
+    small_cache.put("a", "x" * (size - 2))
+    small_cache.put("b", "y" * (size - 2))
+    small_cache.put("c", "z" * size)  # too large to persist
+    small_cache.clear()
+    assert small_cache.get("a") is None
+    assert small_cache.get("b") is None
+    small_cache.put("a", "x" * (size - 2))
+    small_cache.put("b", "y" * (size - 2))
+    assert len(small_cache) == 1
+    small_cache.close()
+
+    # Failed writes are rolled back
+    with mock.patch.object(other_cache, "_evict", side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            other_cache.put("c", "value")
+    other_cache.clear()
+    assert len(cache) == 0
+
+    cache.close()
+    other_cache.close()
@@ -0,0 +1,209 @@
+"""A vectorized representation of measurement counts, shared by cirq- and qiskit-superstaq."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+_ZERO = ord("0")
+
+
+class Counts:
+    """A histogram of measurement outcomes, stored as an array of bits and an array of counts.
+
+    Each row of `outcomes` holds the bits of one outcome (in the same order as the characters of
+    the corresponding bitstring), and the same row of `counts` holds the number of times it was
+    measured. All operations are performed on these arrays with NumPy, so their cost is
+    independent of the number of distinct outcomes in Python terms, e.g.:
+
+    .. code-block:: python
+
+        counts = gss.Counts.from_dict({"011": 10, "110": 5})
+        counts.marginalize([2, 0]).to_dict()  # {"10": 10, "01": 5}
+
+    Both arrays are read-only, so they can be shared freely (including with views derived from
+    them). Counts are stored as integers, unless they are given as floats (e.g. fractional counts
+    from measurement error mitigation), in which case they are kept as floats.
+    """
+
+    def __init__(self, outcomes: npt.ArrayLike, counts: npt.ArrayLike) -> None:
+        """Initializes a `Counts` object.
+
+        Outcomes need not be unique; use `merge` to combine the counts of repeated outcomes.
+
+        Args:
+            outcomes: A two-dimensional array of bits (zeros and ones), with one row per outcome.
+            counts: The number of times each outcome was measured (integers or floats).
+
+        Raises:
+            ValueError: If `outcomes` is not two-dimensional, or if `counts` is not a
+                one-dimensional array with one entry per outcome.
+        """
+        # Use views, so that marking them read-only doesn't affect the caller's arrays
+        outcomes = np.asarray(outcomes, dtype=np.uint8).view()
+        counts = np.asarray(counts)
+        if counts.size and counts.dtype.kind not in "biu":
+            counts = counts.astype(np.float64, copy=False).view()
+        else:
+            counts = counts.astype(np.int64, copy=False).view()
+        if outcomes.ndim != 2:
+            raise ValueError("`outcomes` must be a two-dimensional array of bits.")
+        if counts.shape != outcomes.shape[:1]:
+            raise ValueError("`counts` must contain exactly one entry per outcome.")
+
+        outcomes.setflags(write=False)
+        counts.setflags(write=False)
+        self._outcomes: npt.NDArray[np.uint8] = outcomes
+        self._counts: npt.NDArray[np.int64 | np.float64] = counts
+
+    @classmethod
+    def from_dict(cls, counts: Mapping[str, float], num_bits: int | None = None) -> Counts:
+        """Creates a `Counts` object from a dictionary mapping bitstrings to counts.
+
+        Args:
+            counts: A dictionary mapping bitstrings (e.g. "0110") to the number of times they were
+                measured (integers or floats). All bitstrings must have the same length.
+            num_bits: The number of bits in each outcome. Only needed if `counts` is empty.
+
+        Returns:
+            The new `Counts` object.
+
+        Raises:
+            ValueError: If the bitstrings are not all of the same length (or of length
+                `num_bits`), or contain characters other than "0" and "1".
+        """
+        if num_bits is None:
+            num_bits = len(next(iter(counts), ""))
+
+        bits = np.frombuffer("".join(counts).encode(), dtype=np.uint8) - np.uint8(_ZERO)
+        if bits.size != len(counts) * num_bits or any(len(key) != num_bits for key in counts):
+            raise ValueError(f"All bitstrings must have length {num_bits}.")
+        if np.any(bits > 1):
+            raise ValueError("Bitstrings may only contain the characters '0' and '1'.")
+
+        outcomes = bits.reshape(len(counts), num_bits)
+        return cls(outcomes, np.array(list(counts.values())))
+
+    @property
+    def outcomes(self) -> npt.NDArray[np.uint8]:
+        """A (read-only) two-dimensional array of bits, with one row per outcome."""
+        return self._outcomes
+
+    @property
+    def counts(self) -> npt.NDArray[np.int64 | np.float64]:
+        """A (read-only) array of the number of times each outcome was measured."""
+        return self._counts
+
+    @property
+    def num_bits(self) -> int:
+        """The number of bits in each outcome."""
+        return self._outcomes.shape[1]
+
+    @property
+    def shots(self) -> int:
+        """The total number of measurements (rounded to the nearest integer for float counts)."""
+        return round(self._counts.sum().item())
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Counts):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __add__(self, other: Counts) -> Counts:
+        """Combines two histograms of outcomes with the same number of bits.
+
+        Args:
+            other: The `Counts` to combine with.
+
+        Returns:
+            A new (merged) `Counts` object containing the outcomes of both.
+
+        Raises:
+            ValueError: If the outcomes have different numbers of bits.
+        """
+        if self.num_bits != other.num_bits:
+            raise ValueError("Only counts with the same number of bits can be added.")
+        outcomes = np.concatenate([self._outcomes, other._outcomes])
+        return Counts(outcomes, np.concatenate([self._counts, other._counts])).merge()
+
+    def __repr__(self) -> str:
+        return f"gss.Counts.from_dict({self.to_dict()!r}, num_bits={self.num_bits!r})"
+
+    def to_dict(self) -> dict[str, int]:
+        """Converts to a dictionary mapping bitstrings to counts.
+
+        Returns:
+            A dictionary mapping each outcome (as a bitstring) to its count (an integer, or a float
+            for float counts). Repeated outcomes are combined.
+        """
+        num_bits = self.num_bits
+        keys = [""] * len(self)
+        if num_bits:
+            chars = (self._outcomes + np.uint8(_ZERO)).tobytes().decode()
+            keys = [chars[i : i + num_bits] for i in range(0, len(chars), num_bits)]
+
+        result: dict[str, int] = {}
+        for key, count in zip(keys, self._counts.tolist()):
+            result[key] = result.get(key, 0) + count
+        return result
+
+    def merge(self) -> Counts:
+        """Combines the counts of repeated outcomes.
+
+        Returns:
+            A new `Counts` object with unique outcomes (in sorted order).
+        """
+        if not self.num_bits:
+            total = self._counts.sum(keepdims=True)
+            return Counts(np.zeros((min(len(self), 1), 0), dtype=np.uint8), total[: len(self)])
+
+        packed = np.ascontiguousarray(np.packbits(self._outcomes, axis=1))
+        keys = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+        _, first_indices, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        counts = np.bincount(inverse.ravel(), weights=self._counts, minlength=len(first_indices))
+        return Counts(self._outcomes[first_indices], counts.astype(self._counts.dtype))
+
+    def marginalize(self, indices: Sequence[int]) -> Counts:
+        """Computes a marginal distribution over (or a permutation of) some of the bits.
+
+        Args:
+            indices: The indices of the bits to keep, in the order they should appear in the new
+                outcomes.
+
+        Returns:
+            A new (merged) `Counts` object whose outcomes contain only the bits at `indices`.
+        """
+        return Counts(self._outcomes[:, list(indices)], self._counts).merge()
+
+    def expand(self, indices: Sequence[int], num_bits: int) -> Counts:
+        """Places the bits of each outcome at the given positions of a wider (zero-padded) outcome.
+
+        Args:
+            indices: The new index of each of the current bits.
+            num_bits: The number of bits in each new outcome.
+
+        Returns:
+            A new `Counts` object with `num_bits` bits per outcome.
+
+        Raises:
+            ValueError: If there is not exactly one index per bit.
+        """
+        if len(indices) != self.num_bits:
+            raise ValueError("Exactly one index must be provided for each bit.")
+
+        outcomes = np.zeros((len(self), num_bits), dtype=np.uint8)
+        outcomes[:, list(indices)] = self._outcomes
+        return Counts(outcomes, self._counts)
+
+    def reverse_bits(self) -> Counts:
+        """Reverses the order of the bits in each outcome (i.e. flips their endianness).
+
+        Returns:
+            A new `Counts` object sharing this object's data.
+        """
+        return Counts(self._outcomes[:, ::-1], self._counts)
@@ -0,0 +1,121 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import general_superstaq as gss
+
+
+def test_counts() -> None:
+    counts = gss.Counts.from_dict({"011": 10, "110": 5, "010": 2})
+    assert counts.num_bits == 3
+    assert counts.shots == 17
+    assert len(counts) == 3
+    np.testing.assert_array_equal(counts.outcomes, [[0, 1, 1], [1, 1, 0], [0, 1, 0]])
+    np.testing.assert_array_equal(counts.counts, [10, 5, 2])
+    assert counts.to_dict() == {"011": 10, "110": 5, "010": 2}
+
+    with pytest.raises(ValueError, match="read-only"):
+        counts.outcomes[0, 0] = 1
+
+    assert counts == gss.Counts([[0, 1, 0], [1, 1, 0], [0, 1, 1]], [2, 5, 10])
+    assert counts != gss.Counts.from_dict({"011": 10})
+    assert counts != {"011": 10, "110": 5, "010": 2}
+    assert repr(counts) == "gss.Counts.from_dict({'011': 10, '110': 5, '010': 2}, num_bits=3)"
+
+
+def test_counts_validation() -> None:
+    with pytest.raises(ValueError, match="two-dimensional"):
+        _ = gss.Counts([0, 1], [1, 1])
+    with pytest.raises(ValueError, match="one entry per outcome"):
+        _ = gss.Counts([[0], [1]], [1])
+    with pytest.raises(ValueError, match="length 2"):
+        _ = gss.Counts.from_dict({"01": 1, "1": 1})
+    with pytest.raises(ValueError, match="length 2"):
+        _ = gss.Counts.from_dict({"01": 1, "101": 1})
+    with pytest.raises(ValueError, match="length 1"):
+        _ = gss.Counts.from_dict({"01": 1}, num_bits=1)
+    with pytest.raises(ValueError, match="only contain"):
+        _ = gss.Counts.from_dict({"0x": 1})
+
+    # The caller's arrays are not made read-only
+    outcomes = np.array([[0, 1]], dtype=np.uint8)
+    _ = gss.Counts(outcomes, [1])
+    outcomes[0, 0] = 1
+
+
+def test_counts_empty() -> None:
+    counts = gss.Counts.from_dict({}, num_bits=3)
+    assert counts.outcomes.shape == (0, 3)
+    assert counts.to_dict() == {}
+    assert counts.merge().to_dict() == {}
+    assert counts.marginalize([]).to_dict() == {}
+
+    counts = gss.Counts.from_dict({"": 3})
+    assert counts.num_bits == 0
+    assert counts.to_dict() == {"": 3}
+
+
+def test_counts_merge() -> None:
+    counts = gss.Counts([[1, 0], [0, 1], [1, 0], [0, 1], [1, 1]], [1, 2, 3, 4, 5])
+    assert counts.to_dict() == {"10": 4, "01": 6, "11": 5}
+
+    merged = counts.merge()
+    np.testing.assert_array_equal(merged.outcomes, [[0, 1], [1, 0], [1, 1]])
+    np.testing.assert_array_equal(merged.counts, [6, 4, 5])
+
+    assert (counts + gss.Counts.from_dict({"00": 1, "11": 1})).to_dict() == {
+        "00": 1,
+        "01": 6,
+        "10": 4,
+        "11": 6,
+    }
+    with pytest.raises(ValueError, match="same number of bits"):
+        _ = counts + gss.Counts.from_dict({"0": 1})
+
+    # Outcomes wider than 64 bits
+    wide = gss.Counts.from_dict({"0" * 100: 1, "1" * 100: 2})
+    assert (wide + wide).to_dict() == {"0" * 100: 2, "1" * 100: 4}
+
+
+def test_counts_fractional() -> None:
+    # Fractional counts (e.g. from measurement error mitigation) are kept as floats
+    counts = gss.Counts.from_dict({"01": 1.5, "11": 2.5, "00": -0.25})
+    assert counts.counts.dtype == np.float64
+    assert counts.shots == 4
+    assert counts.marginalize([1]).to_dict() == {"0": -0.25, "1": 4.0}
+    assert counts.expand([0, 2], 3).to_dict() == {"001": 1.5, "101": 2.5, "000": -0.25}
+    assert (counts + gss.Counts.from_dict({"01": 1})).to_dict() == {
+        "00": -0.25,
+        "01": 2.5,
+        "11": 2.5,
+    }
+
+    assert gss.Counts.from_dict({"0": 1, "1": 2}).counts.dtype == np.int64
+    assert gss.Counts.from_dict({}, num_bits=1).counts.dtype == np.int64
+
+
+def test_counts_marginalize() -> None:
+    counts = gss.Counts.from_dict({"011": 10, "110": 5, "010": 2})
+    assert counts.marginalize([2, 0]).to_dict() == {"00": 2, "01": 5, "10": 10}
+    assert counts.marginalize([1]).to_dict() == {"1": 17}
+    assert counts.marginalize([]).to_dict() == {"": 17}
+
+
+def test_counts_expand() -> None:
+    counts = gss.Counts.from_dict({"011": 100, "001": 25, "111": 100, "101": 25})
+    assert counts.expand([0, 2, 4], 5).to_dict() == {
+        "00101": 100,
+        "00001": 25,
+        "10101": 100,
+        "10001": 25,
+    }
+    with pytest.raises(ValueError, match="one index"):
+        _ = counts.expand([0, 2], 5)
+
+
+def test_counts_reverse_bits() -> None:
+    counts = gss.Counts.from_dict({"011": 10, "110": 5})
+    assert counts.reverse_bits().to_dict() == {"110": 10, "011": 5}
+    assert np.shares_memory(counts.reverse_bits().outcomes, counts.outcomes)
@@ -0,0 +1,356 @@
+"""Opt-in instrumentation of requests to the Superstaq API and of circuit (de)serialization.
+
+Instrumentation is disabled (and costs next to nothing) until a listener is added. Listeners are
+called with a `RequestEvent` after every API request, and with a `TimingEvent` after every
+instrumented operation (such as `css.serialize_circuits` or `qss.deserialize_circuits`). For
+example, to collect latency and payload-size histograms:
+
+.. code-block:: python
+
+    collector = gss.instrumentation.HistogramCollector()
+    with gss.instrumentation.listening(collector):
+        job = service.create_job(circuits, target="ss_unconstrained_simulator")
+        counts = job.counts()
+
+    print(collector.snapshot()["requests"]["/jobs"]["wall_time_seconds"])
+"""
+
+from __future__ import annotations
+
+import bisect
+import collections
+import contextlib
+import dataclasses
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, TypeVar, Union
+
+import requests
+
+TCallable = TypeVar("TCallable", bound=Callable[..., Any])
+
+
+@dataclasses.dataclass(frozen=True)
+class RequestEvent:
+    """Information about a (possibly retried) request to the Superstaq API."""
+
+    endpoint: str
+    """The requested endpoint (e.g. "/jobs")."""
+    method: str
+    """The HTTP method of the request (e.g. "POST")."""
+    request_bytes: int
+    """The size of the body of the (final) request, as sent."""
+    response_bytes: int
+    """The size of the body of the (final) response."""
+    wall_time_seconds: float
+    """The time taken by the request, including any retries."""
+    attempts: int
+    """The number of times the request was sent."""
+    status_code: int | None
+    """The HTTP status code of the final response, or None if no response was received."""
+
+
+@dataclasses.dataclass(frozen=True)
+class TimingEvent:
+    """Information about an instrumented operation, such as circuit serialization."""
+
+    name: str
+    """The name of the operation (e.g. "css.serialize_circuits")."""
+    wall_time_seconds: float
+    """The time taken by the operation."""
+
+
+Event = Union[RequestEvent, TimingEvent]
+
+_listeners: list[Callable[[Event], object]] = []
+_listeners_lock = threading.Lock()
+
+
+def add_listener(listener: Callable[[Event], object]) -> None:
+    """Registers a function to be called with every `RequestEvent` and `TimingEvent`.
+
+    Args:
+        listener: The function to call.
+    """
+    global _listeners
+    with _listeners_lock:
+        _listeners = [*_listeners, listener]
+
+
+def remove_listener(listener: Callable[[Event], object]) -> None:
+    """Unregisters a listener added with `add_listener`.
+
+    Args:
+        listener: The listener to remove.
+
+    Raises:
+        ValueError: If `listener` is not registered.
+    """
+    global _listeners
+    with _listeners_lock:
+        listeners = list(_listeners)
+        listeners.remove(listener)
+        _listeners = listeners
+
+
+@contextlib.contextmanager
+def listening(listener: Callable[[Event], object]) -> Iterator[Callable[[Event], object]]:
+    """A context manager which registers a listener for the duration of a block.
+
+    Args:
+        listener: The function to call with every event.
+
+    Yields:
+        The listener.
+    """
+    add_listener(listener)
+    try:
+        yield listener
+    finally:
+        remove_listener(listener)
+
+
+def is_enabled() -> bool:
+    """Whether any listeners are registered (i.e. whether events should be emitted)."""
+    return bool(_listeners)
+
+
+def emit(event: Event) -> None:
+    """Calls every registered listener with an event.
+
+    Args:
+        event: The event.
+    """
+    for listener in _listeners:
+        listener(event)
+
+
+def emit_request(
+    endpoint: str,
+    response: requests.Response | None,
+    wall_time_seconds: float,
+    attempts: int,
+) -> None:
+    """Emits a `RequestEvent` describing a request to the Superstaq API.
+
+    Args:
+        endpoint: The requested endpoint.
+        response: The final response received (or None if no response was received).
+        wall_time_seconds: The time taken by the request, including any retries.
+        attempts: The number of times the request was sent.
+    """
+    method = ""
+    request_bytes = response_bytes = 0
+    status_code = None
+    if response is not None:
+        status_code = response.status_code
+        response_bytes = len(response.content or b"")
+        if response.request is not None:
+            method = response.request.method or ""
+            body = response.request.body
+            request_bytes = len(body) if isinstance(body, (bytes, str)) else 0
+
+    emit(
+        RequestEvent(
+            endpoint=endpoint,
+            method=method,
+            request_bytes=request_bytes,
+            response_bytes=response_bytes,
+            wall_time_seconds=wall_time_seconds,
+            attempts=attempts,
+            status_code=status_code,
+        )
+    )
+
+
+def timed(name: str) -> Callable[[TCallable], TCallable]:
+    """A decorator which emits a `TimingEvent` every time the decorated function is called.
+
+    When instrumentation is disabled the decorated function is called directly.
+
+    Args:
+        name: The name of the operation (e.g. "css.serialize_circuits").
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: TCallable) -> TCallable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _listeners:
+                return func(*args, **kwargs)
+
+            start_time = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                emit(TimingEvent(name, time.perf_counter() - start_time))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+DEFAULT_SECONDS_BUCKETS = tuple(0.001 * 2**i for i in range(18))
+"""Histogram bucket boundaries for durations: 1ms, 2ms, 4ms, ..., ~131s."""
+
+DEFAULT_BYTES_BUCKETS = tuple(256 * 4**i for i in range(12))
+"""Histogram bucket boundaries for payload sizes: 256B, 1KiB, 4KiB, ..., 1GiB."""
+
+
+class Histogram:
+    """A histogram of observed values, with fixed bucket boundaries."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initializes a `Histogram`.
+
+        Args:
+            buckets: The (increasing) upper bounds of each bucket. Values greater than the last
+                bound are counted in an additional overflow bucket.
+        """
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Records a value.
+
+        Args:
+            value: The value to record.
+        """
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile of the recorded values (as the upper bound of its bucket).
+
+        Args:
+            q: The quantile to estimate, between 0 and 1.
+
+        Returns:
+            The estimated quantile (or zero if no values have been recorded).
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        cumulative_count = 0
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns the current state of the histogram as a (json-serializable) dictionary."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([*self.buckets, float("inf")], self.bucket_counts)),
+        }
+
+
+class HistogramCollector:
+    """A listener which aggregates events into in-memory histograms, for scraping.
+
+    Request latencies and payload sizes are recorded per endpoint, along with the total number of
+    attempts and the number of final responses with each status code. Other operations are
+    recorded by name.
+    """
+
+    def __init__(
+        self,
+        seconds_buckets: Sequence[float] = DEFAULT_SECONDS_BUCKETS,
+        bytes_buckets: Sequence[float] = DEFAULT_BYTES_BUCKETS,
+    ) -> None:
+        """Initializes a `HistogramCollector`.
+
+        Args:
+            seconds_buckets: The bucket boundaries to use for durations.
+            bytes_buckets: The bucket boundaries to use for payload sizes.
+        """
+        self.seconds_buckets = tuple(seconds_buckets)
+        self.bytes_buckets = tuple(bytes_buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, event: Event) -> None:
+        """Records an event.
+
+        Args:
+            event: The event to record.
+        """
+        with self._lock:
+            if isinstance(event, RequestEvent):
+                key = event.endpoint
+                self._histogram(self._request_seconds, key, self.seconds_buckets).observe(
+                    event.wall_time_seconds
+                )
+                self._histogram(self._request_bytes, key, self.bytes_buckets).observe(
+                    event.request_bytes
+                )
+                self._histogram(self._response_bytes, key, self.bytes_buckets).observe(
+                    event.response_bytes
+                )
+                self._attempts[key] += event.attempts
+                self._status_codes[key][event.status_code] += 1
+            else:
+                self._histogram(self._timings, event.name, self.seconds_buckets).observe(
+                    event.wall_time_seconds
+                )
+
+    def reset(self) -> None:
+        """Discards all recorded data."""
+        with self._lock:
+            self._request_seconds: dict[str, Histogram] = {}
+            self._request_bytes: dict[str, Histogram] = {}
+            self._response_bytes: dict[str, Histogram] = {}
+            self._attempts: collections.Counter[str] = collections.Counter()
+            self._status_codes: collections.defaultdict[str, collections.Counter[int | None]] = (
+                collections.defaultdict(collections.Counter)
+            )
+            self._timings: dict[str, Histogram] = {}
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns all recorded data as a (json-serializable) dictionary.
+
+        Returns:
+            A dictionary with "requests" (mapping each endpoint to histograms of its
+            "wall_time_seconds", "request_bytes", and "response_bytes", plus its total number of
+            "attempts" and a count of its final "status_codes") and "timings" (mapping the names
+            of other operations to histograms of their durations).
+        """
+        with self._lock:
+            return {
+                "requests": {
+                    endpoint: {
+                        "wall_time_seconds": histogram.snapshot(),
+                        "request_bytes": self._request_bytes[endpoint].snapshot(),
+                        "response_bytes": self._response_bytes[endpoint].snapshot(),
+                        "attempts": self._attempts[endpoint],
+                        "status_codes": dict(self._status_codes[endpoint]),
+                    }
+                    for endpoint, histogram in self._request_seconds.items()
+                },
+                "timings": {
+                    name: histogram.snapshot() for name, histogram in self._timings.items()
+                },
+            }
+
+    @staticmethod
+    def _histogram(
+        histograms: dict[str, Histogram], key: str, buckets: Sequence[float]
+    ) -> Histogram:
+        if key not in histograms:
+            histograms[key] = Histogram(buckets)
+        return histograms[key]
@@ -0,0 +1,142 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+import requests
+
+import general_superstaq as gss
+
+
+def test_listeners() -> None:
+    events: list[gss.instrumentation.Event] = []
+    assert not gss.instrumentation.is_enabled()
+
+    with gss.instrumentation.listening(events.append):
+        assert gss.instrumentation.is_enabled()
+        gss.instrumentation.emit(gss.instrumentation.TimingEvent("foo", 1.0))
+
+    assert not gss.instrumentation.is_enabled()
+    gss.instrumentation.emit(gss.instrumentation.TimingEvent("bar", 1.0))
+    assert events == [gss.instrumentation.TimingEvent("foo", 1.0)]
+
+    with pytest.raises(ValueError):
+        gss.instrumentation.remove_listener(events.append)
+
+
+def test_timed() -> None:
+    @gss.instrumentation.timed("double")
+    def double(x: int) -> int:
+        if x < 0:
+            raise ValueError("Negative!")
+        return 2 * x
+
+    assert double.__name__ == "double"
+    assert double(2) == 4
+
+    events: list[gss.instrumentation.Event] = []
+    with gss.instrumentation.listening(events.append):
+        with mock.patch("time.perf_counter", side_effect=[1.0, 1.5, 2.0, 4.0]):
+            assert double(3) == 6
+            with pytest.raises(ValueError, match="Negative"):
+                _ = double(-1)
+
+    assert events == [
+        gss.instrumentation.TimingEvent("double", 0.5),
+        gss.instrumentation.TimingEvent("double", 2.0),
+    ]
+
+
+def test_histogram() -> None:
+    histogram = gss.instrumentation.Histogram([1, 10, 100])
+    assert histogram.quantile(0.5) == 0.0
+
+    for value in (0.5, 5, 5, 50, 500):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.2) == 1
+    assert histogram.quantile(0.5) == 10
+    assert histogram.quantile(0.8) == 100
+    assert histogram.quantile(1.0) == 500
+    assert histogram.snapshot() == {
+        "count": 5,
+        "sum": 560.5,
+        "max": 500,
+        "p50": 10,
+        "p99": 500,
+        "buckets": {1: 1, 10: 2, 100: 1, float("inf"): 1},
+    }
+
+    histogram = gss.instrumentation.Histogram([1, 10, 100])
+    histogram.observe(5)
+    assert histogram.quantile(0.5) == 5
+
+
+def test_histogram_collector() -> None:
+    collector = gss.instrumentation.HistogramCollector(seconds_buckets=[1], bytes_buckets=[100])
+    collector(gss.instrumentation.RequestEvent("/jobs", "POST", 50, 200, 0.5, 1, 200))
+    collector(gss.instrumentation.RequestEvent("/jobs", "POST", 150, 20, 2.0, 3, 503))
+    collector(gss.instrumentation.TimingEvent("css.serialize_circuits", 0.25))
+
+    snapshot = collector.snapshot()
+    assert snapshot["requests"]["/jobs"]["attempts"] == 4
+    assert snapshot["requests"]["/jobs"]["status_codes"] == {200: 1, 503: 1}
+    assert snapshot["requests"]["/jobs"]["wall_time_seconds"]["buckets"] == {
+        1: 1,
+        float("inf"): 1,
+    }
+    assert snapshot["requests"]["/jobs"]["request_bytes"]["sum"] == 200
+    assert snapshot["requests"]["/jobs"]["response_bytes"]["max"] == 200
+    assert snapshot["timings"]["css.serialize_circuits"]["count"] == 1
+
+    collector.reset()
+    assert collector.snapshot() == {"requests": {}, "timings": {}}
+
+
+def test_client_instrumentation() -> None:
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        max_retry_seconds=1,
+    )
+    server = gss.testing.FakeSuperstaqServer()
+    server.install(client)
+
+    # Nothing is recorded until a listener is added
+    _ = client.target_info("ss_unconstrained_simulator")
+
+    events: list[gss.instrumentation.Event] = []
+    with gss.instrumentation.listening(events.append), mock.patch("time.sleep"):
+        server.inject_errors(2)
+        _ = client.target_info("ss_unconstrained_simulator")
+        with pytest.raises(gss.SuperstaqServerException, match="not a valid target"):
+            _ = client.target_info("ss_nonexistent_qpu")
+
+    assert len(events) == 2
+    assert isinstance(events[0], gss.instrumentation.RequestEvent)
+    assert events[0].endpoint == "/target_info"
+    assert events[0].method == "POST"
+    assert events[0].request_bytes > 0
+    assert events[0].response_bytes == len(b'{"target_info": {}}')
+    assert events[0].attempts == 3
+    assert events[0].status_code == 200
+    assert events[0].wall_time_seconds >= 0
+
+    assert isinstance(events[1], gss.instrumentation.RequestEvent)
+    assert events[1].attempts == 1
+    assert events[1].status_code == 400
+
+    # Requests which never receive a response
+    collector = gss.instrumentation.HistogramCollector()
+    with gss.instrumentation.listening(collector), mock.patch("time.sleep"), mock.patch(
+        "requests.Session.get", side_effect=requests.ConnectionError
+    ):
+        with pytest.raises(TimeoutError):
+            _ = client.get_request("/endpoint")
+
+    snapshot = collector.snapshot()["requests"]["/endpoint"]
+    assert snapshot["status_codes"] == {None: 1}
+    assert snapshot["response_bytes"]["sum"] == 0
+    assert snapshot["attempts"] > 1
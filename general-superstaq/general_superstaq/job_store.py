@@ -0,0 +1,208 @@
+"""A persistent, local store of finished jobs, so that they never need to be refetched."""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+TERMINAL_STATES = ("Done", "Canceled", "Cancelled", "Failed", "Deleted")
+"""The job statuses after which a job's data will never change (and so can be stored)."""
+
+_SCHEMA_VERSION = 1
+"""The version of the database schema (stored databases with an older schema are reset)."""
+
+_MAX_QUERY_IDS = 500
+"""The maximum number of job ids per query (well within SQLite's limit on query parameters)."""
+
+
+class JobStore:
+    """An on-disk (SQLite) store of the data of jobs which have reached a terminal state.
+
+    When a client is created with a job store, every job fetched from the Superstaq API in a
+    terminal state (including its counts and input/compiled circuits) is saved to the store, and
+    stored jobs are never requested from the API again - not even by other processes. Jobs are
+    stored by API URL and job id, so a single store can be shared by clients of different servers.
+
+    The database is opened in write-ahead logging mode, so that it can safely be shared by any
+    number of processes. Once its contents exceed `max_size_bytes`, the least recently used jobs
+    are evicted.
+
+    .. code-block:: python
+
+        job_store = gss.JobStore("~/.superstaq/jobs.sqlite3")
+        service = css.Service(job_store=job_store)
+        counts = service.get_job("<job_id>").counts()  # fetched from the API at most once
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_size_bytes: int = 256 * 1024 * 1024,
+        terminal_states: Iterable[str] = TERMINAL_STATES,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        """Opens (or creates) a `JobStore`.
+
+        Args:
+            path: The database file (or ":memory:" for a store which is not persisted).
+            max_size_bytes: The maximum total size of the stored job data, beyond which the least
+                recently used jobs are evicted.
+            terminal_states: The job statuses after which a job can be stored.
+            timeout_seconds: How long to wait for other processes to release the database.
+
+        Raises:
+            ValueError: If `max_size_bytes` is not positive.
+        """
+        if max_size_bytes <= 0:
+            raise ValueError("`max_size_bytes` must be positive.")
+
+        self.path = pathlib.Path(path).expanduser() if path != ":memory:" else None
+        self.max_size_bytes = max_size_bytes
+        self.terminal_states = tuple(terminal_states)
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path or ":memory:"),
+            timeout=timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        with self._lock:
+            if self.path is not None:
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._create_tables()
+
+    def _create_tables(self) -> None:
+        """Creates the database tables, first dropping any stored with an older schema."""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            if version < _SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS jobs")
+                self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "url TEXT NOT NULL, job_id TEXT NOT NULL, data TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed_at REAL NOT NULL, PRIMARY KEY (url, job_id))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_accessed_at ON jobs (accessed_at)"
+            )
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def get_jobs(self, url: str, job_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Gets the data of any stored jobs.
+
+        Args:
+            url: The URL of the API from which the jobs were fetched.
+            job_ids: The ids of the jobs to look up.
+
+        Returns:
+            A dictionary mapping each of the given job ids which is in the store to its job data.
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        now = time.time()
+        rows = []
+        with self._lock:
+            for start in range(0, len(job_ids), _MAX_QUERY_IDS):
+                chunk = job_ids[start : start + _MAX_QUERY_IDS]
+                placeholders = ", ".join("?" * len(chunk))
+                chunk_rows = self._connection.execute(
+                    f"SELECT job_id, data FROM jobs WHERE url = ? AND job_id IN ({placeholders})",
+                    [url, *chunk],
+                ).fetchall()
+                if chunk_rows:
+                    self._connection.execute(
+                        "UPDATE jobs SET accessed_at = ? "
+                        f"WHERE url = ? AND job_id IN ({placeholders})",
+                        [now, url, *chunk],
+                    )
+                    rows.extend(chunk_rows)
+
+        return {job_id: json.loads(data) for job_id, data in rows}
+
+    def put_jobs(self, url: str, jobs: Mapping[str, Mapping[str, Any]]) -> None:
+        """Stores the data of any of the given jobs which are in a terminal state.
+
+        Jobs which are larger than `max_size_bytes` on their own are not stored.
+
+        Args:
+            url: The URL of the API from which the jobs were fetched.
+            jobs: A dictionary mapping job ids to job data (as returned by `/fetch_jobs`).
+        """
+        now = time.time()
+        rows = []
+        for job_id, job_data in jobs.items():
+            if job_data.get("status") in self.terminal_states:
+                data = json.dumps(job_data)
+                if len(data) <= self.max_size_bytes:
+                    rows.append((url, job_id, data, len(data), now))
+
+        if not rows:
+            return
+
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO jobs (url, job_id, data, size, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict()
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def _evict(self) -> None:
+        """Deletes the least recently used jobs until the store is no larger than its limit."""
+        (total_size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM jobs"
+        ).fetchone()
+        if total_size <= self.max_size_bytes:
+            return
+
+        to_delete = []
+        rows = self._connection.execute(
+            "SELECT rowid, size FROM jobs ORDER BY accessed_at"
+        ).fetchall()
+        for rowid, size in rows:
+            if total_size <= self.max_size_bytes:
+                break
+            to_delete.append((rowid,))
+            total_size -= size
+
+        self._connection.executemany("DELETE FROM jobs WHERE rowid = ?", to_delete)
+
+    @property
+    def size_bytes(self) -> int:
+        """The total size of the stored job data."""
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM jobs").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def clear(self) -> None:
+        """Deletes all stored jobs."""
+        with self._lock:
+            self._connection.execute("DELETE FROM jobs")
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,141 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import pathlib
+import sqlite3
+from unittest import mock
+
+import pytest
+
+import general_superstaq as gss
+
+URL = "https://superstaq.infleqtion.com/v0.2.0"
+
+
+def test_job_store(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError, match="positive"):
+        _ = gss.JobStore(tmp_path / "jobs.sqlite3", max_size_bytes=0)
+
+    path = tmp_path / "store" / "jobs.sqlite3"
+    job_store = gss.JobStore(path)
+    assert job_store.get_jobs(URL, []) == {}
+
+    job_store.put_jobs(
+        URL,
+        {
+            "job_1": {"status": "Done", "samples": {"00": 10}},
+            "job_2": {"status": "Running"},
+            "job_3": {"status": "Cancelled"},
+        },
+    )
+    job_store.put_jobs(URL, {"job_4": {"status": "Queued"}})
+    assert len(job_store) == 2
+    assert job_store.size_bytes > 0
+    assert job_store.get_jobs(URL, ["job_1", "job_2", "job_1"]) == {
+        "job_1": {"status": "Done", "samples": {"00": 10}}
+    }
+    assert job_store.get_jobs(URL, ["job_2"]) == {}
+
+    # The store is shared by other connections (e.g. in other processes)
+    other_job_store = gss.JobStore(path)
+    assert other_job_store.get_jobs(URL, ["job_1", "job_3"]) == {
+        "job_1": {"status": "Done", "samples": {"00": 10}},
+        "job_3": {"status": "Cancelled"},
+    }
+    assert sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    # Jobs are stored separately for each API URL
+    assert job_store.get_jobs("http://example.com/v0.2.0", ["job_1", "job_3"]) == {}
+    job_store.put_jobs("http://example.com/v0.2.0", {"job_1": {"status": "Failed"}})
+    assert job_store.get_jobs("http://example.com/v0.2.0", ["job_1"]) == {
+        "job_1": {"status": "Failed"}
+    }
+    assert job_store.get_jobs(URL, ["job_1"]) == {
+        "job_1": {"status": "Done", "samples": {"00": 10}}
+    }
+    assert len(job_store) == 3
+
+    job_store.clear()
+    assert len(other_job_store) == 0
+
+    job_store.close()
+    other_job_store.close()
+
+
+def test_job_store_eviction() -> None:
+    job_store = gss.JobStore(":memory:", max_size_bytes=100, terminal_states=["Done"])
+    assert job_store.path is None
+
+    job_data = {"status": "Done", "samples": {"0": 1}}  # 39 bytes when serialized
+    with mock.patch("time.time", return_value=1.0):
+        job_store.put_jobs(
+            URL, {"job_1": job_data, "job_2": job_data, "job_3": {"status": "Failed"}}
+        )
+    with mock.patch("time.time", return_value=2.0):
+        assert job_store.get_jobs(URL, ["job_1"]) == {"job_1": job_data}
+        job_store.put_jobs(URL, {"job_3": job_data})
+
+    # job_2 was the least recently used
+    assert job_store.get_jobs(URL, ["job_1", "job_2", "job_3"]) == {
+        "job_1": job_data,
+        "job_3": job_data,
+    }
+    assert job_store.size_bytes == 78
+
+    # Jobs larger than the store are not stored
+    job_store.put_jobs(URL, {"job_4": {"status": "Done", "data": "x" * 100}})
+    assert job_store.get_jobs(URL, ["job_4"]) == {}
+    assert len(job_store) == 2
+
+
+def test_job_store_rollback() -> None:
+    job_store = gss.JobStore(":memory:")
+    with mock.patch.object(job_store, "_evict", side_effect=KeyboardInterrupt):
+        with pytest.raises(KeyboardInterrupt):
+            job_store.put_jobs(URL, {"job_1": {"status": "Done"}})
+    assert len(job_store) == 0
+
+
+def test_job_store_chunked_lookup() -> None:
+    job_store = gss.JobStore(":memory:")
+    jobs = {f"job_{i}": {"status": "Done"} for i in range(7)}
+    job_store.put_jobs(URL, jobs)
+    with mock.patch("general_superstaq.job_store._MAX_QUERY_IDS", 2):
+        assert job_store.get_jobs(URL, [*jobs, "job_7"]) == jobs
+
+
+def test_job_store_schema_upgrade(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE jobs (job_id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+    connection.execute("INSERT INTO jobs VALUES ('job_1', '{}')")
+    connection.commit()
+    connection.close()
+
+    # Stores with an older schema are reset
+    job_store = gss.JobStore(path)
+    assert len(job_store) == 0
+    job_store.put_jobs(URL, {"job_1": {"status": "Done"}})
+    job_store.close()
+
+    job_store = gss.JobStore(path)
+    assert job_store.get_jobs(URL, ["job_1"]) == {"job_1": {"status": "Done"}}
+    job_store.close()
+
+
+def test_job_store_schema_rollback(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    connection = sqlite3.connect(path, isolation_level=None)
+
+    def execute(sql: str) -> sqlite3.Cursor:
+        if sql.startswith("CREATE TABLE"):
+            raise KeyboardInterrupt
+        return connection.execute(sql)
+
+    with mock.patch("sqlite3.connect") as mock_connect:
+        mock_connect.return_value.execute.side_effect = execute
+        with pytest.raises(KeyboardInterrupt):
+            _ = gss.JobStore(path)
+
+    assert connection.execute("PRAGMA user_version").fetchone() == (0,)
+    connection.close()
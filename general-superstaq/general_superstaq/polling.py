@@ -0,0 +1,669 @@
+"""Client-side coordination of job polling."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import random
+import threading
+import time
+import weakref
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+import general_superstaq as gss
+
+DEFAULT_STATUS_INTERVALS: Mapping[str, tuple[float, float]] = {
+    "Queued": (2.0, 20.0),
+    "Running": (0.0, 2.0),
+}
+"""The default bounds on the polling interval (in seconds) for jobs with each status: jobs waiting
+in a queue are polled slowly, and running jobs (which may finish at any moment) quickly."""
+
+_NONTERMINAL_STATUSES = ("Submitted", "Queued", "Running")
+"""The statuses of unfinished jobs, from least to most advanced."""
+
+
+def _status_progress(status: str | None) -> tuple[int, str]:
+    """Ranks job statuses by how advanced they are (unrecognized statuses ranking lowest).
+
+    Args:
+        status: A job status (or None if unknown).
+
+    Returns:
+        A sort key for `status`.
+    """
+    if status in _NONTERMINAL_STATUSES:
+        return _NONTERMINAL_STATUSES.index(status), str(status)
+    return -1, str(status)
+
+
+@dataclasses.dataclass
+class PollingStats:
+    """Statistics about the polling performed with a `PollingStrategy`."""
+
+    num_polls: int = 0
+    """The number of times the status of a job (or group of jobs) was checked while waiting."""
+    num_waits: int = 0
+    """The number of completed waits (i.e. which ended with the job(s) reaching a final state)."""
+    sleep_seconds: float = 0.0
+    """The total time spent sleeping between polls."""
+    added_latency_seconds: float = 0.0
+    """The total latency added by polling: for each completed wait, the length of the final
+    interval (an upper bound on the time between the job finishing and this being noticed)."""
+
+
+class PollingStrategy:
+    """Chooses how long to wait between consecutive checks of the status of a job.
+
+    By default the first few polls are made once per second (the fixed interval previously used by
+    every job, so that each waiting job makes at most about one request per second and results from
+    fast targets such as simulators are still returned promptly), after which the interval grows
+    exponentially up to a cap. The interval is further bounded according to the status of the job
+    (see `DEFAULT_STATUS_INTERVALS`) and randomized, so that many clients don't poll in lockstep.
+
+    A single strategy can be shared by any number of jobs (by default, all of the jobs of a client
+    share the client's strategy), and keeps statistics about all of them:
+
+    .. code-block:: python
+
+        polling_strategy = gss.PollingStrategy(max_seconds=60)
+        service = css.Service(polling_strategy=polling_strategy)
+        counts = service.create_job(circuit, 100, target="ss_unconstrained_simulator").counts()
+        print(polling_strategy.stats)
+    """
+
+    def __init__(
+        self,
+        initial_seconds: float = 1.0,
+        fast_polls: int = 4,
+        multiplier: float = 1.5,
+        max_seconds: float = 20.0,
+        status_intervals: Mapping[str, tuple[float, float]] = DEFAULT_STATUS_INTERVALS,
+        jitter: float = 0.1,
+        seed: int | None = None,
+    ) -> None:
+        """Initializes a `PollingStrategy`.
+
+        Args:
+            initial_seconds: The interval between the first polls.
+            fast_polls: The number of polls made at `initial_seconds` intervals before the interval
+                starts to grow.
+            multiplier: The factor by which the interval grows after each subsequent poll.
+            max_seconds: The maximum interval between polls (before jitter is applied).
+            status_intervals: A mapping from job statuses to the `(min_seconds, max_seconds)`
+                bounds on the interval while a job has that status.
+            jitter: The fraction by which each interval is randomly lengthened or shortened.
+            seed: An optional seed for the random number generator used for jitter.
+
+        Raises:
+            ValueError: If any interval is negative, `multiplier` is less than one, or `jitter` is
+                not between zero and one.
+        """
+        gss.validation.validate_integer_param(fast_polls, min_val=0)
+        if min(initial_seconds, max_seconds, *(min(b) for b in status_intervals.values())) < 0:
+            raise ValueError("Polling intervals must be non-negative.")
+        if multiplier < 1:
+            raise ValueError("`multiplier` must be at least 1.")
+        if not 0 <= jitter <= 1:
+            raise ValueError("`jitter` must be between 0 and 1.")
+
+        self.initial_seconds = initial_seconds
+        self.fast_polls = int(fast_polls)
+        self.multiplier = multiplier
+        self.max_seconds = max_seconds
+        self.status_intervals = dict(status_intervals)
+        self.jitter = jitter
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = PollingStats()
+
+    @classmethod
+    def fixed(cls, interval_seconds: float) -> PollingStrategy:
+        """Creates a strategy which always waits for the same interval between polls.
+
+        Args:
+            interval_seconds: The interval between polls.
+
+        Returns:
+            The new `PollingStrategy`.
+        """
+        return cls(
+            initial_seconds=interval_seconds,
+            fast_polls=0,
+            multiplier=1.0,
+            max_seconds=interval_seconds,
+            status_intervals={},
+            jitter=0.0,
+        )
+
+    @property
+    def stats(self) -> PollingStats:
+        """A snapshot of the statistics of all the polling performed with this strategy."""
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def reset_stats(self) -> None:
+        """Resets the polling statistics."""
+        with self._lock:
+            self._stats = PollingStats()
+
+    def interval_seconds(self, poll: int, status: str | None = None) -> float:
+        """The (un-jittered) interval to wait after a given number of polls.
+
+        Args:
+            poll: The number of polls made so far.
+            status: The most recently polled job status (if known).
+
+        Returns:
+            The interval, in seconds.
+        """
+        interval_seconds = self.initial_seconds * self.multiplier ** max(
+            poll + 1 - self.fast_polls, 0
+        )
+        interval_seconds = min(interval_seconds, self.max_seconds)
+        if status in self.status_intervals:
+            min_seconds, max_seconds = self.status_intervals[status]
+            interval_seconds = min(max(interval_seconds, min_seconds), max_seconds)
+        return interval_seconds
+
+    def start(self) -> PollingSchedule:
+        """Starts waiting for a job (or group of jobs).
+
+        Returns:
+            A `PollingSchedule` providing the intervals between the polls of this wait.
+        """
+        return PollingSchedule(self)
+
+    def _next_interval(self, poll: int, status: str | None) -> float:
+        interval_seconds = self.interval_seconds(poll, status)
+        with self._lock:
+            if self.jitter:
+                interval_seconds *= self._random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._stats.num_polls += 1
+            self._stats.sleep_seconds += interval_seconds
+        return interval_seconds
+
+    def _finish(self, last_interval_seconds: float) -> None:
+        with self._lock:
+            self._stats.num_polls += 1
+            self._stats.num_waits += 1
+            self._stats.added_latency_seconds += last_interval_seconds
+
+    def __repr__(self) -> str:
+        return (
+            f"gss.PollingStrategy(initial_seconds={self.initial_seconds!r}, "
+            f"fast_polls={self.fast_polls!r}, multiplier={self.multiplier!r}, "
+            f"max_seconds={self.max_seconds!r}, status_intervals={self.status_intervals!r}, "
+            f"jitter={self.jitter!r})"
+        )
+
+
+class PollingSchedule:
+    """The sequence of intervals between the polls of a single wait, created by
+    `PollingStrategy.start`.
+
+    Typical usage:
+
+    .. code-block:: python
+
+        schedule = polling_strategy.start()
+        while (status := job.status()) not in TERMINAL_STATES:
+            time.sleep(schedule.next_interval(status))
+        schedule.finish()
+    """
+
+    def __init__(self, strategy: PollingStrategy) -> None:
+        """Initializes a `PollingSchedule`.
+
+        Args:
+            strategy: The `PollingStrategy` choosing the intervals.
+        """
+        self.strategy = strategy
+        self.num_polls = 0
+        self.waited_seconds = 0.0
+        self._last_interval_seconds = 0.0
+
+    def next_interval(self, status: str | None = None) -> float:
+        """Records an unsuccessful poll, and chooses how long to wait before the next one.
+
+        Args:
+            status: The polled (non-final) job status, if known.
+
+        Returns:
+            The number of seconds to wait before polling again.
+        """
+        interval_seconds = self.strategy._next_interval(self.num_polls, status)
+        self.num_polls += 1
+        self.waited_seconds += interval_seconds
+        self._last_interval_seconds = interval_seconds
+        return interval_seconds
+
+    def finish(self) -> None:
+        """Records the final poll of this wait (after which the job(s) reached a final state)."""
+        self.num_polls += 1
+        self.strategy._finish(self._last_interval_seconds)
+
+
+@dataclasses.dataclass
+class _CachedJob:
+    """The most recently fetched data for a single job id."""
+
+    data: dict[str, Any]
+    fetched_at: float
+    generation: int
+
+
+@dataclasses.dataclass
+class _Registration:
+    """The job ids a single job object is interested in, and which results it has already seen."""
+
+    job_ids: set[str]
+    terminal_states: tuple[str, ...]
+    seen: dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+class JobPoller:
+    """Coalesces the polling of many jobs into shared, chunked `/fetch_jobs` requests.
+
+    Job objects register interest in their job ids the first time they fetch them. Whenever one of
+    them needs fresh data, the poller requests the non-terminal job ids of every job object which
+    is currently waiting for its jobs to finish (see `waiting`), in chunks of at most `chunk_size`,
+    instead of just the ones it asked for, and fans the results back out:
+    other jobs asking for an id within `max_age_seconds` of it being fetched are served from this
+    shared result instead of making their own request. As a result, polling N jobs at a fixed
+    interval costs roughly one round of requests per interval rather than N.
+
+    A job object is never served the same result twice, so a single job polling on its own makes
+    exactly the same requests as it would without the poller.
+
+    Users should not instantiate this themselves, but instead should use `get_job_poller`.
+    """
+
+    def __init__(
+        self,
+        client: gss.superstaq_client._SuperstaqClient,
+        chunk_size: int = 500,
+        max_age_seconds: float = 1.0,
+    ) -> None:
+        """Creates a `JobPoller`.
+
+        Args:
+            client: The client used to fetch jobs.
+            chunk_size: The maximum number of job ids to request in a single `/fetch_jobs` call.
+            max_age_seconds: How long a fetched result may be shared with other jobs before it is
+                considered stale.
+        """
+        gss.validation.validate_integer_param(chunk_size)
+
+        self._client_ref = weakref.ref(client)
+        self.chunk_size = int(chunk_size)
+        self.max_age_seconds = max_age_seconds
+
+        self._lock = threading.RLock()
+        self._registrations: dict[int, _Registration] = {}
+        self._results: dict[str, _CachedJob] = {}
+        self._interest: collections.Counter[str] = collections.Counter()
+        self._in_flight: dict[str, threading.Event] = {}
+        self._generation = 0
+
+    @property
+    def num_requests(self) -> int:
+        """The number of `/fetch_jobs` requests this poller has made."""
+        return self._generation
+
+    def fetch_jobs(
+        self, owner: object, job_ids: Sequence[str], terminal_states: Iterable[str]
+    ) -> dict[str, Any]:
+        """Gets up-to-date information for some jobs, on behalf of a job object.
+
+        Args:
+            owner: The job object requesting the update. It is registered with this poller (until
+                it is garbage collected) so that its job ids are included in future requests.
+            job_ids: The job ids to get information for.
+            terminal_states: The job statuses after which a job id no longer needs to be polled.
+
+        Returns:
+            A dictionary mapping each of the requested job ids to its job data.
+
+        Raises:
+            ~gss.SuperstaqServerException: If there was an error accessing the API.
+        """
+        with self._lock:
+            registration = self._register(owner, terminal_states)
+            for job_id in job_ids:
+                if job_id not in registration.job_ids:
+                    registration.job_ids.add(job_id)
+                    self._interest[job_id] += 1
+
+        # The lock is only held while reading and updating the cache (not during requests), so
+        # requests for different job ids can be made concurrently
+        results: dict[str, Any] = {}
+        pending_job_ids = list(job_ids)
+        while pending_job_ids:
+            pending_job_ids = self._update(registration, pending_job_ids, results)
+
+        with self._lock:
+            for job_id, data in list(results.items()):
+                if data.get("status") in registration.terminal_states:
+                    registration.job_ids.discard(job_id)
+                    registration.seen.pop(job_id, None)
+                    self._remove_interest(job_id)
+
+        return results
+
+    def _update(
+        self, registration: _Registration, job_ids: Sequence[str], results: dict[str, Any]
+    ) -> list[str]:
+        """Gets information for some jobs, either from the cache or by requesting it. Job ids which
+        are already being fetched by another thread are waited for rather than requested again.
+
+        Args:
+            registration: The registration of the requesting job object.
+            job_ids: The job ids to get information for.
+            results: The dictionary in which to store the job data.
+
+        Returns:
+            The job ids which were waited for, and so need to be looked up again.
+        """
+        with self._lock:
+            stale_job_ids = self._get_cached(registration, job_ids, results)
+            in_flight = {
+                self._in_flight[job_id] for job_id in stale_job_ids if job_id in self._in_flight
+            }
+            ids_to_fetch = self._ids_to_fetch(stale_job_ids)
+            done = threading.Event()
+            for job_id in ids_to_fetch:
+                self._in_flight[job_id] = done
+
+        if ids_to_fetch:
+            try:
+                self._fetch(ids_to_fetch)
+            finally:
+                with self._lock:
+                    for job_id in ids_to_fetch:
+                        del self._in_flight[job_id]
+                done.set()
+
+        with self._lock:
+            for job_id in stale_job_ids:
+                if job_id in ids_to_fetch and job_id in self._results:
+                    cached = self._results[job_id]
+                    results[job_id] = cached.data
+                    registration.seen[job_id] = cached.generation
+
+        for event in in_flight:
+            event.wait()
+        return [job_id for job_id in stale_job_ids if job_id not in ids_to_fetch]
+
+    def _get_cached(
+        self, registration: _Registration, job_ids: Sequence[str], results: dict[str, Any]
+    ) -> list[str]:
+        """Serves job ids from the cache where possible (i.e. if there is a result which is recent
+        enough and hasn't yet been seen by the requesting job object). Must be called with the lock.
+
+        Args:
+            registration: The registration of the requesting job object.
+            job_ids: The job ids to look up.
+            results: The dictionary in which to store the served job data.
+
+        Returns:
+            The job ids which could not be served from the cache.
+        """
+        now = time.monotonic()
+        stale_job_ids = []
+        for job_id in job_ids:
+            cached = self._results.get(job_id)
+            if (
+                cached is not None
+                and cached.generation > registration.seen.get(job_id, 0)
+                and (
+                    now - cached.fetched_at <= self.max_age_seconds
+                    or cached.data.get("status") in registration.terminal_states
+                )
+            ):
+                results[job_id] = cached.data
+                registration.seen[job_id] = cached.generation
+            else:
+                stale_job_ids.append(job_id)
+        return stale_job_ids
+
+    def _ids_to_fetch(self, job_ids: Sequence[str]) -> dict[str, None]:
+        """Chooses which job ids to request: the given ones, along with any others of waiting job
+        objects which need to be refreshed (excluding any which are already being fetched). Must be
+        called with the lock.
+
+        Args:
+            job_ids: The job ids which must be fetched.
+
+        Returns:
+            The (ordered) job ids to request.
+        """
+        if all(job_id in self._in_flight for job_id in job_ids):
+            return {}
+
+        with _waiting_owners_lock:
+            waiting_keys = set(_waiting_owners)
+
+        now = time.monotonic()
+        ids_to_fetch = dict.fromkeys(job_ids)
+        for key, registration in self._registrations.items():
+            if key not in waiting_keys:
+                continue
+            for job_id in registration.job_ids:
+                cached = self._results.get(job_id)
+                if cached is None or (
+                    now - cached.fetched_at > self.max_age_seconds
+                    and cached.data.get("status") not in registration.terminal_states
+                ):
+                    ids_to_fetch[job_id] = None
+
+        return {job_id: None for job_id in ids_to_fetch if job_id not in self._in_flight}
+
+    def _fetch(self, job_ids: Iterable[str]) -> None:
+        """Requests the given job ids (in chunks), storing the results. Called without the lock.
+
+        Args:
+            job_ids: The job ids to request.
+        """
+        client = self._client_ref()
+        assert client is not None
+
+        all_ids = list(job_ids)
+        for start in range(0, len(all_ids), self.chunk_size):
+            chunk = all_ids[start : start + self.chunk_size]
+            result = client.fetch_jobs(chunk)
+            fetched_at = time.monotonic()
+            with self._lock:
+                self._generation += 1
+                for job_id, data in result.items():
+                    self._results[job_id] = _CachedJob(data, fetched_at, self._generation)
+
+    def _register(self, owner: object, terminal_states: Iterable[str]) -> _Registration:
+        """Gets (or creates) the registration for a given job object.
+
+        Args:
+            owner: The job object.
+            terminal_states: The job statuses after which a job id no longer needs to be polled.
+
+        Returns:
+            The `_Registration` for `owner`.
+        """
+        key = id(owner)
+        if key not in self._registrations:
+            self._registrations[key] = _Registration(set(), tuple(terminal_states))
+            weakref.finalize(owner, self._unregister, key)
+        return self._registrations[key]
+
+    def _unregister(self, key: int) -> None:
+        """Removes the registration of a job object (called when it is garbage collected).
+
+        Args:
+            key: The key of the registration to remove.
+        """
+        with self._lock:
+            registration = self._registrations.pop(key, None)
+            if registration is not None:
+                for job_id in registration.job_ids:
+                    self._remove_interest(job_id)
+
+    def _remove_interest(self, job_id: str) -> None:
+        """Records that one fewer job object is interested in a job id, dropping its cached result
+        once no job objects are.
+
+        Args:
+            job_id: The job id.
+        """
+        self._interest[job_id] -= 1
+        if self._interest[job_id] <= 0:
+            del self._interest[job_id]
+            self._results.pop(job_id, None)
+
+
+_job_pollers: weakref.WeakKeyDictionary[Any, JobPoller] = weakref.WeakKeyDictionary()
+_job_pollers_lock = threading.Lock()
+
+_waiting_owners: collections.Counter[int] = collections.Counter()
+_waiting_owners_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def waiting(owner: object) -> Iterator[None]:
+    """Marks a job object as waiting for its jobs to finish (e.g. while polling them in a loop).
+
+    `JobPoller`s only include the job ids of waiting job objects in the requests they make on
+    behalf of other job objects, so jobs which are merely being held on to are not polled.
+
+    Args:
+        owner: The waiting job object.
+
+    Yields:
+        Nothing: the job object is waiting until the context is exited.
+    """
+    key = id(owner)
+    with _waiting_owners_lock:
+        _waiting_owners[key] += 1
+    try:
+        yield
+    finally:
+        with _waiting_owners_lock:
+            _waiting_owners[key] -= 1
+            if _waiting_owners[key] <= 0:
+                del _waiting_owners[key]
+
+
+def get_job_poller(client: gss.superstaq_client._SuperstaqClient) -> JobPoller:
+    """Gets the `JobPoller` shared by all jobs using a given client.
+
+    Args:
+        client: The client used to fetch jobs.
+
+    Returns:
+        The `JobPoller` for `client` (which is created the first time it is requested).
+    """
+    with _job_pollers_lock:
+        if client not in _job_pollers:
+            _job_pollers[client] = JobPoller(client)
+        return _job_pollers[client]
+
+
+class _Waiter:
+    """Stand-in job object on whose behalf `as_completed` polls."""
+
+
+def _poll_pending(
+    pending: Mapping[int, tuple[gss.superstaq_client._SuperstaqClient, str]],
+    owner: _Waiter,
+    terminal_states: tuple[str, ...],
+) -> tuple[dict[int, dict[str, Any]], set[str | None]]:
+    """Fetches all of the given jobs, with a single (chunked) request per client.
+
+    Args:
+        pending: A dictionary mapping positions to the `(client, job_id)` pairs to fetch.
+        owner: The object on whose behalf the jobs are fetched.
+        terminal_states: The job statuses after which a job is finished.
+
+    Returns:
+        A dictionary mapping the positions of finished jobs to their data, and the set of statuses
+        of the unfinished jobs (including None for any jobs which could not be fetched).
+    """
+    job_ids_by_client: dict[gss.superstaq_client._SuperstaqClient, list[str]] = {}
+    for client, job_id in pending.values():
+        job_ids_by_client.setdefault(client, []).append(job_id)
+
+    results = {}
+    for client, job_ids in job_ids_by_client.items():
+        poller = get_job_poller(client)
+        results[client] = poller.fetch_jobs(owner, list(dict.fromkeys(job_ids)), terminal_states)
+
+    finished: dict[int, dict[str, Any]] = {}
+    statuses: set[str | None] = set()
+    for position, (client, job_id) in pending.items():
+        data = results[client].get(job_id)
+        status = data.get("status") if data is not None else None
+        if data is not None and status in terminal_states:
+            finished[position] = data
+        else:
+            statuses.add(status)
+
+    return finished, statuses
+
+
+def as_completed(
+    jobs: Sequence[tuple[gss.superstaq_client._SuperstaqClient, str]],
+    terminal_states: Iterable[str],
+    timeout_seconds: float | None = None,
+    polling_strategy: PollingStrategy | None = None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Polls many jobs from a single loop, yielding each one as soon as it reaches a terminal
+    state.
+
+    Every round of polling fetches all of the unfinished jobs at once, in (chunked) `/fetch_jobs`
+    requests shared via each client's `JobPoller`.
+
+    Args:
+        jobs: The jobs to poll, as `(client, job_id)` pairs.
+        terminal_states: The job statuses after which a job is finished.
+        timeout_seconds: The total number of seconds to poll for, or None to poll indefinitely.
+        polling_strategy: The `PollingStrategy` choosing the intervals between rounds of polling.
+            Defaults to that of the client of the first job.
+
+    Yields:
+        A tuple `(position, job_data)` for each job (where `position` is its index in `jobs`), in
+        the order in which they finish.
+
+    Raises:
+        ~gss.SuperstaqServerException: If there was an error accessing the API.
+        TimeoutError: If some jobs are still unfinished after `timeout_seconds`.
+    """
+    if not jobs:
+        return
+
+    terminal_states = tuple(terminal_states)
+    owner = _Waiter()
+    pending = dict(enumerate(jobs))
+    deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+    schedule = (polling_strategy or jobs[0][0].polling_strategy).start()
+
+    with waiting(owner):
+        while True:
+            finished, statuses = _poll_pending(pending, owner, terminal_states)
+            if not statuses:
+                schedule.finish()
+
+            for position, data in finished.items():
+                del pending[position]
+                yield position, data
+
+            if not pending:
+                return
+
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Timed out while waiting for results. {len(pending)} job(s) are unfinished."
+                )
+            # Poll as quickly as the most advanced unfinished job requires
+            status = max(statuses, key=_status_progress)
+            time.sleep(schedule.next_interval(status))
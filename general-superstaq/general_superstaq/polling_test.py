@@ -0,0 +1,327 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import gc
+import threading
+from unittest import mock
+
+import pytest
+
+import general_superstaq as gss
+
+
+class _Job:
+    """Stand-in for a job object."""
+
+
+def _mock_client(statuses: dict[str, str]) -> mock.MagicMock:
+    client = mock.MagicMock()
+    client.fetch_jobs.side_effect = lambda job_ids: {
+        job_id: {"status": statuses[job_id]} for job_id in job_ids if job_id in statuses
+    }
+    return client
+
+
+def test_get_job_poller() -> None:
+    client = _mock_client({})
+    poller = gss.polling.get_job_poller(client)
+    assert isinstance(poller, gss.polling.JobPoller)
+    assert gss.polling.get_job_poller(client) is poller
+    assert gss.polling.get_job_poller(_mock_client({})) is not poller
+
+    with pytest.raises(ValueError, match="minimum value"):
+        _ = gss.polling.JobPoller(client, chunk_size=0)
+
+
+def test_job_poller_single_job() -> None:
+    statuses = {"a": "Running", "b": "Running"}
+    client = _mock_client(statuses)
+    poller = gss.polling.JobPoller(client)
+    job = _Job()
+
+    # A job polling on its own always makes a new request
+    assert poller.fetch_jobs(job, ["a", "b"], ("Done",)) == {
+        "a": {"status": "Running"},
+        "b": {"status": "Running"},
+    }
+    assert poller.fetch_jobs(job, ["a"], ("Done",)) == {"a": {"status": "Running"}}
+    assert client.fetch_jobs.call_args_list == [mock.call(["a", "b"]), mock.call(["a"])]
+    assert poller.num_requests == 2
+
+    # Missing job ids are left out
+    assert poller.fetch_jobs(job, ["c"], ("Done",)) == {}
+
+
+def test_job_poller_coalesces_jobs() -> None:
+    statuses = {"a": "Running", "b": "Running", "c": "Running"}
+    client = _mock_client(statuses)
+    poller = gss.polling.JobPoller(client, max_age_seconds=1)
+    jobs = [_Job(), _Job(), _Job()]
+    terminal_states = ("Done", "Failed")
+
+    with mock.patch("time.monotonic", return_value=0):
+        for job, job_id in zip(jobs, statuses):
+            assert poller.fetch_jobs(job, [job_id], terminal_states) == {
+                job_id: {"status": "Running"}
+            }
+    assert client.fetch_jobs.call_count == 3
+
+    # Job ids of jobs which aren't waiting are only fetched on their own behalf
+    with mock.patch("time.monotonic", return_value=5):
+        assert poller.fetch_jobs(jobs[0], ["a"], terminal_states) == {"a": {"status": "Running"}}
+    client.fetch_jobs.assert_called_with(["a"])
+
+    # If they are waiting, the next round of polling requires only a single request
+    statuses.update(a="Done", b="Failed")
+    with gss.polling.waiting(jobs[1]), gss.polling.waiting(jobs[2]):
+        with mock.patch("time.monotonic", return_value=10):
+            assert poller.fetch_jobs(jobs[0], ["a"], terminal_states) == {"a": {"status": "Done"}}
+            client.fetch_jobs.assert_called_with(["a", "b", "c"])
+            assert poller.fetch_jobs(jobs[1], ["b"], terminal_states) == {"b": {"status": "Failed"}}
+            assert poller.fetch_jobs(jobs[2], ["c"], terminal_states) == {
+                "c": {"status": "Running"}
+            }
+        assert client.fetch_jobs.call_count == 5
+
+        # Terminal jobs are no longer polled
+        statuses.update(c="Done")
+        with mock.patch("time.monotonic", return_value=15):
+            assert poller.fetch_jobs(jobs[2], ["c"], terminal_states) == {"c": {"status": "Done"}}
+        client.fetch_jobs.assert_called_with(["c"])
+        assert client.fetch_jobs.call_count == 6
+    assert not poller._results
+    assert not gss.polling._waiting_owners
+
+
+def test_job_poller_max_age() -> None:
+    statuses = {"a": "Running", "b": "Running"}
+    client = _mock_client(statuses)
+    poller = gss.polling.JobPoller(client, max_age_seconds=10)
+    job_a, job_b = _Job(), _Job()
+
+    with gss.polling.waiting(job_a):
+        with mock.patch("time.monotonic", return_value=0):
+            _ = poller.fetch_jobs(job_a, ["a"], ("Done",))
+            _ = poller.fetch_jobs(job_b, ["b"], ("Done",))
+            _ = poller.fetch_jobs(job_a, ["a"], ("Done",))
+        assert client.fetch_jobs.call_count == 3
+
+        # Shared results expire after `max_age_seconds`...
+        with mock.patch("time.monotonic", return_value=20):
+            assert poller.fetch_jobs(job_b, ["b"], ("Done",)) == {"b": {"status": "Running"}}
+        assert client.fetch_jobs.call_count == 4
+
+        # ...unless they are terminal
+        statuses.update(a="Done", b="Done")
+        with mock.patch("time.monotonic", return_value=40):
+            assert poller.fetch_jobs(job_b, ["b"], ("Done",)) == {"b": {"status": "Done"}}
+        with mock.patch("time.monotonic", return_value=80):
+            assert poller.fetch_jobs(job_a, ["a"], ("Done",)) == {"a": {"status": "Done"}}
+        assert client.fetch_jobs.call_count == 5
+
+
+def test_job_poller_chunks() -> None:
+    statuses = {str(i): "Running" for i in range(5)}
+    client = _mock_client(statuses)
+    poller = gss.polling.JobPoller(client, chunk_size=2)
+
+    assert len(poller.fetch_jobs(_Job(), list(statuses), ("Done",))) == 5
+    assert client.fetch_jobs.call_args_list == [
+        mock.call(["0", "1"]),
+        mock.call(["2", "3"]),
+        mock.call(["4"]),
+    ]
+
+
+def test_job_poller_concurrent_requests() -> None:
+    statuses = {"a": "Running", "b": "Running"}
+    client = _mock_client(statuses)
+    fetch_jobs = client.fetch_jobs.side_effect
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_fetch_jobs(job_ids: list[str]) -> dict[str, dict[str, str]]:
+        if job_ids == ["a"]:
+            started.set()
+            assert release.wait(timeout=5)
+        return fetch_jobs(job_ids)
+
+    client.fetch_jobs.side_effect = slow_fetch_jobs
+    poller = gss.polling.JobPoller(client)
+    job_a, job_b, job_c = _Job(), _Job(), _Job()
+    results = {}
+
+    def poll(job: _Job, job_id: str) -> None:
+        results[job] = poller.fetch_jobs(job, [job_id], ("Done",))
+
+    thread_a = threading.Thread(target=poll, args=(job_a, "a"))
+    thread_a.start()
+    assert started.wait(timeout=5)
+
+    # The lock isn't held during requests, so other job ids can be fetched in the meantime...
+    assert poller.fetch_jobs(job_b, ["b"], ("Done",)) == {"b": {"status": "Running"}}
+
+    # ...while job ids which are already being fetched are waited for instead of requested again
+    in_flight = poller._in_flight["a"]
+    waiting = threading.Event()
+    wait = in_flight.wait
+
+    def wait_for_fetch() -> bool:
+        waiting.set()
+        return wait()
+
+    with mock.patch.object(in_flight, "wait", side_effect=wait_for_fetch):
+        thread_c = threading.Thread(target=poll, args=(job_c, "a"))
+        thread_c.start()
+        assert waiting.wait(timeout=5)
+        release.set()
+        thread_a.join()
+        thread_c.join()
+
+    assert results == {job_a: {"a": {"status": "Running"}}, job_c: {"a": {"status": "Running"}}}
+    assert client.fetch_jobs.call_args_list == [mock.call(["a"]), mock.call(["b"])]
+    assert not poller._in_flight
+
+
+def test_job_poller_unregister() -> None:
+    client = _mock_client({"a": "Running", "b": "Running"})
+    poller = gss.polling.JobPoller(client)
+    job_a, job_b = _Job(), _Job()
+
+    _ = poller.fetch_jobs(job_a, ["a"], ("Done",))
+    _ = poller.fetch_jobs(job_b, ["a", "b"], ("Done",))
+    assert len(poller._registrations) == 2
+
+    key_b = id(job_b)
+    del job_b
+    gc.collect()
+    assert len(poller._registrations) == 1
+    assert set(poller._results) == {"a"}
+
+    # Jobs which have been garbage collected are no longer polled
+    _ = poller.fetch_jobs(job_a, ["a"], ("Done",))
+    client.fetch_jobs.assert_called_with(["a"])
+
+    poller._unregister(key_b)
+
+
+def test_as_completed() -> None:
+    statuses_1 = {"a": "Running", "b": "Queued", "c": "Done"}
+    statuses_2 = {"a": "Running"}
+    client_1 = _mock_client(statuses_1)
+    client_2 = _mock_client(statuses_2)
+    jobs = [(client_1, "a"), (client_1, "b"), (client_2, "a"), (client_1, "c"), (client_1, "a")]
+
+    def finish_jobs(_: float) -> None:
+        if statuses_1["b"] == "Queued":
+            statuses_1.update(b="Failed", a="Done")
+        else:
+            statuses_2.update(a="Done")
+
+    polling_strategy = gss.PollingStrategy.fixed(5)
+    completed = gss.polling.as_completed(jobs, ("Done", "Failed"), None, polling_strategy)
+    with mock.patch("time.sleep", side_effect=finish_jobs) as mock_sleep:
+        assert list(completed) == [
+            (3, {"status": "Done"}),
+            (0, {"status": "Done"}),
+            (1, {"status": "Failed"}),
+            (4, {"status": "Done"}),
+            (2, {"status": "Done"}),
+        ]
+    mock_sleep.assert_called_with(5)
+    assert polling_strategy.stats == gss.polling.PollingStats(
+        num_polls=3, num_waits=1, sleep_seconds=10.0, added_latency_seconds=5.0
+    )
+
+    # Each round of polling makes a single request per client
+    assert client_1.fetch_jobs.call_args_list == [mock.call(["a", "b", "c"]), mock.call(["a", "b"])]
+    assert client_2.fetch_jobs.call_args_list == [mock.call(["a"])] * 3
+
+    assert not list(gss.polling.as_completed([], ("Done",)))
+
+
+def test_status_progress() -> None:
+    # The most advanced status (which determines the polling interval) isn't alphabetical
+    statuses = {None, "Queued", "Submitted", "Unknown"}
+    assert max(statuses, key=gss.polling._status_progress) == "Queued"
+    assert max(statuses | {"Running"}, key=gss.polling._status_progress) == "Running"
+    assert max({None, "Unknown"}, key=gss.polling._status_progress) == "Unknown"
+
+
+def test_as_completed_timeout() -> None:
+    client = _mock_client({"a": "Done", "b": "Running"})
+    client.polling_strategy = gss.PollingStrategy()
+    completed = gss.polling.as_completed([(client, "a"), (client, "b")], ("Done",), 0)
+
+    with mock.patch("time.sleep") as mock_sleep:
+        assert next(completed) == (0, {"status": "Done"})
+        with pytest.raises(TimeoutError, match="1 job"):
+            _ = next(completed)
+    mock_sleep.assert_not_called()
+
+
+def test_polling_strategy() -> None:
+    polling_strategy = gss.PollingStrategy(
+        initial_seconds=1, fast_polls=2, multiplier=2, max_seconds=10, jitter=0
+    )
+    intervals = [polling_strategy.interval_seconds(poll) for poll in range(7)]
+    assert intervals == [1, 1, 2, 4, 8, 10, 10]
+
+    # Intervals are bounded according to the job status
+    assert polling_strategy.interval_seconds(0, "Queued") == 2
+    assert polling_strategy.interval_seconds(6, "Queued") == 10
+    assert polling_strategy.interval_seconds(6, "Running") == 2
+    assert polling_strategy.interval_seconds(6, "Unknown") == 10
+
+    assert polling_strategy.stats == gss.polling.PollingStats()
+    assert repr(polling_strategy) == (
+        "gss.PollingStrategy(initial_seconds=1, fast_polls=2, multiplier=2, max_seconds=10, "
+        "status_intervals={'Queued': (2.0, 20.0), 'Running': (0.0, 2.0)}, jitter=0)"
+    )
+
+
+def test_polling_strategy_fixed() -> None:
+    polling_strategy = gss.PollingStrategy.fixed(3)
+    assert all(polling_strategy.interval_seconds(poll, "Queued") == 3 for poll in range(10))
+
+
+def test_polling_strategy_validation() -> None:
+    with pytest.raises(ValueError, match="non-negative"):
+        _ = gss.PollingStrategy(initial_seconds=-1)
+    with pytest.raises(ValueError, match="non-negative"):
+        _ = gss.PollingStrategy(status_intervals={"Queued": (-1, 1)})
+    with pytest.raises(ValueError, match="at least 1"):
+        _ = gss.PollingStrategy(multiplier=0.5)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        _ = gss.PollingStrategy(jitter=1.5)
+    with pytest.raises(ValueError, match="less than the minimum"):
+        _ = gss.PollingStrategy(fast_polls=-1)
+
+
+def test_polling_schedule() -> None:
+    polling_strategy = gss.PollingStrategy(initial_seconds=1, fast_polls=0, jitter=0.5, seed=1)
+    schedule = polling_strategy.start()
+    intervals = [schedule.next_interval() for _ in range(3)]
+    for poll, interval in enumerate(intervals):
+        expected = polling_strategy.interval_seconds(poll)
+        assert 0.5 * expected <= interval <= 1.5 * expected
+    assert schedule.waited_seconds == pytest.approx(sum(intervals))
+    schedule.finish()
+    assert schedule.num_polls == 4
+
+    # The same seed produces the same intervals
+    other_schedule = gss.PollingStrategy(
+        initial_seconds=1, fast_polls=0, jitter=0.5, seed=1
+    ).start()
+    assert [other_schedule.next_interval() for _ in range(3)] == intervals
+
+    # Statistics are accumulated across schedules
+    schedule = polling_strategy.start()
+    schedule.finish()
+    stats = polling_strategy.stats
+    assert (stats.num_polls, stats.num_waits) == (5, 2)
+    assert stats.sleep_seconds == pytest.approx(sum(intervals))
+    assert stats.added_latency_seconds == intervals[-1]
+
+    polling_strategy.reset_stats()
+    assert polling_strategy.stats == gss.polling.PollingStats()
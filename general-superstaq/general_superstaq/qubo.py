@@ -0,0 +1,385 @@
+"""Array-based representations of QUBO problems and their solutions, for submitting large QUBOs."""
+
+from __future__ import annotations
+
+import numbers
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+import general_superstaq as gss
+
+# Maximum number of (solution, term) pairs evaluated at once by `SparseQubo.energies`.
+_ENERGY_BLOCK_SIZE = 2**24
+
+
+class SparseQubo:
+    """A QUBO problem in coordinate (COO) format, i.e. as arrays of the row indices, column
+    indices, and coefficients of its quadratic terms, along with a vector of linear coefficients
+    and a constant offset. The objective of a boolean vector `x` is:
+
+    .. code-block:: python
+
+        offset + linear @ x + sum(values * x[rows] * x[cols])
+
+    All validation is vectorized, so QUBOs with millions of terms can be constructed (and
+    submitted via `gss.Service.submit_qubo`) without iterating over their terms in Python, e.g.:
+
+    .. code-block:: python
+
+        qubo = gss.SparseQubo(rows, cols, values, linear=linear, offset=-3.0)
+        qubo = gss.SparseQubo.from_matrix(scipy.sparse.random(50_000, 50_000, density=1e-3))
+        qubo = gss.SparseQubo.from_dict({("a",): 2, ("a", "b"): 1, ("b", "c"): -5, (): -3})
+
+    All arrays are read-only, so they can be shared freely.
+    """
+
+    def __init__(
+        self,
+        rows: npt.ArrayLike,
+        cols: npt.ArrayLike,
+        values: npt.ArrayLike,
+        linear: npt.ArrayLike | None = None,
+        offset: float = 0.0,
+        num_variables: int | None = None,
+        variables: Sequence[Hashable] | None = None,
+    ) -> None:
+        """Initializes a `SparseQubo`.
+
+        Args:
+            rows: The index of the first variable in each quadratic term.
+            cols: The index of the second variable in each quadratic term.
+            values: The coefficient of each quadratic term. Terms with equal row and column
+                indices are equivalent to linear terms (because `x**2 == x` for booleans).
+            linear: Optionally, the linear coefficient of every variable.
+            offset: The constant term.
+            num_variables: The number of variables. Defaults to the smallest number consistent
+                with the other arguments.
+            variables: Optionally, a label for each variable (e.g. the keys of the dictionary from
+                which the QUBO was created).
+
+        Raises:
+            ValueError: If the arguments don't describe a valid QUBO.
+        """
+        rows = _as_index_array(rows, "rows")
+        cols = _as_index_array(cols, "cols")
+        values = _as_real_array(values, "values")
+        if not rows.shape == cols.shape == values.shape:
+            raise ValueError("`rows`, `cols`, and `values` must have the same length.")
+
+        linear = _as_real_array(np.zeros(0) if linear is None else linear, "linear")
+        if not isinstance(offset, numbers.Real) or not np.isfinite(offset):
+            raise ValueError("QUBO offsets must be finite real numbers.")
+
+        if num_variables is None:
+            num_variables = max(
+                int(rows.max(initial=-1)) + 1,
+                int(cols.max(initial=-1)) + 1,
+                len(linear) if linear.size else 0,
+                len(variables) if variables is not None else 0,
+            )
+        gss.validation.validate_integer_param(num_variables, min_val=0)
+        num_variables = int(num_variables)
+
+        if linear.size == 0:
+            linear = np.zeros(num_variables)
+        if len(linear) != num_variables:
+            raise ValueError("`linear` must contain exactly one entry per variable.")
+        if variables is not None and len(variables) != num_variables:
+            raise ValueError("`variables` must contain exactly one label per variable.")
+        if np.any(rows < 0) or np.any(cols < 0):
+            raise ValueError("QUBO variable indices must be non-negative.")
+        if np.any(rows >= num_variables) or np.any(cols >= num_variables):
+            raise ValueError(f"QUBO variable indices must be less than {num_variables}.")
+
+        for array in (rows, cols, values, linear):
+            array.setflags(write=False)
+        self._rows: npt.NDArray[np.int64] = rows
+        self._cols: npt.NDArray[np.int64] = cols
+        self._values: npt.NDArray[np.float64] = values
+        self._linear: npt.NDArray[np.float64] = linear
+        self._offset: float = float(offset)
+        self._num_variables: int = num_variables
+        self._variables: list[Hashable] | None = list(variables) if variables is not None else None
+
+    @classmethod
+    def from_dict(cls, qubo: Mapping[tuple[Any, ...], float]) -> SparseQubo:
+        """Creates a `SparseQubo` from a dictionary (in the format accepted by
+        `gss.Service.submit_qubo`).
+
+        Args:
+            qubo: A dictionary mapping tuples of at most two variables to coefficients, e.g.
+                {('a',): 2, ('a', 'b'): 1, ('b', 'c'): -5, (): -3}.
+
+        Returns:
+            The new `SparseQubo`, labelling its variables with the dictionary's variables (in order
+            of appearance).
+        """
+        gss.validation.validate_qubo(qubo)
+
+        indices: dict[Hashable, int] = {}
+        for key in qubo:
+            for variable in key:
+                indices.setdefault(variable, len(indices))
+
+        linear = np.zeros(len(indices))
+        offset = 0.0
+        rows, cols, values = [], [], []
+        for key, value in qubo.items():
+            if len(key) == 0:
+                offset += value
+            elif len(key) == 1:
+                linear[indices[key[0]]] += value
+            else:
+                rows.append(indices[key[0]])
+                cols.append(indices[key[1]])
+                values.append(value)
+
+        return cls(
+            np.array(rows, dtype=np.int64),
+            np.array(cols, dtype=np.int64),
+            np.array(values, dtype=np.float64),
+            linear=linear,
+            offset=offset,
+            variables=list(indices),
+        )
+
+    @classmethod
+    def from_matrix(
+        cls, matrix: Any, linear: npt.ArrayLike | None = None, offset: float = 0.0
+    ) -> SparseQubo:
+        """Creates a `SparseQubo` from a square matrix of quadratic coefficients.
+
+        Args:
+            matrix: A SciPy sparse matrix (or any object with a `tocoo()` method), or a dense
+                two-dimensional array.
+            linear: Optionally, the linear coefficient of every variable.
+            offset: The constant term.
+
+        Returns:
+            The new `SparseQubo`, containing a quadratic term for each (explicitly stored, or
+            nonzero) entry of `matrix`.
+
+        Raises:
+            ValueError: If `matrix` is not a square (two-dimensional) matrix.
+        """
+        if hasattr(matrix, "tocoo"):
+            coo = matrix.tocoo()
+            rows, cols, values, shape = coo.row, coo.col, coo.data, coo.shape
+        else:
+            matrix = np.asarray(matrix)
+            if matrix.ndim != 2:
+                raise ValueError("QUBO matrices must be two-dimensional.")
+            rows, cols = np.nonzero(matrix)
+            values, shape = matrix[rows, cols], matrix.shape
+
+        if shape[0] != shape[1]:
+            raise ValueError("QUBO matrices must be square.")
+        return cls(rows, cols, values, linear=linear, offset=offset, num_variables=shape[0])
+
+    @property
+    def rows(self) -> npt.NDArray[np.int64]:
+        """The index of the first variable in each quadratic term."""
+        return self._rows
+
+    @property
+    def cols(self) -> npt.NDArray[np.int64]:
+        """The index of the second variable in each quadratic term."""
+        return self._cols
+
+    @property
+    def values(self) -> npt.NDArray[np.float64]:
+        """The coefficient of each quadratic term."""
+        return self._values
+
+    @property
+    def linear(self) -> npt.NDArray[np.float64]:
+        """The linear coefficient of every variable."""
+        return self._linear
+
+    @property
+    def offset(self) -> float:
+        """The constant term."""
+        return self._offset
+
+    @property
+    def num_variables(self) -> int:
+        """The number of variables."""
+        return self._num_variables
+
+    @property
+    def variables(self) -> list[Hashable] | None:
+        """The label of each variable (if any)."""
+        return self._variables
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return (
+            f"gss.SparseQubo(<{len(self)} quadratic terms>, num_variables={self.num_variables}, "
+            f"offset={self.offset!r})"
+        )
+
+    def energies(self, solutions: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Evaluates the QUBO objective for each of a number of boolean vectors.
+
+        Args:
+            solutions: A two-dimensional array of bits (zeros and ones), with one row per solution.
+
+        Returns:
+            The value of the objective for each solution.
+
+        Raises:
+            ValueError: If `solutions` doesn't have one column per variable.
+        """
+        solutions = np.asarray(solutions, dtype=np.uint8)
+        if solutions.ndim != 2 or solutions.shape[1] != self.num_variables:
+            raise ValueError(
+                "`solutions` must be a two-dimensional array with a column per variable."
+            )
+
+        energies = self._offset + solutions @ self._linear
+        block_size = max(1, _ENERGY_BLOCK_SIZE // max(len(self), 1))
+        for start in range(0, len(solutions), block_size):
+            block = solutions[start : start + block_size]
+            energies[start : start + block_size] += (
+                block[:, self._rows] & block[:, self._cols]
+            ) @ self._values
+        return energies
+
+    def serialize(self) -> str:
+        """Serializes this QUBO into a (base64-encoded) binary envelope of compact arrays, as
+        submitted by `gss.Service.submit_qubo`.
+
+        Returns:
+            The string representing the serialized QUBO.
+        """
+        index_dtype = np.int32 if self.num_variables <= np.iinfo(np.int32).max else np.int64
+        arrays = {
+            "rows": self._rows.astype(index_dtype),
+            "cols": self._cols.astype(index_dtype),
+            "values": self._values,
+            "linear": self._linear,
+            "offset": self._offset,
+            "num_variables": self._num_variables,
+        }
+        # Coefficients rarely compress well, so leave compression to the client (if enabled)
+        return gss.serialization.serialize_envelope(arrays, compression=None)
+
+
+class QuboSolutions:
+    """The solutions of a QUBO problem, stored as a two-dimensional array of bits (with one row
+    per solution and one column per variable) along with the energy of each solution.
+
+    Both arrays are read-only, so they can be shared freely.
+    """
+
+    def __init__(
+        self,
+        solutions: npt.ArrayLike,
+        energies: npt.ArrayLike,
+        variables: Sequence[Hashable] | None = None,
+    ) -> None:
+        """Initializes a `QuboSolutions` object.
+
+        Args:
+            solutions: A two-dimensional array of bits (zeros and ones), with one row per solution.
+            energies: The energy of each solution.
+            variables: Optionally, a label for each variable (i.e. each column of `solutions`).
+
+        Raises:
+            ValueError: If `solutions` is not a two-dimensional array of bits, or if `energies` or
+                `variables` have the wrong length.
+        """
+        # Use views, so that marking them read-only doesn't affect the caller's arrays
+        solutions = np.asarray(solutions, dtype=np.uint8).view()
+        energies = np.asarray(energies, dtype=np.float64).view()
+        if solutions.ndim != 2 or np.any(solutions > 1):
+            raise ValueError("`solutions` must be a two-dimensional array of bits.")
+        if energies.shape != solutions.shape[:1]:
+            raise ValueError("`energies` must contain exactly one entry per solution.")
+        if variables is not None and len(variables) != solutions.shape[1]:
+            raise ValueError("`variables` must contain exactly one label per variable.")
+
+        solutions.setflags(write=False)
+        energies.setflags(write=False)
+        self._solutions: npt.NDArray[np.uint8] = solutions
+        self._energies: npt.NDArray[np.float64] = energies
+        self._variables: list[Hashable] | None = list(variables) if variables is not None else None
+
+    @property
+    def solutions(self) -> npt.NDArray[np.uint8]:
+        """A (read-only) two-dimensional array of bits, with one row per solution."""
+        return self._solutions
+
+    @property
+    def energies(self) -> npt.NDArray[np.float64]:
+        """A (read-only) array of the energy of each solution."""
+        return self._energies
+
+    @property
+    def variables(self) -> list[Hashable] | None:
+        """The label of each variable (if any)."""
+        return self._variables
+
+    def __len__(self) -> int:
+        return len(self._energies)
+
+    def __repr__(self) -> str:
+        return f"gss.QuboSolutions(<{len(self)} solutions of {self._solutions.shape[1]} variables>)"
+
+    def to_dicts(self) -> list[dict[Hashable, int]]:
+        """Converts to the format returned by `gss.Service.submit_qubo` for dictionary QUBOs.
+
+        Returns:
+            A dictionary for each solution, mapping each variable (label, or index if there are no
+            labels) to its value.
+        """
+        variables = (
+            self._variables if self._variables is not None else range(self._solutions.shape[1])
+        )
+        return [dict(zip(variables, solution)) for solution in self._solutions.tolist()]
+
+
+def _as_index_array(indices: npt.ArrayLike, name: str) -> npt.NDArray[np.int64]:
+    """Converts variable indices into a one-dimensional (copied) integer array.
+
+    Args:
+        indices: The indices to convert.
+        name: The name of the argument (for error messages).
+
+    Returns:
+        The converted indices.
+
+    Raises:
+        ValueError: If `indices` is not a one-dimensional array of integers.
+    """
+    array = np.asarray(indices)
+    if array.ndim != 1 or not (array.dtype.kind in "iu" or array.size == 0):
+        raise ValueError(f"`{name}` must be a one-dimensional array of integers.")
+    return array.astype(np.int64)
+
+
+def _as_real_array(values: npt.ArrayLike, name: str) -> npt.NDArray[np.float64]:
+    """Converts coefficients into a one-dimensional (copied) float array.
+
+    Args:
+        values: The coefficients to convert.
+        name: The name of the argument (for error messages).
+
+    Returns:
+        The converted coefficients.
+
+    Raises:
+        ValueError: If `values` is not a one-dimensional array of finite real numbers.
+    """
+    array = np.asarray(values)
+    if array.ndim != 1 or not (array.dtype.kind in "biuf" or array.size == 0):
+        raise ValueError(f"`{name}` must be a one-dimensional array of real numbers.")
+    array = array.astype(np.float64)
+    if not np.all(np.isfinite(array)):
+        raise ValueError(f"`{name}` must only contain finite values.")
+    return array
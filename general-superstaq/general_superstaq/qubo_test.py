@@ -0,0 +1,152 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import itertools
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import general_superstaq as gss
+
+
+def _energy(qubo: dict[tuple[str, ...], float], solution: dict[str, int]) -> float:
+    return sum(value * float(np.prod([solution[v] for v in key])) for key, value in qubo.items())
+
+
+def test_sparse_qubo() -> None:
+    qubo = gss.SparseQubo([0, 1, 2], [1, 2, 2], [1.0, -5, 2], linear=[2, 0, 0], offset=-3)
+    assert len(qubo) == 3
+    assert qubo.num_variables == 3
+    assert qubo.rows.tolist() == [0, 1, 2]
+    assert qubo.cols.tolist() == [1, 2, 2]
+    assert qubo.values.tolist() == [1.0, -5.0, 2.0]
+    assert qubo.linear.tolist() == [2.0, 0.0, 0.0]
+    assert qubo.offset == -3.0
+    assert qubo.variables is None
+    assert repr(qubo) == "gss.SparseQubo(<3 quadratic terms>, num_variables=3, offset=-3.0)"
+
+    # Arrays are read-only copies
+    rows = np.array([0, 1])
+    qubo = gss.SparseQubo(rows, [1, 1], [1, 1], num_variables=4)
+    rows[0] = 1
+    assert qubo.rows.tolist() == [0, 1]
+    assert qubo.linear.tolist() == [0.0] * 4
+    with pytest.raises(ValueError, match="read-only"):
+        qubo.values[0] = 2
+
+    qubo = gss.SparseQubo([], [], [], variables=["a", "b"])
+    assert qubo.num_variables == 2
+    assert qubo.variables == ["a", "b"]
+
+
+def test_sparse_qubo_validation() -> None:
+    with pytest.raises(ValueError, match="`rows` must be a one-dimensional array of integers"):
+        _ = gss.SparseQubo([0.5], [1], [1.0])
+    with pytest.raises(ValueError, match="`cols` must be a one-dimensional array of integers"):
+        _ = gss.SparseQubo([0], [[1]], [1.0])
+    with pytest.raises(ValueError, match="`values` must be a one-dimensional array of real"):
+        _ = gss.SparseQubo([0], [1], [1j])
+    with pytest.raises(ValueError, match="`linear` must only contain finite values"):
+        _ = gss.SparseQubo([0], [1], [1.0], linear=[0, np.nan])
+    with pytest.raises(ValueError, match="same length"):
+        _ = gss.SparseQubo([0, 1], [1], [1.0])
+    with pytest.raises(ValueError, match="offsets must be finite real numbers"):
+        _ = gss.SparseQubo([0], [1], [1.0], offset=np.inf)
+    with pytest.raises(ValueError, match="offsets must be finite real numbers"):
+        _ = gss.SparseQubo([0], [1], [1.0], offset="1")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="one entry per variable"):
+        _ = gss.SparseQubo([0], [1], [1.0], linear=[1.0, 2.0], num_variables=3)
+    with pytest.raises(ValueError, match="one label per variable"):
+        _ = gss.SparseQubo([0], [1], [1.0], variables=["a"])
+    with pytest.raises(ValueError, match="must be non-negative"):
+        _ = gss.SparseQubo([0], [-1], [1.0], num_variables=2)
+    with pytest.raises(ValueError, match="must be less than 2"):
+        _ = gss.SparseQubo([0], [2], [1.0], num_variables=2)
+    with pytest.raises(ValueError, match="less than the minimum value"):
+        _ = gss.SparseQubo([], [], [], num_variables=-1)
+
+
+def test_sparse_qubo_from_dict() -> None:
+    qubo_dict = {("a",): 2.0, ("a", "b"): 1.0, ("b", "c"): -5, ("c", "c"): 2, ("c",): 1, (): -3}
+    qubo = gss.SparseQubo.from_dict(qubo_dict)
+    assert qubo.variables == ["a", "b", "c"]
+    assert qubo.linear.tolist() == [2.0, 0.0, 1.0]
+    assert qubo.offset == -3.0
+    assert len(qubo) == 3
+
+    solutions = np.array(list(itertools.product([0, 1], repeat=3)))
+    expected = [_energy(qubo_dict, dict(zip("abc", solution))) for solution in solutions]
+    assert qubo.energies(solutions).tolist() == expected
+
+    with mock.patch("general_superstaq.qubo._ENERGY_BLOCK_SIZE", 5):
+        assert qubo.energies(solutions).tolist() == expected
+
+    with pytest.raises(ValueError, match="column per variable"):
+        _ = qubo.energies(solutions[:, :2])
+    with pytest.raises(ValueError, match="must be quadratic"):
+        _ = gss.SparseQubo.from_dict({(1, 2, 3): 123})
+
+
+def test_sparse_qubo_from_matrix() -> None:
+    matrix = np.array([[1.0, 0.0], [-2.0, 0.5]])
+    qubo = gss.SparseQubo.from_matrix(matrix, linear=[1, 1], offset=2)
+    assert qubo.rows.tolist() == [0, 1, 1]
+    assert qubo.cols.tolist() == [0, 0, 1]
+    assert qubo.values.tolist() == [1.0, -2.0, 0.5]
+    assert qubo.energies([[1, 1], [0, 1]]).tolist() == [3.5, 3.5]
+
+    class CooMatrix:  # Mimics a scipy.sparse.coo_matrix
+        row = np.array([0, 2])
+        col = np.array([1, 2])
+        data = np.array([3.0, 4.0])
+        shape = (3, 3)
+
+        def tocoo(self) -> CooMatrix:
+            return self
+
+    qubo = gss.SparseQubo.from_matrix(CooMatrix())
+    assert qubo.num_variables == 3
+    assert qubo.values.tolist() == [3.0, 4.0]
+
+    with pytest.raises(ValueError, match="must be square"):
+        _ = gss.SparseQubo.from_matrix(np.zeros((2, 3)))
+    with pytest.raises(ValueError, match="must be two-dimensional"):
+        _ = gss.SparseQubo.from_matrix(np.zeros(2))
+
+
+def test_sparse_qubo_serialize() -> None:
+    qubo = gss.SparseQubo([0, 1], [1, 2], [1.0, -5.0], linear=[2, 0, 0], offset=-3)
+    arrays = gss.serialization.deserialize(qubo.serialize(), allow_pickle=False)
+    assert arrays["rows"].dtype == np.int32
+    assert arrays["rows"].tolist() == [0, 1]
+    assert arrays["cols"].tolist() == [1, 2]
+    assert arrays["values"].tolist() == [1.0, -5.0]
+    assert arrays["linear"].tolist() == [2.0, 0.0, 0.0]
+    assert arrays["offset"] == -3.0
+    assert arrays["num_variables"] == 3
+
+
+def test_qubo_solutions() -> None:
+    solutions = gss.QuboSolutions([[0, 1], [1, 1]], [-1.0, 2.0], variables=["a", "b"])
+    assert len(solutions) == 2
+    assert solutions.solutions.dtype == np.uint8
+    assert solutions.energies.tolist() == [-1.0, 2.0]
+    assert solutions.variables == ["a", "b"]
+    assert solutions.to_dicts() == [{"a": 0, "b": 1}, {"a": 1, "b": 1}]
+    assert repr(solutions) == "gss.QuboSolutions(<2 solutions of 2 variables>)"
+    with pytest.raises(ValueError, match="read-only"):
+        solutions.solutions[0, 0] = 1
+
+    solutions = gss.QuboSolutions(np.zeros((1, 3)), [0.0])
+    assert solutions.variables is None
+    assert solutions.to_dicts() == [{0: 0, 1: 0, 2: 0}]
+
+    with pytest.raises(ValueError, match="two-dimensional array of bits"):
+        _ = gss.QuboSolutions([[0, 2]], [0.0])
+    with pytest.raises(ValueError, match="two-dimensional array of bits"):
+        _ = gss.QuboSolutions([0, 1], [0.0])
+    with pytest.raises(ValueError, match="one entry per solution"):
+        _ = gss.QuboSolutions([[0, 1]], [0.0, 1.0])
+    with pytest.raises(ValueError, match="one label per variable"):
+        _ = gss.QuboSolutions([[0, 1]], [0.0], variables=["a"])
@@ -0,0 +1,364 @@
+"""Policies controlling how requests to the Superstaq API are retried."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import email.utils
+import http
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+
+import requests
+
+JITTER_MODES = ("full", "decorrelated")
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryEvent:
+    """Information about a request which is about to be retried."""
+
+    endpoint: str
+    """The endpoint which was requested."""
+    attempt: int
+    """The number of attempts made so far (so the first retry has `attempt=1`)."""
+    delay_seconds: float
+    """How long the client will wait before retrying."""
+    message: str
+    """A description of the error which caused the retry."""
+    status_code: int | None = None
+    """The HTTP status code of the failed response, or None if no response was received."""
+
+
+class CircuitBreaker:
+    """Fails requests fast while the Superstaq API appears to be unavailable.
+
+    The breaker "opens" after `failure_threshold` consecutive retriable failures (across all
+    requests made with the same policy), after which requests are rejected without contacting the
+    server. Once `reset_timeout_seconds` have passed, a single trial request is allowed through
+    ("half-open"): if it succeeds the breaker closes again, and otherwise it re-opens.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0) -> None:
+        """Initializes a `CircuitBreaker`.
+
+        Args:
+            failure_threshold: The number of consecutive failures after which to open the breaker.
+            reset_timeout_seconds: How long to wait before allowing a trial request through an open
+                breaker.
+
+        Raises:
+            ValueError: If `failure_threshold` is not positive or `reset_timeout_seconds` is
+                negative.
+        """
+        if failure_threshold < 1:
+            raise ValueError("`failure_threshold` must be a positive integer.")
+        if reset_timeout_seconds < 0:
+            raise ValueError("`reset_timeout_seconds` must be non-negative.")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_progress = False
+
+    @property
+    def state(self) -> str:
+        """The current state of the breaker: "closed", "open", or "half-open"."""
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout_seconds:
+            return "half-open"
+        return "open"
+
+    def seconds_until_reset(self) -> float:
+        """Returns the number of seconds until an open breaker will allow a trial request."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout_seconds - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Checks whether a request should be attempted.
+
+        Returns:
+            False if the breaker is open (or half-open with a trial request already in progress),
+            and True otherwise.
+        """
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return True
+            return False
+
+    def release_trial(self) -> None:
+        """Releases a half-open breaker's trial request without recording its outcome (e.g. if it
+        raised an unexpected exception), so that another trial request can be made.
+        """
+        with self._lock:
+            self._trial_in_progress = False
+
+    def record_success(self) -> None:
+        """Records a successful request, closing the breaker."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Records a failed request, opening the breaker if there have been too many in a row."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._trial_in_progress or self._consecutive_failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_progress = False
+
+    def __repr__(self) -> str:
+        return (
+            f"gss.retry.CircuitBreaker(failure_threshold={self.failure_threshold!r}, "
+            f"reset_timeout_seconds={self.reset_timeout_seconds!r})"
+        )
+
+
+class RetryPolicy:
+    """Configures how requests to the Superstaq API are retried.
+
+    By default failed requests are retried after 0.1 seconds, doubling the delay after each
+    subsequent failure. Only "503 Service Unavailable" responses and connection errors are retried.
+    """
+
+    def __init__(
+        self,
+        initial_delay_seconds: float = 0.1,
+        multiplier: float = 2.0,
+        max_delay_seconds: float | None = None,
+        jitter: str | None = None,
+        retriable_status_codes: Iterable[int] = (http.HTTPStatus.SERVICE_UNAVAILABLE,),
+        respect_retry_after: bool = True,
+        endpoint_budgets: Mapping[str, float] | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        on_retry: Callable[[RetryEvent], object] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initializes a `RetryPolicy`.
+
+        Args:
+            initial_delay_seconds: The delay before the first retry.
+            multiplier: The factor by which the delay grows after each retry.
+            max_delay_seconds: An optional cap on the delay between consecutive retries.
+            jitter: Optional randomization of retry delays, which prevents many clients from
+                retrying in lockstep. Either "full" (wait a random time between zero and the
+                exponential backoff delay) or "decorrelated" (wait a random time between
+                `initial_delay_seconds` and three times the previous delay).
+            retriable_status_codes: The HTTP status codes for which requests are retried (e.g.
+                429, 502, 503, or 504).
+            respect_retry_after: Whether to honor the server's `Retry-After` header, if provided.
+            endpoint_budgets: An optional mapping from endpoints (e.g. "/fetch_jobs") to retry
+                budgets. Each request to a budgeted endpoint earns that many retries (up to a
+                maximum of ten requests' worth), so for example a budget of 0.2 allows at most one
+                retry for every five requests on average, even if every request is failing.
+            circuit_breaker: An optional `gss.retry.CircuitBreaker` used to fail fast while the
+                API is unavailable.
+            on_retry: An optional function called with a `gss.retry.RetryEvent` before every retry,
+                e.g. to track retry amplification.
+            seed: An optional seed for the random number generator used for jitter.
+
+        Raises:
+            ValueError: If `jitter` is not a recognized jitter mode.
+            ValueError: If any delay or budget is negative.
+        """
+        if jitter is not None and jitter not in JITTER_MODES:
+            raise ValueError(f"`jitter` must be one of {JITTER_MODES} (or None).")
+        if initial_delay_seconds < 0 or (max_delay_seconds is not None and max_delay_seconds < 0):
+            raise ValueError("Retry delays must be non-negative.")
+        if endpoint_budgets and any(budget < 0 for budget in endpoint_budgets.values()):
+            raise ValueError("Retry budgets must be non-negative.")
+
+        self.initial_delay_seconds = initial_delay_seconds
+        self.multiplier = multiplier
+        self.max_delay_seconds = max_delay_seconds
+        self.jitter = jitter
+        self.retriable_status_codes = frozenset(int(code) for code in retriable_status_codes)
+        self.respect_retry_after = respect_retry_after
+        self.endpoint_budgets = dict(endpoint_budgets or {})
+        self.circuit_breaker = circuit_breaker
+        self.on_retry = on_retry
+
+        self.retry_counts: collections.Counter[str] = collections.Counter()
+        """The number of retries made so far, by endpoint."""
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._budget_tokens = {
+            endpoint: 10 * budget for endpoint, budget in self.endpoint_budgets.items()
+        }
+
+    def backoff_seconds(self, attempt: int) -> float:
+        """The (un-jittered) exponential backoff delay after a given number of attempts.
+
+        Args:
+            attempt: The number of attempts made so far.
+
+        Returns:
+            The backoff delay, in seconds.
+        """
+        delay_seconds = self.initial_delay_seconds * self.multiplier ** (attempt - 1)
+        if self.max_delay_seconds is not None:
+            delay_seconds = min(delay_seconds, self.max_delay_seconds)
+        return delay_seconds
+
+    def delay_seconds(
+        self, attempt: int, previous_delay_seconds: float | None, retry_after: float | None = None
+    ) -> float:
+        """Chooses how long to wait before the next retry.
+
+        Args:
+            attempt: The number of attempts made so far.
+            previous_delay_seconds: The delay before the previous retry (if any).
+            retry_after: The delay requested by the server via a `Retry-After` header (if any).
+
+        Returns:
+            The number of seconds to wait before retrying.
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return retry_after
+
+        backoff_seconds = self.backoff_seconds(attempt)
+        with self._lock:
+            if self.jitter == "full":
+                return self._random.uniform(0, backoff_seconds)
+            if self.jitter == "decorrelated":
+                upper = 3 * (previous_delay_seconds or self.initial_delay_seconds)
+                delay_seconds = self._random.uniform(self.initial_delay_seconds, upper)
+                if self.max_delay_seconds is not None:
+                    delay_seconds = min(delay_seconds, self.max_delay_seconds)
+                return delay_seconds
+        return backoff_seconds
+
+    def is_retriable(self, status_code: int) -> bool:
+        """Whether responses with a given status code should be retried.
+
+        Args:
+            status_code: An HTTP status code.
+
+        Returns:
+            True if requests failing with `status_code` should be retried.
+        """
+        return status_code in self.retriable_status_codes
+
+    def get_retry_after(self, response: requests.Response) -> float | None:
+        """Extracts the delay requested by the server via the `Retry-After` header, if any.
+
+        Args:
+            response: The failed response.
+
+        Returns:
+            The requested delay in seconds, or None if no (valid) `Retry-After` header was found.
+        """
+        value = response.headers.get("Retry-After")
+        if not isinstance(value, str):
+            return None
+
+        value = value.strip()
+        if value.isdecimal():
+            return float(value)
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def allow_request(self, endpoint: str) -> bool:
+        """Checks the circuit breaker (if any), and credits the endpoint's retry budget (if any).
+
+        Args:
+            endpoint: The endpoint being requested.
+
+        Returns:
+            False if the request should be rejected without contacting the server.
+        """
+        if not self.allow_attempt():
+            return False
+
+        if endpoint in self.endpoint_budgets:
+            with self._lock:
+                budget = self.endpoint_budgets[endpoint]
+                self._budget_tokens[endpoint] = min(
+                    self._budget_tokens[endpoint] + budget, 10 * budget
+                )
+        return True
+
+    def allow_attempt(self) -> bool:
+        """Checks the circuit breaker (if any) before each attempt, including retries.
+
+        Returns:
+            False if the attempt should be abandoned without contacting the server.
+        """
+        return not self.circuit_breaker or self.circuit_breaker.allow_request()
+
+    def release_attempt(self) -> None:
+        """Releases an attempt with no recorded outcome (see `CircuitBreaker.release_trial`)."""
+        if self.circuit_breaker:
+            self.circuit_breaker.release_trial()
+
+    def allow_retry(self, endpoint: str) -> bool:
+        """Checks whether the endpoint's retry budget allows another retry, and debits it if so.
+
+        Args:
+            endpoint: The endpoint being requested.
+
+        Returns:
+            Whether the request may be retried.
+        """
+        if endpoint not in self.endpoint_budgets:
+            return True
+
+        with self._lock:
+            if self._budget_tokens[endpoint] < 1:
+                return False
+            self._budget_tokens[endpoint] -= 1
+            return True
+
+    def record_success(self) -> None:
+        """Records a successful request (i.e. any response other than a retriable error)."""
+        if self.circuit_breaker:
+            self.circuit_breaker.record_success()
+
+    def record_failure(self) -> None:
+        """Records a failed (retriable) request."""
+        if self.circuit_breaker:
+            self.circuit_breaker.record_failure()
+
+    def record_retry(self, event: RetryEvent) -> None:
+        """Records a retry, notifying the `on_retry` hook (if any).
+
+        Args:
+            event: The `gss.retry.RetryEvent` describing the retry.
+        """
+        with self._lock:
+            self.retry_counts[event.endpoint] += 1
+        if self.on_retry:
+            self.on_retry(event)
+
+    def __repr__(self) -> str:
+        return (
+            f"gss.RetryPolicy(initial_delay_seconds={self.initial_delay_seconds!r}, "
+            f"multiplier={self.multiplier!r}, max_delay_seconds={self.max_delay_seconds!r}, "
+            f"jitter={self.jitter!r}, "
+            f"retriable_status_codes={sorted(self.retriable_status_codes)!r}, "
+            f"respect_retry_after={self.respect_retry_after!r}, "
+            f"endpoint_budgets={self.endpoint_budgets!r}, "
+            f"circuit_breaker={self.circuit_breaker!r})"
+        )
@@ -0,0 +1,188 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import email.utils
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+import general_superstaq as gss
+
+
+def test_retry_policy_defaults() -> None:
+    policy = gss.RetryPolicy()
+    assert [policy.backoff_seconds(attempt) for attempt in range(1, 5)] == [0.1, 0.2, 0.4, 0.8]
+    assert [policy.delay_seconds(attempt, None) for attempt in range(1, 5)] == [0.1, 0.2, 0.4, 0.8]
+    assert policy.is_retriable(503)
+    assert not policy.is_retriable(502)
+    assert not policy.is_retriable(504)
+    assert policy.allow_request("/jobs")
+    assert policy.allow_retry("/jobs")
+
+    assert repr(policy) == (
+        "gss.RetryPolicy(initial_delay_seconds=0.1, multiplier=2.0, max_delay_seconds=None, "
+        "jitter=None, retriable_status_codes=[503], respect_retry_after=True, "
+        "endpoint_budgets={}, circuit_breaker=None)"
+    )
+
+
+def test_retry_policy_errors() -> None:
+    with pytest.raises(ValueError, match="jitter"):
+        _ = gss.RetryPolicy(jitter="partial")
+    with pytest.raises(ValueError, match="non-negative"):
+        _ = gss.RetryPolicy(initial_delay_seconds=-1)
+    with pytest.raises(ValueError, match="non-negative"):
+        _ = gss.RetryPolicy(max_delay_seconds=-1)
+    with pytest.raises(ValueError, match="budgets"):
+        _ = gss.RetryPolicy(endpoint_budgets={"/jobs": -1})
+
+
+def test_retry_policy_max_delay() -> None:
+    policy = gss.RetryPolicy(initial_delay_seconds=1, multiplier=3, max_delay_seconds=5)
+    assert [policy.backoff_seconds(attempt) for attempt in range(1, 5)] == [1, 3, 5, 5]
+
+
+def test_retry_policy_full_jitter() -> None:
+    policy = gss.RetryPolicy(jitter="full", seed=1234)
+    for attempt in range(1, 10):
+        assert 0 <= policy.delay_seconds(attempt, None) <= policy.backoff_seconds(attempt)
+
+    delays = [gss.RetryPolicy(jitter="full", seed=1234).delay_seconds(1, None) for _ in range(2)]
+    assert delays[0] == delays[1]
+
+
+def test_retry_policy_decorrelated_jitter() -> None:
+    policy = gss.RetryPolicy(jitter="decorrelated", max_delay_seconds=2.0)
+    delay_seconds = None
+    for attempt in range(1, 20):
+        previous_delay_seconds = delay_seconds
+        delay_seconds = policy.delay_seconds(attempt, previous_delay_seconds)
+        assert 0.1 <= delay_seconds <= 2.0
+        assert delay_seconds <= 3 * (previous_delay_seconds or 0.1)
+
+
+def test_retry_policy_retry_after() -> None:
+    policy = gss.RetryPolicy(jitter="full")
+    response = requests.Response()
+    assert policy.get_retry_after(response) is None
+
+    response.headers["Retry-After"] = "12"
+    assert policy.get_retry_after(response) == 12.0
+    assert policy.delay_seconds(1, None, retry_after=12.0) == 12.0
+
+    response.headers["Retry-After"] = email.utils.formatdate(time.time() + 100, usegmt=True)
+    assert 90 < policy.get_retry_after(response) <= 100  # type: ignore[operator]
+
+    response.headers["Retry-After"] = "tomorrow"
+    assert policy.get_retry_after(response) is None
+
+    # Non-string headers (e.g. from a mocked response) are ignored
+    assert policy.get_retry_after(mock.MagicMock()) is None
+
+    policy = gss.RetryPolicy(respect_retry_after=False)
+    assert policy.delay_seconds(1, None, retry_after=12.0) == 0.1
+
+
+def test_retry_policy_endpoint_budgets() -> None:
+    policy = gss.RetryPolicy(endpoint_budgets={"/fetch_jobs": 0.5})
+
+    # Unbudgeted endpoints can always retry
+    assert all(policy.allow_retry("/jobs") for _ in range(100))
+
+    # The budget starts full (ten requests' worth of retries)
+    assert sum(policy.allow_retry("/fetch_jobs") for _ in range(100)) == 5
+
+    # ...and is replenished by subsequent requests
+    for _ in range(4):
+        assert policy.allow_request("/fetch_jobs")
+    assert sum(policy.allow_retry("/fetch_jobs") for _ in range(100)) == 2
+
+    for _ in range(100):
+        assert policy.allow_request("/fetch_jobs")
+    assert sum(policy.allow_retry("/fetch_jobs") for _ in range(100)) == 5
+
+
+def test_retry_policy_on_retry() -> None:
+    events: list[gss.retry.RetryEvent] = []
+    policy = gss.RetryPolicy(on_retry=events.append)
+    event = gss.retry.RetryEvent("/jobs", 1, 0.1, "Service Unavailable", 503)
+    policy.record_retry(event)
+    policy.record_retry(event)
+    policy.record_retry(gss.retry.RetryEvent("/fetch_jobs", 1, 0.1, "RequestException"))
+    assert events == [event, event, gss.retry.RetryEvent("/fetch_jobs", 1, 0.1, "RequestException")]
+    assert policy.retry_counts == {"/jobs": 2, "/fetch_jobs": 1}
+
+
+def test_circuit_breaker() -> None:
+    breaker = gss.retry.CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10)
+    assert repr(breaker) == (
+        "gss.retry.CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10)"
+    )
+
+    with mock.patch("time.monotonic", return_value=0):
+        assert breaker.state == "closed"
+        assert breaker.seconds_until_reset() == 0.0
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+
+    with mock.patch("time.monotonic", return_value=4):
+        assert breaker.seconds_until_reset() == 6.0
+        assert not breaker.allow_request()
+
+    # A single trial request is let through once the timeout has passed...
+    with mock.patch("time.monotonic", return_value=10):
+        assert breaker.state == "half-open"
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        # ...which reopens the breaker if it fails
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+
+    # An unrecorded trial request can be released, allowing another one
+    with mock.patch("time.monotonic", return_value=20):
+        assert breaker.allow_request()
+        breaker.release_trial()
+        assert breaker.state == "half-open"
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow_request()
+
+    with pytest.raises(ValueError, match="failure_threshold"):
+        _ = gss.retry.CircuitBreaker(failure_threshold=0)
+    with pytest.raises(ValueError, match="reset_timeout_seconds"):
+        _ = gss.retry.CircuitBreaker(reset_timeout_seconds=-1)
+
+
+def test_retry_policy_circuit_breaker() -> None:
+    breaker = gss.retry.CircuitBreaker(failure_threshold=1)
+    policy = gss.RetryPolicy(circuit_breaker=breaker)
+    assert policy.allow_request("/jobs")
+    policy.record_failure()
+    assert not policy.allow_request("/jobs")
+    assert breaker.state == "open"
+
+    assert not policy.allow_attempt()
+
+    breaker._opened_at = -1000.0
+    assert policy.allow_attempt()
+    assert not policy.allow_request("/jobs")
+    policy.release_attempt()
+    assert policy.allow_request("/jobs")
+    policy.record_success()
+    assert breaker.state == "closed"
+
+    policy = gss.RetryPolicy()
+    assert policy.allow_attempt()
+    policy.release_attempt()
@@ -1,8 +1,35 @@
 from __future__ import annotations
 
+import base64
 import codecs
+import concurrent.futures
+import gzip
+import json
+import math
 import pickle
-from typing import Any
+import struct
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+import numpy as np
+
+import general_superstaq as gss
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+CHUNKS_PER_WORKER = 4
+"""The number of chunks into which `map_chunks` splits its items per worker (for load balancing)."""
+
+ENVELOPE_MAGIC = b"GSSB"
+"""The first bytes of every binary envelope generated by `pack_envelope`."""
+
+ENVELOPE_VERSION = 1
+"""The version of the binary envelope format generated by `pack_envelope`."""
+
+_ENVELOPE_HEADER = struct.Struct("<4sBBH")  # magic, version, compression, reserved
+_ENVELOPE_ALIGNMENT = 8
+_COMPRESSIONS = (None, "gzip", "zstd")
 
 
 def bytes_to_str(bytes_data: bytes) -> str:
@@ -41,13 +68,254 @@ def serialize(obj: Any) -> str:
     return bytes_to_str(pickle.dumps(obj))
 
 
-def deserialize(serialized_obj: str) -> Any:
+def deserialize(serialized_obj: str, allow_pickle: bool = True) -> Any:
     """Deserialize serialized objects.
 
     Args:
-        serialized_obj: A string generated via `general_superstaq.serialization.serialize`.
+        serialized_obj: A string generated via `general_superstaq.serialization.serialize` or
+            `general_superstaq.serialization.serialize_envelope`.
+        allow_pickle: Whether to accept pickled objects (generated via
+            `general_superstaq.serialization.serialize`). Unpickling can execute arbitrary code, so
+            this should only be allowed for trusted data.
 
     Returns:
         The serialized object.
+
+    Raises:
+        ValueError: If `serialized_obj` is a pickled object and `allow_pickle` is False.
+    """
+    data = base64.b64decode(serialized_obj)
+    if data.startswith(ENVELOPE_MAGIC):
+        return unpack_envelope(data)
+    if not allow_pickle:
+        raise ValueError("Refusing to deserialize a pickled object.")
+    return pickle.loads(data)
+
+
+def serialize_envelope(obj: Any, compression: str | None = "gzip") -> str:
+    """Serialize an object into a string via a binary envelope (see `pack_envelope`).
+
+    Args:
+        obj: The object to be serialized.
+        compression: The compression to apply (None, "gzip", or "zstd").
+
+    Returns:
+        The (base64-encoded) string representing the serialized object.
+    """
+    return base64.b64encode(pack_envelope(obj, compression)).decode()
+
+
+def pack_envelope(obj: Any, compression: str | None = None) -> bytes:
+    """Serialize an object into a versioned binary envelope, without pickling.
+
+    Objects may be any combination of None, booleans, numbers, strings, bytes, lists, tuples,
+    dictionaries, and NumPy arrays and scalars (of any non-object dtype). The structure of the
+    object is stored as json, followed by the raw contents of each array (and bytes object), so
+    that they can be decoded without copying (see `unpack_envelope`).
+
+    Args:
+        obj: The object to be serialized.
+        compression: The compression to apply (None, "gzip", or "zstd"). Compressing with "zstd"
+            requires the zstandard package.
+
+    Returns:
+        The binary envelope.
+
+    Raises:
+        ValueError: If `compression` is not supported.
+        TypeError: If `obj` contains an object which can't be serialized.
+    """
+    if compression not in _COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression!r}.")
+
+    buffers: list[memoryview] = []
+    value = _encode_value(obj, buffers)
+    skeleton = json.dumps(
+        {"value": value, "buffers": [buffer.nbytes for buffer in buffers]}, separators=(",", ":")
+    ).encode()
+
+    parts: list[bytes | memoryview] = [struct.pack("<I", len(skeleton)), skeleton]
+    size = 4 + len(skeleton)
+    for buffer in buffers:
+        padding = -size % _ENVELOPE_ALIGNMENT
+        parts += [b"\0" * padding, buffer]
+        size += padding + buffer.nbytes
+
+    body = b"".join(parts)
+    if compression == "gzip":
+        body = gzip.compress(body, compresslevel=6, mtime=0)
+    elif compression == "zstd":
+        body = _zstandard().ZstdCompressor().compress(body)
+
+    header = _ENVELOPE_HEADER.pack(
+        ENVELOPE_MAGIC, ENVELOPE_VERSION, _COMPRESSIONS.index(compression), 0
+    )
+    return header + body
+
+
+def unpack_envelope(data: bytes | bytearray | memoryview) -> Any:
+    """Deserialize an object from a binary envelope generated via `pack_envelope`.
+
+    NumPy arrays in uncompressed envelopes are views of `data` itself (so they are read-only if
+    `data` is immutable); those in compressed envelopes share a single decompressed buffer.
+
+    Args:
+        data: The binary envelope.
+
+    Returns:
+        The deserialized object.
+
+    Raises:
+        ValueError: If `data` is not a binary envelope, or uses an unsupported version or
+            compression.
+    """
+    view = memoryview(data).cast("B")
+    if view.nbytes < _ENVELOPE_HEADER.size or view[:4] != ENVELOPE_MAGIC:
+        raise ValueError("Data is not a binary envelope.")
+
+    _, version, compression_index, _ = _ENVELOPE_HEADER.unpack_from(view)
+    if version != ENVELOPE_VERSION:
+        raise ValueError(f"Unsupported binary envelope version: {version}.")
+    if compression_index >= len(_COMPRESSIONS):
+        raise ValueError(f"Unsupported binary envelope compression: {compression_index}.")
+
+    body = view[_ENVELOPE_HEADER.size :]
+    if _COMPRESSIONS[compression_index] == "gzip":
+        body = memoryview(gzip.decompress(body))
+    elif _COMPRESSIONS[compression_index] == "zstd":
+        body = memoryview(_zstandard().ZstdDecompressor().decompress(body))
+
+    (skeleton_size,) = struct.unpack_from("<I", body)
+    skeleton = json.loads(bytes(body[4 : 4 + skeleton_size]))
+
+    buffers = []
+    offset = 4 + skeleton_size
+    for size in skeleton["buffers"]:
+        offset += -offset % _ENVELOPE_ALIGNMENT
+        buffers.append(body[offset : offset + size])
+        offset += size
+
+    return _decode_value(skeleton["value"], buffers)
+
+
+def _encode_value(value: Any, buffers: list[memoryview]) -> Any:
+    """Converts an object into its json-serializable structure for `pack_envelope`.
+
+    Args:
+        value: The object to convert.
+        buffers: The list to which the raw contents of any arrays (and bytes objects) are added.
+
+    Returns:
+        A json-serializable structure, in which every container is tagged with its type.
+
+    Raises:
+        TypeError: If `value` contains an object which can't be serialized.
+    """
+    if isinstance(value, (np.ndarray, np.generic)):
+        array = np.asarray(value)
+        if array.dtype.hasobject:
+            raise TypeError("Arrays of Python objects can't be serialized.")
+        buffers.append(np.ascontiguousarray(array).reshape(-1).view(np.uint8).data)
+        tag = "s" if isinstance(value, np.generic) else "a"
+        dtype = np.lib.format.dtype_to_descr(array.dtype)
+        return {tag: len(buffers) - 1, "dtype": dtype, "shape": array.shape}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, complex):
+        return {"c": [value.real, value.imag]}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        buffers.append(memoryview(value).cast("B"))
+        return {"b": len(buffers) - 1}
+    if isinstance(value, list):
+        return [_encode_value(item, buffers) for item in value]
+    if isinstance(value, tuple):
+        return {"t": [_encode_value(item, buffers) for item in value]}
+    if isinstance(value, dict):
+        return {
+            "d": [[_encode_value(k, buffers), _encode_value(v, buffers)] for k, v in value.items()]
+        }
+    raise TypeError(f"Objects of type {type(value).__name__} can't be serialized.")
+
+
+def _decode_value(value: Any, buffers: list[memoryview]) -> Any:
+    """Reconstructs an object from its structure in a binary envelope.
+
+    Args:
+        value: The json structure generated by `_encode_value`.
+        buffers: The raw contents of the arrays (and bytes objects) in the envelope.
+
+    Returns:
+        The reconstructed object.
+    """
+    if isinstance(value, list):
+        return [_decode_value(item, buffers) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "t" in value:
+        return tuple(_decode_value(item, buffers) for item in value["t"])
+    if "d" in value:
+        return {_decode_value(k, buffers): _decode_value(v, buffers) for k, v in value["d"]}
+    if "c" in value:
+        return complex(*value["c"])
+    if "b" in value:
+        return bytes(buffers[value["b"]])
+
+    dtype = np.lib.format.descr_to_dtype(value["dtype"])
+    buffer = buffers[value["a"] if "a" in value else value["s"]]
+    shape = tuple(value["shape"])
+    array = np.frombuffer(buffer, dtype=dtype, count=math.prod(shape)).reshape(shape)
+    return array if "a" in value else array[()]
+
+
+def _zstandard() -> Any:
+    """Imports the (optional) zstandard package, for "zstd" compression."""
+    try:
+        import zstandard
+
+        return zstandard
+
+    except ImportError:
+        raise ModuleNotFoundError(
+            "The zstandard package is required for zstd compression. You can install it using "
+            "'pip install zstandard'."
+        )
+
+
+def map_chunks(
+    func: Callable[[Sequence[T]], R],
+    items: Sequence[T],
+    max_workers: int | None = None,
+    chunks_per_worker: int = CHUNKS_PER_WORKER,
+) -> list[R]:
+    """Applies a function to consecutive chunks of a sequence in parallel worker processes, e.g. to
+    serialize a large batch of circuits.
+
+    Starting the worker processes (and pickling the items sent to them) has a fixed cost of its
+    own, so this is only worthwhile for large batches. On platforms which start processes by
+    spawning them (e.g. Windows and macOS), the calling script must be guarded by
+    `if __name__ == "__main__":`.
+
+    Args:
+        func: The function to apply to each chunk. It must be picklable (e.g. a module-level
+            function).
+        items: The items to process.
+        max_workers: The maximum number of worker processes to use. If None or 1, `func` is
+            applied to all of `items` in the current process.
+        chunks_per_worker: The number of chunks into which to split `items` per worker (more
+            chunks balance the load better, while fewer allow `func` to batch more work).
+
+    Returns:
+        The result of `func` for each chunk, in order.
     """
-    return pickle.loads(str_to_bytes(serialized_obj))
+    if max_workers is None:
+        return [func(items)]
+
+    gss.validation.validate_integer_param(max_workers)
+    num_chunks = min(len(items), int(max_workers) * chunks_per_worker)
+    if int(max_workers) == 1 or num_chunks <= 1:
+        return [func(items)]
+
+    bounds = [len(items) * i // num_chunks for i in range(num_chunks + 1)]
+    chunks = [items[start:stop] for start, stop in zip(bounds, bounds[1:])]
+    with concurrent.futures.ProcessPoolExecutor(min(int(max_workers), num_chunks)) as executor:
+        return list(executor.map(func, chunks))
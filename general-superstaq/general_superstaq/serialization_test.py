@@ -1,6 +1,15 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+import base64
+import sys
+import zlib
+from typing import Any
+from unittest import mock
+
+import numpy as np
+import pytest
+
 import general_superstaq as gss
 
 
@@ -9,3 +18,100 @@ def test_serialization() -> None:
     serialized_obj = gss.serialization.serialize(obj)
     assert isinstance(serialized_obj, str)
     assert gss.serialization.deserialize(serialized_obj) == obj
+
+
+def test_envelope() -> None:
+    obj = {
+        "items": [1, 2.5, None, True, "str", (1, (2,)), 1 + 2j, b"bytes"],
+        (0, 1): np.arange(6).reshape(2, 3),
+        "empty": np.zeros((0, 3)),
+        "scalar": np.float32(1.5),
+        "zero_dimensional": np.array(3),
+        "strided": np.arange(10)[::2],
+        "structured": np.zeros(2, dtype=[("x", "<i4", (2,)), ("y", "<f8")]),
+    }
+
+    def assert_equal(value: Any, expected: Any) -> None:
+        assert type(value) is type(expected)
+        if isinstance(expected, np.ndarray):
+            np.testing.assert_array_equal(value, expected)
+            assert value.dtype == expected.dtype
+        elif isinstance(expected, np.generic):
+            assert value == expected
+            assert value.dtype == expected.dtype
+        else:
+            assert value == expected
+
+    for compression in [None, "gzip"]:
+        envelope = gss.serialization.pack_envelope(obj, compression)
+        assert envelope.startswith(gss.serialization.ENVELOPE_MAGIC)
+        deserialized_obj = gss.serialization.unpack_envelope(envelope)
+        assert deserialized_obj.keys() == obj.keys()
+        for key, value in obj.items():
+            assert_equal(deserialized_obj[key], value)
+
+    # Uncompressed arrays are decoded without copying
+    envelope = gss.serialization.pack_envelope(np.arange(1000.0))
+    array = gss.serialization.unpack_envelope(envelope)
+    assert np.shares_memory(array, np.frombuffer(envelope, dtype=np.uint8))
+    assert not array.flags.writeable
+    assert len(gss.serialization.pack_envelope(np.zeros(1000), "gzip")) < 200
+
+    serialized_obj = gss.serialization.serialize_envelope([{0: 1, 1: 0}] * 10)
+    assert gss.serialization.deserialize(serialized_obj) == [{0: 1, 1: 0}] * 10
+    assert gss.serialization.deserialize(serialized_obj, allow_pickle=False) == [{0: 1, 1: 0}] * 10
+    with pytest.raises(ValueError, match="pickled"):
+        _ = gss.serialization.deserialize(gss.serialization.serialize(obj), allow_pickle=False)
+
+
+def test_envelope_zstd() -> None:
+    zstandard = mock.MagicMock()
+    zstandard.ZstdCompressor.return_value.compress.side_effect = zlib.compress
+    zstandard.ZstdDecompressor.return_value.decompress.side_effect = zlib.decompress
+    with mock.patch.dict(sys.modules, {"zstandard": zstandard}):
+        envelope = gss.serialization.pack_envelope([np.arange(5)], "zstd")
+        np.testing.assert_array_equal(gss.serialization.unpack_envelope(envelope)[0], range(5))
+
+    with mock.patch.dict(sys.modules, {"zstandard": None}):
+        with pytest.raises(ModuleNotFoundError, match="pip install zstandard"):
+            _ = gss.serialization.pack_envelope([], "zstd")
+
+
+def test_envelope_errors() -> None:
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        _ = gss.serialization.pack_envelope([], "lzma")
+    with pytest.raises(TypeError, match="Arrays of Python objects"):
+        _ = gss.serialization.pack_envelope(np.array([None]))
+    with pytest.raises(TypeError, match="type set"):
+        _ = gss.serialization.pack_envelope({"a": {1}})
+
+    envelope = gss.serialization.pack_envelope([])
+    with pytest.raises(ValueError, match="not a binary envelope"):
+        _ = gss.serialization.unpack_envelope(envelope[:4])
+    with pytest.raises(ValueError, match="not a binary envelope"):
+        _ = gss.serialization.unpack_envelope(b"GSSX" + envelope[4:])
+    with pytest.raises(ValueError, match="version: 2"):
+        _ = gss.serialization.unpack_envelope(envelope[:4] + b"\x02" + envelope[5:])
+    with pytest.raises(ValueError, match="compression: 7"):
+        _ = gss.serialization.unpack_envelope(envelope[:5] + b"\x07" + envelope[6:])
+
+    # Legacy (line-wrapped) base64 strings are still accepted
+    serialized_obj = gss.serialization.serialize(list(range(100)))
+    assert "\n" in serialized_obj
+    assert gss.serialization.deserialize(serialized_obj) == list(range(100))
+    assert base64.b64decode(serialized_obj) == gss.serialization.str_to_bytes(serialized_obj)
+
+
+def test_map_chunks() -> None:
+    items = list(range(10))
+    assert gss.serialization.map_chunks(sum, items) == [45]
+    assert gss.serialization.map_chunks(sum, items, max_workers=1) == [45]
+    assert gss.serialization.map_chunks(sum, items[:1], max_workers=2) == [0]
+
+    chunks = gss.serialization.map_chunks(list, items, max_workers=2)
+    assert len(chunks) == 8
+    assert sum(chunks, []) == items
+    assert gss.serialization.map_chunks(sum, items, max_workers=2, chunks_per_worker=1) == [10, 35]
+
+    with pytest.raises(ValueError, match="less than the minimum value"):
+        _ = gss.serialization.map_chunks(sum, items, max_workers=0)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import numbers
 import os
 from collections.abc import Mapping, Sequence
-from typing import Any, TypeVar, overload
+from typing import Any, TypeVar, cast, overload
 
 import general_superstaq as gss
 
@@ -20,11 +20,32 @@ class Service:
         api_version: str = gss.API_VERSION,
         max_retry_seconds: int = 3600,
         verbose: bool = False,
+        retry_policy: gss.RetryPolicy | None = None,
+        request_compression: str | None = None,
+        metadata_cache: gss.MetadataCache | None = None,
+        job_store: gss.JobStore | None = None,
+        polling_strategy: gss.PollingStrategy | None = None,
     ) -> None:
         """Initializes the `Service` class.
 
         Args:
-            client: The Superstaq client to use.
+            api_key: The key used for authenticating against the Superstaq API.
+            remote_host: The url of the server exposing the Superstaq API.
+            api_version: The version of the API.
+            max_retry_seconds: The number of seconds to retry calls for. Defaults to one hour.
+            verbose: Whether to print to stdio and stderr on retriable errors.
+            retry_policy: An optional `gss.RetryPolicy` configuring how failed requests are
+                retried (e.g. with jitter, additional retriable status codes, or a circuit
+                breaker).
+            request_compression: Optionally compress large request bodies (such as batches of
+                serialized circuits) using this encoding. Either "gzip" or "deflate".
+            metadata_cache: An optional `gss.MetadataCache` in which to cache target information
+                and target lists. The same cache can be shared by multiple services and providers.
+            job_store: An optional `gss.JobStore` in which to save finished jobs, so that they are
+                never refetched (even by other processes).
+            polling_strategy: An optional `gss.PollingStrategy` choosing the intervals with which
+                jobs are polled while waiting for their results. The same strategy (and its
+                statistics) can be shared by multiple services and providers.
         """
 
         self._client = gss.superstaq_client._SuperstaqClient(
@@ -34,6 +55,11 @@ class Service:
             api_version=api_version,
             max_retry_seconds=max_retry_seconds,
             verbose=verbose,
+            retry_policy=retry_policy,
+            request_compression=request_compression,
+            metadata_cache=metadata_cache,
+            job_store=job_store,
+            polling_strategy=polling_strategy,
         )
 
     def get_balance(self, pretty_output: bool = True) -> str | float:
@@ -233,14 +259,34 @@ class Service:
 
         return user_info
 
+    @overload
     def submit_qubo(
         self,
         qubo: Mapping[tuple[TQuboKey, ...], float],
+        target: str = ...,
+        repetitions: int = ...,
+        method: str | None = ...,
+        max_solutions: int = ...,
+    ) -> list[dict[TQuboKey, int]]: ...
+
+    @overload
+    def submit_qubo(
+        self,
+        qubo: gss.SparseQubo,
+        target: str = ...,
+        repetitions: int = ...,
+        method: str | None = ...,
+        max_solutions: int = ...,
+    ) -> gss.QuboSolutions: ...
+
+    def submit_qubo(
+        self,
+        qubo: Mapping[tuple[TQuboKey, ...], float] | gss.SparseQubo,
         target: str = "ss_unconstrained_simulator",
         repetitions: int = 10,
         method: str | None = None,
         max_solutions: int = 1000,
-    ) -> list[dict[TQuboKey, int]]:
+    ) -> list[dict[TQuboKey, int]] | gss.QuboSolutions:
         """Solves a submitted QUBO problem via annealing.
 
         This method returns any number of specified dictionaries that seek the minimum of
@@ -251,19 +297,63 @@ class Service:
                 boolean variables of the QUBO and the values represent the coefficients.
                 As an example, for a QUBO with integer coefficients = 2*a + a*b - 5*b*c - 3
                 (where a, b, and c are boolean variables), the corresponding dictionary format
-                would be {('a',): 2, ('a', 'b'): 1, ('b', 'c'): -5, (): -3}.
+                would be {('a',): 2, ('a', 'b'): 1, ('b', 'c'): -5, (): -3}. Large QUBOs (e.g.
+                with millions of terms) should instead be provided as a `gss.SparseQubo`.
             target: The target to submit the QUBO.
             repetitions: Number of times that the execution is repeated before stopping.
             method: The parameter specifying method of QUBO solving execution. Currently,
-                will either be the "dry-run" option which runs on dwave's simulated annealer,
-                or defaults to `None` and sends it directly to the specified target.
+                will either be the "dry-run" option which runs a local simulated annealer (see
+                `gss.annealing.anneal`) without contacting the server, or defaults to `None` and
+                sends it directly to the specified target.
             max_solutions: A parameter that specifies the max number of output solutions.
 
         Returns:
-            A dictionary containing the output solutions.
+            A dictionary containing the output solutions, or a `gss.QuboSolutions` object (with an
+            array of solutions and their energies) if `qubo` is a `gss.SparseQubo`.
         """
+        if method == "dry-run":
+            return self._dry_run_qubo(qubo, target, repetitions, max_solutions)
+
         result_dict = self._client.submit_qubo(qubo, target, repetitions, method, max_solutions)
-        return gss.serialization.deserialize(result_dict["solution"])
+        if not isinstance(qubo, gss.SparseQubo):
+            return gss.serialization.deserialize(result_dict["solution"])
+
+        solution = gss.serialization.deserialize(result_dict["solution"], allow_pickle=False)
+        return gss.QuboSolutions(solution["solutions"], solution["energies"], qubo.variables)
+
+    @staticmethod
+    def _dry_run_qubo(
+        qubo: Mapping[tuple[TQuboKey, ...], float] | gss.SparseQubo,
+        target: str,
+        repetitions: int,
+        max_solutions: int,
+    ) -> list[dict[TQuboKey, int]] | gss.QuboSolutions:
+        """Solves a QUBO locally via simulated annealing (in place of a "dry-run" submission).
+
+        Args:
+            qubo: The QUBO to solve (see `submit_qubo`).
+            target: The target to which the QUBO would have been submitted.
+            repetitions: The number of annealing chains to run.
+            max_solutions: The maximum number of (lowest-energy) solutions to return.
+
+        Returns:
+            The solutions, in the same format as `submit_qubo`.
+        """
+        gss.validation.validate_target(target)
+        gss.validation.validate_integer_param(repetitions)
+        gss.validation.validate_integer_param(max_solutions)
+
+        sparse_qubo = qubo if isinstance(qubo, gss.SparseQubo) else gss.SparseQubo.from_dict(qubo)
+        result = gss.annealing.anneal(sparse_qubo, num_reads=int(repetitions))
+        solutions = gss.QuboSolutions(
+            result.solutions[: int(max_solutions)],
+            result.energies[: int(max_solutions)],
+            result.variables,
+        )
+        if isinstance(qubo, gss.SparseQubo):
+            return solutions
+        # The variables of `sparse_qubo` were collected from the keys of `qubo`:
+        return cast("list[dict[TQuboKey, int]]", solutions.to_dicts())
 
     @staticmethod
     def _qtrl_config_to_yaml_str(config: object) -> str:
@@ -6,6 +6,7 @@ import secrets
 import tempfile
 from unittest import mock
 
+import numpy as np
 import pytest
 
 import general_superstaq as gss
@@ -164,10 +165,60 @@ def test_submit_qubo(
     repetitions = 10
 
     service = gss.service.Service(remote_host="http://example.com", api_key="key")
-    assert (
-        service.submit_qubo(example_qubo, target, repetitions=repetitions, method="dry-run")
-        == [{0: 1, 1: 1}] * 10
-    )
+    assert service.submit_qubo(example_qubo, target, repetitions=repetitions) == [{0: 1, 1: 1}] * 10
+
+    # Solutions may also be returned in a binary envelope
+    _mock_post_request.return_value = {
+        "solution": gss.serialization.serialize_envelope([{0: 1, 1: 1}] * 10)
+    }
+    assert service.submit_qubo(example_qubo, target, repetitions=repetitions) == [{0: 1, 1: 1}] * 10
+
+
+@mock.patch("general_superstaq.superstaq_client._SuperstaqClient.post_request")
+def test_submit_qubo_dry_run(mock_post_request: mock.MagicMock) -> None:
+    example_qubo = {("a",): 2.0, ("a", "b"): 1.0, ("b", "c"): -5.0, (): -3.0}
+    service = gss.service.Service(remote_host="http://example.com", api_key="key")
+
+    # Dry runs are solved locally
+    solutions = service.submit_qubo(example_qubo, repetitions=20, method="dry-run", max_solutions=5)
+    assert solutions[0] == {"a": 0, "b": 1, "c": 1}
+    assert len(solutions) == 5
+
+    sparse_qubo = gss.SparseQubo.from_dict(example_qubo)
+    sparse_solutions = service.submit_qubo(sparse_qubo, repetitions=3, method="dry-run")
+    assert isinstance(sparse_solutions, gss.QuboSolutions)
+    assert len(sparse_solutions) == 3
+    assert sparse_solutions.energies[0] == -8.0
+    mock_post_request.assert_not_called()
+
+    with pytest.raises(ValueError, match="valid target device type"):
+        _ = service.submit_qubo(example_qubo, "ss_example_device", method="dry-run")
+    with pytest.raises(ValueError, match="less than the minimum value"):
+        _ = service.submit_qubo(example_qubo, repetitions=0, method="dry-run")
+
+
+@mock.patch("general_superstaq.superstaq_client._SuperstaqClient.post_request")
+def test_submit_sparse_qubo(mock_post_request: mock.MagicMock) -> None:
+    qubo = gss.SparseQubo.from_dict({("a",): 1.0, ("b",): 1.0, ("a", "b"): -2.0})
+    solutions = np.array([[0, 0], [1, 1], [0, 1]], dtype=np.uint8)
+    mock_post_request.return_value = {
+        "solution": gss.serialization.serialize_envelope(
+            {"solutions": solutions, "energies": qubo.energies(solutions)}
+        )
+    }
+
+    service = gss.service.Service(remote_host="http://example.com", api_key="key")
+    result = service.submit_qubo(qubo, "ss_unconstrained_simulator", repetitions=10)
+    assert isinstance(result, gss.QuboSolutions)
+    assert result.solutions.tolist() == solutions.tolist()
+    assert result.energies.tolist() == [0.0, 0.0, 1.0]
+    assert result.to_dicts()[2] == {"a": 0, "b": 1}
+    assert mock_post_request.call_args[0][1]["sparse_qubo"] == qubo.serialize()
+
+    # Pickled solutions are never accepted for sparse QUBOs
+    mock_post_request.return_value = {"solution": gss.serialization.serialize({})}
+    with pytest.raises(ValueError, match="pickled"):
+        _ = service.submit_qubo(qubo)
 
 
 @mock.patch(
@@ -13,6 +13,11 @@
 """Client for making requests to Superstaq's API."""
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import functools
+import gzip
+import http
 import json
 import os
 import pathlib
@@ -21,14 +26,59 @@ import textwrap
 import time
 import urllib
 import warnings
+import zlib
 from collections.abc import Callable, Mapping, Sequence
-from typing import Any, TypeVar
+from typing import Any, NoReturn, TypeVar
 
 import requests
 
 import general_superstaq as gss
 
 TQuboKey = TypeVar("TQuboKey")
+T = TypeVar("T")
+
+REQUEST_COMPRESSION_METHODS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": lambda data: gzip.compress(data, compresslevel=6),
+    "deflate": lambda data: zlib.compress(data, 6),
+}
+
+MAX_JOB_PAYLOAD_BYTES = 32 * 1024 * 1024
+"""The maximum size of the serialized circuits submitted in a single `/jobs` request."""
+
+
+def split_batch(
+    sizes: Sequence[int], max_circuits: int | None = None, max_payload_bytes: int | None = None
+) -> list[range]:
+    """Splits a batch of circuits into contiguous chunks which can each be submitted as one job.
+
+    Circuits are assigned to chunks greedily (in order), starting a new chunk whenever adding the
+    next circuit would exceed either limit. A circuit which is larger than `max_payload_bytes` on
+    its own is placed in a chunk by itself.
+
+    Args:
+        sizes: The serialized size of each circuit in the batch.
+        max_circuits: The maximum number of circuits per chunk (or None for no limit).
+        max_payload_bytes: The maximum total serialized size of each chunk (or None for no limit).
+
+    Returns:
+        A list of ranges of circuit indices, one for each chunk.
+    """
+    chunks = []
+    start = 0
+    payload_bytes = 0
+    for index, size in enumerate(sizes):
+        if index > start and (
+            (max_circuits is not None and index - start >= max_circuits)
+            or (max_payload_bytes is not None and payload_bytes + size > max_payload_bytes)
+        ):
+            chunks.append(range(start, index))
+            start = index
+            payload_bytes = 0
+        payload_bytes += size
+
+    if start < len(sizes):
+        chunks.append(range(start, len(sizes)))
+    return chunks
 
 
 class _SuperstaqClient:
@@ -38,9 +88,6 @@ class _SuperstaqClient:
     but instead should use `$client_superstaq.Service`.
     """
 
-    RETRIABLE_STATUS_CODES = {
-        requests.codes.service_unavailable,
-    }
     SUPPORTED_VERSIONS = {
         gss.API_VERSION,
     }
@@ -57,6 +104,13 @@ class _SuperstaqClient:
         ibmq_token: str | None = None,
         ibmq_instance: str | None = None,
         ibmq_channel: str | None = None,
+        retry_policy: gss.RetryPolicy | None = None,
+        request_compression: str | None = None,
+        compression_threshold_bytes: int = 64 * 1024,
+        metadata_cache: gss.MetadataCache | None = None,
+        job_store: gss.JobStore | None = None,
+        polling_strategy: gss.PollingStrategy | None = None,
+        compile_cache: gss.CompileCache | None = None,
         **kwargs: Any,
     ) -> None:
         """Creates the SuperstaqClient.
@@ -81,7 +135,26 @@ class _SuperstaqClient:
                 to IBM hardware, or to access non-public IBM devices you may have access to.
             ibmq_instance: An optional instance to use when running IBM jobs.
             ibmq_channel: The type of IBM account. Must be either "ibm_quantum" or "ibm_cloud".
+            retry_policy: An optional `gss.RetryPolicy` configuring how failed requests are
+                retried. Defaults to retrying "503 Service Unavailable" responses and connection
+                errors with an exponentially increasing delay.
+            request_compression: Optionally compress large POST request bodies (such as batches of
+                serialized circuits) using this encoding. Either "gzip" or "deflate".
+            compression_threshold_bytes: The minimum size of a request body to be compressed, if
+                `request_compression` is set.
+            metadata_cache: An optional `gss.MetadataCache` in which to cache the responses of
+                `target_info`, `get_targets`, and `get_my_targets` requests.
+            job_store: An optional `gss.JobStore` in which to save finished jobs, which are then
+                never refetched from the API.
+            polling_strategy: An optional `gss.PollingStrategy` choosing the intervals with which
+                jobs are polled while waiting for their results. Defaults to polling quickly at
+                first, and then less and less frequently.
+            compile_cache: An optional `gss.CompileCache` in which to cache compiled circuits, which
+                are then never recompiled (with the same target and options).
             kwargs: Other optimization and execution parameters.
+
+        Raises:
+            ValueError: If `request_compression` is not a supported encoding.
         """
 
         self.api_key = api_key or gss.superstaq_client.find_api_key()
@@ -90,6 +163,19 @@ class _SuperstaqClient:
         self.api_version = api_version
         self.max_retry_seconds = max_retry_seconds
         self.verbose = verbose
+        self.retry_policy = retry_policy or gss.RetryPolicy()
+        if request_compression is not None and request_compression not in (
+            REQUEST_COMPRESSION_METHODS
+        ):
+            raise ValueError(
+                f"request_compression must be one of {list(REQUEST_COMPRESSION_METHODS)}."
+            )
+        self.request_compression = request_compression
+        self.compression_threshold_bytes = compression_threshold_bytes
+        self.metadata_cache = metadata_cache
+        self.job_store = job_store
+        self.polling_strategy = polling_strategy or gss.PollingStrategy()
+        self.compile_cache = compile_cache
         url = urllib.parse.urlparse(self.remote_host)
         assert url.scheme and url.netloc, (
             f"Specified remote_host {self.remote_host} is not a valid url, for example "
@@ -110,6 +196,7 @@ class _SuperstaqClient:
             "X-Client-Version": self.api_version,
         }
         self.session = requests.Session()
+        self._async_client: _AsyncSuperstaqClient | None = None
 
         if ibmq_channel and ibmq_channel not in ("ibm_quantum", "ibm_cloud"):
             raise ValueError("ibmq_channel must be either 'ibm_cloud' or 'ibm_quantum'.")
@@ -125,6 +212,19 @@ class _SuperstaqClient:
 
         self.client_kwargs = kwargs
 
+    def get_async_client(self) -> _AsyncSuperstaqClient:
+        """Gets an asyncio interface to Superstaq's API which shares this client's session.
+
+        The asynchronous client is created the first time this method is called, and reused
+        afterwards.
+
+        Returns:
+            The `_AsyncSuperstaqClient` wrapping this client.
+        """
+        if self._async_client is None:
+            self._async_client = _AsyncSuperstaqClient(self)
+        return self._async_client
+
     def get_superstaq_version(self) -> dict[str, str | None]:
         """Gets Superstaq version from response header.
 
@@ -178,6 +278,50 @@ class _SuperstaqClient:
             json_dict["options"] = json.dumps({**self.client_kwargs, **kwargs})
         return self.post_request("/jobs", json_dict)
 
+    def create_jobs(
+        self, job_requests: Sequence[Mapping[str, Any]], max_workers: int = 8
+    ) -> dict[str, list[str]]:
+        """Concurrently creates several jobs, e.g. the chunks of a batch too large for one request.
+
+        If any of the jobs cannot be created, any which were successfully created are cancelled
+        (on a best-effort basis) before the error is raised.
+
+        Args:
+            job_requests: The keyword arguments for `create_job` for each job.
+            max_workers: The maximum number of jobs to submit at once.
+
+        Returns:
+            A dictionary containing the ids of all of the created jobs (in order) under "job_ids".
+
+        Raises:
+            ~gss.SuperstaqServerException: If any of the requests fail.
+        """
+        gss.validation.validate_integer_param(max_workers)
+
+        num_workers = min(int(max_workers), len(job_requests)) or 1
+        with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+            futures = [executor.submit(self.create_job, **request) for request in job_requests]
+            concurrent.futures.wait(futures)
+
+        job_ids: list[str] = []
+        errors: list[BaseException] = []
+        for future in futures:
+            error = future.exception()
+            if error is None:
+                job_ids.extend(future.result()["job_ids"])
+            else:
+                errors.append(error)
+
+        if errors:
+            if job_ids:
+                try:
+                    self.cancel_jobs(job_ids)
+                except gss.SuperstaqServerException:
+                    pass
+            raise errors[0]
+
+        return {"job_ids": job_ids}
+
     def cancel_jobs(
         self,
         job_ids: Sequence[str],
@@ -210,6 +354,9 @@ class _SuperstaqClient:
     ) -> dict[str, dict[str, str]]:
         """Get the job from the Superstaq API.
 
+        If this client has a `job_store`, any stored jobs are read from it instead, and any
+        fetched jobs which have finished are saved to it.
+
         Args:
             job_ids: The UUIDs of the jobs (returned when the jobs were created).
             kwargs:  Extra options needed to fetch jobs.
@@ -220,6 +367,12 @@ class _SuperstaqClient:
         Raises:
             ~gss.SuperstaqServerException: For other API call failures.
         """
+        stored_jobs: dict[str, Any] = {}
+        if self.job_store is not None:
+            stored_jobs = self.job_store.get_jobs(self.url, job_ids)
+            job_ids = [job_id for job_id in job_ids if job_id not in stored_jobs]
+            if not job_ids:
+                return stored_jobs
 
         json_dict: dict[str, Any] = {
             "job_ids": job_ids,
@@ -227,7 +380,11 @@ class _SuperstaqClient:
         if kwargs or self.client_kwargs:
             json_dict["options"] = json.dumps({**self.client_kwargs, **kwargs})
 
-        return self.post_request("/fetch_jobs", json_dict)
+        fetched_jobs = self.post_request("/fetch_jobs", json_dict)
+        if self.job_store is not None:
+            self.job_store.put_jobs(self.url, fetched_jobs)
+            return {**stored_jobs, **fetched_jobs}
+        return fetched_jobs
 
     def get_balance(self) -> dict[str, float]:
         """Get the querying user's account balance in USD.
@@ -302,7 +459,7 @@ class _SuperstaqClient:
         if self.client_kwargs:
             json_dict["options"] = json.dumps(self.client_kwargs)
 
-        superstaq_targets = self.post_request("/targets", json_dict)["superstaq_targets"]
+        superstaq_targets = self._post_metadata_request("/targets", json_dict)["superstaq_targets"]
         target_list = [
             gss.Target(target=target_name, **properties)
             for target_name, properties in superstaq_targets.items()
@@ -319,7 +476,7 @@ class _SuperstaqClient:
         if self.client_kwargs:
             json_dict["options"] = json.dumps(self.client_kwargs)
 
-        superstaq_targets = self.post_request("/targets", json_dict)["superstaq_targets"]
+        superstaq_targets = self._post_metadata_request("/targets", json_dict)["superstaq_targets"]
         target_list = [
             gss.Target(target=target_name, **properties)
             for target_name, properties in superstaq_targets.items()
@@ -405,7 +562,7 @@ class _SuperstaqClient:
 
     def submit_qubo(
         self,
-        qubo: Mapping[tuple[TQuboKey, ...], float],
+        qubo: Mapping[tuple[TQuboKey, ...], float] | gss.SparseQubo,
         target: str,
         repetitions: int,
         method: str | None = None,
@@ -419,7 +576,9 @@ class _SuperstaqClient:
                 boolean variables of the QUBO and the values represent the coefficients.
                 As an example, for a QUBO with integer coefficients = 2*a + a*b - 5*b*c - 3
                 (where a, b, and c are boolean variables), the corresponding dictionary format
-                would be {('a',): 2, ('a', 'b'): 1, ('b', 'c'): -5, (): -3}.
+                would be {('a',): 2, ('a', 'b'): 1, ('b', 'c'): -5, (): -3}. Large QUBOs can
+                instead be provided as a `gss.SparseQubo`, which is submitted as a binary
+                envelope of arrays (see `gss.SparseQubo.serialize`).
             target: The target to submit the QUBO.
             repetitions: Number of times that the execution is repeated before stopping.
             method: The parameter specifying method of QUBO solving execution. Currently,
@@ -431,17 +590,21 @@ class _SuperstaqClient:
             A dictionary from the POST request.
         """
         gss.validation.validate_target(target)
-        gss.validation.validate_qubo(qubo)
+        if not isinstance(qubo, gss.SparseQubo):
+            gss.validation.validate_qubo(qubo)
         gss.validation.validate_integer_param(repetitions)
         gss.validation.validate_integer_param(max_solutions)
 
-        json_dict = {
-            "qubo": list(qubo.items()),
+        json_dict: dict[str, Any] = {
             "target": target,
             "shots": int(repetitions),
             "method": method,
             "max_solutions": max_solutions,
         }
+        if isinstance(qubo, gss.SparseQubo):
+            json_dict["sparse_qubo"] = qubo.serialize()
+        else:
+            json_dict["qubo"] = list(qubo.items())
         return self.post_request("/qubo", json_dict)
 
     def supercheq(
@@ -703,7 +866,7 @@ class _SuperstaqClient:
             "target": target,
             "options": json.dumps(self.client_kwargs),
         }
-        return self.post_request("/target_info", json_dict)
+        return self._post_metadata_request("/target_info", json_dict)
 
     def aqt_upload_configs(self, aqt_configs: dict[str, str]) -> str:
         """Makes a POST request to Superstaq API to upload configurations.
@@ -724,6 +887,22 @@ class _SuperstaqClient:
         """
         return self.get_request("/get_aqt_configs")
 
+    def _post_metadata_request(self, endpoint: str, json_dict: Mapping[str, object]) -> Any:
+        """Makes a POST request for (slowly changing) metadata, using `metadata_cache` if set.
+
+        Args:
+            endpoint: The endpoint to perform the POST request on.
+            json_dict: The json to send in the body of the POST request.
+
+        Returns:
+            The json body of the (possibly cached) response.
+        """
+        if self.metadata_cache is None:
+            return self.post_request(endpoint, json_dict)
+
+        key = self.metadata_cache.make_key(self.url, self.api_key, endpoint, json_dict)
+        return self.metadata_cache.get(key, lambda: self.post_request(endpoint, json_dict))
+
     def get_request(self, endpoint: str, query: Mapping[str, object] | None = None) -> Any:
         """Performs a GET request on a given endpoint.
 
@@ -752,12 +931,16 @@ class _SuperstaqClient:
                 verify=self.verify_https,
             )
 
-        response = self._make_request(request)
+        response = self._make_request(request, endpoint)
         return self._handle_response(response)
 
     def post_request(self, endpoint: str, json_dict: Mapping[str, object]) -> Any:
         """Performs a POST request on a given endpoint with a given payload.
 
+        If `request_compression` is set, payloads of at least `compression_threshold_bytes` are
+        compressed before being sent (falling back to an uncompressed request if the server does
+        not accept it).
+
         Args:
             endpoint: The endpoint to perform the POST request on.
             json_dict: The payload to POST.
@@ -765,6 +948,15 @@ class _SuperstaqClient:
         Returns:
             The response of the POST request.
         """
+        compressed_body = self._compress_json(json_dict)
+        if compressed_body is not None:
+            try:
+                return self._post_compressed(endpoint, compressed_body)
+            except gss.SuperstaqServerException as e:
+                if e.status_code != requests.codes.unsupported_media_type:
+                    raise
+                # The server doesn't accept compressed requests; stop trying
+                self.request_compression = None
 
         def request() -> requests.Response:
             """Builds GET request object.
@@ -779,7 +971,53 @@ class _SuperstaqClient:
                 verify=self.verify_https,
             )
 
-        response = self._make_request(request)
+        response = self._make_request(request, endpoint)
+        return self._handle_response(response)
+
+    def _compress_json(self, json_dict: Mapping[str, object]) -> bytes | None:
+        """Encodes and compresses a JSON payload, if configured to do so by `request_compression`.
+
+        Args:
+            json_dict: The payload to compress.
+
+        Returns:
+            The compressed JSON payload, or None if the payload should not be compressed.
+        """
+        if self.request_compression is None:
+            return None
+
+        body = json.dumps(json_dict).encode()
+        if len(body) < self.compression_threshold_bytes:
+            return None
+
+        return REQUEST_COMPRESSION_METHODS[self.request_compression](body)
+
+    def _post_compressed(self, endpoint: str, compressed_body: bytes) -> Any:
+        """Performs a POST request with a compressed payload.
+
+        Args:
+            endpoint: The endpoint to perform the POST request on.
+            compressed_body: The payload to POST, compressed using `request_compression`.
+
+        Returns:
+            The response of the POST request.
+        """
+        headers = {**self.headers, "Content-Encoding": str(self.request_compression)}
+
+        def request() -> requests.Response:
+            """Builds compressed POST request object.
+
+            Returns:
+                The Flask POST request object.
+            """
+            return self.session.post(
+                f"{self.url}{endpoint}",
+                data=compressed_body,
+                headers=headers,
+                verify=self.verify_https,
+            )
+
+        response = self._make_request(request, endpoint)
         return self._handle_response(response)
 
     def _handle_response(self, response: requests.Response) -> object:
@@ -822,6 +1060,9 @@ class _SuperstaqClient:
                     response.status_code,
                 )
 
+        if self.retry_policy.is_retriable(response.status_code):
+            return
+
         if response.status_code == requests.codes.gateway_timeout:
             # Job took too long. Don't retry, it probably won't be any faster.
             raise gss.SuperstaqServerException(
@@ -830,20 +1071,19 @@ class _SuperstaqClient:
                 response.status_code,
             )
 
-        if response.status_code not in self.RETRIABLE_STATUS_CODES:
-            try:
-                json_content = self._handle_response(response)
-            except requests.JSONDecodeError:
-                json_content = None
+        try:
+            json_content = self._handle_response(response)
+        except requests.JSONDecodeError:
+            json_content = None
 
-            if isinstance(json_content, dict) and "message" in json_content:
-                message = json_content["message"]
-            else:
-                message = str(response.text)
+        if isinstance(json_content, dict) and "message" in json_content:
+            message = json_content["message"]
+        else:
+            message = str(response.text)
 
-            raise gss.SuperstaqServerException(
-                message=message, status_code=response.status_code, contact_info=True
-            )
+        raise gss.SuperstaqServerException(
+            message=message, status_code=response.status_code, contact_info=True
+        )
 
     def _prompt_accept_terms_of_use(self) -> None:
         """Prompts terms of use.
@@ -864,44 +1104,163 @@ class _SuperstaqClient:
                 requests.codes.unauthorized,
             )
 
-    def _make_request(self, request: Callable[[], requests.Response]) -> requests.Response:
-        """Make a request to the API, retrying if necessary.
+    def _make_request(
+        self, request: Callable[[], requests.Response], endpoint: str = ""
+    ) -> requests.Response:
+        """Make a request to the API, retrying if necessary (as configured by `retry_policy`).
+
+        If instrumentation is enabled (see `gss.instrumentation`), a `RequestEvent` is emitted once
+        the request has completed (successfully or not).
 
         Args:
             request: A function that returns a `requests.Response`.
+            endpoint: The endpoint being requested.
 
         Raises:
             ~gss.SuperstaqServerException: If there was a not-retriable error from
-                the API.
-            TimeoutError: If the requests retried for more than `max_retry_seconds`.
+                the API, or if the retry policy's circuit breaker is open.
+            TimeoutError: If the requests retried for more than `max_retry_seconds`, or exhausted
+                the endpoint's retry budget.
 
         Returns:
             The `requests.Response` from the final successful request call.
         """
-        # Initial backoff of 100ms.
-        delay_seconds = 0.1
-        while True:
-            try:
-                response = request()
+        if not gss.instrumentation.is_enabled():
+            return self._make_request_with_retries(request, endpoint)
+
+        responses: list[requests.Response | None] = []
+
+        def instrumented_request() -> requests.Response:
+            responses.append(None)
+            responses[-1] = response = request()
+            return response
+
+        start_time = time.perf_counter()
+        try:
+            return self._make_request_with_retries(instrumented_request, endpoint)
+        finally:
+            gss.instrumentation.emit_request(
+                endpoint,
+                responses[-1] if responses else None,
+                time.perf_counter() - start_time,
+                len(responses),
+            )
 
-                if response.ok:
-                    return response
+    def _make_request_with_retries(
+        self, request: Callable[[], requests.Response], endpoint: str
+    ) -> requests.Response:
+        """Make a request to the API, retrying if necessary (as configured by `retry_policy`).
 
-                self._handle_status_codes(response)
-                message = response.reason
-
-            # Fallthrough should retry.
-            except requests.RequestException as e:
-                # Connection error, timeout at server, or too many redirects.
-                # Retry these.
-                message = f"RequestException of type {type(e)}."
-            if delay_seconds > self.max_retry_seconds:
+        Args:
+            request: A function that returns a `requests.Response`.
+            endpoint: The endpoint being requested.
+
+        Raises:
+            ~gss.SuperstaqServerException: If there was a not-retriable error from
+                the API, or if the retry policy's circuit breaker is open.
+            TimeoutError: If the requests retried for more than `max_retry_seconds`, or exhausted
+                the endpoint's retry budget.
+
+        Returns:
+            The `requests.Response` from the final successful request call.
+        """
+        policy = self.retry_policy
+        if not policy.allow_request(endpoint):
+            self._raise_circuit_breaker_open()
+
+        attempt = 0
+        delay_seconds = None
+        total_delay_seconds = 0.0
+        while True:
+            # Fail fast if the breaker was opened (e.g. by another thread) while retrying
+            if attempt and not policy.allow_attempt():
+                self._raise_circuit_breaker_open()
+
+            attempt += 1
+            response, message = self._attempt_request(request)
+            if response is not None and response.ok:
+                return response
+
+            status_code = None if response is None else response.status_code
+            retry_after = None if response is None else policy.get_retry_after(response)
+
+            if (
+                policy.backoff_seconds(attempt) > self.max_retry_seconds
+                or total_delay_seconds > self.max_retry_seconds
+                or (retry_after is not None and retry_after > self.max_retry_seconds)
+            ):
                 raise TimeoutError(f"Reached maximum number of retries. Last error: {message}")
+            if not policy.allow_retry(endpoint):
+                raise TimeoutError(
+                    f"Exhausted the retry budget for {endpoint}. Last error: {message}"
+                )
+
+            delay_seconds = policy.delay_seconds(attempt, delay_seconds, retry_after)
+            policy.record_retry(
+                gss.retry.RetryEvent(endpoint, attempt, delay_seconds, message, status_code)
+            )
             if self.verbose:
                 print(message, file=sys.stderr)
                 print(f"Waiting {delay_seconds} seconds before retrying.")
             time.sleep(delay_seconds)
-            delay_seconds *= 2
+            total_delay_seconds += delay_seconds
+
+    def _attempt_request(
+        self, request: Callable[[], requests.Response]
+    ) -> tuple[requests.Response | None, str]:
+        """Makes a single request attempt, recording its outcome with the retry policy.
+
+        Args:
+            request: A function that returns a `requests.Response`.
+
+        Raises:
+            ~gss.SuperstaqServerException: If there was a not-retriable error from the API.
+
+        Returns:
+            The response (or None if the request raised a retriable `requests.RequestException`),
+            and a description of the error if it was not successful.
+        """
+        policy = self.retry_policy
+        recorded = False
+        try:
+            response = request()
+
+            # Any response other than a retriable error means the server is available
+            if response.ok or not policy.is_retriable(response.status_code):
+                policy.record_success()
+            else:
+                policy.record_failure()
+            recorded = True
+
+            if not response.ok:
+                self._handle_status_codes(response)
+            return response, response.reason
+
+        except requests.RequestException as e:
+            # Connection error, timeout at server, or too many redirects.
+            # Retry these.
+            policy.record_failure()
+            recorded = True
+            return None, f"RequestException of type {type(e)}."
+
+        finally:
+            # Never leave a half-open circuit breaker waiting on a trial request that raised
+            if not recorded:
+                policy.release_attempt()
+
+    def _raise_circuit_breaker_open(self) -> NoReturn:
+        """Rejects a request because the retry policy's circuit breaker is open.
+
+        Raises:
+            ~gss.SuperstaqServerException: Always.
+        """
+        assert self.retry_policy.circuit_breaker is not None
+        seconds_until_reset = self.retry_policy.circuit_breaker.seconds_until_reset()
+        raise gss.SuperstaqServerException(
+            "The Superstaq API is currently unavailable (too many consecutive failed "
+            f"requests). Try again in {seconds_until_reset:.1f} seconds.",
+            http.HTTPStatus.SERVICE_UNAVAILABLE,
+        )
 
     def __str__(self) -> str:
         return f"Client with host={self.url} and name={self.client_name}"
@@ -920,6 +1279,188 @@ class _SuperstaqClient:
         )
 
 
+class _AsyncSuperstaqClient:
+    """Handles asynchronous calls to Superstaq's API.
+
+    Requests are made through the wrapped `_SuperstaqClient`, and are dispatched to a bounded pool
+    of worker threads so that many of them can be in flight at once without blocking the event
+    loop. The connection pool of the underlying `requests.Session` is sized to match, so concurrent
+    requests reuse keep-alive connections, as well as all of the wrapped client's authentication,
+    retry, and status code handling.
+
+    Users should not instantiate this themselves, but instead should use the asynchronous methods
+    of `$client_superstaq.Service` (or `_SuperstaqClient.get_async_client`).
+    """
+
+    def __init__(self, client: _SuperstaqClient, max_concurrent_requests: int = 32) -> None:
+        """Creates the asynchronous client.
+
+        Args:
+            client: The `_SuperstaqClient` used to make requests.
+            max_concurrent_requests: The maximum number of requests to keep in flight at once (and
+                the number of connections to keep alive in the session's connection pool).
+        """
+        gss.validation.validate_integer_param(max_concurrent_requests)
+
+        self.client = client
+        self.max_concurrent_requests = int(max_concurrent_requests)
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.max_concurrent_requests,
+            pool_maxsize=self.max_concurrent_requests,
+        )
+        self.client.session.mount("http://", adapter)
+        self.client.session.mount("https://", adapter)
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Runs a blocking call in this client's worker pool without blocking the event loop.
+
+        Args:
+            func: The function to call.
+            args: Positional arguments to pass to `func`.
+            kwargs: Keyword arguments to pass to `func`.
+
+        Returns:
+            The value returned by `func`.
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_concurrent_requests, thread_name_prefix="superstaq"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def get_request(self, endpoint: str, query: Mapping[str, object] | None = None) -> Any:
+        """Performs a GET request on a given endpoint.
+
+        Args:
+            endpoint: The endpoint to perform the GET request on.
+            query: An optional query dictionary to include in the get request.
+
+        Returns:
+            The response of the GET request.
+        """
+        return await self.run(self.client.get_request, endpoint, query)
+
+    async def post_request(self, endpoint: str, json_dict: Mapping[str, object]) -> Any:
+        """Performs a POST request on a given endpoint with a given payload.
+
+        Args:
+            endpoint: The endpoint to perform the POST request on.
+            json_dict: The payload to POST.
+
+        Returns:
+            The response of the POST request.
+        """
+        return await self.run(self.client.post_request, endpoint, json_dict)
+
+    async def create_job(
+        self,
+        serialized_circuits: dict[str, str],
+        repetitions: int = 1,
+        target: str = "ss_unconstrained_simulator",
+        method: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, list[str]]:
+        """Create a job.
+
+        Args:
+            serialized_circuits: The serialized representation of the circuit to run.
+            repetitions: The number of times to repeat the circuit.
+            target: Target to run on.
+            method: Which type of method to execute the circuits (noisy simulator,
+            non-noisy simulator, hardware, e.t.c)
+            kwargs: Other optimization and execution parameters.
+
+        Returns:
+            The json body of the response as a dict, containing the new job ids.
+        """
+        return await self.run(
+            self.client.create_job,
+            serialized_circuits=serialized_circuits,
+            repetitions=repetitions,
+            target=target,
+            method=method,
+            **kwargs,
+        )
+
+    async def create_jobs(
+        self, job_requests: Sequence[Mapping[str, Any]], max_workers: int = 8
+    ) -> dict[str, list[str]]:
+        """Concurrently creates several jobs (see `_SuperstaqClient.create_jobs`).
+
+        Args:
+            job_requests: The keyword arguments for `create_job` for each job.
+            max_workers: The maximum number of jobs to submit at once.
+
+        Returns:
+            A dictionary containing the ids of all of the created jobs (in order) under "job_ids".
+        """
+        return await self.run(self.client.create_jobs, job_requests, max_workers=max_workers)
+
+    async def fetch_jobs(self, job_ids: list[str], **kwargs: object) -> dict[str, dict[str, str]]:
+        """Get the job from the Superstaq API.
+
+        Args:
+            job_ids: The UUIDs of the jobs (returned when the jobs were created).
+            kwargs: Extra options needed to fetch jobs.
+
+        Returns:
+            The json body of the response as a dict.
+        """
+        return await self.run(self.client.fetch_jobs, job_ids, **kwargs)
+
+    async def cancel_jobs(self, job_ids: Sequence[str], **kwargs: object) -> list[str]:
+        """Cancel jobs associated with given job ids.
+
+        Args:
+            job_ids: The UUIDs of the jobs (returned when the jobs were created).
+            kwargs: Extra options needed to fetch jobs.
+
+        Returns:
+            A list of the job ids of the jobs that successfully cancelled.
+        """
+        return await self.run(self.client.cancel_jobs, job_ids, **kwargs)
+
+    async def compile(self, json_dict: dict[str, str]) -> dict[str, str]:
+        """Makes a POST request to Superstaq API to compile a list of circuits.
+
+        Args:
+            json_dict: The dictionary containing data to compile.
+
+        Returns:
+            A dictionary containing compiled circuit data.
+        """
+        return await self.run(self.client.compile, json_dict)
+
+    async def target_info(self, target: str) -> dict[str, Any]:
+        """Makes a POST request to the /target_info endpoint.
+
+        Args:
+            target: A string representing the device to get information about.
+
+        Returns:
+            The target information.
+        """
+        return await self.run(self.client.target_info, target)
+
+    def close(self) -> None:
+        """Shuts down this client's worker pool (it will be restarted if needed)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __str__(self) -> str:
+        return f"Async{self.client}"
+
+    def __repr__(self) -> str:
+        return (
+            f"gss.superstaq_client._AsyncSuperstaqClient({self.client!r}, "
+            f"max_concurrent_requests={self.max_concurrent_requests!r})"
+        )
+
+
 def find_api_key() -> str:
     """Function to try to load a Superstaq API key from the environment or a key file.
 
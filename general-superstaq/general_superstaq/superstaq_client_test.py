@@ -13,10 +13,16 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import gzip
+import http
 import io
 import json
 import os
+import pathlib
+import zlib
+from collections.abc import Callable
 from unittest import mock
 
 import pytest
@@ -324,6 +330,143 @@ def test_superstaq_client_create_job_retry_request_error(mock_post: mock.MagicMo
     assert mock_post.call_count == 2
 
 
+@mock.patch("time.sleep")
+@mock.patch("requests.Session.post")
+def test_superstaq_client_retry_policy(
+    mock_post: mock.MagicMock, mock_sleep: mock.MagicMock
+) -> None:
+    bad_gateway = requests.Response()
+    bad_gateway.status_code = http.HTTPStatus.BAD_GATEWAY
+    too_many_requests = requests.Response()
+    too_many_requests.status_code = http.HTTPStatus.TOO_MANY_REQUESTS
+    too_many_requests.headers["Retry-After"] = "3"
+    mock_post.side_effect = [
+        bad_gateway,
+        too_many_requests,
+        requests.exceptions.ConnectionError(),
+        mock.MagicMock(ok=True),
+    ]
+
+    events: list[gss.retry.RetryEvent] = []
+    retry_policy = gss.RetryPolicy(
+        retriable_status_codes=(429, 502, 503, 504), jitter="full", on_retry=events.append
+    )
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        retry_policy=retry_policy,
+    )
+    assert client.retry_policy is retry_policy
+    _ = client.fetch_jobs(["job_id"])
+    assert mock_post.call_count == 4
+
+    assert [(event.attempt, event.status_code) for event in events] == [
+        (1, 502),
+        (2, 429),
+        (3, None),
+    ]
+    assert events[1].delay_seconds == 3.0
+    assert all(event.endpoint == "/fetch_jobs" for event in events)
+    assert retry_policy.retry_counts == {"/fetch_jobs": 3}
+    assert mock_sleep.call_args_list == [mock.call(event.delay_seconds) for event in events]
+
+    # Don't retry if the server asks us to wait longer than `max_retry_seconds`
+    too_many_requests.headers["Retry-After"] = "3600"
+    mock_post.side_effect = [too_many_requests]
+    with pytest.raises(TimeoutError, match="maximum number of retries"):
+        _ = client.fetch_jobs(["job_id"])
+
+
+@mock.patch("time.sleep")
+@mock.patch("requests.Session.post")
+def test_superstaq_client_retry_max_total_delay(
+    mock_post: mock.MagicMock, mock_sleep: mock.MagicMock
+) -> None:
+    mock_post.return_value.ok = False
+    mock_post.return_value.status_code = requests.codes.service_unavailable
+
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        max_retry_seconds=10,
+        retry_policy=gss.RetryPolicy(initial_delay_seconds=1.0, max_delay_seconds=1.0),
+    )
+    with pytest.raises(TimeoutError, match="maximum number of retries"):
+        _ = client.create_job({"Hello": "World"}, target="ss_example_qpu")
+    assert mock_sleep.call_count == 11
+
+
+@mock.patch("time.sleep")
+@mock.patch("requests.Session.post")
+def test_superstaq_client_retry_budget(
+    mock_post: mock.MagicMock, mock_sleep: mock.MagicMock
+) -> None:
+    mock_post.return_value.ok = False
+    mock_post.return_value.status_code = requests.codes.service_unavailable
+
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        retry_policy=gss.RetryPolicy(endpoint_budgets={"/fetch_jobs": 0.1}),
+    )
+    with pytest.raises(TimeoutError, match="retry budget for /fetch_jobs"):
+        _ = client.fetch_jobs(["job_id"])
+    assert mock_post.call_count == 2
+    mock_sleep.assert_called_once_with(0.1)
+
+
+@mock.patch("time.sleep")
+@mock.patch("requests.Session.post")
+def test_superstaq_client_circuit_breaker(
+    mock_post: mock.MagicMock, mock_sleep: mock.MagicMock
+) -> None:
+    unavailable = mock.MagicMock(ok=False, status_code=requests.codes.service_unavailable)
+    bad_request = mock.MagicMock(ok=False, status_code=requests.codes.bad_request)
+    ok = mock.MagicMock(ok=True, status_code=requests.codes.ok)
+    ok.json.return_value = {}
+    mock_post.side_effect = [unavailable, unavailable, bad_request, ok]
+
+    breaker = gss.retry.CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10)
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        retry_policy=gss.RetryPolicy(circuit_breaker=breaker),
+    )
+
+    # Stop retrying once the breaker opens
+    with pytest.raises(gss.SuperstaqServerException, match="currently unavailable"):
+        _ = client.fetch_jobs(["job_id"])
+    assert breaker.state == "open"
+    assert mock_post.call_count == 2
+
+    # Fail fast while the breaker is open
+    with pytest.raises(gss.SuperstaqServerException, match="currently unavailable"):
+        _ = client.fetch_jobs(["job_id"])
+    assert mock_post.call_count == 2
+
+    # A non-retriable error in response to the trial request still closes the breaker
+    breaker._opened_at = -1000.0
+    with pytest.raises(gss.SuperstaqServerException, match="Status code: 400"):
+        _ = client.fetch_jobs(["job_id"])
+    assert breaker.state == "closed"
+    assert client.fetch_jobs(["job_id"]) == {}
+    assert mock_post.call_count == 4
+
+    # The trial request is released if it raises unexpectedly
+    breaker._opened_at = -1000.0
+    mock_post.side_effect = KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        _ = client.fetch_jobs(["job_id"])
+    assert breaker.state == "half-open"
+    mock_post.side_effect = [ok]
+    assert client.fetch_jobs(["job_id"]) == {}
+    assert breaker.state == "closed"
+
+
 @mock.patch("requests.Session.post")
 def test_superstaq_client_create_job_invalid_json(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaqClient(
@@ -394,6 +537,211 @@ def test_superstaq_client_create_job_json(mock_post: mock.MagicMock) -> None:
         )
 
 
+def test_split_batch() -> None:
+    assert gss.superstaq_client.split_batch([]) == []
+    assert gss.superstaq_client.split_batch([1, 2, 3]) == [range(0, 3)]
+    assert gss.superstaq_client.split_batch([1, 2, 3, 4, 5], max_circuits=2) == [
+        range(0, 2),
+        range(2, 4),
+        range(4, 5),
+    ]
+    assert gss.superstaq_client.split_batch([5, 5, 20, 5, 5, 5], max_payload_bytes=10) == [
+        range(0, 2),
+        range(2, 3),
+        range(3, 5),
+        range(5, 6),
+    ]
+    assert gss.superstaq_client.split_batch([1, 1, 8, 1], 2, 9) == [
+        range(0, 2),
+        range(2, 4),
+    ]
+
+
+@mock.patch("requests.Session.post")
+def test_superstaq_client_create_jobs(mock_post: mock.MagicMock) -> None:
+    def _post(url: str, json: dict[str, object], **kwargs: object) -> mock.MagicMock:
+        response = mock.MagicMock(ok=True)
+        response.json.return_value = {"job_ids": [f"job_id_{json['Hello']}"]}
+        return response
+
+    mock_post.side_effect = _post
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+    )
+
+    job_requests = [
+        {"serialized_circuits": {"Hello": str(i)}, "repetitions": 10, "target": "ss_example_qpu"}
+        for i in range(5)
+    ]
+    assert client.create_jobs(job_requests, max_workers=2) == {
+        "job_ids": [f"job_id_{i}" for i in range(5)]
+    }
+    assert mock_post.call_count == 5
+    mock_post.assert_any_call(
+        f"http://example.com/{API_VERSION}/jobs",
+        json={"Hello": "3", "target": "ss_example_qpu", "shots": 10},
+        headers=EXPECTED_HEADERS,
+        verify=False,
+    )
+
+    assert client.create_jobs([]) == {"job_ids": []}
+    assert asyncio.run(client.get_async_client().create_jobs(job_requests[:2])) == {
+        "job_ids": ["job_id_0", "job_id_1"]
+    }
+
+    with pytest.raises(ValueError, match="minimum value"):
+        _ = client.create_jobs(job_requests, max_workers=0)
+
+
+@pytest.mark.parametrize("cancel_status_code", [requests.codes.ok, requests.codes.bad_request])
+@mock.patch("requests.Session.post")
+def test_superstaq_client_create_jobs_failure(
+    mock_post: mock.MagicMock, cancel_status_code: int
+) -> None:
+    def _post(url: str, json: dict[str, object], **kwargs: object) -> mock.MagicMock:
+        response = mock.MagicMock(ok=True)
+        if url.endswith("/cancel_jobs"):
+            response.ok = cancel_status_code == requests.codes.ok
+            response.status_code = cancel_status_code
+            response.json.return_value = {"succeeded": json["job_ids"]}
+        elif json["Hello"] == "bad":
+            response.ok = False
+            response.status_code = requests.codes.bad_request
+            response.json.return_value = {"message": "bad circuit"}
+        else:
+            response.json.return_value = {"job_ids": [f"job_id_{json['Hello']}"]}
+        return response
+
+    mock_post.side_effect = _post
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+    )
+
+    job_requests = [
+        {"serialized_circuits": {"Hello": hello}, "target": "ss_example_qpu"}
+        for hello in ("0", "bad", "2")
+    ]
+    with pytest.raises(gss.SuperstaqServerException, match="bad circuit"):
+        _ = client.create_jobs(job_requests)
+
+    mock_post.assert_called_with(
+        f"http://example.com/{API_VERSION}/cancel_jobs",
+        json={"job_ids": ["job_id_0", "job_id_2"]},
+        headers=EXPECTED_HEADERS,
+        verify=False,
+    )
+
+    # Nothing to cancel if every request fails
+    mock_post.reset_mock()
+    with pytest.raises(gss.SuperstaqServerException, match="bad circuit"):
+        _ = client.create_jobs(job_requests[1:2])
+    mock_post.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "encoding, decompress", [("gzip", gzip.decompress), ("deflate", zlib.decompress)]
+)
+@mock.patch("requests.Session.post")
+def test_superstaq_client_request_compression(
+    mock_post: mock.MagicMock, encoding: str, decompress: Callable[[bytes], bytes]
+) -> None:
+    mock_post.return_value.ok = True
+    mock_post.return_value.json.return_value = {"job_ids": ["job_id"]}
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        request_compression=encoding,
+        compression_threshold_bytes=1000,
+    )
+
+    # Small payloads are sent uncompressed
+    _ = client.create_job({"cirq_circuits": "small"}, repetitions=10, target="ss_example_qpu")
+    mock_post.assert_called_once_with(
+        f"http://example.com/{API_VERSION}/jobs",
+        json={
+            "cirq_circuits": "small",
+            "target": "ss_example_qpu",
+            "shots": 10,
+        },
+        headers=EXPECTED_HEADERS,
+        verify=False,
+    )
+
+    serialized_circuits = {"cirq_circuits": "x" * 10000}
+    _ = client.create_job(serialized_circuits, repetitions=10, target="ss_example_qpu")
+    url, kwargs = mock_post.call_args
+    assert url == (f"http://example.com/{API_VERSION}/jobs",)
+    assert kwargs["headers"] == {**EXPECTED_HEADERS, "Content-Encoding": encoding}
+    assert kwargs["verify"] is False
+    assert len(kwargs["data"]) < 1000
+    assert json.loads(decompress(kwargs["data"])) == {
+        "cirq_circuits": "x" * 10000,
+        "target": "ss_example_qpu",
+        "shots": 10,
+    }
+
+    with pytest.raises(ValueError, match="request_compression"):
+        _ = gss.superstaq_client._SuperstaqClient(
+            client_name="general-superstaq",
+            remote_host="http://example.com",
+            api_key="to_my_heart",
+            request_compression="zip",
+        )
+
+
+@mock.patch("requests.Session.post")
+def test_superstaq_client_request_compression_unsupported(mock_post: mock.MagicMock) -> None:
+    unsupported = requests.Response()
+    unsupported.status_code = http.HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+    unsupported._content = b"Unsupported Content-Encoding"
+    success = mock.MagicMock(ok=True)
+    success.json.return_value = {"job_ids": ["job_id"]}
+    mock_post.side_effect = [unsupported, success, success]
+
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        request_compression="gzip",
+        compression_threshold_bytes=0,
+    )
+    assert client.fetch_jobs(["job_id"]) == {"job_ids": ["job_id"]}
+    assert client.request_compression is None
+    assert mock_post.call_count == 2
+    assert "data" in mock_post.call_args_list[0].kwargs
+    mock_post.assert_called_with(
+        f"http://example.com/{API_VERSION}/fetch_jobs",
+        json={"job_ids": ["job_id"]},
+        headers=EXPECTED_HEADERS,
+        verify=False,
+    )
+
+    # Subsequent requests are sent uncompressed
+    assert client.fetch_jobs(["job_id"]) == {"job_ids": ["job_id"]}
+    assert "json" in mock_post.call_args.kwargs
+
+    # Other errors are raised as usual
+    mock_post.side_effect = None
+    mock_post.return_value = mock.MagicMock(ok=False, status_code=requests.codes.bad_request)
+    client.request_compression = "gzip"
+    with pytest.raises(gss.SuperstaqServerException, match="Status code: 400"):
+        _ = client.fetch_jobs(["job_id"])
+
+
+def test_superstaq_client_accepts_compressed_responses() -> None:
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+    )
+    assert "gzip" in str(client.session.headers["Accept-Encoding"])
+
+
 @mock.patch("requests.Session.post")
 def test_superstaq_client_fetch_jobs(mock_post: mock.MagicMock) -> None:
     mock_post.return_value.ok = True
@@ -787,6 +1135,23 @@ def test_superstaq_client_submit_qubo(mock_post: mock.MagicMock) -> None:
         verify=False,
     )
 
+    # Sparse QUBOs are submitted as binary envelopes
+    sparse_qubo = gss.SparseQubo.from_dict(example_qubo)
+    client.submit_qubo(sparse_qubo, target, repetitions=repetitions, max_solutions=1)
+    expected_json = {
+        "sparse_qubo": sparse_qubo.serialize(),
+        "target": target,
+        "shots": repetitions,
+        "method": None,
+        "max_solutions": 1,
+    }
+    mock_post.assert_called_with(
+        f"http://example.com/{API_VERSION}/qubo",
+        headers=EXPECTED_HEADERS,
+        json=expected_json,
+        verify=False,
+    )
+
 
 @mock.patch("requests.Session.post")
 def test_superstaq_client_supercheq(mock_post: mock.MagicMock) -> None:
@@ -1022,6 +1387,100 @@ def test_superstaq_client_target_info_with_credentials(mock_post: mock.MagicMock
     )
 
 
+def test_async_client_str_and_repr() -> None:
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+    )
+    async_client = client.get_async_client()
+    assert client.get_async_client() is async_client
+    assert async_client.client is client
+
+    assert str(async_client) == "Async" + str(client)
+    assert repr(async_client) == (
+        f"gss.superstaq_client._AsyncSuperstaqClient({client!r}, max_concurrent_requests=32)"
+    )
+
+    async_client = gss.superstaq_client._AsyncSuperstaqClient(client, max_concurrent_requests=4)
+    adapter = client.session.get_adapter("https://example.com")
+    assert adapter._pool_maxsize == 4  # type: ignore[attr-defined]
+
+    with pytest.raises(ValueError, match="minimum value"):
+        _ = gss.superstaq_client._AsyncSuperstaqClient(client, max_concurrent_requests=0)
+
+
+@mock.patch("requests.Session.post")
+def test_async_client_post_requests(mock_post: mock.MagicMock) -> None:
+    mock_post.return_value.ok = True
+    mock_post.return_value.json.return_value = response = {"succeeded": ["job_id"]}
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+    )
+    async_client = client.get_async_client()
+
+    async def _make_requests() -> list[object]:
+        return await asyncio.gather(
+            async_client.post_request("/endpoint", {"a": 1}),
+            async_client.create_job({"Hello": "World"}, repetitions=200, target="ss_example_qpu"),
+            async_client.fetch_jobs(["job_id"]),
+            async_client.cancel_jobs(["job_id"]),
+            async_client.compile({"Hello": "World"}),
+            async_client.target_info("ss_example_qpu"),
+        )
+
+    responses = asyncio.run(_make_requests())
+    assert responses == [response, response, response, ["job_id"], response, response]
+    assert mock_post.call_count == 6
+    mock_post.assert_any_call(
+        f"http://example.com/{API_VERSION}/fetch_jobs",
+        json={"job_ids": ["job_id"]},
+        headers=EXPECTED_HEADERS,
+        verify=False,
+    )
+    mock_post.assert_any_call(
+        f"http://example.com/{API_VERSION}/endpoint",
+        json={"a": 1},
+        headers=EXPECTED_HEADERS,
+        verify=False,
+    )
+
+    async_client.close()
+    async_client.close()
+    assert asyncio.run(async_client.fetch_jobs(["job_id"])) == response
+
+
+@mock.patch("requests.Session.post")
+def test_async_client_error(mock_post: mock.MagicMock) -> None:
+    mock_post.return_value.ok = False
+    mock_post.return_value.status_code = requests.codes.bad_request
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+    )
+    with pytest.raises(gss.SuperstaqServerException, match="Status code: 400"):
+        _ = asyncio.run(client.get_async_client().fetch_jobs(["job_id"]))
+
+
+@mock.patch("requests.Session.get")
+def test_async_client_get_request(mock_get: mock.MagicMock) -> None:
+    mock_get.return_value.ok = True
+    mock_get.return_value.json.return_value = {"balance": 123.4567}
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+    )
+    response = asyncio.run(client.get_async_client().get_request("/balance"))
+    assert response == {"balance": 123.4567}
+    mock_get.assert_called_once_with(
+        f"http://example.com/{API_VERSION}/balance", headers=EXPECTED_HEADERS, verify=False
+    )
+
+
 def test_find_api_key() -> None:
     # find key in the environment
     with mock.patch.dict(os.environ, {"SUPERSTAQ_API_KEY": "tomyheart"}):
@@ -1117,3 +1576,95 @@ def test_get_user_info_empty_response(mock_get: mock.MagicMock) -> None:
         headers=EXPECTED_HEADERS,
         verify=False,
     )
+
+
+def test_superstaq_client_metadata_cache() -> None:
+    cache = gss.MetadataCache()
+    clients = [
+        gss.superstaq_client._SuperstaqClient(
+            client_name="general-superstaq",
+            remote_host="http://example.com",
+            api_key="to_my_heart",
+            metadata_cache=cache,
+        )
+        for _ in range(2)
+    ]
+    server = gss.testing.FakeSuperstaqServer(
+        target_info={"ss_unconstrained_simulator": {"num_qubits": 4}}
+    )
+    for client in clients:
+        server.install(client)
+
+    for client in clients:
+        assert client.target_info("ss_unconstrained_simulator") == {
+            "target_info": {"num_qubits": 4}
+        }
+        assert client.get_targets() == clients[0].get_targets()
+        _ = client.get_my_targets()
+        _ = client.get_targets(simulator=True)
+
+    assert server.request_counts == {"/target_info": 1, "/targets": 3}
+
+    cache.invalidate()
+    _ = clients[0].target_info("ss_unconstrained_simulator")
+    assert server.request_counts["/target_info"] == 2
+
+    # Clients with different credentials don't share cached values
+    other_client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="other_key",
+        metadata_cache=cache,
+    )
+    server.install(other_client)
+    _ = other_client.target_info("ss_unconstrained_simulator")
+    assert server.request_counts["/target_info"] == 3
+
+
+def test_superstaq_client_job_store(tmp_path: pathlib.Path) -> None:
+    clients = [
+        gss.superstaq_client._SuperstaqClient(
+            client_name="general-superstaq",
+            remote_host="http://example.com",
+            api_key="to_my_heart",
+            job_store=gss.JobStore(tmp_path / "jobs.sqlite3"),
+        )
+        for _ in range(2)
+    ]
+    with mock.patch(
+        "requests.Session.post",
+        return_value=mock.MagicMock(ok=True, status_code=requests.codes.OK),
+    ) as mock_post:
+        mock_post.return_value.json.return_value = {
+            "job_1": {"status": "Done"},
+            "job_2": {"status": "Running"},
+        }
+        assert clients[0].fetch_jobs(["job_1", "job_2"]) == {
+            "job_1": {"status": "Done"},
+            "job_2": {"status": "Running"},
+        }
+
+        # Finished jobs are never refetched (by any client sharing the store)
+        mock_post.return_value.json.return_value = {"job_2": {"status": "Done"}}
+        assert clients[1].fetch_jobs(["job_1", "job_2"]) == {
+            "job_1": {"status": "Done"},
+            "job_2": {"status": "Done"},
+        }
+        assert mock_post.call_args.kwargs["json"] == {"job_ids": ["job_2"]}
+
+        assert clients[0].fetch_jobs(["job_2", "job_1"]) == {
+            "job_1": {"status": "Done"},
+            "job_2": {"status": "Done"},
+        }
+        assert mock_post.call_count == 2
+
+        # Jobs stored for one server are not returned for another
+        other_client = gss.superstaq_client._SuperstaqClient(
+            client_name="general-superstaq",
+            remote_host="http://example.org",
+            api_key="to_my_heart",
+            job_store=clients[0].job_store,
+        )
+        mock_post.return_value.json.return_value = {"job_1": {"status": "Failed"}}
+        assert other_client.fetch_jobs(["job_1"]) == {"job_1": {"status": "Failed"}}
+        assert mock_post.call_count == 3
@@ -1,5 +1,24 @@
+"""Utilities for testing code which uses the Superstaq API without network access."""
+
 from __future__ import annotations
 
+import collections
+import gzip
+import http
+import json
+import random
+import threading
+import time
+import urllib.parse
+import uuid
+import zlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import requests
+import requests.adapters
+
+import general_superstaq as gss
 from general_superstaq.typing import Target
 
 TARGET_LIST = {
@@ -211,3 +230,347 @@ TARGET_LIST = {
 RETURNED_TARGETS = [
     Target(target=target_name, **properties) for target_name, properties in TARGET_LIST.items()
 ]
+
+
+class _FakeJob:
+    """A job submitted to a `FakeSuperstaqServer`."""
+
+    def __init__(self, data: dict[str, Any], submitted_at: float) -> None:
+        self.data = data
+        self.submitted_at = submitted_at
+        self.cancelled = False
+
+
+class FakeSuperstaqServer(requests.adapters.BaseAdapter):
+    """An in-process stand-in for the Superstaq API, implemented as a `requests` transport adapter.
+
+    Once installed on a client (see `install`), every request that client makes is handled locally
+    instead of being sent over the network. The `/jobs`, `/fetch_jobs`, `/cancel_jobs`,
+    `/compile`, `/targets`, and `/target_info` endpoints are supported; circuits are run using the
+    simulator registered for their serialization type (e.g. `css.testing.simulate_circuits` for
+    "cirq_circuits" or `qss.testing.simulate_circuits` for "qiskit_circuits").
+
+    Latency, queueing, and failures can be configured to benchmark client throughput, retry
+    behavior, and polling strategies reproducibly:
+
+    .. code-block:: python
+
+        server = gss.testing.FakeSuperstaqServer(
+            simulators={"cirq_circuits": css.testing.simulate_circuits},
+            latency_seconds=0.05,
+            queue_seconds=2.0,
+            error_rate=0.1,
+        )
+        server.install(service)
+    """
+
+    def __init__(
+        self,
+        simulators: Mapping[str, Callable[[str, int], list[dict[str, Any]]]] | None = None,
+        compilers: Mapping[str, Callable[[str, str], dict[str, Any]]] | None = None,
+        latency_seconds: float = 0.0,
+        queue_seconds: float = 0.0,
+        run_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        error_status_code: int = http.HTTPStatus.SERVICE_UNAVAILABLE,
+        targets: Mapping[str, Mapping[str, bool]] | None = None,
+        target_info: Mapping[str, Mapping[str, Any]] | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initializes a `FakeSuperstaqServer`.
+
+        Args:
+            simulators: A mapping from serialized circuit types (e.g. "cirq_circuits") to the
+                functions used to run them. Each is called with a batch of serialized circuits and
+                a number of shots, and returns the job data (e.g. "input_circuit", "num_qubits",
+                and "samples") of each circuit in the batch.
+            compilers: A mapping from serialized circuit types to the functions used to compile
+                them. Each is called with a batch of serialized circuits and a target, and returns
+                the body of the `/compile` response.
+            latency_seconds: How long to wait before responding to each request.
+            queue_seconds: How long each job reports a "Queued" status after being submitted.
+            run_seconds: How long each job then reports a "Running" status before finishing.
+            error_rate: The probability with which any request fails with `error_status_code`.
+            error_status_code: The HTTP status code of randomly injected failures.
+            targets: The targets returned by `/targets` (defaults to `gss.testing.TARGET_LIST`).
+            target_info: A mapping from target names to the information returned by
+                `/target_info`.
+            seed: An optional seed for the random number generator used to inject failures.
+
+        Raises:
+            ValueError: If `error_rate` is not between zero and one, or any delay is negative.
+        """
+        super().__init__()
+        if not 0 <= error_rate <= 1:
+            raise ValueError("`error_rate` must be between 0 and 1.")
+        if min(latency_seconds, queue_seconds, run_seconds) < 0:
+            raise ValueError("Delays must be non-negative.")
+
+        self.simulators = dict(simulators or {})
+        self.compilers = dict(compilers or {})
+        self.latency_seconds = latency_seconds
+        self.queue_seconds = queue_seconds
+        self.run_seconds = run_seconds
+        self.error_rate = error_rate
+        self.error_status_code = error_status_code
+        self.targets = dict(TARGET_LIST if targets is None else targets)
+        self.target_info = dict(target_info or {})
+
+        self.request_counts: collections.Counter[str] = collections.Counter()
+        """The number of requests received so far, by endpoint."""
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._jobs: dict[str, _FakeJob] = {}
+        self._injected_errors: collections.deque[tuple[str | None, int, float | None]] = (
+            collections.deque()
+        )
+
+        self._handlers: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "/jobs": self._create_jobs,
+            "/fetch_jobs": self._fetch_jobs,
+            "/cancel_jobs": self._cancel_jobs,
+            "/compile": self._compile,
+            "/targets": self._get_targets,
+            "/target_info": self._get_target_info,
+        }
+
+    @property
+    def num_jobs(self) -> int:
+        """The number of (single-circuit) jobs submitted to this server."""
+        return len(self._jobs)
+
+    def install(self, client: Any) -> None:
+        """Routes all requests made by a client to this server.
+
+        Args:
+            client: A `_SuperstaqClient`, or any service or provider wrapping one (e.g.
+                `css.Service` or `qss.SuperstaqProvider`).
+        """
+        client = getattr(client, "_client", client)
+        client.session.mount(client.url, self)
+
+    def inject_errors(
+        self,
+        count: int = 1,
+        status_code: int = http.HTTPStatus.SERVICE_UNAVAILABLE,
+        retry_after: float | None = None,
+        endpoint: str | None = None,
+    ) -> None:
+        """Makes the next `count` requests (optionally to a specific endpoint) fail.
+
+        Args:
+            count: The number of requests to fail.
+            status_code: The HTTP status code with which to fail them.
+            retry_after: An optional delay to return in the `Retry-After` header.
+            endpoint: The endpoint whose requests should fail (or None for any endpoint).
+        """
+        with self._lock:
+            for _ in range(count):
+                self._injected_errors.append((endpoint, status_code, retry_after))
+
+    def send(
+        self, request: requests.PreparedRequest, *args: object, **kwargs: object
+    ) -> requests.Response:
+        """Handles a request (see `requests.adapters.BaseAdapter.send`).
+
+        Args:
+            request: The request being sent.
+            args: Unused positional arguments.
+            kwargs: Unused keyword arguments.
+
+        Returns:
+            The response of the fake server.
+        """
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+        path = urllib.parse.urlsplit(request.url or "").path
+        endpoint = "/" + path.strip("/").partition("/")[2]
+        with self._lock:
+            self.request_counts[endpoint] += 1
+
+        error = self._get_injected_error(endpoint)
+        if error is not None:
+            status_code, retry_after = error
+            headers = {} if retry_after is None else {"Retry-After": str(retry_after)}
+            return self._build_response(
+                request, status_code, {"message": "Injected error."}, headers
+            )
+
+        handler = self._handlers.get(endpoint)
+        if handler is None or request.method != "POST":
+            return self._build_response(
+                request, http.HTTPStatus.NOT_FOUND, {"message": f"Unknown endpoint: {endpoint}"}
+            )
+
+        try:
+            body = self._handle(handler, request)
+        except (KeyError, ValueError) as e:
+            return self._build_response(request, http.HTTPStatus.BAD_REQUEST, {"message": str(e)})
+        return self._build_response(request, http.HTTPStatus.OK, body)
+
+    def close(self) -> None:
+        """Cleans up adapter specific items (there are none)."""
+
+    def _get_injected_error(self, endpoint: str) -> tuple[int, float | None] | None:
+        """Pops the next error to inject for a request to `endpoint` (if any).
+
+        Args:
+            endpoint: The requested endpoint.
+
+        Returns:
+            The status code and `Retry-After` delay of the error, or None if the request should
+            succeed.
+        """
+        with self._lock:
+            for index, (error_endpoint, status_code, retry_after) in enumerate(
+                self._injected_errors
+            ):
+                if error_endpoint in (None, endpoint):
+                    del self._injected_errors[index]
+                    return status_code, retry_after
+
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_status_code, None
+        return None
+
+    def _handle(
+        self, handler: Callable[[dict[str, Any]], Any], request: requests.PreparedRequest
+    ) -> Any:
+        """Decodes the body of a request and passes it to an endpoint handler.
+
+        Args:
+            handler: The endpoint handler.
+            request: The request.
+
+        Returns:
+            The (json-serializable) body of the response.
+        """
+        body = request.body or b"{}"
+        if isinstance(body, str):
+            body = body.encode()
+        assert isinstance(body, bytes)
+
+        encoding = request.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+
+        return handler(json.loads(body))
+
+    def _build_response(
+        self,
+        request: requests.PreparedRequest,
+        status_code: int,
+        body: Any,
+        headers: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """Builds a `requests.Response` with a json body.
+
+        Args:
+            request: The request being responded to.
+            status_code: The HTTP status code of the response.
+            body: The (json-serializable) body of the response.
+            headers: Any additional response headers.
+
+        Returns:
+            The response.
+        """
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = http.HTTPStatus(status_code).phrase
+        response.headers.update({"Content-Type": "application/json", **(headers or {})})
+        response.encoding = "utf-8"
+        response._content = json.dumps(body).encode()
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+    def _create_jobs(self, json_dict: dict[str, Any]) -> dict[str, list[str]]:
+        target = json_dict["target"]
+        gss.validation.validate_target(target)
+        if target not in self.targets:
+            raise ValueError(f"{target!r} is not a valid target.")
+
+        shots = int(json_dict.get("shots", 1))
+        for circuit_type, simulator in self.simulators.items():
+            if circuit_type in json_dict:
+                job_data = simulator(json_dict[circuit_type], shots)
+                break
+        else:
+            raise ValueError("No simulator is registered for the submitted circuits.")
+
+        submitted_at = time.monotonic()
+        job_ids = []
+        with self._lock:
+            for data in job_data:
+                job_id = str(uuid.uuid4())
+                self._jobs[job_id] = _FakeJob(
+                    {
+                        "job_id": job_id,
+                        "target": target,
+                        "shots": shots,
+                        "compiled_circuit": data.get("input_circuit"),
+                        **data,
+                    },
+                    submitted_at,
+                )
+                job_ids.append(job_id)
+        return {"job_ids": job_ids}
+
+    def _fetch_jobs(self, json_dict: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        now = time.monotonic()
+        results = {}
+        with self._lock:
+            for job_id in json_dict["job_ids"]:
+                if job_id not in self._jobs:
+                    raise ValueError(f"Job {job_id} does not exist.")
+
+                job = self._jobs[job_id]
+                elapsed_seconds = now - job.submitted_at
+                if job.cancelled:
+                    results[job_id] = {**job.data, "status": "Cancelled", "samples": None}
+                elif elapsed_seconds < self.queue_seconds:
+                    results[job_id] = {**job.data, "status": "Queued", "samples": None}
+                elif elapsed_seconds < self.queue_seconds + self.run_seconds:
+                    results[job_id] = {**job.data, "status": "Running", "samples": None}
+                else:
+                    results[job_id] = {**job.data, "status": "Done"}
+        return results
+
+    def _cancel_jobs(self, json_dict: dict[str, Any]) -> dict[str, list[str]]:
+        now = time.monotonic()
+        succeeded = []
+        with self._lock:
+            for job_id in json_dict["job_ids"]:
+                job = self._jobs.get(job_id)
+                if job is not None and now - job.submitted_at < (
+                    self.queue_seconds + self.run_seconds
+                ):
+                    job.cancelled = True
+                    succeeded.append(job_id)
+        return {"succeeded": succeeded}
+
+    def _compile(self, json_dict: dict[str, Any]) -> dict[str, Any]:
+        for circuit_type, compiler in self.compilers.items():
+            if circuit_type in json_dict:
+                return compiler(json_dict[circuit_type], json_dict["target"])
+        raise ValueError("No compiler is registered for the submitted circuits.")
+
+    def _get_targets(self, json_dict: dict[str, Any]) -> dict[str, Any]:
+        filters = {key: value for key, value in json_dict.items() if key != "options"}
+        return {
+            "superstaq_targets": {
+                target: properties
+                for target, properties in self.targets.items()
+                if all(properties.get(key) == value for key, value in filters.items())
+            }
+        }
+
+    def _get_target_info(self, json_dict: dict[str, Any]) -> dict[str, Any]:
+        target = json_dict["target"]
+        if target not in self.targets:
+            raise ValueError(f"{target!r} is not a valid target.")
+        return {"target_info": dict(self.target_info.get(target, {}))}
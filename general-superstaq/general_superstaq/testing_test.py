@@ -0,0 +1,188 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest import mock
+
+import pytest
+import requests
+
+import general_superstaq as gss
+
+
+def _simulate(serialized_circuits: str, shots: int) -> list[dict[str, Any]]:
+    return [
+        {"input_circuit": circuit, "num_qubits": 1, "samples": {"0": shots}}
+        for circuit in json.loads(serialized_circuits)
+    ]
+
+
+def _compile(serialized_circuits: str, target: str) -> dict[str, Any]:
+    return {"fake_circuits": serialized_circuits, "target": target}
+
+
+@pytest.fixture
+def client() -> gss.superstaq_client._SuperstaqClient:
+    return gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        max_retry_seconds=0,
+    )
+
+
+def test_fake_superstaq_server_validation() -> None:
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        _ = gss.testing.FakeSuperstaqServer(error_rate=2)
+    with pytest.raises(ValueError, match="non-negative"):
+        _ = gss.testing.FakeSuperstaqServer(queue_seconds=-1)
+
+
+def test_fake_superstaq_server_jobs(client: gss.superstaq_client._SuperstaqClient) -> None:
+    server = gss.testing.FakeSuperstaqServer(
+        simulators={"fake_circuits": _simulate}, queue_seconds=1.0, run_seconds=1.0
+    )
+    server.install(client)
+
+    with mock.patch("time.monotonic", return_value=100.0):
+        job_ids = client.create_job(
+            {"fake_circuits": json.dumps(["a", "b"])},
+            repetitions=10,
+            target="ss_unconstrained_simulator",
+        )["job_ids"]
+    assert len(job_ids) == 2
+    assert server.num_jobs == 2
+
+    for now, status in [(100.5, "Queued"), (101.5, "Running"), (102.5, "Done")]:
+        with mock.patch("time.monotonic", return_value=now):
+            jobs = client.fetch_jobs(job_ids)
+        assert [jobs[job_id]["status"] for job_id in job_ids] == [status, status]
+
+    assert jobs[job_ids[0]] == {
+        "job_id": job_ids[0],
+        "target": "ss_unconstrained_simulator",
+        "shots": 10,
+        "input_circuit": "a",
+        "compiled_circuit": "a",
+        "num_qubits": 1,
+        "samples": {"0": 10},
+        "status": "Done",
+    }
+
+    # Only jobs which haven't finished can be cancelled
+    with mock.patch("time.monotonic", return_value=101.0):
+        new_job_id = client.create_job(
+            {"fake_circuits": json.dumps(["c"])}, target="ss_unconstrained_simulator"
+        )["job_ids"][0]
+    with mock.patch("time.monotonic", return_value=102.5):
+        assert client.cancel_jobs([*job_ids, new_job_id, "unknown"]) == [new_job_id]
+        assert client.fetch_jobs([new_job_id])[new_job_id]["status"] == "Cancelled"
+
+    with pytest.raises(gss.SuperstaqServerException, match="does not exist"):
+        _ = client.fetch_jobs(["unknown"])
+
+    with pytest.raises(gss.SuperstaqServerException, match="not a valid target"):
+        _ = client.create_job({"fake_circuits": "[]"}, target="ss_nonexistent_qpu")
+
+    with pytest.raises(gss.SuperstaqServerException, match="No simulator"):
+        _ = client.create_job({"other_circuits": "[]"}, target="ss_unconstrained_simulator")
+
+    assert server.request_counts == {"/jobs": 4, "/fetch_jobs": 5, "/cancel_jobs": 1}
+
+
+def test_fake_superstaq_server_compile(client: gss.superstaq_client._SuperstaqClient) -> None:
+    server = gss.testing.FakeSuperstaqServer(compilers={"fake_circuits": _compile})
+    server.install(client)
+
+    assert client.compile({"fake_circuits": "abc", "target": "ss_unconstrained_simulator"}) == {
+        "fake_circuits": "abc",
+        "target": "ss_unconstrained_simulator",
+    }
+    with pytest.raises(gss.SuperstaqServerException, match="No compiler"):
+        _ = client.compile({"other_circuits": "abc", "target": "ss_unconstrained_simulator"})
+
+
+def test_fake_superstaq_server_targets(client: gss.superstaq_client._SuperstaqClient) -> None:
+    server = gss.testing.FakeSuperstaqServer(
+        target_info={"ss_unconstrained_simulator": {"num_qubits": 4, "max_circuits": 2}}
+    )
+    server.install(client)
+
+    assert client.get_targets() == gss.testing.RETURNED_TARGETS
+    assert client.get_targets(supports_submit_qubo=True) == [
+        target for target in gss.testing.RETURNED_TARGETS if target.supports_submit_qubo
+    ]
+
+    assert client.target_info("ss_unconstrained_simulator") == {
+        "target_info": {"num_qubits": 4, "max_circuits": 2}
+    }
+    assert client.target_info("aws_sv1_simulator") == {"target_info": {}}
+    with pytest.raises(gss.SuperstaqServerException, match="not a valid target"):
+        _ = client.target_info("ss_nonexistent_qpu")
+
+    with pytest.raises(gss.SuperstaqServerException, match="Unknown endpoint"):
+        _ = client.get_request("/targets")
+    with pytest.raises(gss.SuperstaqServerException, match="Unknown endpoint"):
+        _ = client.post_request("/balance", {})
+
+
+def test_fake_superstaq_server_errors(client: gss.superstaq_client._SuperstaqClient) -> None:
+    server = gss.testing.FakeSuperstaqServer(latency_seconds=0.5)
+    server.install(client)
+
+    client.retry_policy = gss.RetryPolicy(
+        initial_delay_seconds=0.0, retriable_status_codes=(429, 503)
+    )
+    client.max_retry_seconds = 10
+
+    server.inject_errors(2, status_code=429, retry_after=0, endpoint="/target_info")
+    server.inject_errors(1)
+    with mock.patch("time.sleep") as mock_sleep:
+        assert client.get_targets() == gss.testing.RETURNED_TARGETS
+        assert client.target_info("ss_unconstrained_simulator") == {"target_info": {}}
+
+    mock_sleep.assert_has_calls([mock.call(0.5), mock.call(0.0)])
+    assert server.request_counts == {"/targets": 2, "/target_info": 3}
+    assert client.retry_policy.retry_counts == {"/targets": 1, "/target_info": 2}
+
+    server.inject_errors(1, status_code=400)
+    with mock.patch("time.sleep"), pytest.raises(gss.SuperstaqServerException, match="Injected"):
+        _ = client.get_targets()
+
+    server = gss.testing.FakeSuperstaqServer(error_rate=1.0, seed=0)
+    server.install(client)
+    client.retry_policy = gss.RetryPolicy()
+    with mock.patch("time.sleep"), pytest.raises(TimeoutError):
+        _ = client.get_targets()
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+def test_fake_superstaq_server_compressed_requests(encoding: str) -> None:
+    client = gss.superstaq_client._SuperstaqClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        request_compression=encoding,
+        compression_threshold_bytes=0,
+    )
+    server = gss.testing.FakeSuperstaqServer(simulators={"fake_circuits": _simulate})
+    server.install(client)
+
+    job_ids = client.create_job({"fake_circuits": json.dumps(["a"])})["job_ids"]
+    assert client.fetch_jobs(job_ids)[job_ids[0]]["status"] == "Done"
+
+
+def test_fake_superstaq_server_empty_body() -> None:
+    server = gss.testing.FakeSuperstaqServer()
+    request = requests.Request("POST", "http://example.com/v0.2.0/targets").prepare()
+    response = server.send(request)
+    assert response.ok
+    assert response.reason == "OK"
+    assert len(response.json()["superstaq_targets"]) == len(gss.testing.TARGET_LIST)
+
+    request = requests.Request(
+        "POST", "http://example.com/v0.2.0/target_info", data='{"target": "aws_sv1_simulator"}'
+    ).prepare()
+    assert server.send(request).json() == {"target_info": {}}
+    server.close()
@@ -1,4 +1,4 @@
-from . import compiler_output, custom_gates, serialization, validation
+from . import compiler_output, custom_gates, serialization, testing, validation
 from ._version import __version__
 from .compiler_output import active_qubit_indices, classical_bit_mapping, measured_qubit_indices
 from .custom_gates import (
@@ -12,7 +12,7 @@ from .custom_gates import (
 )
 from .serialization import deserialize_circuits, serialize_circuits
 from .superstaq_backend import SuperstaqBackend
-from .superstaq_job import SuperstaqJob
+from .superstaq_job import SuperstaqJob, as_completed, wait_for_jobs
 from .superstaq_provider import SuperstaqProvider
 
 __all__ = [
@@ -20,6 +20,7 @@ __all__ = [
     "AceCR",
     "AQTiCCXGate",
     "AQTiToffoliGate",
+    "as_completed",
     "classical_bit_mapping",
     "compiler_output",
     "custom_gates",
@@ -33,7 +34,9 @@ __all__ = [
     "SuperstaqBackend",
     "SuperstaqJob",
     "SuperstaqProvider",
+    "testing",
     "validation",
+    "wait_for_jobs",
     "ZZSwapGate",
     "__version__",
 ]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
 import io
 import json
 import re
+import struct
 import warnings
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Hashable, Sequence
 from typing import TypeVar
 
 import general_superstaq as gss
@@ -51,6 +53,11 @@ _custom_resolvers: dict[
     ),
 }
 
+# Custom gate types whose definitions are determined by their parameters (and `ctrl_state`)
+_params_determine_definition = {
+    gate_type for gate_type in _custom_gates_by_name.values() if gate_type not in _custom_resolvers
+}
+
 
 def _mcphase(
     lam: float | qiskit.circuit.ParameterExpression,
@@ -152,28 +159,134 @@ def to_json(val: object) -> str:
     return json.dumps(val, default=json_encoder)
 
 
-def serialize_circuits(circuits: qiskit.QuantumCircuit | Sequence[qiskit.QuantumCircuit]) -> str:
+@gss.instrumentation.timed("qss.serialize_circuits")
+def serialize_circuits(
+    circuits: qiskit.QuantumCircuit | Sequence[qiskit.QuantumCircuit],
+    max_workers: int | None = None,
+) -> str:
     """Serializes qiskit.QuantumCircuit(s) into a single string.
 
     Args:
         circuits: A `qiskit.QuantumCircuit` or list of `qiskit.QuantumCircuit` to be serialized.
+        max_workers: Optionally, the maximum number of worker processes with which to serialize a
+            list of circuits in parallel (see `gss.serialization.map_chunks`). The result always
+            deserializes to equivalent circuits, but is not necessarily byte-for-byte the same.
 
     Returns:
         A string representing the serialized circuit(s).
     """
     if isinstance(circuits, qiskit.QuantumCircuit):
-        circuits = [_prepare_circuit(circuits)]
-    else:
-        circuits = [_prepare_circuit(circuit) for circuit in circuits]
+        circuits = [circuits]
+
+    qpy_chunks = gss.serialization.map_chunks(_serialize_chunk, circuits, max_workers)
+    return gss.serialization.bytes_to_str(_concatenate_qpy(qpy_chunks, len(circuits)))
+
+
+@gss.instrumentation.timed("qss.serialize_circuit_batches")
+def serialize_circuit_batches(
+    circuits: Sequence[qiskit.QuantumCircuit],
+    max_circuits: int | None = None,
+    max_payload_bytes: int | None = None,
+    max_workers: int | None = None,
+) -> list[str]:
+    """Serializes a list of qiskit.QuantumCircuits into several strings, each containing a
+    contiguous chunk of the list (as chosen by `gss.superstaq_client.split_batch`).
+
+    Every circuit is only serialized once: the chunks are assembled from the serialized circuits,
+    and each deserializes to the same circuits as the result of `serialize_circuits()` would.
+
+    Args:
+        circuits: The list of `qiskit.QuantumCircuit` to be serialized.
+        max_circuits: The maximum number of circuits per chunk (or None for no limit).
+        max_payload_bytes: The maximum serialized size of each chunk (or None for no limit).
+        max_workers: Optionally, the maximum number of worker processes with which to serialize
+            the circuits in parallel (see `gss.serialization.map_chunks`).
+
+    Returns:
+        A list of strings, each representing a chunk of the serialized circuits.
+    """
+    qpy_circuits = _serialize_qpy_circuits(circuits, max_workers)
+    return _split_qpy_circuits(qpy_circuits, max_circuits, max_payload_bytes)
+
+
+def _serialize_qpy_circuits(
+    circuits: Sequence[qiskit.QuantumCircuit], max_workers: int | None = None
+) -> list[bytes]:
+    """Prepares and serializes each of a list of circuits into its own QPY file (in parallel if
+    `max_workers` allows it)."""
+    return [
+        qpy
+        for qpy_chunk in gss.serialization.map_chunks(_serialize_each, circuits, max_workers)
+        for qpy in qpy_chunk
+    ]
+
+
+def _split_qpy_circuits(
+    qpy_circuits: Sequence[bytes], max_circuits: int | None, max_payload_bytes: int | None
+) -> list[str]:
+    """Splits a list of serialized circuits into contiguous chunks (as chosen by
+    `gss.superstaq_client.split_batch`), and concatenates each into a single serialized string."""
+    sizes = [len(gss.serialization.bytes_to_str(qpy)) for qpy in qpy_circuits]
+    chunks = gss.superstaq_client.split_batch(sizes, max_circuits, max_payload_bytes)
+    return [
+        gss.serialization.bytes_to_str(
+            _concatenate_qpy(qpy_circuits[chunk.start : chunk.stop], len(chunk))
+        )
+        for chunk in chunks
+    ]
+
+
+def _serialize_chunk(circuits: Sequence[qiskit.QuantumCircuit]) -> bytes:
+    """Prepares and serializes a list of circuits into a QPY file."""
+    prepared_gates: dict[str, dict[Hashable, qiskit.circuit.Instruction]] = {}
+    return _dump_qpy([_prepare_circuit(circuit, prepared_gates) for circuit in circuits])
+
+
+def _serialize_each(circuits: Sequence[qiskit.QuantumCircuit]) -> list[bytes]:
+    """Prepares and serializes each of a list of circuits into its own QPY file."""
+    prepared_gates: dict[str, dict[Hashable, qiskit.circuit.Instruction]] = {}
+    return [_dump_qpy([_prepare_circuit(circuit, prepared_gates)]) for circuit in circuits]
 
+
+def _dump_qpy(circuits: Sequence[qiskit.QuantumCircuit]) -> bytes:
+    """Serializes a list of (prepared) circuits into a QPY file."""
     # Use the lowest compatible QPY version for serialization. Deserialization can't be done with a
     # QPY version older than that used for serialization, so this prevents us from having to force
     # users to update Qiskit the moment we do
     buf = io.BytesIO()
     qiskit.qpy.dump(circuits, buf, version=QPY_SERIALIZATION_VERSION)
-    return gss.serialization.bytes_to_str(buf.getvalue())
+    return buf.getvalue()
+
+
+def _concatenate_qpy(qpy_chunks: Sequence[bytes], num_circuits: int) -> bytes:
+    """Concatenates QPY files containing consecutive chunks of a list of circuits.
 
+    Each file consists of a header (which includes the number of circuits it contains), a program
+    type key, and then each circuit in turn. The result is equivalent to dumping every circuit into
+    a single file.
+
+    Args:
+        qpy_chunks: The QPY files to concatenate.
+        num_circuits: The total number of circuits in all of the files.
 
+    Returns:
+        A single QPY file containing every circuit.
+    """
+    if len(qpy_chunks) == 1:
+        return qpy_chunks[0]
+
+    header_size = qiskit.qpy.formats.FILE_HEADER_V10_SIZE
+    header = qiskit.qpy.formats.FILE_HEADER_V10._make(
+        struct.unpack(qiskit.qpy.formats.FILE_HEADER_V10_PACK, qpy_chunks[0][:header_size])
+    )
+    new_header = struct.pack(
+        qiskit.qpy.formats.FILE_HEADER_V10_PACK, *header._replace(num_programs=num_circuits)
+    )
+    type_key = qpy_chunks[0][header_size : header_size + 1]
+    return b"".join([new_header, type_key, *(chunk[header_size + 1 :] for chunk in qpy_chunks)])
+
+
+@gss.instrumentation.timed("qss.deserialize_circuits")
 def deserialize_circuits(serialized_circuits: str) -> list[qiskit.QuantumCircuit]:
     """Deserializes serialized qiskit.QuantumCircuit(s).
 
@@ -214,7 +327,8 @@ def deserialize_circuits(serialized_circuits: str) -> list[qiskit.QuantumCircuit
                 f"error: {e!r}"
             )
 
-    return [_resolve_circuit(circuit) for circuit in circuits]
+    resolved_gates: dict[Hashable, qiskit.circuit.Instruction] = {}
+    return [_resolve_circuit(circuit, resolved_gates) for circuit in circuits]
 
 
 def insert_times_and_durations(
@@ -258,6 +372,24 @@ def _is_qiskit_gate(gate: qiskit.circuit.Instruction) -> bool:
     """Returns True if `gate` will be correctly resolved by QPY."""
     base_class = getattr(gate, "base_class", type(gate))
 
+    return _is_qiskit_gate_class(base_class) and not (  # type: ignore[arg-type]
+        issubclass(  # https://github.com/Qiskit/qiskit/issues/11377
+            base_class,
+            (
+                qiskit.circuit.library.MCXGate,
+                qiskit.circuit.library.MCU1Gate,
+                qiskit.circuit.library.MCPhaseGate,
+            ),
+        )
+        and gate.ctrl_state != 2**gate.num_ctrl_qubits - 1
+    )
+
+
+@functools.lru_cache
+def _is_qiskit_gate_class(base_class: type) -> bool:
+    """Returns True if instances of `base_class` can be correctly resolved by QPY (i.e. the checks
+    in `_is_qiskit_gate` which only depend on the type of a gate, memoized per type).
+    """
     return (
         issubclass(base_class, qiskit.circuit.Instruction)
         and base_class.__module__.startswith("qiskit.")
@@ -270,17 +402,6 @@ def _is_qiskit_gate(gate: qiskit.circuit.Instruction) -> bool:
         and not issubclass(  # https://github.com/Qiskit/qiskit/issues/11378
             base_class, qiskit.circuit.library.MSGate
         )
-        and not (
-            issubclass(  # https://github.com/Qiskit/qiskit/issues/11377
-                base_class,
-                (
-                    qiskit.circuit.library.MCXGate,
-                    qiskit.circuit.library.MCU1Gate,
-                    qiskit.circuit.library.MCPhaseGate,
-                ),
-            )
-            and gate.ctrl_state != 2**gate.num_ctrl_qubits - 1
-        )
         and (
             hasattr(qiskit.circuit.library, base_class.__name__)
             or hasattr(qiskit.circuit, base_class.__name__)
@@ -289,7 +410,10 @@ def _is_qiskit_gate(gate: qiskit.circuit.Instruction) -> bool:
     )
 
 
-def _prepare_circuit(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumCircuit:
+def _prepare_circuit(
+    circuit: qiskit.QuantumCircuit,
+    prepared_gates: dict[str, dict[Hashable, qiskit.circuit.Instruction]] | None = None,
+) -> qiskit.QuantumCircuit:
     """Rewrites the input circuit in anticipation of QPY serialization.
 
     This is intended to be run prior to serialization as a workaround for various known QPY issues,
@@ -308,12 +432,19 @@ def _prepare_circuit(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumCircuit:
 
     Args:
         circuit: The `qiskit.QuantumCircuit` to be rewritten.
+        prepared_gates: Optionally, a dictionary in which to cache prepared gates (by name and then
+            by `_gate_key`), which can be shared between circuits serialized together so that each
+            distinct custom gate is only prepared once.
 
     Returns:
-        A copy of the input circuit with unique custom instruction names.
+        The input circuit itself if it contains no instructions which need to be rewritten,
+        otherwise a copy of the input circuit with unique custom instruction names.
     """
-    old_gates_by_name = {}
-    new_gates_by_name = {}
+    if not any(_needs_preparation(inst.operation) for inst in circuit):
+        return circuit
+
+    if prepared_gates is None:
+        prepared_gates = {}
 
     def _update_gate(gate: qiskit.circuit.Instruction) -> qiskit.circuit.Instruction:
         # Control flow operations contain nested circuit blocks; prepare them first
@@ -324,21 +455,19 @@ def _prepare_circuit(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumCircuit:
         if _is_qiskit_gate(gate):
             return gate
 
-        if gate.name not in old_gates_by_name:
+        key = _cache_key(gate)
+        if gate.name not in prepared_gates:
             new_gate = _prepare_gate(gate)
-            old_gates_by_name[gate.name] = [gate]
-            new_gates_by_name[gate.name] = [new_gate]
+            prepared_gates[gate.name] = {key: new_gate}
             return new_gate
 
-        for i, other in enumerate(old_gates_by_name[gate.name]):
-            if gate is other or gate == other:
-                return new_gates_by_name[gate.name][i]
+        if key in prepared_gates[gate.name]:
+            return prepared_gates[gate.name][key]
 
         # Workaround for https://github.com/Qiskit/qiskit/issues/8941: wrap gate in a temporary
         # instruction to prevent `.definition` from being overwritten
         new_gate = _wrap_gate(gate)
-        old_gates_by_name[gate.name].append(gate)
-        new_gates_by_name[gate.name].append(new_gate)
+        prepared_gates[gate.name][key] = new_gate
         return new_gate
 
     new_circuit = circuit.copy_empty_like()
@@ -349,6 +478,11 @@ def _prepare_circuit(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumCircuit:
     return new_circuit
 
 
+def _needs_preparation(gate: qiskit.circuit.Instruction) -> bool:
+    """Returns True if `gate` may be rewritten by `_prepare_circuit`."""
+    return isinstance(gate, qiskit.circuit.ControlFlowOp) or not _is_qiskit_gate(gate)
+
+
 def _prepare_gate(gate: qiskit.circuit.Instruction) -> qiskit.circuit.Instruction:
     # Check if this is a gate QPY already handles
     if _is_qiskit_gate(gate):
@@ -418,19 +552,119 @@ def _wrap_gate(gate: qiskit.circuit.Instruction) -> qiskit.circuit.Instruction:
     return new_gate
 
 
-def _resolve_circuit(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumCircuit:
+def _resolve_circuit(
+    circuit: qiskit.QuantumCircuit,
+    resolved_gates: dict[Hashable, qiskit.circuit.Instruction] | None = None,
+) -> qiskit.QuantumCircuit:
     """Reverse of the transformation performed by `_prepare_circuit`.
 
     This is intended to be run after deserialization in order to recover the names and types of
-    instructions in the original circuit.
+    instructions in the original circuit. Circuits containing no instructions which need to be
+    resolved are returned as-is.
+
+    Args:
+        circuit: The deserialized `qiskit.QuantumCircuit`.
+        resolved_gates: Optionally, a dictionary in which to cache resolved gates (by `_gate_key`),
+            which can be shared between circuits deserialized together so that each distinct gate
+            is only resolved once.
+
+    Returns:
+        The resolved circuit.
     """
+    if not any(_needs_resolution(inst.operation) for inst in circuit):
+        return circuit
+
+    if resolved_gates is None:
+        resolved_gates = {}
+
     new_circuit = circuit.copy_empty_like()
     for inst in circuit:
-        inst = inst.replace(operation=_resolve_gate(inst.operation))
-        new_circuit.append(inst)
+        gate = inst.operation
+        if _needs_resolution(gate):
+            key = _cache_key(gate)
+            if key not in resolved_gates:
+                resolved_gates[key] = _resolve_gate(gate)
+            gate = resolved_gates[key]
+
+        new_circuit.append(inst.replace(operation=gate))
+
     return new_circuit
 
 
+def _needs_resolution(gate: qiskit.circuit.Instruction) -> bool:
+    """Returns True if `gate` may be replaced by `_resolve_gate` (i.e. if it could have been
+    rewritten by `_prepare_circuit`).
+    """
+    return (
+        isinstance(gate, qiskit.circuit.ControlFlowOp)
+        or type(gate) is qiskit.circuit.ControlledGate
+        or (gate.mutable and type(gate) in (qiskit.circuit.Instruction, qiskit.circuit.Gate))
+    )
+
+
+def _cache_key(gate: qiskit.circuit.Instruction) -> Hashable:
+    """Returns `_gate_key(gate)` if it is hashable, and otherwise `id(gate)` (so that gates with
+    unhashable attributes, e.g. array parameters, are only identified with themselves).
+    """
+    try:
+        key = _gate_key(gate)
+        hash(key)
+        return key
+    except TypeError:
+        return id(gate)
+
+
+def _gate_key(gate: qiskit.circuit.Instruction) -> tuple[object, ...]:
+    """Constructs a key identifying `gate` for the purposes of serialization.
+
+    Gates with equal keys are interchangeable (i.e. they are equal, with the same label, condition,
+    and duration). The key may be unhashable, e.g. if the gate has array parameters.
+    """
+    key: tuple[object, ...] = (
+        type(gate),
+        gate.name,
+        gate.num_qubits,
+        gate.num_clbits,
+        tuple(gate.params),
+        gate.label,
+        getattr(gate, "ctrl_state", None),
+        getattr(gate, "_condition", None),
+        getattr(gate, "_duration", None),
+        getattr(gate, "_unit", None),
+    )
+
+    # Definitions needn't be compared if they are determined by the rest of the key
+    if _is_qiskit_gate(gate) or (
+        type(gate) in _params_determine_definition and gate._definition is None
+    ):
+        return key
+
+    if isinstance(gate, qiskit.circuit.ControlledGate):
+        key += (_gate_key(gate.base_gate),)
+
+    if gate.definition is None:
+        return key
+
+    return key + (_circuit_key(gate.definition),)
+
+
+def _circuit_key(circuit: qiskit.QuantumCircuit) -> tuple[object, ...]:
+    """Constructs a key identifying the contents of `circuit` (see `_gate_key`)."""
+    return (
+        circuit.num_qubits,
+        circuit.num_clbits,
+        circuit.global_phase,
+        tuple(
+            (
+                _gate_key(inst.operation),
+                tuple(circuit.find_bit(qubit).index for qubit in inst.qubits),
+                tuple(circuit.find_bit(clbit).index for clbit in inst.clbits),
+            )
+            for inst in circuit
+        ),
+    )
+
+
 def _resolve_gate(gate: qiskit.circuit.Instruction) -> qiskit.circuit.Instruction:
     if gate.name.startswith(r"__superstaq_wrapper_"):
         return _resolve_gate(gate.definition[0].operation)
@@ -466,22 +700,59 @@ def _resolve_gate(gate: qiskit.circuit.Instruction) -> qiskit.circuit.Instructio
 
 
 def _resolve_custom_gate(gate: qiskit.circuit.Instruction) -> qiskit.circuit.Instruction:
-    for name, trial_class in _custom_gates_by_name.items():
-        if gate.name == name or gate.name.startswith(f"{name}_"):
-            try:
-                if resolver := _custom_resolvers.get(trial_class):
-                    trial_gate = resolver(gate)
-                elif issubclass(trial_class, qiskit.circuit.ControlledGate):
-                    trial_gate = trial_class(
-                        *gate.params, ctrl_state=gate.ctrl_state, label=gate.label
-                    )
-                else:
-                    trial_gate = trial_class(*gate.params, label=gate.label)
-
-            except Exception:
-                continue
-
-            if trial_gate.definition == gate.definition:
-                return trial_gate
+    for trial_class in _custom_gate_candidates(gate.name):
+        try:
+            if resolver := _custom_resolvers.get(trial_class):
+                trial_gate = resolver(gate)
+                trial_definition = trial_gate.definition
+            else:
+                ctrl_state = None
+                if issubclass(trial_class, qiskit.circuit.ControlledGate):
+                    ctrl_state = gate.ctrl_state
+
+                # (Gate parameters are validated, and therefore hashable, once this succeeds)
+                trial_gate = _new_custom_gate(trial_class, gate.params, ctrl_state, gate.label)
+                trial_definition = _custom_gate_definition(
+                    trial_class, tuple(gate.params), ctrl_state  # type: ignore[arg-type]
+                )
+
+        except Exception:
+            continue
+
+        if trial_definition == gate.definition:
+            return trial_gate
 
     return gate
+
+
+def _custom_gate_candidates(name: str) -> list[type[qiskit.circuit.Instruction]]:
+    """Finds the custom gate types which could have produced a gate with the given name, i.e. those
+    whose names in `_custom_gates_by_name` are either `name` or a prefix of it followed by "_".
+    """
+    prefixes = [name[:i] for i, char in enumerate(name) if char == "_"]
+    prefixes.append(name)
+    return [_custom_gates_by_name[prefix] for prefix in prefixes if prefix in _custom_gates_by_name]
+
+
+def _new_custom_gate(
+    gate_type: type[qiskit.circuit.Instruction],
+    params: Sequence[object],
+    ctrl_state: int | None = None,
+    label: str | None = None,
+) -> qiskit.circuit.Instruction:
+    """Constructs a custom gate of the given type from its parameters."""
+    if issubclass(gate_type, qiskit.circuit.ControlledGate):
+        return gate_type(*params, ctrl_state=ctrl_state, label=label)
+    return gate_type(*params, label=label)
+
+
+@functools.lru_cache(maxsize=1024)
+def _custom_gate_definition(
+    gate_type: type[qiskit.circuit.Instruction],
+    params: tuple[object, ...],
+    ctrl_state: int | None = None,
+) -> qiskit.QuantumCircuit | None:
+    """The (memoized) definition of a custom gate, against which deserialized gates are verified
+    in `_resolve_custom_gate`. The returned circuit should not be modified.
+    """
+    return _new_custom_gate(gate_type, params, ctrl_state).definition
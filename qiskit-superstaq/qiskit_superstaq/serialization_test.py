@@ -115,6 +115,64 @@ def test_circuit_serialization() -> None:
     assert qss.serialization.deserialize_circuits(serialized_circuits) == circuits
 
 
+def test_circuit_serialization_parallel() -> None:
+    circuits = []
+    for i in range(10):
+        circuit = qiskit.QuantumCircuit(3)
+        circuit.rx(0.1 * i, 0)
+        circuit.cx(1, 2)
+        circuits.append(circuit)
+
+    serialized_circuits = qss.serialization.serialize_circuits(circuits, max_workers=2)
+    assert serialized_circuits == qss.serialization.serialize_circuits(circuits)
+    assert qss.deserialize_circuits(serialized_circuits) == circuits
+
+    # Custom gates are given unique names, so only compare the deserialized circuits
+    for circuit in circuits:
+        circuit.append(qss.ZZSwapGate(0.5), [1, 2])
+        circuit.append(qss.AceCR("+-"), [0, 1])
+
+    serialized_circuits = qss.serialization.serialize_circuits(circuits, max_workers=2)
+    assert qss.deserialize_circuits(serialized_circuits) == circuits
+
+
+def test_serialize_circuit_batches() -> None:
+    circuits = []
+    for i in range(5):
+        circuit = qiskit.QuantumCircuit(2)
+        circuit.rx(0.1 * i, 0)
+        circuit.cx(0, 1)
+        circuits.append(circuit)
+
+    batches = qss.serialization.serialize_circuit_batches(circuits, max_circuits=2)
+    assert batches == [
+        qss.serialization.serialize_circuits(circuits[0:2]),
+        qss.serialization.serialize_circuits(circuits[2:4]),
+        qss.serialization.serialize_circuits(circuits[4:]),
+    ]
+
+    max_payload_bytes = len(qss.serialization.serialize_circuits(circuits[:3]))
+    batches = qss.serialization.serialize_circuit_batches(
+        circuits, max_payload_bytes=max_payload_bytes, max_workers=2
+    )
+    assert [len(qss.deserialize_circuits(batch)) for batch in batches] == [2, 2, 1]
+    assert [circuit for batch in batches for circuit in qss.deserialize_circuits(batch)] == circuits
+
+
+def test_serialization_instrumentation() -> None:
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.x(0)
+
+    events: list[gss.instrumentation.Event] = []
+    with gss.instrumentation.listening(events.append):
+        _ = qss.deserialize_circuits(qss.serialize_circuits(circuit))
+
+    assert events == [
+        gss.instrumentation.TimingEvent("qss.serialize_circuits", mock.ANY),
+        gss.instrumentation.TimingEvent("qss.deserialize_circuits", mock.ANY),
+    ]
+
+
 def test_insert_times_and_durations() -> None:
     circuit = qiskit.QuantumCircuit(2)
 
@@ -467,3 +525,64 @@ def test_different_gates_with_same_name() -> None:
     expected_circuit.append(expected_gate3, [0, 1])
 
     assert qss.deserialize_circuits(qss.serialize_circuits(circuit))[0] == expected_circuit
+
+
+def test_serialization_caching() -> None:
+    circuit = qiskit.QuantumCircuit(2, 1)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure(1, 0)
+
+    # Circuits which don't need to be rewritten are returned as-is
+    qss.serialization._is_qiskit_gate_class.cache_clear()
+    assert qss.serialization._prepare_circuit(circuit) is circuit
+    assert qss.serialization._prepare_circuit(circuit) is circuit
+    assert qss.serialization._resolve_circuit(circuit) is circuit
+    assert qss.serialization._is_qiskit_gate_class.cache_info()[:2] == (3, 3)  # hits, misses
+
+    opaque_gate = qiskit.circuit.Gate("foo", 1, [])
+    array_gate = qiskit.circuit.Instruction("foo", 1, 0, [np.array([1.0, 2.0])])
+    circuit.append(qss.ZZSwapGate(1.2), [0, 1])
+    circuit.append(opaque_gate, [0])
+    circuit.append(qss.ZZSwapGate(1.2), [0, 1])
+    circuit.append(qiskit.circuit.Gate("foo", 1, [], label="bar"), [0])
+    circuit.append(array_gate, [1])
+    circuit.append(array_gate, [1])
+    circuits = [circuit, circuit.copy()]
+
+    prepared_gates: dict[str, dict[object, qiskit.circuit.Instruction]] = {}
+    prepared_circuits = [qss.serialization._prepare_circuit(c, prepared_gates) for c in circuits]
+    assert len(prepared_gates["zzswap"]) == 1
+    assert len(prepared_gates["foo"]) == 5  # (array gates are only shared by identity)
+    assert prepared_circuits[0][3].operation is prepared_circuits[1][5].operation
+
+    new_circuits = qss.deserialize_circuits(qss.serialize_circuits(circuits))
+    assert new_circuits == circuits
+    assert new_circuits[0][3].operation is new_circuits[1][5].operation
+    assert new_circuits[0][4].operation is new_circuits[1][4].operation
+    assert new_circuits[0][6].operation.label == "bar"
+
+    # Gates with unhashable parameters are only cached by identity
+    assert new_circuits[0][7].operation is not new_circuits[0][8].operation
+    np.testing.assert_array_equal(new_circuits[0][8].operation.params[0], [1.0, 2.0])
+
+
+def test_resolve_custom_gate() -> None:
+    assert qss.serialization._custom_gate_candidates("zzswap") == [qss.ZZSwapGate]
+    assert qss.serialization._custom_gate_candidates("parallel_x_rz") == [qss.ParallelGates]
+    assert qss.serialization._custom_gate_candidates("ixdg") == [qss.custom_gates.iXdgGate]
+    assert qss.serialization._custom_gate_candidates("stripped") == []
+
+    qss.serialization._custom_gate_definition.cache_clear()
+    for label in ["a", "b"]:
+        gate = qiskit.circuit.Gate("zzswap", 2, [1.2], label=label)
+        gate.definition = qss.ZZSwapGate(1.2).definition
+        assert qss.serialization._resolve_custom_gate(gate) == qss.ZZSwapGate(1.2, label=label)
+        assert qss.serialization._resolve_custom_gate(gate).label == label
+
+    # Canonical definitions are only constructed once per parameter value
+    assert qss.serialization._custom_gate_definition.cache_info()[:2] == (3, 1)  # hits, misses
+
+    gate = qiskit.circuit.Gate("zzswap", 2, [1.2])
+    gate.definition = qss.ZZSwapGate(1.3).definition
+    assert qss.serialization._resolve_custom_gate(gate) is gate
@@ -127,6 +127,7 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
         circuits: qiskit.QuantumCircuit | Sequence[qiskit.QuantumCircuit],
         shots: int,
         method: str | None = None,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> qss.SuperstaqJob:
         """Runs circuits on the stored Superstaq backend.
@@ -136,11 +137,93 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
             shots: The number of execution shots (times to run the circuit).
             method:  An optional string that describes the execution method
                 (e.g. 'dry-run', 'statevector', etc.).
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the submission of large batches).
             kwargs: Other optimization and execution parameters.
 
         Returns:
             A Superstaq job storing ID and other related info.
 
+        Raises:
+            ValueError: If `circuits` contains invalid circuits for submission.
+        """
+        job_requests = self._get_run_requests(circuits, shots, method, max_workers, **kwargs)
+        if len(job_requests) == 1:
+            result = self._provider._client.create_job(**job_requests[0])
+        else:
+            result = self._provider._client.create_jobs(job_requests)
+
+        #  we make a virtual job_id that aggregates all of the individual jobs
+        # into a single one, that comma-separates the individual jobs:
+        job_id = ",".join(result["job_ids"])
+        job = qss.SuperstaqJob(self, job_id)
+
+        return job
+
+    async def run_async(
+        self,
+        circuits: qiskit.QuantumCircuit | Sequence[qiskit.QuantumCircuit],
+        shots: int,
+        method: str | None = None,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> qss.SuperstaqJob:
+        """Asynchronously runs circuits on the stored Superstaq backend.
+
+        Circuit serialization and the request itself run in the client's worker pool, so many
+        jobs can be submitted concurrently (e.g. using `asyncio.gather`) without blocking the
+        event loop.
+
+        Args:
+            circuits: A list of circuits to run.
+            shots: The number of execution shots (times to run the circuit).
+            method:  An optional string that describes the execution method
+                (e.g. 'dry-run', 'statevector', etc.).
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the submission of large batches).
+            kwargs: Other optimization and execution parameters.
+
+        Returns:
+            A Superstaq job storing ID and other related info.
+
+        Raises:
+            ValueError: If `circuits` contains invalid circuits for submission.
+        """
+        async_client = self._provider._client.get_async_client()
+        job_requests = await async_client.run(
+            self._get_run_requests, circuits, shots, method, max_workers, **kwargs
+        )
+        if len(job_requests) == 1:
+            result = await async_client.create_job(**job_requests[0])
+        else:
+            result = await async_client.create_jobs(job_requests)
+        job_id = ",".join(result["job_ids"])
+        return qss.SuperstaqJob(self, job_id)
+
+    def _get_run_requests(
+        self,
+        circuits: qiskit.QuantumCircuit | Sequence[qiskit.QuantumCircuit],
+        shots: int,
+        method: str | None,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """Validates and serializes circuits into the arguments of `create_job` requests.
+
+        Batches whose serialized size exceeds `gss.superstaq_client.MAX_JOB_PAYLOAD_BYTES` are
+        split into several requests (each also containing at most `self.max_circuits` circuits),
+        which are then submitted as separate jobs.
+
+        Args:
+            circuits: A list of circuits to run.
+            shots: The number of execution shots (times to run the circuit).
+            method: An optional string that describes the execution method.
+            max_workers: The maximum number of worker processes with which to serialize `circuits`.
+            kwargs: Other optimization and execution parameters.
+
+        Returns:
+            A list of dictionaries of keyword arguments for the client's `create_job` method.
+
         Raises:
             ValueError: If `circuits` contains invalid circuits for submission.
         """
@@ -153,22 +236,31 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
             # statevector simulation)
             raise ValueError("Circuit has no measurements to sample.")
 
-        qiskit_circuits = qss.serialization.serialize_circuits(circuits)
-
-        result = self._provider._client.create_job(
-            serialized_circuits={"qiskit_circuits": qiskit_circuits},
-            repetitions=shots,
-            target=self.name,
-            method=method,
-            **kwargs,
+        # Serialize each circuit once, so that oversized batches can be split without serializing
+        # them again. Only look up `self.max_circuits` (which requires a /target_info request) if
+        # the batch is too large to submit in a single request anyway
+        qpy_circuits = qss.serialization._serialize_qpy_circuits(circuits, max_workers)
+        qiskit_circuits = gss.serialization.bytes_to_str(
+            qss.serialization._concatenate_qpy(qpy_circuits, len(qpy_circuits))
         )
+        max_payload_bytes = gss.superstaq_client.MAX_JOB_PAYLOAD_BYTES
+        if len(qiskit_circuits) <= max_payload_bytes or len(circuits) == 1:
+            all_qiskit_circuits = [qiskit_circuits]
+        else:
+            all_qiskit_circuits = qss.serialization._split_qpy_circuits(
+                qpy_circuits, self.max_circuits, max_payload_bytes
+            )
 
-        #  we make a virtual job_id that aggregates all of the individual jobs
-        # into a single one, that comma-separates the individual jobs:
-        job_id = ",".join(result["job_ids"])
-        job = qss.SuperstaqJob(self, job_id)
-
-        return job
+        return [
+            {
+                "serialized_circuits": {"qiskit_circuits": serialized_chunk},
+                "repetitions": shots,
+                "target": self.name,
+                "method": method,
+                **kwargs,
+            }
+            for serialized_chunk in all_qiskit_circuits
+        ]
 
     def retrieve_job(self, job_id: str) -> qss.SuperstaqJob:
         """Gets a job that has been created on the Superstaq API.
@@ -192,12 +284,15 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
     def compile(
         self,
         circuits: qiskit.QuantumCircuit | Sequence[qiskit.QuantumCircuit],
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> qss.compiler_output.CompilerOutput:
         """Compiles the given circuit(s) to the backend's native gateset.
 
         Args:
             circuits: The qiskit.QuantumCircuit(s) to compile.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the compilation of large batches).
             kwargs: Other desired compile options.
 
         Returns:
@@ -208,18 +303,18 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
             ValueError: If this backend does not support compilation.
         """
         if self.name.startswith("ibmq_"):
-            return self.ibmq_compile(circuits, **kwargs)
+            return self.ibmq_compile(circuits, max_workers=max_workers, **kwargs)
 
         elif self.name.startswith("aqt_"):
-            return self.aqt_compile(circuits, **kwargs)
+            return self.aqt_compile(circuits, max_workers=max_workers, **kwargs)
 
         elif self.name.startswith("qscout_"):
-            return self.qscout_compile(circuits, **kwargs)
+            return self.qscout_compile(circuits, max_workers=max_workers, **kwargs)
 
         elif self.name.startswith("cq_"):
-            return self.cq_compile(circuits, **kwargs)
+            return self.cq_compile(circuits, max_workers=max_workers, **kwargs)
 
-        request_json = self._get_compile_request_json(circuits, **kwargs)
+        request_json = self._get_compile_request_json(circuits, max_workers=max_workers, **kwargs)
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
         json_dict = self._provider._client.compile(request_json)
         return qss.compiler_output.read_json(json_dict, circuits_is_list)
@@ -227,12 +322,13 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
     def _get_compile_request_json(
         self,
         circuits: qiskit.QuantumCircuit | Sequence[qiskit.QuantumCircuit],
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> dict[str, str]:
         qss.validation.validate_qiskit_circuits(circuits)
         gss.validation.validate_target(self.name)
 
-        serialized_circuits = qss.serialization.serialize_circuits(circuits)
+        serialized_circuits = qss.serialization.serialize_circuits(circuits, max_workers)
         options = {**self._provider._client.client_kwargs, **kwargs}
         request_json = {
             "qiskit_circuits": serialized_circuits,
@@ -252,6 +348,7 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
         gateset: Mapping[str, Sequence[Sequence[int]]] | None = None,
         pulses: object = None,
         variables: object = None,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> qss.compiler_output.CompilerOutput:
         """Compiles and optimizes the given circuit(s) for the Advanced Quantum Testbed (AQT).
@@ -279,6 +376,8 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
                 values indicate which qubit(s) they act upon.
             pulses: Qtrl `PulseManager` or file path for pulse configuration.
             variables: Qtrl `VariableManager` or file path for variable configuration.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the compilation of large batches).
             kwargs: Other desired compile options.
 
         Returns:
@@ -312,7 +411,7 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
                 "variables": self._provider._qtrl_config_to_yaml_str(variables),
             }
 
-        request_json = self._get_compile_request_json(circuits, **options)
+        request_json = self._get_compile_request_json(circuits, max_workers=max_workers, **options)
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
         json_dict = self._provider._client.aqt_compile(request_json)
         return qss.compiler_output.read_json_aqt(json_dict, circuits_is_list, num_eca_circuits)
@@ -323,6 +422,7 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
         *,
         dynamical_decoupling: bool = True,
         dd_strategy: str = "adaptive",
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> qss.compiler_output.CompilerOutput:
         """Compiles and optimizes the given circuit(s) for IBMQ devices.
@@ -346,6 +446,8 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
             dynamical_decoupling: Applies dynamical decoupling optimization to circuit(s).
             dd_strategy: Method to use for placing dynamical decoupling operations; should be either
                 "standard", "syncopated", or "adaptive" (default). See above.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the compilation of large batches).
             kwargs: Other desired compile options.
 
         Returns:
@@ -363,7 +465,7 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
 
         options["dynamical_decoupling"] = dynamical_decoupling
         options["dd_strategy"] = dd_strategy
-        request_json = self._get_compile_request_json(circuits, **options)
+        request_json = self._get_compile_request_json(circuits, max_workers=max_workers, **options)
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
         json_dict = self._provider._client.compile(request_json)
         return qss.compiler_output.read_json(json_dict, circuits_is_list)
@@ -376,6 +478,7 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
         base_entangling_gate: str = "xx",
         num_qubits: int | None = None,
         error_rates: SupportsItems[tuple[int, ...], float] | None = None,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> qss.compiler_output.CompilerOutput:
         """Compiles and optimizes the given circuit(s) for the QSCOUT trapped-ion testbed at Sandia
@@ -407,6 +510,8 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
                 for gates acting on those qubits (for example `{(0, 1): 0.3, (1, 2): 0.2}`) . If
                 provided, Superstaq will attempt to map the circuit to minimize the total error on
                 each qubit.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the compilation of large batches).
             kwargs: Other desired qscout_compile options.
 
         Returns:
@@ -454,7 +559,7 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
             raise ValueError(f"At least {max_circuit_qubits} qubits are required for this input.")
         options["num_qubits"] = num_qubits
 
-        request_json = self._get_compile_request_json(circuits, **options)
+        request_json = self._get_compile_request_json(circuits, max_workers=max_workers, **options)
         json_dict = self._provider._client.qscout_compile(request_json)
         return qss.compiler_output.read_json_qscout(json_dict, circuits_is_list)
 
@@ -465,6 +570,7 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
         grid_shape: tuple[int, int] | None = None,
         control_radius: float = 1.0,
         stripped_cz_rads: float = 0.0,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> qss.compiler_output.CompilerOutput:
         """Compiles and optimizes the given circuit(s) for CQ devices.
@@ -476,6 +582,8 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
             control_radius: The radius with which qubits remain connected
                 (ie 1.0 indicates nearest neighbor connectivity).
             stripped_cz_rads: The angle in radians of the stripped cz gate.
+            max_workers: Optionally, the maximum number of worker processes with which to serialize
+                `circuits` in parallel (which can speed up the compilation of large batches).
             kwargs: Other desired compile options.
 
         Returns:
@@ -492,6 +600,7 @@ class SuperstaqBackend(qiskit.providers.BackendV2):
             grid_shape=grid_shape,
             control_radius=control_radius,
             stripped_cz_rads=stripped_cz_rads,
+            max_workers=max_workers,
             **kwargs,
         )
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
@@ -1,11 +1,13 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+import asyncio
 import json
 import textwrap
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
+import general_superstaq as gss
 import pytest
 import qiskit
 
@@ -41,6 +43,32 @@ def test_run(fake_superstaq_provider: MockSuperstaqProvider) -> None:
         backend.run(qc, shots=1000)
 
 
+def test_run_async(fake_superstaq_provider: MockSuperstaqProvider) -> None:
+    qc = qiskit.QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+
+    backend = fake_superstaq_provider.get_backend("ss_example_qpu")
+
+    with patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.create_job",
+        return_value={"job_ids": ["job_id1", "job_id2"], "status": "ready"},
+    ) as mock_create_job:
+        answer = asyncio.run(backend.run_async(circuits=[qc, qc], shots=1000, method="dry-run"))
+        assert answer == qss.SuperstaqJob(backend, "job_id1,job_id2")
+        mock_create_job.assert_called_once_with(
+            serialized_circuits={"qiskit_circuits": qss.serialize_circuits([qc, qc])},
+            repetitions=1000,
+            target="ss_example_qpu",
+            method="dry-run",
+        )
+
+    with pytest.raises(ValueError, match="Circuit has no measurements to sample"):
+        qc.remove_final_measurements()
+        _ = asyncio.run(backend.run_async(qc, shots=1000))
+
+
 def test_multi_circuit_run(fake_superstaq_provider: MockSuperstaqProvider) -> None:
     qc1 = qiskit.QuantumCircuit(1, 1)
     qc1.h(0)
@@ -62,6 +90,61 @@ def test_multi_circuit_run(fake_superstaq_provider: MockSuperstaqProvider) -> No
         assert answer == expected
 
 
+def test_chunked_run(fake_superstaq_provider: MockSuperstaqProvider) -> None:
+    qc = qiskit.QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+
+    backend = fake_superstaq_provider.get_backend("ss_example_qpu")
+    backend._target_info = {**backend.target_info(), "max_circuits": 2}
+
+    # Batches which are too large are split by size, and then by `max_circuits`
+    max_payload_bytes = len(qss.serialize_circuits([qc] * 4)) - 1
+    with patch("general_superstaq.superstaq_client.MAX_JOB_PAYLOAD_BYTES", max_payload_bytes):
+        with patch(
+            "general_superstaq.superstaq_client._SuperstaqClient.create_jobs",
+            return_value={"job_ids": ["job_id1", "job_id2", "job_id3"]},
+        ) as mock_create_jobs, patch(
+            "qiskit_superstaq.serialization._prepare_circuit",
+            wraps=qss.serialization._prepare_circuit,
+        ) as mock_prepare_circuit:
+            answer = backend.run(circuits=[qc] * 5, shots=100, method="dry-run")
+            assert answer == qss.SuperstaqJob(backend, "job_id1,job_id2,job_id3")
+
+            # Each circuit is only serialized once
+            assert mock_prepare_circuit.call_count == 5
+
+            answer = asyncio.run(backend.run_async(circuits=[qc] * 5, shots=100, method="dry-run"))
+            assert answer == qss.SuperstaqJob(backend, "job_id1,job_id2,job_id3")
+
+    expected_requests = [
+        {
+            "serialized_circuits": {"qiskit_circuits": qss.serialize_circuits([qc] * num_circuits)},
+            "repetitions": 100,
+            "target": "ss_example_qpu",
+            "method": "dry-run",
+        }
+        for num_circuits in (2, 2, 1)
+    ]
+    assert mock_create_jobs.call_count == 2
+    for call in mock_create_jobs.call_args_list:
+        assert call.args[0] == expected_requests
+
+    # Circuits within the size limit are submitted in a single request, without looking up
+    # `max_circuits`
+    backend._target_info = None
+    with patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.create_job",
+        return_value={"job_ids": ["job_id"]},
+    ) as mock_create_job, patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.target_info"
+    ) as mock_target_info:
+        answer = backend.run(circuits=[qc] * 5, shots=100)
+        assert answer == qss.SuperstaqJob(backend, "job_id")
+        mock_create_job.assert_called_once()
+        mock_target_info.assert_not_called()
+
+
 def test_multi_arg_run(fake_superstaq_provider: MockSuperstaqProvider) -> None:
     qc = qiskit.QuantumCircuit(2, 2)
     qc.h(0)
@@ -323,6 +406,47 @@ def test_compile(mock_post: MagicMock) -> None:
     assert out.final_logical_to_physicals == [{0: 0}]
 
 
+def test_max_workers(fake_superstaq_provider: MockSuperstaqProvider) -> None:
+    qc = qiskit.QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+    circuits = [qc] * 4
+    compiled_json = {
+        "qiskit_circuits": qss.serialization.serialize_circuits(circuits),
+        "initial_logical_to_physicals": json.dumps([[(0, 0)]] * 4),
+        "final_logical_to_physicals": json.dumps([[(0, 0)]] * 4),
+    }
+
+    with patch(
+        "general_superstaq.serialization.map_chunks", wraps=gss.serialization.map_chunks
+    ) as mock_map_chunks, patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.create_job",
+        return_value={"job_ids": ["job_id"], "status": "ready"},
+    ) as mock_create_job, patch(
+        "general_superstaq.superstaq_client._SuperstaqClient.compile", return_value=compiled_json
+    ) as mock_compile:
+        backend = fake_superstaq_provider.get_backend("ss_example_qpu")
+        _ = backend.run(circuits, shots=100, max_workers=2)
+        _ = asyncio.run(backend.run_async(circuits, shots=100, max_workers=2))
+        assert "max_workers" not in mock_create_job.call_args.kwargs
+        assert (
+            qss.deserialize_circuits(
+                mock_create_job.call_args.kwargs["serialized_circuits"]["qiskit_circuits"]
+            )
+            == circuits
+        )
+
+        assert backend.compile(circuits, max_workers=2).circuits == circuits
+        backend = fake_superstaq_provider.get_backend("ibmq_brisbane_qpu")
+        assert backend.compile(circuits, max_workers=2).circuits == circuits
+        options = json.loads(mock_compile.call_args.args[0]["options"])
+        assert "max_workers" not in options
+
+    assert mock_map_chunks.call_count == 4
+    for call in mock_map_chunks.call_args_list:
+        assert call.args[1:] == (circuits, 2)
+
+
 def test_target_info(fake_superstaq_provider: MockSuperstaqProvider) -> None:
     target = "ibmq_brisbane_qpu"
     backend = fake_superstaq_provider.get_backend(target)
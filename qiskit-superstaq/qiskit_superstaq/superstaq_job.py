@@ -11,10 +11,15 @@
 # that they have been altered from the originals.
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+import copy
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import Any, overload
 
 import general_superstaq as gss
+import numpy as np
+import numpy.typing as npt
 import qiskit
 
 import qiskit_superstaq as qss
@@ -37,6 +42,8 @@ class SuperstaqJob(qiskit.providers.JobV1):
         super().__init__(backend, job_id)
         self._overall_status = "Submitted"
         self._job_info: dict[str, Any] = {}
+        self._circuits: dict[tuple[str, str], tuple[str, qiskit.QuantumCircuit]] = {}
+        self._counts_arrays: dict[str, tuple[dict[str, int], gss.Counts]] = {}
 
     def __eq__(self, other: object) -> bool:
         if not (isinstance(other, SuperstaqJob)):
@@ -44,12 +51,60 @@ class SuperstaqJob(qiskit.providers.JobV1):
 
         return self._job_id == other._job_id
 
-    def _wait_for_results(self, timeout: float, wait: float = 5) -> list[dict[str, dict[str, int]]]:
+    def _polling_strategy(self, wait: float | None) -> gss.PollingStrategy:
+        """Gets the strategy with which to poll this job.
+
+        Args:
+            wait: An optional fixed interval with which to poll.
+
+        Returns:
+            A fixed-interval `gss.PollingStrategy` if `wait` is given, and otherwise the client's
+            strategy.
+        """
+        if wait is not None:
+            return gss.PollingStrategy.fixed(wait)
+        return self._backend._provider._client.polling_strategy
+
+    def wait_for_final_state(
+        self,
+        timeout: float | None = None,
+        wait: float | None = None,
+        callback: Callable[..., object] | None = None,
+    ) -> None:
+        """Polls the job status until it progresses to a final state such as `DONE` or `ERROR`.
+
+        Args:
+            timeout: Seconds to wait for the job. If None, wait indefinitely.
+            wait: An optional fixed number of seconds between queries. By default the interval is
+                chosen by the client's `gss.PollingStrategy`.
+            callback: An optional function invoked after each query with the job id, the job
+                status from the last query, and this job.
+
+        Raises:
+            qiskit.providers.JobTimeoutError: If the job does not reach a final state before the
+                specified timeout.
+        """
+        schedule = self._polling_strategy(wait).start()
+        start_time = time.time()
+        with gss.polling.waiting(self):
+            while (status := self.status()) not in qiskit.providers.jobstatus.JOB_FINAL_STATES:
+                if timeout is not None and time.time() - start_time >= timeout:
+                    raise qiskit.providers.JobTimeoutError(
+                        f"Timeout while waiting for job {self.job_id()}."
+                    )
+                if callback:
+                    callback(self.job_id(), status, self)
+                time.sleep(schedule.next_interval(self._overall_status))
+        schedule.finish()
+
+    def _wait_for_results(
+        self, timeout: float | None, wait: float | None = None
+    ) -> list[dict[str, dict[str, int]]]:
         """Waits for the results till either the job is done or some error in the job occurs.
 
         Args:
             timeout: Time to wait for results. Defaults to None.
-            wait: Time to wait before checking again. Defaults to 5.
+            wait: An optional fixed time to wait before checking again.
 
         Returns:
             Results from the job.
@@ -70,14 +125,7 @@ class SuperstaqJob(qiskit.providers.JobV1):
         Returns:
             A dictionary with the updated counts keys.
         """
-        arranged_counts = {}
-        for key in counts:
-            updated_key = "0" * num_clbits
-            for counter, index in enumerate(circ_meas_bit_indices):
-                updated_key = updated_key[:index] + key[counter] + updated_key[index + 1 :]
-            arranged_counts[updated_key] = counts[key]
-
-        return arranged_counts
+        return gss.Counts.from_dict(counts).expand(circ_meas_bit_indices, num_clbits).to_dict()
 
     def _get_clbit_indices(self, index: int) -> list[int]:
         """Helper method to update the measurement indices from the compiled circuit.
@@ -89,7 +137,7 @@ class SuperstaqJob(qiskit.providers.JobV1):
             The specific measurement indices of the circuit with label `index` in
             the job.
         """
-        input_circuit = self.input_circuits(index)
+        input_circuit = self._get_cached_circuits("input_circuit", index)[0]
         return sorted(qss.classical_bit_mapping(input_circuit))
 
     def _get_num_clbits(self, index: int) -> int:
@@ -101,13 +149,13 @@ class SuperstaqJob(qiskit.providers.JobV1):
         Returns:
             The number of classical bits for the circuit in the job.
         """
-        return self.input_circuits(index).num_clbits
+        return self._get_cached_circuits("input_circuit", index)[0].num_clbits
 
     def result(
         self,
         index: int | None = None,
         timeout: float | None = None,
-        wait: float = 5,
+        wait: float | None = None,
         qubit_indices: Sequence[int] | None = None,
     ) -> qiskit.result.Result:
         """Retrieves the result data associated with a Superstaq job.
@@ -116,8 +164,8 @@ class SuperstaqJob(qiskit.providers.JobV1):
             index: An optional index to retrieve a specific result from a result list.
             timeout: An optional parameter that fixes when result retrieval times out. Units are
                 in seconds.
-            wait: An optional parameter that sets the interval to check for Superstaq job results.
-                Units are in seconds. Defaults to 5.
+            wait: An optional fixed interval (in seconds) with which to check for Superstaq job
+                results. By default the interval is chosen by the client's `gss.PollingStrategy`.
             qubit_indices: The qubit indices to return the results of individually.
 
         Returns:
@@ -134,15 +182,10 @@ class SuperstaqJob(qiskit.providers.JobV1):
         for i, result in enumerate(results):
             counts = result["samples"]
             if counts:
-                num_clbits = self._get_num_clbits(i)
-                circ_meas_bit_indices = self._get_clbit_indices(i)
-                if len(circ_meas_bit_indices) != num_clbits:
-                    counts = self._arrange_counts(counts, circ_meas_bit_indices, num_clbits)
-                counts = {
-                    key[::-1]: value for key, value in counts.items()
-                }  # change endianess to match Qiskit
+                counts_array = self._get_counts_array(i if index is None else index)
                 if qubit_indices:
-                    counts = qiskit.result.marginal_counts(counts, indices=qubit_indices)
+                    counts_array = counts_array.marginalize(sorted(qubit_indices))
+                counts = counts_array.reverse_bits().to_dict()  # change endianess to match Qiskit
             results_list.append(
                 {
                     "success": result["status"] == "Done",
@@ -163,6 +206,117 @@ class SuperstaqJob(qiskit.providers.JobV1):
             }
         )
 
+    def _get_counts_array(self, index: int) -> gss.Counts:
+        """Gets the counts of a (finished) sub-job, with one column per classical bit of its input
+        circuit. These are built at most once per sub-job.
+
+        Args:
+            index: The index of the sub-job.
+
+        Returns:
+            A `gss.Counts` in which column `i` of each outcome holds the value of classical bit `i`
+            (i.e. in the reverse order to the bitstrings of a `qiskit.result.Result`).
+        """
+        job_id = self._job_id.split(",")[index]
+        samples = self._job_info[job_id]["samples"]
+        cached = self._counts_arrays.get(job_id)
+        if cached is None or cached[0] is not samples:
+            num_clbits = self._get_num_clbits(index)
+            circ_meas_bit_indices = self._get_clbit_indices(index)
+            counts = gss.Counts.from_dict(samples, len(circ_meas_bit_indices))
+            if len(circ_meas_bit_indices) != num_clbits:
+                counts = counts.expand(circ_meas_bit_indices, num_clbits)
+            cached = (samples, counts)
+            self._counts_arrays[job_id] = cached
+        return cached[1]
+
+    @overload
+    def counts_array(
+        self, index: int, timeout: float | None = None, wait: float | None = None
+    ) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64 | np.float64]]: ...
+
+    @overload
+    def counts_array(
+        self, index: None = None, timeout: float | None = None, wait: float | None = None
+    ) -> list[tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64 | np.float64]]]: ...
+
+    def counts_array(
+        self, index: int | None = None, timeout: float | None = None, wait: float | None = None
+    ) -> (
+        tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64 | np.float64]]
+        | list[tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64 | np.float64]]]
+    ):
+        """Retrieves the counts of a Superstaq job as arrays, without building any bitstrings.
+
+        The arrays are built once (when the results are first requested) and are read-only, so
+        slicing them (e.g. `outcomes[:, 2:5]` to select a range of classical bits) doesn't copy
+        any data.
+
+        Args:
+            index: An optional index to retrieve the counts of a specific circuit.
+            timeout: An optional parameter that fixes when result retrieval times out. Units are
+                in seconds.
+            wait: An optional fixed interval (in seconds) with which to check for Superstaq job
+                results. By default the interval is chosen by the client's `gss.PollingStrategy`.
+
+        Returns:
+            A tuple `(outcomes, counts)`, where `outcomes` is a two-dimensional array with one row
+            per measured outcome, whose column `i` holds the value of classical bit `i`, and
+            `counts` is an array of the number of times each outcome was measured. If `index` is
+            None, a list of such tuples for each circuit in the job.
+        """
+        if index is not None:
+            gss.validation.validate_integer_param(index, min_val=0)
+        timeout = timeout or self._backend._provider._client.max_retry_seconds
+        num_circuits = len(self._wait_for_results(timeout, wait))
+
+        arrays = []
+        for i in range(num_circuits) if index is None else [index]:
+            counts = self._get_counts_array(i)
+            arrays.append((counts.outcomes, counts.counts))
+        return arrays if index is None else arrays[0]
+
+    async def result_async(
+        self,
+        index: int | None = None,
+        timeout: float | None = None,
+        wait: float | None = None,
+        qubit_indices: Sequence[int] | None = None,
+    ) -> qiskit.result.Result:
+        """Asynchronously retrieves the result data associated with a Superstaq job.
+
+        Identical to `result`, except that status requests run in the client's worker pool and
+        the event loop is free to run other tasks (such as polling other jobs) while waiting.
+
+        Args:
+            index: An optional index to retrieve a specific result from a result list.
+            timeout: An optional parameter that fixes when result retrieval times out. Units are
+                in seconds.
+            wait: An optional fixed interval (in seconds) with which to check for Superstaq job
+                results. By default the interval is chosen by the client's `gss.PollingStrategy`.
+            qubit_indices: The qubit indices to return the results of individually.
+
+        Returns:
+            A qiskit result object containing job information.
+
+        Raises:
+            qiskit.providers.JobTimeoutError: If the job does not finish within `timeout`.
+        """
+        async_client = self._backend._provider._client.get_async_client()
+        timeout = timeout or self._backend._provider._client.max_retry_seconds
+        schedule = self._polling_strategy(wait).start()
+        start_time = time.time()
+        with gss.polling.waiting(self):
+            while not await async_client.run(self.in_final_state):
+                if time.time() - start_time >= timeout:
+                    raise qiskit.providers.JobTimeoutError(
+                        f"Timeout while waiting for job {self.job_id()}."
+                    )
+                await asyncio.sleep(schedule.next_interval(self._overall_status))
+        schedule.finish()
+
+        return await async_client.run(self.result, index, timeout, wait, qubit_indices)
+
     def _check_if_stopped(self) -> None:
         """Verifies that the job status is not in a cancelled or failed state and
         raises an exception if it is.
@@ -212,7 +366,8 @@ class SuperstaqJob(qiskit.providers.JobV1):
                 jobs_to_fetch.append(job_id)
 
         if jobs_to_fetch:
-            result = self._backend._provider._client.fetch_jobs(jobs_to_fetch)
+            poller = gss.polling.get_job_poller(self._backend._provider._client)
+            result = poller.fetch_jobs(self, jobs_to_fetch, self.TERMINAL_STATES)
             self._job_info.update(result)
 
         self._update_status_queue_info()
@@ -259,10 +414,31 @@ class SuperstaqJob(qiskit.providers.JobV1):
         Returns:
             A single circuit or list of circuits.
         """
+        circuits = [qc.copy() for qc in self._get_cached_circuits(circuit_type, index)]
+        return circuits if index is None else circuits[0]
+
+    def _get_cached_circuits(
+        self, circuit_type: str, index: int | None = None
+    ) -> list[qiskit.QuantumCircuit]:
+        """Retrieves the corresponding circuit(s) to `circuit_type`, deserializing each circuit at
+        most once.
+
+        Args:
+            circuit_type: The kind of circuit(s) to retrieve. Either "input_circuit",
+                "compiled_circuit", or "pulse_gate_circuits".
+            index: An optional index of the specific circuit to retrieve.
+
+        Returns:
+            A list of all the requested circuits (or just the one at `index`). These are shared
+            with later calls, and so must not be modified.
+        """
         if circuit_type not in ("input_circuit", "compiled_circuit", "pulse_gate_circuits"):
             raise ValueError("The circuit type requested is invalid.")
 
         job_ids = self._job_id.split(",")
+        if index is not None:
+            gss.validation.validate_integer_param(index, min_val=0)
+            job_ids = [job_ids[index]]
 
         if not all(
             job_id in self._job_info and circuit_type in self._job_info[job_id]
@@ -273,13 +449,15 @@ class SuperstaqJob(qiskit.providers.JobV1):
         if any(self._job_info[job_id].get(circuit_type) is None for job_id in job_ids):
             raise ValueError(f"The circuit type '{circuit_type}' is not supported on this device.")
 
-        if index is None:
-            serialized_circuits = [self._job_info[job_id][circuit_type] for job_id in job_ids]
-            return [qss.deserialize_circuits(serialized)[0] for serialized in serialized_circuits]
-
-        gss.validation.validate_integer_param(index, min_val=0)
-        serialized_circuit = self._job_info[job_ids[index]][circuit_type]
-        return qss.deserialize_circuits(serialized_circuit)[0]
+        circuits = []
+        for job_id in job_ids:
+            serialized_circuit = self._job_info[job_id][circuit_type]
+            cached = self._circuits.get((job_id, circuit_type))
+            if cached is None or cached[0] != serialized_circuit:
+                cached = (serialized_circuit, qss.deserialize_circuits(serialized_circuit)[0])
+                self._circuits[job_id, circuit_type] = cached
+            circuits.append(cached[1])
+        return circuits
 
     @overload
     def compiled_circuits(self, index: int) -> qiskit.QuantumCircuit: ...
@@ -300,14 +478,14 @@ class SuperstaqJob(qiskit.providers.JobV1):
         """
         if index is None:
             compiled_circuits = self._get_circuits("compiled_circuit")
-            input_circuits = self._get_circuits("input_circuit")
+            input_circuits = self._get_cached_circuits("input_circuit")
             for compiled_qc, in_qc in zip(compiled_circuits, input_circuits):
-                compiled_qc.metadata = in_qc.metadata
+                compiled_qc.metadata = copy.deepcopy(in_qc.metadata)
             return compiled_circuits
 
         compiled_circuit = self._get_circuits("compiled_circuit", index)
-        input_circuit = self._get_circuits("input_circuit", index)
-        compiled_circuit.metadata = input_circuit.metadata
+        input_circuit = self._get_cached_circuits("input_circuit", index)[0]
+        compiled_circuit.metadata = copy.deepcopy(input_circuit.metadata)
         return compiled_circuit
 
     @overload
@@ -400,3 +578,105 @@ class SuperstaqJob(qiskit.providers.JobV1):
         if self._overall_status not in self.TERMINAL_STATES:
             self._refresh_job()
         return self._job_info
+
+
+def _iter_finished(
+    jobs: Iterable[qss.SuperstaqJob], timeout: float | None, wait: float | None
+) -> Iterator[tuple[qss.SuperstaqJob, int]]:
+    """Polls the sub-jobs of many jobs from a single loop, updating each as soon as it finishes.
+
+    Args:
+        jobs: The jobs to poll.
+        timeout: The total number of seconds to poll for, or None to poll indefinitely.
+        wait: An optional fixed interval with which to poll.
+
+    Yields:
+        A tuple `(job, index)` for each sub-job, in the order in which they reach a terminal state.
+
+    Raises:
+        qiskit.providers.JobTimeoutError: If some sub-jobs are still unfinished after `timeout`.
+    """
+    sub_jobs = []
+    for job in jobs:
+        for index, job_id in enumerate(job.job_id().split(",")):
+            if job._job_info.get(job_id, {}).get("status") in SuperstaqJob.TERMINAL_STATES:
+                yield job, index
+            else:
+                sub_jobs.append((job, index, job_id))
+
+    polled = gss.polling.as_completed(
+        [(job._backend._provider._client, job_id) for job, _, job_id in sub_jobs],
+        SuperstaqJob.TERMINAL_STATES,
+        timeout_seconds=timeout,
+        polling_strategy=None if wait is None else gss.PollingStrategy.fixed(wait),
+    )
+    try:
+        for position, job_data in polled:
+            job, index, job_id = sub_jobs[position]
+            job._job_info[job_id] = job_data
+            if all(sub_job_id in job._job_info for sub_job_id in job.job_id().split(",")):
+                job._update_status_queue_info()
+            yield job, index
+    except TimeoutError as e:
+        raise qiskit.providers.JobTimeoutError(str(e)) from e
+
+
+def wait_for_jobs(
+    jobs: Iterable[qss.SuperstaqJob], timeout: float | None = None, wait: float | None = None
+) -> None:
+    """Waits for every sub-job of the given jobs to reach a final state.
+
+    All of the jobs are polled from a single loop, with batched `/fetch_jobs` requests.
+
+    Args:
+        jobs: The jobs to wait for.
+        timeout: An optional number of seconds after which to stop waiting.
+        wait: An optional fixed interval (in seconds) with which to check the status of the jobs.
+            By default the interval is chosen by the `gss.PollingStrategy` of the client of the
+            first job.
+
+    Raises:
+        qiskit.providers.JobTimeoutError: If some jobs are still unfinished after `timeout`.
+    """
+    for _ in _iter_finished(jobs, timeout, wait):
+        pass
+
+
+def as_completed(
+    jobs: Iterable[qss.SuperstaqJob], timeout: float | None = None, wait: float | None = None
+) -> Iterator[tuple[qss.SuperstaqJob, int, dict[str, int]]]:
+    """Polls many jobs from a single loop, yielding the counts of each circuit as soon as they are
+    available, e.g.:
+
+    .. code-block:: python
+
+        for job, index, counts in qss.as_completed(jobs):
+            process(job.input_circuits(index), counts)
+
+    Args:
+        jobs: The jobs to poll.
+        timeout: An optional number of seconds after which to stop waiting.
+        wait: An optional fixed interval (in seconds) with which to check the status of the jobs.
+            By default the interval is chosen by the `gss.PollingStrategy` of the client of the
+            first job.
+
+    Yields:
+        A tuple `(job, index, counts)` for each circuit (where `index` is the index of the circuit
+        in `job` and `counts` are in the same format as `job.result(index).get_counts()`), in the
+        order in which they finish.
+
+    Raises:
+        ~gss.SuperstaqUnsuccessfulJobException: If any of the sub-jobs have been cancelled or
+            have failed.
+        qiskit.providers.JobTimeoutError: If some jobs are still unfinished after `timeout`.
+    """
+    for job, index in _iter_finished(jobs, timeout, wait):
+        job_id = job.job_id().split(",")[index]
+        job_data = job._job_info[job_id]
+        if job_data["status"] != "Done":
+            raise gss.SuperstaqUnsuccessfulJobException(job_id, job_data["status"])
+
+        counts = job_data["samples"]
+        if counts:
+            counts = job._get_counts_array(index).reverse_bits().to_dict()
+        yield job, index, counts
@@ -1,11 +1,13 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import TYPE_CHECKING
 from unittest import mock
 
 import general_superstaq as gss
+import numpy as np
 import pytest
 import qiskit
 import requests
@@ -75,6 +77,27 @@ def test_wait_for_results(backend: qss.SuperstaqBackend) -> None:
         ]
 
 
+def test_polling_is_coalesced(backend: qss.SuperstaqBackend) -> None:
+    job = qss.SuperstaqJob(backend=backend, job_id="123abc")
+    other_job = qss.SuperstaqJob(backend=backend, job_id="456def")
+
+    with patched_requests(
+        {"123abc": mock_response("Queued")},
+        {"456def": mock_response("Queued")},
+        {"123abc": mock_response("Done"), "456def": mock_response("Done")},
+    ) as mocked_requests:
+        with mock.patch("time.monotonic", return_value=0):
+            assert job.status() == qiskit.providers.JobStatus.QUEUED
+            assert other_job.status() == qiskit.providers.JobStatus.QUEUED
+        assert mocked_requests.call_count == 2
+
+        # Subsequent polling of both jobs is done in a single request
+        with mock.patch("time.monotonic", return_value=5):
+            assert job.status() == qiskit.providers.JobStatus.DONE
+            assert other_job.status() == qiskit.providers.JobStatus.DONE
+        assert mocked_requests.call_count == 3
+
+
 def test_cancel(backend: qss.SuperstaqBackend) -> None:
     multi_job = qss.SuperstaqJob(backend=backend, job_id="123abc,456def,789abc")
     with mock.patch("requests.Session.post", return_value=mock.MagicMock(ok=True)) as mock_post:
@@ -98,6 +121,34 @@ def test_timeout(backend: qss.SuperstaqBackend) -> None:
         assert mocked_get_job.call_count == 3
 
 
+@mock.patch("time.sleep", return_value=None)
+def test_wait_for_final_state(mock_sleep: mock.MagicMock, backend: qss.SuperstaqBackend) -> None:
+    polling_strategy = backend._provider._client.polling_strategy = gss.PollingStrategy(jitter=0)
+    job = qss.SuperstaqJob(backend=backend, job_id="123abc")
+    callback = mock.MagicMock()
+
+    with patched_requests(
+        {"123abc": mock_response("Queued")},
+        {"123abc": mock_response("Running")},
+        {"123abc": mock_response("Done")},
+    ):
+        job.wait_for_final_state(callback=callback)
+
+    # Queued jobs are polled slowly, and running jobs more often
+    assert mock_sleep.call_args_list == [mock.call(2.0), mock.call(1.0)]
+    assert callback.call_args_list == [
+        mock.call("123abc", qiskit.providers.JobStatus.QUEUED, job),
+        mock.call("123abc", qiskit.providers.JobStatus.RUNNING, job),
+    ]
+    assert polling_strategy.stats.num_polls == 3
+    assert polling_strategy.stats.added_latency_seconds == 1.0
+
+    job = qss.SuperstaqJob(backend=backend, job_id="123abc")
+    with patched_requests({"123abc": mock_response("Queued")}):
+        with pytest.raises(qiskit.providers.JobTimeoutError, match="123abc"):
+            job.wait_for_final_state(timeout=0)
+
+
 def test_result(backend: qss.SuperstaqBackend) -> None:
     qc = qiskit.QuantumCircuit(3, 3)
     qc.h(0)
@@ -147,6 +198,44 @@ def test_result(backend: qss.SuperstaqBackend) -> None:
         ]
         assert multi_job.result(index=0).get_counts() == {"011": 30, "001": 50, "111": 20}
 
+    # Fractional counts (e.g. from measurement error mitigation) aren't truncated
+    job = qss.SuperstaqJob(backend=backend, job_id="123abc")
+    fractional_response = {**response, "samples": {"110": 30.5, "100": 49.25, "111": 20.25}}
+    with patched_requests({"123abc": fractional_response}):
+        assert job.result(index=0).get_counts() == {"011": 30.5, "001": 49.25, "111": 20.25}
+        assert job.result(index=0, qubit_indices=[2]).get_counts() == {"0": 79.75, "1": 20.25}
+
+
+def test_result_async(backend: qss.SuperstaqBackend) -> None:
+    qc = qiskit.QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+    job = qss.SuperstaqJob(backend=backend, job_id="123abc")
+
+    response = mock_response("Done")
+    response["input_circuit"] = qss.serialize_circuits(qc)
+    response["compiled_circuit"] = qss.serialize_circuits(qc)
+
+    with patched_requests(
+        {"123abc": mock_response("Queued")}, {"123abc": response}
+    ) as mocked_requests:
+        result = asyncio.run(job.result_async(wait=0.0))
+        assert result.get_counts() == {"11": 50, "01": 50}
+        assert mocked_requests.call_count == 2
+
+        result = asyncio.run(job.result_async(index=0, qubit_indices=[0]))
+        assert result.get_counts() == {"1": 100}
+        assert mocked_requests.call_count == 2
+
+
+def test_result_async_timeout(backend: qss.SuperstaqBackend) -> None:
+    job = qss.SuperstaqJob(backend=backend, job_id="123abc")
+
+    with patched_requests(*[{"123abc": mock_response("Queued")}] * 3):
+        with pytest.raises(qiskit.providers.JobTimeoutError, match="123abc"):
+            _ = asyncio.run(job.result_async(timeout=0.01, wait=0.01))
+
 
 def test_counts_arranged(backend: qss.SuperstaqBackend) -> None:
     # Test case: len(qiskit.ClassicalRegister()) = len(qiskit.QuantumRegister())
@@ -566,3 +655,122 @@ def test_to_dict(backend: qss.SuperstaqBackend) -> None:
                 "shots": 100,
             }
         }
+
+
+def test_circuits_deserialized_once(backend: qss.SuperstaqBackend) -> None:
+    qc1 = qiskit.QuantumCircuit(2, 2)
+    qc1.measure([0, 1], [0, 1])
+    qc2 = qiskit.QuantumCircuit(3, 3)
+    qc2.x(0)
+    qc2.measure([0, 2], [0, 2])
+
+    job_info = {
+        "123abc": {**mock_response("Done"), "input_circuit": qss.serialize_circuits(qc1)},
+        "456xyz": {
+            **mock_response("Done"),
+            "samples": {"10": 100},
+            "input_circuit": qss.serialize_circuits(qc2),
+        },
+    }
+    job = qss.SuperstaqJob(backend=backend, job_id="123abc,456xyz")
+
+    with patched_requests(job_info), mock.patch(
+        "qiskit_superstaq.deserialize_circuits", wraps=qss.deserialize_circuits
+    ) as mock_deserialize:
+        for _ in range(3):
+            assert job.result().get_counts() == [{"11": 50, "01": 50}, {"001": 100}]
+        assert job.result(index=1).get_counts() == {"001": 100}
+        assert mock_deserialize.call_count == 2
+
+        # Returned circuits are copies, so modifying them doesn't affect the job
+        job.input_circuits(index=0).x(0)
+        assert job.input_circuits() == [qc1, qc2]
+        assert mock_deserialize.call_count == 2
+
+        # Circuits are deserialized again if the job data changes
+        job._job_info["123abc"]["input_circuit"] = qss.serialize_circuits(qc2)
+        assert job.input_circuits(index=0) == qc2
+        assert mock_deserialize.call_count == 3
+
+
+def test_counts_array(backend: qss.SuperstaqBackend) -> None:
+    qc1 = qiskit.QuantumCircuit(3, 3)
+    qc1.x(0)
+    qc1.measure([0, 2], [0, 2])
+    qc2 = qiskit.QuantumCircuit(1, 1)
+    qc2.measure(0, 0)
+
+    job_info = {
+        "123abc": {
+            **mock_response("Done"),
+            "samples": {"10": 7, "11": 3},
+            "input_circuit": qss.serialize_circuits(qc1),
+        },
+        "456xyz": {
+            **mock_response("Done"),
+            "samples": {},
+            "input_circuit": qss.serialize_circuits(qc2),
+        },
+    }
+    job = qss.SuperstaqJob(backend=backend, job_id="123abc,456xyz")
+
+    with patched_requests(job_info):
+        arrays = job.counts_array()
+
+    # Column i holds classical bit i
+    outcomes, counts = job.counts_array(index=0)
+    np.testing.assert_array_equal(outcomes, [[1, 0, 0], [1, 0, 1]])
+    np.testing.assert_array_equal(counts, [7, 3])
+    assert arrays[0][0] is outcomes
+    assert arrays[0][1] is counts
+    assert job.result(index=0).get_counts() == {"001": 7, "101": 3}
+
+    assert arrays[1][0].shape == (0, 1)
+    assert arrays[1][1].shape == (0,)
+
+
+def test_as_completed_and_wait_for_jobs() -> None:
+    provider = qss.SuperstaqProvider(api_key="key", remote_host="http://example.com")
+    server = qss.testing.fake_superstaq_server()
+    server.install(provider)
+    backend = provider.get_backend("ss_unconstrained_simulator")
+
+    qc1 = qiskit.QuantumCircuit(2, 2)
+    qc1.x(0)
+    qc1.measure([0, 1], [0, 1])
+    qc2 = qiskit.QuantumCircuit(3, 3)
+    qc2.x(0)
+    qc2.measure(0, 2)
+
+    job_1 = backend.run([qc1, qc2], shots=10)
+    job_2 = backend.run(qc2, shots=10)
+
+    # All sub-jobs are fetched in a single request
+    assert list(qss.as_completed([job_1, job_2], wait=0)) == [
+        (job_1, 0, {"01": 10}),
+        (job_1, 1, {"100": 10}),
+        (job_2, 0, {"100": 10}),
+    ]
+    assert server.request_counts["/fetch_jobs"] == 1
+    assert job_1._overall_status == "Done"
+
+    # Finished jobs are not refetched
+    qss.wait_for_jobs([job_1, job_2])
+    assert [index for _, index, _ in qss.as_completed([job_1])] == [0, 1]
+    assert server.request_counts["/fetch_jobs"] == 1
+
+    server.queue_seconds = 100
+    job_3 = backend.run(qc1, shots=10)
+    with pytest.raises(qiskit.providers.JobTimeoutError, match="1 job"):
+        qss.wait_for_jobs([job_1, job_3], timeout=0)
+
+    job_3.cancel()
+    qss.wait_for_jobs([job_3])
+    with pytest.raises(gss.SuperstaqUnsuccessfulJobException, match="Cancelled"):
+        _ = list(qss.as_completed([job_3]))
+
+
+def test_as_completed_empty_counts(backend: qss.SuperstaqBackend) -> None:
+    job = qss.SuperstaqJob(backend=backend, job_id="123abc")
+    job._job_info["123abc"] = {**mock_response("Done"), "samples": {}}
+    assert list(qss.as_completed([job])) == [(job, 0, {})]
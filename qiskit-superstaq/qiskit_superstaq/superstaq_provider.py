@@ -54,6 +54,12 @@ class SuperstaqProvider(gss.service.Service):
         ibmq_token: str | None = None,
         ibmq_instance: str | None = None,
         ibmq_channel: str | None = None,
+        retry_policy: gss.RetryPolicy | None = None,
+        request_compression: str | None = None,
+        compression_threshold_bytes: int = 64 * 1024,
+        metadata_cache: gss.MetadataCache | None = None,
+        job_store: gss.JobStore | None = None,
+        polling_strategy: gss.PollingStrategy | None = None,
         **kwargs: Any,
     ) -> None:
         """Initializes a `SuperstaqProvider`.
@@ -83,6 +89,20 @@ class SuperstaqProvider(gss.service.Service):
                 to IBM hardware, or to access non-public IBM devices you may have access to.
             ibmq_instance: An optional instance to use when running IBM jobs.
             ibmq_channel: The type of IBM account. Must be either "ibm_quantum" or "ibm_cloud".
+            retry_policy: An optional `gss.RetryPolicy` configuring how failed requests are
+                retried (e.g. with jitter, additional retriable status codes, or a circuit
+                breaker).
+            request_compression: Optionally compress large request bodies (such as batches of
+                serialized circuits) using this encoding. Either "gzip" or "deflate".
+            compression_threshold_bytes: The minimum size (in bytes) of a request body to be
+                compressed, if `request_compression` is set.
+            metadata_cache: An optional `gss.MetadataCache` in which to cache target information
+                and target lists. The same cache can be shared by multiple services and providers.
+            job_store: An optional `gss.JobStore` in which to save finished jobs, so that they are
+                never refetched (even by other processes).
+            polling_strategy: An optional `gss.PollingStrategy` choosing the intervals with which
+                jobs are polled while waiting for their results. The same strategy (and its
+                statistics) can be shared by multiple services and providers.
             kwargs: Other optimization and execution parameters.
 
         Raises:
@@ -101,6 +121,12 @@ class SuperstaqProvider(gss.service.Service):
             ibmq_token=ibmq_token,
             ibmq_instance=ibmq_instance,
             ibmq_channel=ibmq_channel,
+            retry_policy=retry_policy,
+            request_compression=request_compression,
+            compression_threshold_bytes=compression_threshold_bytes,
+            metadata_cache=metadata_cache,
+            job_store=job_store,
+            polling_strategy=polling_strategy,
             **kwargs,
         )
 
@@ -192,6 +218,22 @@ class SuperstaqProvider(gss.service.Service):
         else:
             raise gss.SuperstaqException("Job ids belong to jobs at different targets.")
 
+    async def get_job_async(self, job_id: str) -> qss.SuperstaqJob:
+        """Asynchronously gets a job that has been created on the Superstaq API.
+
+        Args:
+            job_id: The UUID of the job. Jobs are assigned these numbers by the server during the
+            creation of the job.
+
+        Returns:
+            A `qss.SuperstaqJob` which can be queried for status or results.
+
+        Raises:
+            ~gss.SuperstaqServerException: If there was an error accessing the API.
+            ~gss.SuperstaqException: If retrived jobs are from different targets.
+        """
+        return await self._client.get_async_client().run(self.get_job, job_id)
+
     def resource_estimate(
         self, circuits: qiskit.QuantumCircuit | Sequence[qiskit.QuantumCircuit], target: str
     ) -> gss.ResourceEstimate | list[gss.ResourceEstimate]:
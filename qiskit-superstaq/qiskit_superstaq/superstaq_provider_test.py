@@ -1,6 +1,7 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import textwrap
@@ -96,6 +97,7 @@ def test_get_job(mock_post: MagicMock, fake_superstaq_provider: MockSuperstaqPro
         },
     }
     assert job == fake_superstaq_provider.get_job("job_id1,job_id2")
+    assert job == asyncio.run(fake_superstaq_provider.get_job_async("job_id1,job_id2"))
 
     # job ids belonging to different targets
     with patch(
@@ -0,0 +1,95 @@
+"""Utilities for running qiskit-superstaq against a local fake Superstaq server."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import general_superstaq as gss
+import qiskit
+from qiskit.providers.basic_provider import BasicSimulator
+
+import qiskit_superstaq as qss
+
+
+def simulate_circuits(serialized_circuits: str, shots: int) -> list[dict[str, Any]]:
+    """Runs serialized `qiskit.QuantumCircuit`(s) on a local simulator.
+
+    This can be registered as the "qiskit_circuits" simulator of a
+    `gss.testing.FakeSuperstaqServer`. Measurement results are returned in the same format as the
+    Superstaq API, i.e. as big-endian bitstrings containing only the measured classical bits.
+
+    Args:
+        serialized_circuits: The circuit(s), serialized with `qss.serialize_circuits`.
+        shots: The number of times to sample each circuit.
+
+    Returns:
+        A list containing the job data of each circuit.
+    """
+    simulator = BasicSimulator()
+    job_data = []
+    for circuit in qss.deserialize_circuits(serialized_circuits):
+        clbit_indices = sorted(qss.classical_bit_mapping(circuit))
+        counts = simulator.run(circuit, shots=shots).result().get_counts()
+
+        samples: dict[str, int] = {}
+        for key, count in counts.items():
+            bits = key.replace(" ", "")[::-1]
+            bitstring = "".join(bits[index] for index in clbit_indices)
+            samples[bitstring] = samples.get(bitstring, 0) + count
+
+        job_data.append(
+            {
+                "input_circuit": qss.serialize_circuits(circuit),
+                "num_qubits": circuit.num_qubits,
+                "samples": samples,
+            }
+        )
+    return job_data
+
+
+def compile_circuits(serialized_circuits: str, target: str) -> dict[str, Any]:
+    """Returns serialized `qiskit.QuantumCircuit`(s) unchanged, as if they had been compiled.
+
+    This can be registered as the "qiskit_circuits" compiler of a
+    `gss.testing.FakeSuperstaqServer`.
+
+    Args:
+        serialized_circuits: The circuit(s), serialized with `qss.serialize_circuits`.
+        target: The target to compile for (unused).
+
+    Returns:
+        The body of a `/compile` response, with trivial qubit mappings.
+    """
+    circuits: list[qiskit.QuantumCircuit] = qss.deserialize_circuits(serialized_circuits)
+    qubit_maps = [[(q, q) for q in range(circuit.num_qubits)] for circuit in circuits]
+    return {
+        "qiskit_circuits": serialized_circuits,
+        "initial_logical_to_physicals": json.dumps(qubit_maps),
+        "final_logical_to_physicals": json.dumps(qubit_maps),
+    }
+
+
+def fake_superstaq_server(**kwargs: Any) -> gss.testing.FakeSuperstaqServer:
+    """Creates a `gss.testing.FakeSuperstaqServer` which simulates and compiles qiskit circuits.
+
+    Example:
+
+    .. code-block:: python
+
+        provider = qss.SuperstaqProvider(api_key="fake", remote_host="http://localhost")
+        qss.testing.fake_superstaq_server(latency_seconds=0.05).install(provider)
+
+    Args:
+        kwargs: Other arguments for `gss.testing.FakeSuperstaqServer` (e.g. `latency_seconds`,
+            `queue_seconds`, or `error_rate`).
+
+    Returns:
+        The fake server, which can be installed on a `qss.SuperstaqProvider` using its `install`
+        method.
+    """
+    return gss.testing.FakeSuperstaqServer(
+        simulators={"qiskit_circuits": simulate_circuits},
+        compilers={"qiskit_circuits": compile_circuits},
+        **kwargs,
+    )
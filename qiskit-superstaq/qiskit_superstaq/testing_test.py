@@ -0,0 +1,73 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+from __future__ import annotations
+
+from unittest import mock
+
+import general_superstaq as gss
+import pytest
+import qiskit
+
+import qiskit_superstaq as qss
+
+
+def test_simulate_circuits() -> None:
+    qc1 = qiskit.QuantumCircuit(3, 3)
+    qc1.x(0)
+    qc1.measure([0, 2], [0, 2])
+
+    qc2 = qiskit.QuantumCircuit(
+        qiskit.QuantumRegister(2), qiskit.ClassicalRegister(1), qiskit.ClassicalRegister(1)
+    )
+    qc2.x(1)
+    qc2.measure([0, 1], [0, 1])
+
+    job_data = qss.testing.simulate_circuits(qss.serialize_circuits([qc1, qc2]), 10)
+    assert job_data == [
+        {"input_circuit": qss.serialize_circuits(qc1), "num_qubits": 3, "samples": {"10": 10}},
+        {"input_circuit": qss.serialize_circuits(qc2), "num_qubits": 2, "samples": {"01": 10}},
+    ]
+
+
+def test_compile_circuits() -> None:
+    qc = qiskit.QuantumCircuit(2, 2)
+    qc.cx(1, 0)
+    qc.measure([0, 1], [0, 1])
+    serialized_circuits = qss.serialize_circuits([qc])
+
+    out = qss.compiler_output.read_json(
+        qss.testing.compile_circuits(serialized_circuits, "ss_unconstrained_simulator"),
+        circuits_is_list=True,
+    )
+    assert out.circuits == [qc]
+    assert out.initial_logical_to_physicals == [{0: 0, 1: 1}]
+    assert out.final_logical_to_physicals == [{0: 0, 1: 1}]
+
+
+def test_fake_superstaq_server() -> None:
+    provider = qss.SuperstaqProvider(api_key="key", remote_host="http://example.com")
+    server = qss.testing.fake_superstaq_server(
+        queue_seconds=1.0, target_info={"ss_unconstrained_simulator": {"num_qubits": 4}}
+    )
+    server.install(provider)
+
+    qc = qiskit.QuantumCircuit(3, 3)
+    qc.x(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+
+    backend = provider.get_backend("ss_unconstrained_simulator")
+    assert backend.target_info() == {"num_qubits": 4}
+
+    with mock.patch("time.monotonic", return_value=100.0):
+        job = backend.run([qc, qc], shots=50)
+        assert job.status() == qiskit.providers.JobStatus.QUEUED
+
+    with mock.patch("time.monotonic", return_value=101.0):
+        assert job.result().get_counts() == [{"011": 50}, {"011": 50}]
+        assert job.input_circuits(index=1) == qc
+
+    assert backend.compile(qc).circuit == qc
+
+    server.inject_errors(status_code=400)
+    with pytest.raises(gss.SuperstaqServerException, match="Injected error"):
+        _ = provider.get_targets()
@@ -74,16 +74,33 @@ class QCVVResults(ABC):
         if self.data is not None:
             return True
         if self.job is None:
-            raise RuntimeError(
-                "No data available and no Superstaq job to use to collect data. Please manually "
-                "add results data in order to perform analysis"
-            )
+            raise self._no_data
         job_status = self.job.status()
         if job_status == "Done":
             self.data = self._collect_device_counts()
             return True
         return False
 
+    def wait_for_data(self, timeout_seconds: int = 7200) -> None:
+        """Waits until the experimental data is ready to analyse.
+
+        Unlike `data_ready` (which checks the status of the Superstaq job once), this polls the
+        job until it finishes, with intervals chosen by the `gss.PollingStrategy` of the job's
+        client (i.e. about once a second at first, and then less and less frequently).
+
+        Args:
+            timeout_seconds: The total number of seconds to poll for.
+
+        Raises:
+            RuntimeError: If there is no stored data and no Superstaq job to use to collect the
+                results.
+        """
+        if self.data is not None:
+            return
+        if self.job is None:
+            raise self._no_data
+        self.data = self._collect_device_counts(timeout_seconds)
+
     @property
     def samples(self) -> Sequence[Sample]:
         """Returns:
@@ -137,9 +154,12 @@ class QCVVResults(ABC):
     def print_results(self) -> None:
         """Prints the key results data."""
 
-    def _collect_device_counts(self) -> pd.DataFrame:
+    def _collect_device_counts(self, timeout_seconds: int = 7200) -> pd.DataFrame:
         """Process the counts returned by the server and process into a results dataframe.
 
+        Args:
+            timeout_seconds: The total number of seconds to wait for the counts.
+
         Returns:
             The results dataframe.
         """
@@ -148,7 +168,7 @@ class QCVVResults(ABC):
                 "No Superstaq job associated with these results. Cannot collect device counts."
             )
         records = []
-        device_counts = self.job.counts()
+        device_counts = self.job.counts(timeout_seconds=timeout_seconds)
         for counts, sample in zip(device_counts, self.samples):
 
             total = sum(counts.values())
@@ -161,6 +181,13 @@ class QCVVResults(ABC):
 
         return pd.DataFrame(records)
 
+    @property
+    def _no_data(self) -> RuntimeError:
+        return RuntimeError(
+            "No data available and no Superstaq job to use to collect data. Please manually "
+            "add results data in order to perform analysis"
+        )
+
     @property
     def _not_analyzed(self) -> RuntimeError:
         return RuntimeError("Value has not yet been estimated. Please run `.analyze()` method.")
@@ -229,6 +229,31 @@ def test_results_ready_from_job(
     )
 
 
+def test_results_wait_for_data(
+    abc_experiment: ExampleExperiment, sample_circuits: list[Sample]
+) -> None:
+    abc_experiment.samples = sample_circuits
+    results = ExampleResults(
+        target="target", experiment=abc_experiment, job=MagicMock(spec=css.Job)
+    )
+    results.job.counts.return_value = [  # type: ignore[union-attr]
+        {"00": 20, "01": 5, "11": 10},
+        {"00": 30, "01": 5},
+    ]
+    results.wait_for_data(timeout_seconds=60)
+    results.job.counts.assert_called_once_with(timeout_seconds=60)  # type: ignore[union-attr]
+    results.job.status.assert_not_called()  # type: ignore[union-attr]
+    assert results.data is not None
+    assert results.data_ready
+
+    # Data is only collected once
+    results.wait_for_data()
+    results.job.counts.assert_called_once()  # type: ignore[union-attr]
+
+    with pytest.raises(RuntimeError, match="No data available"):
+        ExampleResults(target="target", experiment=abc_experiment).wait_for_data()
+
+
 def test_run_with_simulator(
     abc_experiment: ExampleExperiment, sample_circuits: list[Sample]
 ) -> None: